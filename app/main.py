@@ -1,21 +1,48 @@
 from __future__ import annotations
 
+import argparse
 import logging
 import sys
 import traceback
 from pathlib import Path
 
-# Import QtSvg to ensure SVG image format plugins are included by PyInstaller
-import PySide6.QtSvg  # noqa: F401
-from PySide6.QtGui import QIcon
-from PySide6.QtWidgets import QApplication, QMessageBox
+# Qt and the main window are imported inside main() so they show up as
+# phases in the --profile-startup timeline. PySide6.QtSvg is listed in
+# rest_client.spec hiddenimports so its image plugins are still bundled.
+from core.logger import configure_logging, get_logger, shutdown_logging
+from core.profiling import StartupProfiler
+from core.settings import get_settings
 
-from app.ui.main_window import MainWindow
-from core.logger import configure_logging, get_logger
-from core.settings import AppSettings
+
+def _parse_args(argv: list[str]) -> tuple[argparse.Namespace, list[str]]:
+    parser = argparse.ArgumentParser(prog="rest_client", add_help=True)
+    parser.add_argument(
+        "--profile-startup",
+        nargs="?",
+        const="-",
+        default=None,
+        metavar="PATH",
+        help="print a startup timeline (to PATH, or stderr) and exit once the window is ready",
+    )
+    # Anything else (e.g. -platform offscreen) is passed through to Qt.
+    return parser.parse_known_args(argv)
+
+
+def _write_startup_report(profiler: StartupProfiler, target: str) -> None:
+    report = profiler.format_timeline()
+    if target != "-":
+        Path(target).write_text(report + "\n", encoding="utf-8")
+        return
+    # Windowed PyInstaller builds have no console streams.
+    stream = sys.stderr or sys.stdout
+    if stream is not None:
+        stream.write(report + "\n")
+        stream.flush()
 
 
 def _handle_exception(exc_type: type[BaseException], exc: BaseException, tb: object) -> None:
+    from PySide6.QtWidgets import QApplication, QMessageBox
+
     logger = get_logger("app")
     logger.error("Unhandled exception", exc_info=(exc_type, exc, tb))
 
@@ -27,8 +54,12 @@ def _handle_exception(exc_type: type[BaseException], exc: BaseException, tb: obj
         sys.stderr.write(message)
 
 
-def main() -> None:
-    settings = AppSettings()
+def main(argv: list[str] | None = None) -> None:
+    profiler = StartupProfiler()
+    args, qt_args = _parse_args(sys.argv[1:] if argv is None else argv)
+
+    with profiler.phase("settings"):
+        settings = get_settings()
     
     # Resolve base directory
     if getattr(sys, 'frozen', False):
@@ -45,10 +76,7 @@ def main() -> None:
         base_dir = Path(__file__).resolve().parent.parent
 
     # Configure logging
-    log_level_str = settings.value("log_level")
-    if not log_level_str:
-        log_level_str = "DEBUG"
-        settings.setValue("log_level", log_level_str)
+    log_level_str = settings.get("log_level")
     
     log_path_str = settings.value("log_path")
     if not log_path_str:
@@ -66,16 +94,23 @@ def main() -> None:
         settings.setValue("log_path", log_path_str)
 
     # Resolve log level
-    log_level = logging.DEBUG
+    log_level = logging.INFO
     if isinstance(log_level_str, str):
         level_upper = log_level_str.upper()
-        log_level = getattr(logging, level_upper, logging.DEBUG)
+        log_level = getattr(logging, level_upper, logging.INFO)
     elif isinstance(log_level_str, int):
         log_level = log_level_str
         
     log_path = Path(log_path_str) if log_path_str else None
     
-    configure_logging(log_path=log_path, level=log_level)
+    with profiler.phase("logging"):
+        configure_logging(
+            log_path=log_path,
+            level=log_level,
+            levels=settings.get("log_levels"),
+            max_bytes=settings.get("log_max_bytes"),
+            backup_count=settings.get("log_backup_count"),
+        )
     
     logger = get_logger("app")
     logger.debug(f"Base directory: {base_dir}")
@@ -83,7 +118,12 @@ def main() -> None:
     
     sys.excepthook = _handle_exception
 
-    app = QApplication([])
+    with profiler.phase("import Qt"):
+        from PySide6.QtGui import QIcon
+        from PySide6.QtWidgets import QApplication
+
+    with profiler.phase("QApplication"):
+        app = QApplication([sys.argv[0], *qt_args])
     app.setOrganizationName("Jiran")
     app.setApplicationName("RestClient")
     
@@ -101,9 +141,27 @@ def main() -> None:
     else:
         logger.warning(f"Icon file not found at {icon_path}")
     
-    window = MainWindow()
-    window.show()
-    app.exec()
+    with profiler.phase("import main window"):
+        from app.ui.main_window import MainWindow
+
+    with profiler.phase("MainWindow()"):
+        window = MainWindow(settings, profiler)
+    with profiler.phase("show"):
+        window.show()
+
+    def _on_startup_finished() -> None:
+        logger.info(f"Startup finished in {profiler.elapsed_ms():.0f} ms")
+        if args.profile_startup is not None:
+            _write_startup_report(profiler, args.profile_startup)
+            app.quit()
+
+    window.startup_finished.connect(_on_startup_finished)
+    try:
+        app.exec()
+    finally:
+        # The one write that is allowed to block: whatever is still pending.
+        settings.close()
+        shutdown_logging()
 
 
 if __name__ == "__main__":
@@ -1,9 +1,15 @@
 import datetime
 import os
-
-from PySide6.QtCore import QByteArray, QPoint, Qt, QTimer
-from PySide6.QtGui import QFontMetrics, QGuiApplication, QCloseEvent
+from collections import OrderedDict, deque
+from collections.abc import Callable
+from dataclasses import dataclass, replace
+from functools import partial
+from typing import TYPE_CHECKING
+
+from PySide6.QtCore import QByteArray, QPoint, Qt, QThreadPool, QTimer, Signal
+from PySide6.QtGui import QFontMetrics, QGuiApplication, QCloseEvent, QKeySequence, QPaintEvent
 from PySide6.QtWidgets import (
+    QApplication,
     QComboBox,
     QDialog,
     QDialogButtonBox,
@@ -24,61 +30,83 @@ from PySide6.QtWidgets import (
 from app import __version__
 from app.ui.panels.collection_tree import CollectionTreePanel
 from app.ui.panels.history_panel import HistoryPanel
-from app.ui.panels.request_editor import RequestEditorPanel
+from app.ui.panels.request_editor import DEFAULT_HEADERS, DEFAULT_PARAMS, RequestEditorPanel
 from app.ui.panels.response_viewer import ResponseViewerPanel
-from core.http_client import HttpClient
+from core.diff import DiffSource
+from core.environments import NO_ENVIRONMENT, build_environment_map
 from core.logger import get_logger
-from core.settings import AppSettings
+from core.profiling import StartupProfiler
+from core.settings import AppSettings, get_settings
+from core.stall import DEFAULT_HEARTBEAT_MS, StallWatchdog
 from core.model import (
     EnvironmentScope,
     HistoryEntry,
     RequestData,
     ResponseData,
+    WorkspaceCollection,
     WorkspaceData,
     WorkspaceEnvironment,
+    WorkspaceFolder,
+    WorkspaceRequest,
 )
-from core.storage.history_jsonl import (
-    append_history_entry,
-    default_history_path,
-    load_history_entries,
-)
+from core.storage.history_jsonl import append_history_entry, default_history_path
 from core.storage.json_storage import load_workspace, save_workspace
+from core.storage.workspace_snapshot import WorkspaceSnapshotCache
+from core.workspace_index import WorkspaceIndex
 from core.template import render_request
-from workers.request_worker import RequestWorker
+from workers.snapshot_worker import SnapshotWriteWorker
+from workers.startup_worker import StartupLoadWorker
+
+if TYPE_CHECKING:
+    # httpx is only imported when the first request is sent.
+    from app.ui.panels.diagnostics import DiagnosticsDialog
+    from app.ui.panels.monitor import MonitorDialog
+    from core.http_client import HttpClient
+    from core.monitor import MonitorAlert
+    from workers.monitor_worker import MonitorWorker
+    from workers.request_worker import RequestTask
 
 
 _LOGGER = get_logger(__name__)
+FIRST_PAINT_TIMEOUT_MS = 2000
+RECENT_RESPONSE_LIMIT = 10
+# Last outcome kept per request tab, so switching tabs shows that tab's response.
+# Their response bodies are cut to the preview limit.
+REQUEST_RESULT_LIMIT = 20
+
+
+@dataclass(slots=True)
+class _InFlightRequest:
+    task: "RequestTask"
+    # Rendered with the environment that was active when Send was clicked.
+    request: RequestData
+    environment_name: str
 
 
 class MainWindow(QMainWindow):
-    def __init__(self) -> None:
+    startup_finished = Signal()
+
+    def __init__(
+        self,
+        settings: AppSettings | None = None,
+        profiler: StartupProfiler | None = None,
+    ) -> None:
         super().__init__()
         self.setWindowTitle(f"pyRestClient v{__version__}")
         self.resize(1200, 800)
 
-        self._settings = AppSettings()
+        self._profiler = profiler or StartupProfiler()
+        self._settings = settings or get_settings()
         
         # Load Settings
-        try:
-            self._default_timeout_ms = int(self._settings.value("default_timeout_ms", 10000))
-        except (ValueError, TypeError):
-            self._default_timeout_ms = 10000
-        if self._settings.value("default_timeout_ms") is None:
-             self._settings.setValue("default_timeout_ms", 10000)
-
-        try:
-            self._history_max_items = int(self._settings.value("history_max_items", 100))
-        except (ValueError, TypeError):
-            self._history_max_items = 100
-        if self._settings.value("history_max_items") is None:
-             self._settings.setValue("history_max_items", 100)
-             
-        try:
-            self._editor_font_size = int(self._settings.value("editor_font_size", 12))
-        except (ValueError, TypeError):
-            self._editor_font_size = 12
-        if self._settings.value("editor_font_size") is None:
-             self._settings.setValue("editor_font_size", 12)
+        self._default_timeout_ms = self._settings.get("default_timeout_ms")
+        self._history_max_items = self._settings.get("history_max_items")
+        self._editor_font_size = self._settings.get("editor_font_size")
+        self._response_preview_limit_kb = self._settings.get("response_preview_limit_kb")
+        self._request_max_open_tabs = self._settings.get("request_max_open_tabs")
+        self._history_body_capture_kb = self._settings.get("history_body_capture_kb")
+        self._max_concurrent_requests = self._settings.get("max_concurrent_requests")
+        self._diff_ignore_fields = tuple(str(field) for field in self._settings.get("diff_ignore_fields"))
 
         self._environments = self._build_environments()
         self._collection_tree = CollectionTreePanel()
@@ -89,17 +117,41 @@ class MainWindow(QMainWindow):
         
         # Apply Font Size
         self._request_editor.set_font_size(self._editor_font_size)
+        self._request_editor.set_max_open_tabs(self._request_max_open_tabs)
         self._response_viewer.set_font_size(self._editor_font_size)
-
-        self._http_client = HttpClient(default_timeout_ms=self._default_timeout_ms)
-        self._current_worker: RequestWorker | None = None
+        self._response_viewer.set_preview_limit(self._response_preview_limit_kb * 1024)
+        self._settings.add_listener(self._on_setting_changed)
+
+        self._http_client: HttpClient | None = None
+        self._request_pool = QThreadPool(self)
+        self._request_pool.setMaxThreadCount(self._max_concurrent_requests)
+        self._in_flight: dict[str, _InFlightRequest] = {}
+        self._request_results: OrderedDict[str, tuple[str, object]] = OrderedDict()
+        self._startup_loading = False
+        self._startup_worker: StartupLoadWorker | None = None
+        self._snapshot_cache = WorkspaceSnapshotCache()
+        # One snapshot write at a time; a save made meanwhile waits its turn.
+        self._snapshot_worker: SnapshotWriteWorker | None = None
+        self._pending_snapshot: tuple[str, WorkspaceData] | None = None
+        self._first_paint_done = False
+        self._startup_steps: list[Callable[[], None]] = []
+        self._running_startup_steps = False
         self._workspace_path: str | None = None
         self._history_path = default_history_path()
-        self._pending_history_request: RequestData | None = None
+        self._recent_responses: deque[DiffSource] = deque(maxlen=RECENT_RESPONSE_LIMIT)
         self._notification_timer = QTimer(self)
         self._notification_timer.setSingleShot(True)
         self._notification_timer.timeout.connect(self._hide_notification)
         self._environment_overlay: QWidget | None = None
+        self._monitor_worker: MonitorWorker | None = None
+        self._monitor_dialog: MonitorDialog | None = None
+        self._diagnostics_dialog: DiagnosticsDialog | None = None
+        # Heartbeat for the stall watchdog; a late tick means the event loop was blocked.
+        self._stall_watchdog: StallWatchdog | None = None
+        self._heartbeat_timer = QTimer(self)
+        self._heartbeat_timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._heartbeat_timer.setInterval(DEFAULT_HEARTBEAT_MS)
+        self._apply_stall_threshold(self._settings.get("stall_threshold_ms"))
 
         self._init_menu()
         self._init_toolbar()
@@ -107,6 +159,49 @@ class MainWindow(QMainWindow):
         self._restore_window_state()
         self._connect_signals()
         self._init_workspace()
+        # A window that starts minimized or hidden never paints; do not hold
+        # the workspace back forever in that case.
+        QTimer.singleShot(FIRST_PAINT_TIMEOUT_MS, lambda: self._on_first_paint("first paint timeout"))
+
+    def is_starting_up(self) -> bool:
+        return (
+            self._startup_worker is not None
+            or not self._first_paint_done
+            or 0 < len(self._startup_steps)
+        )
+
+    def paintEvent(self, event: QPaintEvent) -> None:
+        super().paintEvent(event)
+        self._on_first_paint("first paint")
+
+    def _on_first_paint(self, label: str) -> None:
+        if self._first_paint_done:
+            return
+        self._first_paint_done = True
+        self._profiler.mark(label)
+        QTimer.singleShot(0, self._run_startup_steps)
+
+    def _queue_startup_step(self, step: Callable[[], None]) -> None:
+        """Apply a startup result once the first frame is on screen.
+
+        Results can arrive before the window has painted; applying them then
+        would delay the first frame, so they wait and run in arrival order.
+        """
+        self._startup_steps.append(step)
+        if self._first_paint_done and not self._running_startup_steps:
+            self._run_startup_steps()
+
+    def _run_startup_steps(self) -> None:
+        if self._running_startup_steps:
+            return
+        self._running_startup_steps = True
+        try:
+            while self._startup_steps:
+                self._startup_steps.pop(0)()
+        finally:
+            self._running_startup_steps = False
+        if not self.is_starting_up():
+            self.startup_finished.emit()
 
     def closeEvent(self, event: QCloseEvent) -> None:
         # Save Window State
@@ -124,50 +219,159 @@ class MainWindow(QMainWindow):
 
         if self._workspace_path:
             try:
-                save_workspace(self._workspace_path, self._build_workspace())
+                self._save_workspace_file(self._workspace_path, self._build_workspace())
                 _LOGGER.info(f"Auto-saved workspace to {self._workspace_path}")
             except Exception as e:
                 _LOGGER.error(f"Failed to auto-save workspace: {e}")
                 # We don't block exit on save failure, but logging is good.
 
-        settings = AppSettings()
         if self._workspace_path:
-            settings.setValue("last_workspace", self._workspace_path)
-        
+            self._settings.setValue("last_workspace", self._workspace_path)
+
+        if self._startup_worker is not None:
+            self._startup_worker.requestInterruption()
+            self._startup_worker.wait()
+        if self._monitor_worker is not None:
+            self._monitor_worker.stop()
+        for in_flight in self._in_flight.values():
+            in_flight.task.cancel()
+        self._request_pool.waitForDone()
+        self._response_viewer.shutdown()
+        self._finish_snapshot_writes()
+        self._apply_stall_threshold(0)
+        self._settings.remove_listener(self._on_setting_changed)
         event.accept()
 
+    def _on_setting_changed(self, key: str, _value: object) -> None:
+        # Re-read through the schema so a bad value falls back to the default.
+        if key == "editor_font_size":
+            self._editor_font_size = self._settings.get(key)
+            self._request_editor.set_font_size(self._editor_font_size)
+            self._response_viewer.set_font_size(self._editor_font_size)
+        elif key == "request_max_open_tabs":
+            self._request_max_open_tabs = self._settings.get(key)
+            self._request_editor.set_max_open_tabs(self._request_max_open_tabs)
+        elif key == "response_preview_limit_kb":
+            self._response_preview_limit_kb = self._settings.get(key)
+            self._response_viewer.set_preview_limit(self._response_preview_limit_kb * 1024)
+        elif key == "history_body_capture_kb":
+            self._history_body_capture_kb = self._settings.get(key)
+        elif key == "max_concurrent_requests":
+            self._max_concurrent_requests = self._settings.get(key)
+            self._request_pool.setMaxThreadCount(self._max_concurrent_requests)
+        elif key == "diff_ignore_fields":
+            self._diff_ignore_fields = tuple(str(field) for field in self._settings.get(key))
+        elif key == "stall_threshold_ms":
+            self._apply_stall_threshold(self._settings.get(key))
+
+    def _apply_stall_threshold(self, threshold_ms: int) -> None:
+        """Start, retune or (with 0) stop the UI stall watchdog."""
+        if 0 >= threshold_ms:
+            if self._stall_watchdog is not None:
+                self._heartbeat_timer.stop()
+                self._heartbeat_timer.timeout.disconnect(self._stall_watchdog.beat)
+                self._stall_watchdog.stop()
+                self._stall_watchdog = None
+        elif self._stall_watchdog is not None:
+            self._stall_watchdog.set_threshold(threshold_ms)
+        else:
+            self._stall_watchdog = StallWatchdog(threshold_ms, DEFAULT_HEARTBEAT_MS)
+            self._heartbeat_timer.timeout.connect(self._stall_watchdog.beat)
+            self._stall_watchdog.start()
+            self._heartbeat_timer.start()
+        if self._diagnostics_dialog is not None:
+            self._diagnostics_dialog.set_watchdog(self._stall_watchdog)
+
     def _init_workspace(self) -> None:
-        settings = AppSettings()
-        last_path = settings.value("last_workspace")
+        last_path = self._settings.value("last_workspace")
         
         target_path = last_path
         
         # If no last path or file doesn't exist, fallback to default in CWD
         if not target_path or not isinstance(target_path, str) or not os.path.exists(target_path):
             target_path = os.path.abspath("workspace.json")
-        
-        if os.path.exists(target_path):
-            try:
-                workspace = load_workspace(target_path)
-                self._apply_workspace(workspace)
-                self._workspace_path = target_path
-                self._show_notification(f"Workspace loaded: {os.path.basename(target_path)}")
-                return
-            except Exception as e:
-                _LOGGER.error(f"Failed to load workspace {target_path}: {e}")
-                # Proceed to overwrite/create if it was invalid? 
-                # Better to be safe and maybe create a new name or just use current default state.
-                # If specifically requested "save initial workspace if none exists", we might proceed.
-        
-        # If file doesn't exist (or failed load? no, safe to keep current state if load failed to avoid dataloss overwriting)
-        # If file doesn't exist, save initial state.
-        if not os.path.exists(target_path):
+
+        # The workspace and history are parsed on a worker thread so the
+        # window can paint first; panels show a placeholder until then.
+        workspace_path = target_path if os.path.exists(target_path) else None
+        worker = StartupLoadWorker(
+            workspace_path,
+            self._history_path,
+            self._history_max_items,
+            self._profiler,
+            self._snapshot_cache,
+        )
+        worker.workspace_loaded.connect(self._on_startup_workspace_loaded)
+        worker.workspace_failed.connect(self._on_startup_workspace_failed)
+        worker.history_loaded.connect(self._on_startup_history_loaded)
+        worker.history_failed.connect(self._on_startup_history_failed)
+        worker.finished.connect(self._on_startup_load_finished)
+        self._startup_worker = worker
+        self._set_startup_loading(True)
+
+        if workspace_path is None:
+            # No workspace yet: start from the sample data and save it.
+            self._apply_sample_workspace()
             try:
-                save_workspace(target_path, self._build_workspace())
+                self._save_workspace_file(target_path, self._build_workspace())
                 self._workspace_path = target_path
                 self._show_notification(f"New workspace created: {os.path.basename(target_path)}")
             except Exception as e:
                 _LOGGER.error(f"Failed to create initial workspace {target_path}: {e}")
+        worker.start()
+
+    def _set_startup_loading(self, loading: bool) -> None:
+        self._collection_tree.set_loading(loading)
+        self._history_panel.set_loading(loading)
+        # History is replaced once loaded, so hold sends until then.
+        self._startup_loading = loading
+        self._update_request_buttons()
+
+    def _on_startup_workspace_loaded(
+        self, path: str, workspace: WorkspaceData, index: WorkspaceIndex
+    ) -> None:
+        self._queue_startup_step(partial(self._apply_startup_workspace, path, workspace, index))
+
+    def _on_startup_workspace_failed(self, path: str, message: str) -> None:
+        self._queue_startup_step(partial(self._apply_startup_workspace_failure, path, message))
+
+    def _on_startup_history_loaded(self, entries: list[HistoryEntry]) -> None:
+        self._queue_startup_step(partial(self._apply_startup_history, entries))
+
+    def _on_startup_history_failed(self, message: str) -> None:
+        self._queue_startup_step(
+            partial(QMessageBox.warning, self, "History", f"History 로드 실패: {message}")
+        )
+
+    def _on_startup_load_finished(self) -> None:
+        self._queue_startup_step(self._finish_startup_load)
+
+    def _apply_startup_workspace(
+        self, path: str, workspace: WorkspaceData, index: WorkspaceIndex
+    ) -> None:
+        with self._profiler.phase("workspace apply"):
+            self._apply_workspace(workspace, index)
+        self._workspace_path = path
+        self._show_notification(f"Workspace loaded: {os.path.basename(path)}")
+
+    def _apply_startup_workspace_failure(self, path: str, message: str) -> None:
+        # Keep the file untouched so a broken workspace is not overwritten.
+        _LOGGER.error(f"Failed to load workspace {path}: {message}")
+        self._apply_sample_workspace()
+        self._show_notification(f"Workspace 로드 실패: {os.path.basename(path)}")
+
+    def _apply_startup_history(self, entries: list[HistoryEntry]) -> None:
+        with self._profiler.phase("history apply"):
+            self._history_panel.set_entries(entries)
+
+    def _finish_startup_load(self) -> None:
+        worker = self._startup_worker
+        if worker is None:
+            return
+        worker.deleteLater()
+        self._startup_worker = None
+        self._set_startup_loading(False)
+        self._profiler.mark("startup data loaded")
 
     def _init_menu(self) -> None:
         file_menu = QMenu("File", self)
@@ -177,6 +381,23 @@ class MainWindow(QMainWindow):
         self._save_action = file_menu.addAction("Save Workspace")
         self._save_as_action = file_menu.addAction("Save Workspace As...")
 
+        view_menu = QMenu("View", self)
+        self.menuBar().addMenu(view_menu)
+
+        self._quick_open_action = view_menu.addAction("Quick Open...")
+        self._quick_open_action.setShortcut(QKeySequence("Ctrl+P"))
+        self._history_stats_action = view_menu.addAction("History Statistics...")
+
+        tools_menu = QMenu("Tools", self)
+        self.menuBar().addMenu(tools_menu)
+
+        self._compare_responses_action = tools_menu.addAction("Compare Responses...")
+        self._compare_environments_action = tools_menu.addAction("Compare Environments...")
+        tools_menu.addSeparator()
+        self._monitor_action = tools_menu.addAction("Monitor...")
+        tools_menu.addSeparator()
+        self._diagnostics_action = tools_menu.addAction("Diagnostics...")
+
     def _init_toolbar(self) -> None:
         toolbar = QToolBar("Main")
         toolbar.setObjectName("MainToolBar")
@@ -207,9 +428,19 @@ class MainWindow(QMainWindow):
         self._open_action.triggered.connect(self._on_open_workspace)
         self._save_action.triggered.connect(self._on_save_workspace)
         self._save_as_action.triggered.connect(self._on_save_as_workspace)
+        self._quick_open_action.triggered.connect(self._on_quick_open)
+        self._history_stats_action.triggered.connect(self._on_history_stats)
+        self._compare_responses_action.triggered.connect(self._on_compare_responses)
+        self._compare_environments_action.triggered.connect(self._on_compare_environments)
+        self._monitor_action.triggered.connect(self._on_monitor)
+        self._diagnostics_action.triggered.connect(self._on_diagnostics)
         self._history_panel.entry_selected.connect(self._on_history_selected)
         self._collection_tree.request_selected.connect(self._request_editor.select_request)
         self._request_editor.request_selected.connect(self._collection_tree.select_request_item)
+        self._request_editor.request_selected.connect(self._on_request_tab_selected)
+        self._collection_tree.request_renamed.connect(self._request_editor.rename_request)
+        self._collection_tree.request_moved.connect(self._request_editor.move_request)
+        self._request_editor.request_changed.connect(self._collection_tree.update_request_item)
 
     def _init_layout(self) -> None:
         self._main_splitter = QSplitter(orientation=Qt.Orientation.Horizontal)
@@ -253,7 +484,6 @@ class MainWindow(QMainWindow):
         layout.addWidget(self._main_splitter)
 
         self.setCentralWidget(central_widget)
-        self._load_history_entries()
 
     def _restore_window_state(self) -> None:
         try:
@@ -284,55 +514,126 @@ class MainWindow(QMainWindow):
             _LOGGER.error(f"Failed to restore window state: {e}")
 
     def _on_send_clicked(self) -> None:
+        from workers.request_worker import RequestTask
+
+        request_id = self._request_editor.current_request_id()
+        if request_id is None:
+            self._response_viewer.set_error("요청을 선택해주세요.")
+            return
         request = self._request_editor.build_request()
         if 0 == len(request.url):
             self._response_viewer.set_error("URL을 입력해주세요.")
             return
 
-        if self._current_worker and self._current_worker.isRunning():
+        if request_id in self._in_flight:
             self._response_viewer.set_error("요청이 이미 진행 중입니다.")
             return
 
         self._response_viewer.set_loading(request.name)
-        self._send_button.setEnabled(False)
-        self._cancel_button.setEnabled(True)
+        self._store_request_result(request_id, "loading", request.name)
 
         environment = self._current_environment()
-        self._pending_history_request = render_request(request, environment)
-        worker = RequestWorker(request, self._http_client, environment)
-        worker.response_ready.connect(self._on_response_ready)
-        worker.failed.connect(self._on_request_failed)
-        worker.canceled.connect(self._on_request_canceled)
-        worker.finished.connect(self._on_worker_finished)
-        self._current_worker = worker
-        worker.start()
+        task = RequestTask(request_id, request, self._ensure_http_client(), environment)
+        task.signals.response_ready.connect(self._on_response_ready)
+        task.signals.failed.connect(self._on_request_failed)
+        task.signals.canceled.connect(self._on_request_canceled)
+        task.signals.finished.connect(self._on_request_finished)
+        self._in_flight[request_id] = _InFlightRequest(
+            task=task,
+            request=render_request(request, environment),
+            environment_name=self._environment_combo.currentText(),
+        )
+        self._request_pool.start(task)
+        self._update_request_buttons()
 
     def _on_cancel_clicked(self) -> None:
-        if not self._current_worker or not self._current_worker.isRunning():
+        request_id = self._request_editor.current_request_id()
+        in_flight = self._in_flight.get(request_id) if request_id is not None else None
+        if in_flight is None:
             self._response_viewer.set_error("취소할 요청이 없습니다.")
             return
 
         self._response_viewer.set_canceling()
-        self._cancel_button.setEnabled(False)
-        self._current_worker.cancel()
-
-    def _on_response_ready(self, response: ResponseData) -> None:
-        self._response_viewer.set_response(response)
-        self._record_history(status_code=response.status_code, elapsed_ms=response.elapsed_ms)
-
-    def _on_request_failed(self, message: str) -> None:
-        self._response_viewer.set_error(message)
-        self._record_history(error=message)
+        in_flight.task.cancel()
+        self._update_request_buttons()
 
-    def _on_request_canceled(self) -> None:
-        self._response_viewer.set_canceled()
-        self._record_history(error="Canceled")
+    def _on_response_ready(self, request_id: str, response: ResponseData) -> None:
+        in_flight = self._in_flight.get(request_id)
+        if in_flight is None:
+            return
+        self._store_request_result(request_id, "response", (self._preview_response(response), len(response.body)))
+        if request_id == self._request_editor.current_request_id():
+            self._response_viewer.set_response(response)
+        self._remember_response(in_flight, response)
+        response_body = None
+        # Opt-in: 0 keeps bodies out of history.jsonl.
+        if 0 < self._history_body_capture_kb and len(response.body) <= self._history_body_capture_kb * 1024:
+            response_body = response.body
+        self._record_history(
+            in_flight.request,
+            status_code=response.status_code,
+            elapsed_ms=response.elapsed_ms,
+            response_body=response_body,
+        )
 
-    def _on_worker_finished(self) -> None:
-        self._send_button.setEnabled(True)
-        self._cancel_button.setEnabled(False)
-        self._current_worker = None
-        self._pending_history_request = None
+    def _on_request_failed(self, request_id: str, message: str) -> None:
+        in_flight = self._in_flight.get(request_id)
+        if in_flight is None:
+            return
+        self._store_request_result(request_id, "error", message)
+        if request_id == self._request_editor.current_request_id():
+            self._response_viewer.set_error(message)
+        self._record_history(in_flight.request, error=message)
+
+    def _on_request_canceled(self, request_id: str) -> None:
+        in_flight = self._in_flight.get(request_id)
+        if in_flight is None:
+            return
+        self._store_request_result(request_id, "canceled", None)
+        if request_id == self._request_editor.current_request_id():
+            self._response_viewer.set_canceled()
+        self._record_history(in_flight.request, error="Canceled")
+
+    def _on_request_finished(self, request_id: str) -> None:
+        self._in_flight.pop(request_id, None)
+        self._update_request_buttons()
+
+    def _on_request_tab_selected(self, request_id: str) -> None:
+        in_flight = self._in_flight.get(request_id)
+        if in_flight is not None and in_flight.task.is_cancelled():
+            self._response_viewer.set_canceling()
+        else:
+            self._show_request_result(request_id)
+        self._update_request_buttons()
+
+    def _store_request_result(self, request_id: str, kind: str, payload: object) -> None:
+        self._request_results[request_id] = (kind, payload)
+        self._request_results.move_to_end(request_id)
+        while REQUEST_RESULT_LIMIT < len(self._request_results):
+            self._request_results.popitem(last=False)
+
+    def _show_request_result(self, request_id: str) -> None:
+        result = self._request_results.get(request_id)
+        if result is None:
+            # Never sent (or evicted): don't leave the previous tab's result up.
+            self._response_viewer.clear()
+            return
+        kind, payload = result
+        if kind == "loading":
+            self._response_viewer.set_loading(str(payload))
+        elif kind == "response":
+            response, body_length = payload
+            self._response_viewer.set_response(response, body_length)
+        elif kind == "error":
+            self._response_viewer.set_error(str(payload))
+        elif kind == "canceled":
+            self._response_viewer.set_canceled()
+
+    def _update_request_buttons(self) -> None:
+        request_id = self._request_editor.current_request_id()
+        in_flight = self._in_flight.get(request_id) if request_id is not None else None
+        self._send_button.setEnabled(not self._startup_loading and in_flight is None)
+        self._cancel_button.setEnabled(in_flight is not None and not in_flight.task.is_cancelled())
 
     def _on_manage_env_clicked(self) -> None:
         environment = self._current_environment()
@@ -370,7 +671,7 @@ class MainWindow(QMainWindow):
 
         workspace = self._build_workspace()
         try:
-            save_workspace(self._workspace_path, workspace)
+            self._save_workspace_file(self._workspace_path, workspace)
         except Exception as exc:
             QMessageBox.critical(self, "Save Workspace", f"저장 실패: {exc}")
             return
@@ -389,7 +690,7 @@ class MainWindow(QMainWindow):
 
         workspace = self._build_workspace()
         try:
-            save_workspace(path, workspace)
+            self._save_workspace_file(path, workspace)
         except Exception as exc:
             QMessageBox.critical(self, "Save Workspace", f"저장 실패: {exc}")
             return
@@ -397,6 +698,135 @@ class MainWindow(QMainWindow):
         self._workspace_path = path
         self._show_notification("Workspace를 저장했습니다.")
 
+    def _on_quick_open(self) -> None:
+        from app.ui.panels.quick_open import QuickOpenDialog
+
+        dialog = QuickOpenDialog(
+            self._collection_tree.quick_open_index,
+            self._collection_tree.quick_open_pending,
+            self,
+        )
+        if dialog.exec() != QDialog.DialogCode.Accepted:
+            return
+        request_id = dialog.selected_request_id()
+        if request_id is None:
+            return
+        self._request_editor.select_request(request_id)
+        self._collection_tree.select_request_item(request_id)
+
+    def _on_history_stats(self) -> None:
+        from app.ui.panels.history_stats import HistoryStatsDialog
+
+        try:
+            dialog = HistoryStatsDialog(self._history_path, self)
+        except Exception as exc:
+            QMessageBox.warning(self, "History", f"History 통계 로드 실패: {exc}")
+            return
+        dialog.exec()
+
+    def _on_compare_responses(self) -> None:
+        from app.ui.panels.response_diff import ResponseDiffDialog
+
+        sources = list(reversed(self._recent_responses))
+        for entry in self._history_panel.entries():
+            if entry.response_body is not None:
+                sources.append(DiffSource.from_history(entry))
+
+        dialog = ResponseDiffDialog(sources, self._diff_ignore_fields, self)
+        dialog.exec()
+        ignore_fields = dialog.ignore_fields()
+        if ignore_fields != self._diff_ignore_fields:
+            self._settings.setValue("diff_ignore_fields", list(ignore_fields))
+
+    def _on_compare_environments(self) -> None:
+        from app.ui.panels.latency_compare import LatencyCompareDialog
+
+        if self._request_editor.current_request_id() is None:
+            QMessageBox.information(self, "Compare Environments", "요청을 선택해주세요.")
+            return
+        request = self._request_editor.build_request()
+        if 0 == len(request.url):
+            QMessageBox.information(self, "Compare Environments", "URL을 입력해주세요.")
+            return
+        dialog = LatencyCompareDialog(
+            request,
+            self._environments,
+            self._request_pool,
+            self._ensure_http_client(),
+            self,
+        )
+        dialog.exec()
+
+    def _on_monitor(self) -> None:
+        from app.ui.panels.monitor import MonitorDialog
+
+        requests = self._request_editor.build_workspace_requests()
+        environment_name = self._environment_combo.currentText()
+        if self._monitor_dialog is not None:
+            self._monitor_dialog.set_requests(requests, self._environments, environment_name)
+        else:
+            self._monitor_dialog = MonitorDialog(
+                self._ensure_monitor_worker(),
+                requests,
+                self._environments,
+                environment_name,
+                self._ensure_http_client(),
+                self._settings.get("monitor"),
+                self,
+            )
+            self._monitor_dialog.config_changed.connect(partial(self._settings.setValue, "monitor"))
+        self._monitor_dialog.show()
+        self._monitor_dialog.raise_()
+        self._monitor_dialog.activateWindow()
+
+    def _on_diagnostics(self) -> None:
+        from app.ui.panels.diagnostics import DiagnosticsDialog
+
+        if self._diagnostics_dialog is None:
+            self._diagnostics_dialog = DiagnosticsDialog(self._stall_watchdog, self)
+        self._diagnostics_dialog.show()
+        self._diagnostics_dialog.raise_()
+        self._diagnostics_dialog.activateWindow()
+
+    def _ensure_monitor_worker(self) -> "MonitorWorker":
+        if self._monitor_worker is None:
+            from core.timeseries import TimeSeriesStore, default_timeseries_path
+            from workers.monitor_worker import MonitorWorker
+
+            path = default_timeseries_path()
+            self._monitor_worker = MonitorWorker(TimeSeriesStore.load(path), path, self)
+            self._monitor_worker.alert_raised.connect(self._on_monitor_alert)
+        return self._monitor_worker
+
+    def _on_monitor_alert(self, alert: "MonitorAlert") -> None:
+        # Shown even while the Monitor dialog is closed.
+        self._show_notification(f"[Monitor] {alert.message}")
+        QApplication.alert(self)
+
+    def _ensure_http_client(self) -> "HttpClient":
+        if self._http_client is None:
+            from core.http_client import HttpClient
+
+            self._http_client = HttpClient(default_timeout_ms=self._default_timeout_ms)
+        return self._http_client
+
+    def _preview_response(self, response: ResponseData) -> ResponseData:
+        limit = self._response_preview_limit_kb * 1024
+        if len(response.body) <= limit:
+            return response
+        return replace(response, body=response.body[:limit])
+
+    def _remember_response(self, in_flight: _InFlightRequest, response: ResponseData) -> None:
+        if self._response_preview_limit_kb * 1024 < len(response.body):
+            # A diff of a cut-off body would be misleading, so it is left out.
+            _LOGGER.debug("Not keeping a %s char response body for Compare", len(response.body))
+            return
+        request = in_flight.request
+        time_text = datetime.datetime.now().strftime("%H:%M:%S")
+        environment = in_flight.environment_name
+        label = f"{time_text} {request.method} {request.url} [{environment}] -> {response.status_code}"
+        self._recent_responses.append(DiffSource.from_response(label, response))
+
     def _current_environment(self) -> dict[str, str]:
         name = self._environment_combo.currentText()
         return dict(self._environments.get(name, {}))
@@ -615,34 +1045,66 @@ class MainWindow(QMainWindow):
         overlay.setFocus()
         self._environment_overlay = overlay
 
-    def _apply_workspace(self, workspace: WorkspaceData) -> None:
-        self._collection_tree.load_workspace_tree(
-            workspace.collections,
-            workspace.folders,
-            workspace.requests,
-        )
+    def _apply_workspace(self, workspace: WorkspaceData, index: WorkspaceIndex | None = None) -> None:
+        if index is None:
+            self._collection_tree.load_workspace_tree(
+                workspace.collections,
+                workspace.folders,
+                workspace.requests,
+            )
+        else:
+            self._collection_tree.load_workspace_index(index)
         self._request_editor.load_workspace_requests(workspace.requests)
-        self._environments = self._build_environment_map(workspace)
+        self._environments = build_environment_map(workspace)
         self._environment_combo.clear()
         self._environment_combo.addItems(list(self._environments.keys()))
 
-    def _load_history_entries(self) -> None:
-        try:
-            entries = load_history_entries(self._history_path, limit=self._history_max_items)
-        except Exception as exc:
-            QMessageBox.warning(self, "History", f"History 로드 실패: {exc}")
+    def _save_workspace_file(self, path: str, workspace: WorkspaceData) -> None:
+        # A running snapshot write must not hash the file being replaced.
+        if self._snapshot_worker is not None:
+            self._snapshot_worker.requestInterruption()
+        self._pending_snapshot = None
+        self._snapshot_cache.invalidate(path)
+        save_workspace(path, workspace)
+        # Saving changes the file's mtime, so rewrite the snapshot or the next
+        # launch falls back to a full parse; that happens on a worker.
+        self._pending_snapshot = (path, workspace)
+        self._start_snapshot_write()
+
+    def _start_snapshot_write(self) -> None:
+        if self._snapshot_worker is not None or self._pending_snapshot is None:
+            return
+        path, workspace = self._pending_snapshot
+        self._pending_snapshot = None
+        worker = SnapshotWriteWorker(path, workspace, self._snapshot_cache)
+        worker.finished.connect(self._on_snapshot_write_finished)
+        self._snapshot_worker = worker
+        worker.start()
+
+    def _on_snapshot_write_finished(self) -> None:
+        worker = self.sender()
+        if not isinstance(worker, SnapshotWriteWorker):
             return
-        self._history_panel.set_entries(entries)
+        worker.deleteLater()
+        if worker is self._snapshot_worker:
+            self._snapshot_worker = None
+            self._start_snapshot_write()
+
+    def _finish_snapshot_writes(self) -> None:
+        """Wait for the snapshot of the last save so it is not lost on exit."""
+        while self._snapshot_worker is not None:
+            self._snapshot_worker.wait()
+            self._snapshot_worker = None
+            self._start_snapshot_write()
 
     def _record_history(
         self,
+        request: RequestData,
         status_code: int | None = None,
         elapsed_ms: int | None = None,
         error: str | None = None,
+        response_body: str | None = None,
     ) -> None:
-        request = self._pending_history_request
-        if request is None:
-            return
         entry = HistoryEntry(
             timestamp=datetime.datetime.now(tz=datetime.timezone.utc).isoformat(),
             name=request.name,
@@ -651,6 +1113,7 @@ class MainWindow(QMainWindow):
             status_code=status_code,
             elapsed_ms=elapsed_ms,
             error=error,
+            response_body=response_body,
         )
         try:
             append_history_entry(self._history_path, entry)
@@ -662,23 +1125,10 @@ class MainWindow(QMainWindow):
         self._request_editor.apply_history_entry(entry)
         self._response_viewer.set_history_entry(entry)
 
-    def _build_environment_map(self, workspace: WorkspaceData) -> dict[str, dict[str, str]]:
-        environment_map: dict[str, dict[str, str]] = {"No Environment": {}}
-        index = 1
-        for env in workspace.environments:
-            if env.scope is not EnvironmentScope.GLOBAL:
-                continue
-            name = env.variables.get("name")
-            if name is None or 0 == len(name):
-                name = f"Env {index}"
-            index += 1
-            environment_map[name] = dict(env.variables)
-        return environment_map
-
     def _build_workspace_environments(self) -> list[WorkspaceEnvironment]:
         environments: list[WorkspaceEnvironment] = []
         for name, variables in self._environments.items():
-            if name == "No Environment":
+            if name == NO_ENVIRONMENT:
                 continue
             variables_payload = dict(variables)
             variables_payload.setdefault("name", name)
@@ -691,10 +1141,64 @@ class MainWindow(QMainWindow):
             )
         return environments
 
+    def _apply_sample_workspace(self) -> None:
+        collections = [
+            WorkspaceCollection(id="col-1", name="Sample API"),
+            WorkspaceCollection(id="col-2", name="Sandbox"),
+        ]
+        folders = [
+            WorkspaceFolder(id="folder-1", collection_id="col-1", parent_id=None, name="Users", order=0),
+            WorkspaceFolder(id="folder-2", collection_id="col-1", parent_id=None, name="Auth", order=1),
+        ]
+        requests = [
+            WorkspaceRequest(
+                id="req-1",
+                folder_id="folder-1",
+                name="List Users",
+                method="GET",
+                url="https://api.example.com/users",
+                headers=list(DEFAULT_HEADERS),
+                params=list(DEFAULT_PARAMS),
+            ),
+            WorkspaceRequest(
+                id="req-2",
+                folder_id="folder-1",
+                name="Create User",
+                method="POST",
+                url="https://api.example.com/users",
+                headers=list(DEFAULT_HEADERS),
+                params=list(DEFAULT_PARAMS),
+                body="{\n    \"name\": \"Jane\"\n}",
+            ),
+            WorkspaceRequest(
+                id="req-3",
+                folder_id="folder-2",
+                name="Login",
+                method="POST",
+                url="https://api.example.com/auth/login",
+            ),
+            WorkspaceRequest(
+                id="req-4",
+                folder_id="folder-2",
+                name="Refresh Token",
+                method="POST",
+                url="https://api.example.com/auth/refresh",
+            ),
+            WorkspaceRequest(
+                id="req-5",
+                folder_id="col-2",
+                name="Health Check",
+                method="GET",
+                url="https://api.example.com/health",
+            ),
+        ]
+        self._collection_tree.load_workspace_tree(collections, folders, requests)
+        self._request_editor.load_workspace_requests(requests)
+
     @staticmethod
     def _build_environments() -> dict[str, dict[str, str]]:
         return {
-            "No Environment": {},
+            NO_ENVIRONMENT: {},
             "Dev": {
                 "env_name": "dev",
                 "base_url": "https://httpbin.org",
@@ -1,51 +1,426 @@
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtWidgets import QTreeWidget, QTreeWidgetItem, QVBoxLayout, QWidget
-
+from __future__ import annotations
+
+from typing import Any
+
+from PySide6.QtCore import (
+    QAbstractItemModel,
+    QItemSelectionModel,
+    QMimeData,
+    QModelIndex,
+    QPersistentModelIndex,
+    QPoint,
+    QSortFilterProxyModel,
+    Qt,
+    QTimer,
+    Signal,
+)
+from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QLineEdit,
+    QMenu,
+    QTreeView,
+    QVBoxLayout,
+    QWidget,
+)
+
+from core.fuzzy_index import FuzzyEntry, FuzzyIndex
+from core.logger import get_logger
 from core.model import WorkspaceCollection, WorkspaceFolder, WorkspaceRequest
+from core.workspace_index import (
+    KIND_COLLECTION,
+    KIND_FOLDER,
+    KIND_REQUEST,
+    WorkspaceIndex,
+    WorkspaceNode,
+)
+
+_LOGGER = get_logger(__name__)
+
+_ModelIndex = QModelIndex | QPersistentModelIndex
+# beginFilterChange()/endFilterChange() replace invalidateRowsFilter() from Qt 6.9.
+_HAS_FILTER_CHANGE = hasattr(QSortFilterProxyModel, "beginFilterChange")
+
+FILTER_DEBOUNCE_MS = 150
+FILTER_EXPAND_LIMIT = 2000
+QUICK_OPEN_BATCH = 2000
+
+
+class CollectionTreeModel(QAbstractItemModel):
+    """Tree model over a WorkspaceIndex.
+
+    Children are exposed in batches through ``fetchMore`` and edits are
+    reported with row insert/move/remove signals, so neither loading nor
+    editing a large workspace rebuilds the whole tree.
+    """
+
+    FETCH_BATCH = 500
+    ID_ROLE = int(Qt.ItemDataRole.UserRole) + 1
+    KIND_ROLE = int(Qt.ItemDataRole.UserRole) + 2
+    MIME_TYPE = "application/x-pyrestclient-node-id"
+
+    node_renamed = Signal(str, str)
+    node_moved = Signal(str, str)
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._index = WorkspaceIndex()
+        self._loaded: dict[str | None, int] = {}
+
+    @property
+    def workspace_index(self) -> WorkspaceIndex:
+        return self._index
+
+    def set_workspace_index(self, index: WorkspaceIndex) -> None:
+        self.beginResetModel()
+        self._index = index
+        self._loaded = {}
+        self.endResetModel()
+
+    def node(self, index: _ModelIndex) -> WorkspaceNode | None:
+        if not index.isValid():
+            return None
+        node = index.internalPointer()
+        if isinstance(node, WorkspaceNode):
+            return node
+        return None
+
+    def index_for_id(self, node_id: str) -> QModelIndex:
+        """Model index of a node, fetching the rows above it if needed."""
+        node = self._index.node(node_id)
+        if node is None:
+            return QModelIndex()
+        for ancestor_id in self._index.ancestors(node_id) + [node_id]:
+            ancestor = self._index.node(ancestor_id)
+            if ancestor is None:
+                return QModelIndex()
+            self._ensure_loaded(ancestor.parent_id, self._index.row_of(ancestor_id) + 1)
+        return self.createIndex(self._index.row_of(node_id), 0, node)
+
+    def ensure_visible_loaded(self, node_ids: set[str]) -> None:
+        """Fetch enough rows that every id in ``node_ids`` exists in the model."""
+        index = self._index
+        # Parents first, so each insert happens under an already exposed row.
+        for node_id in sorted(node_ids, key=lambda item: len(index.ancestors(item))):
+            node = index.node(node_id)
+            if node is not None:
+                self._ensure_loaded(node.parent_id, index.row_of(node_id) + 1)
+
+    def add_node(
+        self,
+        kind: str,
+        name: str,
+        parent_id: str | None,
+        node_id: str | None = None,
+        method: str = "",
+        url: str = "",
+    ) -> WorkspaceNode:
+        parent_index = self._parent_index(parent_id)
+        row = len(self._index.children_of(parent_id))
+        loaded = self._loaded_count(parent_id)
+        if loaded < row or (parent_id is not None and not parent_index.isValid()):
+            # Unfetched tail or hidden parent: the view picks it up on fetch.
+            return self._index.add(kind, name, parent_id, node_id=node_id, method=method, url=url)
+        self.beginInsertRows(parent_index, row, row)
+        node = self._index.add(kind, name, parent_id, node_id=node_id, method=method, url=url)
+        self._loaded[parent_id] = loaded + 1
+        self.endInsertRows()
+        return node
+
+    def rename_node(self, node_id: str, name: str) -> None:
+        node = self._index.node(node_id)
+        if node is None or node.name == name:
+            return
+        self._index.rename(node_id, name)
+        index = self._existing_index(node_id)
+        if index.isValid():
+            self.dataChanged.emit(index, index)
+        self.node_renamed.emit(node_id, name)
+
+    def update_request(self, node_id: str, name: str, method: str, url: str) -> None:
+        node = self._index.node(node_id)
+        if node is None or node.kind != KIND_REQUEST:
+            return
+        if (node.name, node.method, node.url) == (name, method, url):
+            return
+        self._index.update_request(node_id, name, method, url)
+        index = self._existing_index(node_id)
+        if index.isValid():
+            self.dataChanged.emit(index, index)
+
+    def move_node(self, node_id: str, parent_id: str, row: int | None = None) -> bool:
+        if not self._index.can_move(node_id, parent_id):
+            return False
+        node = self._index.node(node_id)
+        if node is None:
+            _LOGGER.warning(f"Cannot move unknown node {node_id}")
+            return False
+        old_parent_id = node.parent_id
+        old_row = self._index.row_of(node_id)
+        self.index_for_id(node_id)
+        self.index_for_id(parent_id)
+        self._ensure_loaded(parent_id, len(self._index.children_of(parent_id)))
+        destination = len(self._index.children_of(parent_id)) if row is None else row
+
+        source_parent = self._parent_index(old_parent_id)
+        target_parent = self.index_for_id(parent_id)
+        if not self.beginMoveRows(source_parent, old_row, old_row, target_parent, destination):
+            return False
+        self._index.move(node_id, parent_id, destination)
+        self._loaded[old_parent_id] = self._loaded_count(old_parent_id) - 1
+        self._loaded[parent_id] = self._loaded_count(parent_id) + 1
+        self.endMoveRows()
+        self.node_moved.emit(node_id, parent_id)
+        return True
+
+    def index(self, row: int, column: int, parent: _ModelIndex = QModelIndex()) -> QModelIndex:
+        parent_id = self._node_id(parent)
+        children = self._index.children_of(parent_id)
+        if column != 0 or row < 0 or row >= min(len(children), self._loaded_count(parent_id)):
+            return QModelIndex()
+        node = self._index.node(children[row])
+        if node is None:
+            return QModelIndex()
+        return self.createIndex(row, 0, node)
+
+    def parent(self, index: _ModelIndex = QModelIndex()) -> QModelIndex:  # type: ignore[override]
+        node = self.node(index)
+        if node is None or node.parent_id is None:
+            return QModelIndex()
+        parent_node = self._index.node(node.parent_id)
+        if parent_node is None:
+            return QModelIndex()
+        return self.createIndex(self._index.row_of(parent_node.id), 0, parent_node)
+
+    def rowCount(self, parent: _ModelIndex = QModelIndex()) -> int:
+        if parent.isValid() and parent.column() != 0:
+            return 0
+        parent_id = self._node_id(parent)
+        return min(len(self._index.children_of(parent_id)), self._loaded_count(parent_id))
+
+    def columnCount(self, parent: _ModelIndex = QModelIndex()) -> int:
+        return 1
+
+    def hasChildren(self, parent: _ModelIndex = QModelIndex()) -> bool:
+        return 0 < len(self._index.children_of(self._node_id(parent)))
+
+    def canFetchMore(self, parent: _ModelIndex) -> bool:
+        parent_id = self._node_id(parent)
+        return self._loaded_count(parent_id) < len(self._index.children_of(parent_id))
+
+    def fetchMore(self, parent: _ModelIndex) -> None:
+        parent_id = self._node_id(parent)
+        self._ensure_loaded(parent_id, self._loaded_count(parent_id) + self.FETCH_BATCH)
+
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> Any:
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return "Collections"
+        return None
+
+    def data(self, index: _ModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        node = self.node(index)
+        if node is None:
+            return None
+        if role == Qt.ItemDataRole.DisplayRole or role == Qt.ItemDataRole.EditRole:
+            return node.name
+        if role == Qt.ItemDataRole.ToolTipRole and node.kind == KIND_REQUEST and node.url:
+            return f"{node.method} {node.url}"
+        if role == self.ID_ROLE:
+            return node.id
+        if role == self.KIND_ROLE:
+            return node.kind
+        return None
+
+    def setData(self, index: _ModelIndex, value: Any, role: int = Qt.ItemDataRole.EditRole) -> bool:
+        node = self.node(index)
+        if node is None or role != Qt.ItemDataRole.EditRole:
+            return False
+        name = str(value).strip()
+        if 0 == len(name):
+            return False
+        self.rename_node(node.id, name)
+        return True
+
+    def flags(self, index: _ModelIndex) -> Qt.ItemFlag:
+        node = self.node(index)
+        if node is None:
+            return Qt.ItemFlag.ItemIsDropEnabled
+        flags = (
+            Qt.ItemFlag.ItemIsEnabled
+            | Qt.ItemFlag.ItemIsSelectable
+            | Qt.ItemFlag.ItemIsEditable
+        )
+        if node.kind != KIND_COLLECTION:
+            flags |= Qt.ItemFlag.ItemIsDragEnabled
+        if node.kind != KIND_REQUEST:
+            flags |= Qt.ItemFlag.ItemIsDropEnabled
+        return flags
+
+    def supportedDropActions(self) -> Qt.DropAction:
+        return Qt.DropAction.MoveAction
+
+    def mimeTypes(self) -> list[str]:
+        return [self.MIME_TYPE]
+
+    def mimeData(self, indexes: list[QModelIndex]) -> QMimeData:  # type: ignore[override]
+        mime = QMimeData()
+        for index in indexes:
+            node = self.node(index)
+            if node is not None:
+                mime.setData(self.MIME_TYPE, node.id.encode("utf-8"))
+                break
+        return mime
+
+    def canDropMimeData(
+        self,
+        data: QMimeData,
+        action: Qt.DropAction,
+        row: int,
+        column: int,
+        parent: _ModelIndex,
+    ) -> bool:
+        if not data.hasFormat(self.MIME_TYPE):
+            return False
+        node_id = bytes(data.data(self.MIME_TYPE).data()).decode("utf-8")
+        return self._index.can_move(node_id, self._node_id(parent))
+
+    def dropMimeData(
+        self,
+        data: QMimeData,
+        action: Qt.DropAction,
+        row: int,
+        column: int,
+        parent: _ModelIndex,
+    ) -> bool:
+        if not self.canDropMimeData(data, action, row, column, parent):
+            return False
+        parent_id = self._node_id(parent)
+        assert parent_id is not None
+        node_id = bytes(data.data(self.MIME_TYPE).data()).decode("utf-8")
+        return self.move_node(node_id, parent_id, row if 0 <= row else None)
+
+    def _ensure_loaded(self, parent_id: str | None, count: int) -> None:
+        total = len(self._index.children_of(parent_id))
+        loaded = self._loaded_count(parent_id)
+        target = min(total, count)
+        if target <= loaded:
+            return
+        self.beginInsertRows(self._parent_index(parent_id), loaded, target - 1)
+        self._loaded[parent_id] = target
+        self.endInsertRows()
+
+    def _loaded_count(self, parent_id: str | None) -> int:
+        if parent_id is None:
+            # Collections are few; show them all up front.
+            return len(self._index.roots())
+        return self._loaded.get(parent_id, 0)
+
+    def _existing_index(self, node_id: str) -> QModelIndex:
+        node = self._index.node(node_id)
+        if node is None:
+            return QModelIndex()
+        row = self._index.row_of(node_id)
+        if row < 0 or self._loaded_count(node.parent_id) <= row:
+            return QModelIndex()
+        return self.createIndex(row, 0, node)
+
+    def _parent_index(self, parent_id: str | None) -> QModelIndex:
+        if parent_id is None:
+            return QModelIndex()
+        return self._existing_index(parent_id)
+
+    def _node_id(self, index: _ModelIndex) -> str | None:
+        node = self.node(index)
+        return None if node is None else node.id
+
+
+class CollectionFilterProxyModel(QSortFilterProxyModel):
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._visible_ids: set[str] | None = None
+
+    def set_visible_ids(self, visible_ids: set[str] | None) -> None:
+        if _HAS_FILTER_CHANGE:
+            self.beginFilterChange()
+        self._visible_ids = visible_ids
+        if _HAS_FILTER_CHANGE:
+            self.endFilterChange(QSortFilterProxyModel.Direction.Rows)
+        else:
+            self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: _ModelIndex) -> bool:
+        if self._visible_ids is None:
+            return True
+        model = self.sourceModel()
+        if not isinstance(model, CollectionTreeModel):
+            return True
+        node = model.node(model.index(source_row, 0, source_parent))
+        return node is not None and node.id in self._visible_ids
 
 
 class CollectionTreePanel(QWidget):
     request_selected = Signal(str)
-
-    _ID_ROLE = int(Qt.ItemDataRole.UserRole) + 1
-    _TYPE_ROLE = int(Qt.ItemDataRole.UserRole) + 2
-    _TYPE_COLLECTION = "collection"
-    _TYPE_FOLDER = "folder"
-    _TYPE_REQUEST = "request"
+    request_renamed = Signal(str, str)
+    request_moved = Signal(str, str)
 
     def __init__(self) -> None:
         super().__init__()
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
 
-        self._tree = QTreeWidget()
-        self._tree.setHeaderLabel("Collections")
-        self._tree.itemSelectionChanged.connect(self._on_selection_changed)
+        self._filter_edit = QLineEdit()
+        self._filter_edit.setPlaceholderText("Filter by name or URL")
+        self._filter_edit.setClearButtonEnabled(True)
+        layout.addWidget(self._filter_edit)
+
+        self._model = CollectionTreeModel(self)
+        self._proxy = CollectionFilterProxyModel(self)
+        self._proxy.setSourceModel(self._model)
+
+        self._tree = QTreeView()
+        self._tree.setModel(self._proxy)
+        self._tree.setUniformRowHeights(True)
+        self._tree.setEditTriggers(
+            QAbstractItemView.EditTrigger.EditKeyPressed
+            | QAbstractItemView.EditTrigger.SelectedClicked
+        )
+        self._tree.setDragDropMode(QAbstractItemView.DragDropMode.InternalMove)
+        self._tree.setDefaultDropAction(Qt.DropAction.MoveAction)
+        self._tree.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self._tree.customContextMenuRequested.connect(self._on_context_menu)
+        self._tree.selectionModel().currentChanged.connect(self._on_current_changed)
         layout.addWidget(self._tree)
 
-        self._collection_id_counter = 1
-        self._folder_id_counter = 1
-        self._request_id_counter = 1
-        self._items_by_id: dict[str, QTreeWidgetItem] = {}
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(FILTER_DEBOUNCE_MS)
+        self._filter_timer.timeout.connect(self._apply_filter)
+        self._filter_edit.textChanged.connect(self._filter_timer.start)
 
-        self._populate_dummy_data()
+        self._model.node_renamed.connect(self._on_node_renamed)
+        self._model.node_moved.connect(self._on_node_moved)
+
+        # The quick-open index is built in batches on the event loop so a
+        # large workspace does not block the first paint.
+        self._quick_open_index = FuzzyIndex()
+        self._quick_open_pending: list[str] = []
+        self._quick_open_timer = QTimer(self)
+        self._quick_open_timer.setInterval(0)
+        self._quick_open_timer.timeout.connect(self._index_quick_open_batch)
+
+    @property
+    def quick_open_index(self) -> FuzzyIndex:
+        return self._quick_open_index
+
+    def quick_open_pending(self) -> int:
+        return len(self._quick_open_pending)
 
     def build_workspace_collections(self) -> tuple[list[WorkspaceCollection], list[WorkspaceFolder]]:
-        collections: list[WorkspaceCollection] = []
-        folders: list[WorkspaceFolder] = []
-        for index in range(self._tree.topLevelItemCount()):
-            item = self._tree.topLevelItem(index)
-            if item is None:
-                continue
-            collection_id = self._ensure_item_id(item, self._TYPE_COLLECTION)
-            collections.append(
-                WorkspaceCollection(
-                    id=collection_id,
-                    name=item.text(0),
-                )
-            )
-            self._collect_folders(item, collection_id, None, folders)
-        return collections, folders
+        return self._model.workspace_index.build_collections()
 
     def load_workspace_tree(
         self,
@@ -53,178 +428,163 @@ class CollectionTreePanel(QWidget):
         folders: list[WorkspaceFolder],
         requests: list[WorkspaceRequest],
     ) -> None:
-        self._tree.clear()
-        self._reset_counters()
-
-        collection_items: dict[str, QTreeWidgetItem] = {}
-        for collection in collections:
-            item = self._create_item(collection.name, self._TYPE_COLLECTION, collection.id)
-            self._tree.addTopLevelItem(item)
-            collection_items[collection.id] = item
-
-        if 0 == len(collection_items):
-            fallback = WorkspaceCollection(id="col-1", name="Default")
-            item = self._create_item(fallback.name, self._TYPE_COLLECTION, fallback.id)
-            self._tree.addTopLevelItem(item)
-            collection_items[fallback.id] = item
-
-        folder_items: dict[str, QTreeWidgetItem] = {}
-        ordered_folders = sorted(folders, key=lambda item: (item.collection_id, item.order))
-        for folder in ordered_folders:
-            parent_item = None
-            if folder.parent_id is not None:
-                parent_item = folder_items.get(folder.parent_id)
-            if parent_item is None:
-                parent_item = collection_items.get(folder.collection_id)
-            if parent_item is None:
-                parent_item = next(iter(collection_items.values()))
-
-            folder_item = self._create_item(folder.name, self._TYPE_FOLDER, folder.id)
-            parent_item.addChild(folder_item)
-            folder_items[folder.id] = folder_item
-
-        for request in requests:
-            parent_item = folder_items.get(request.folder_id)
-            if parent_item is None:
-                continue
-            request_item = self._create_item(request.name, self._TYPE_REQUEST, request.id)
-            parent_item.addChild(request_item)
+        if 0 == len(collections):
+            collections = [WorkspaceCollection(id="col-1", name="Default")]
+        self._set_index(WorkspaceIndex(collections, folders, requests))
 
-        self._tree.expandAll()
+    def load_workspace_index(self, index: WorkspaceIndex) -> None:
+        """Show a prebuilt index, e.g. one restored from a snapshot."""
+        self._set_index(index)
 
-    def _on_selection_changed(self) -> None:
-        items = self._tree.selectedItems()
-        if not items:
-            return
-        
-        item = items[0]
-        item_type = self._item_type(item)
-        if item_type == self._TYPE_REQUEST:
-            request_id = item.data(0, self._ID_ROLE)
-            if request_id:
-                self.request_selected.emit(request_id)
-
-    def _populate_dummy_data(self) -> None:
-        self._reset_counters()
-        sample_collection = self._create_item("Sample API", self._TYPE_COLLECTION, "col-1")
-        users_folder = self._create_item("Users", self._TYPE_FOLDER, "folder-1")
-        users_folder.addChild(self._create_item("List Users", self._TYPE_REQUEST, "req-1"))
-        users_folder.addChild(self._create_item("Create User", self._TYPE_REQUEST, "req-2"))
-        sample_collection.addChild(users_folder)
-
-        auth_folder = self._create_item("Auth", self._TYPE_FOLDER, "folder-2")
-        auth_folder.addChild(self._create_item("Login", self._TYPE_REQUEST, "req-3"))
-        auth_folder.addChild(self._create_item("Refresh Token", self._TYPE_REQUEST, "req-4"))
-        sample_collection.addChild(auth_folder)
-
-        self._tree.addTopLevelItem(sample_collection)
-
-        sandbox_collection = self._create_item("Sandbox", self._TYPE_COLLECTION, "col-2")
-        sandbox_collection.addChild(self._create_item("Health Check", self._TYPE_REQUEST, "req-5"))
-        self._tree.addTopLevelItem(sandbox_collection)
-
-        self._tree.expandAll()
+    def set_loading(self, loading: bool) -> None:
+        """Show a placeholder while the workspace is read in the background."""
+        self._filter_edit.setEnabled(not loading)
+        self._filter_edit.setPlaceholderText(
+            "Loading workspace..." if loading else "Filter by name or URL"
+        )
 
     def select_request_item(self, request_id: str) -> None:
-        item = self._items_by_id.get(request_id)
-        if item is None:
+        source_index = self._model.index_for_id(request_id)
+        if not source_index.isValid():
             return
-
-        current_items = self._tree.selectedItems()
-        if current_items and current_items[0] is item:
+        index = self._proxy.mapFromSource(source_index)
+        if not index.isValid() or self._tree.currentIndex() == index:
             return
-
-        self._tree.setCurrentItem(item)
-        self._tree.scrollToItem(item)
-
-    def _collect_folders(
-        self,
-        parent_item: QTreeWidgetItem,
-        collection_id: str,
-        parent_folder_id: str | None,
-        folders: list[WorkspaceFolder],
-    ) -> None:
-        for index in range(parent_item.childCount()):
-            child = parent_item.child(index)
-            if child is None:
-                continue
-            if self._item_type(child) == self._TYPE_REQUEST:
+        self._tree.setCurrentIndex(index)
+        self._tree.scrollTo(index)
+
+    def add_folder(self, name: str, parent_id: str) -> str:
+        return self._model.add_node(KIND_FOLDER, name, parent_id).id
+
+    def add_request_item(self, request: WorkspaceRequest) -> None:
+        self._model.add_node(
+            KIND_REQUEST,
+            request.name,
+            request.folder_id,
+            node_id=request.id,
+            method=request.method,
+            url=request.url,
+        )
+        self._reindex_quick_open([request.id])
+
+    def rename_item(self, node_id: str, name: str) -> None:
+        self._model.rename_node(node_id, name)
+
+    def update_request_item(self, request: WorkspaceRequest) -> None:
+        self._model.update_request(request.id, request.name, request.method, request.url)
+        self._reindex_quick_open([request.id])
+
+    def move_item(self, node_id: str, parent_id: str, row: int | None = None) -> bool:
+        return self._model.move_node(node_id, parent_id, row)
+
+    def _set_index(self, index: WorkspaceIndex) -> None:
+        self._model.set_workspace_index(index)
+        self._apply_filter()
+        self._quick_open_index.clear()
+        self._quick_open_pending = index.request_ids()
+        self._quick_open_pending.reverse()
+        self._quick_open_timer.start()
+
+    def _reindex_quick_open(self, node_ids: list[str]) -> None:
+        if len(node_ids) <= QUICK_OPEN_BATCH:
+            self._index_quick_open(node_ids)
+            return
+        self._quick_open_pending.extend(node_ids)
+        self._quick_open_timer.start()
+
+    def _index_quick_open_batch(self) -> None:
+        pending = self._quick_open_pending
+        batch = pending[-QUICK_OPEN_BATCH:]
+        del pending[-QUICK_OPEN_BATCH:]
+        self._index_quick_open(batch)
+        if 0 == len(pending):
+            self._quick_open_timer.stop()
+
+    def _index_quick_open(self, node_ids: list[str]) -> None:
+        # Entries are read from the workspace index at indexing time, so ids
+        # queued before an edit still pick up the latest name and path.
+        workspace_index = self._model.workspace_index
+        for node_id in node_ids:
+            node = workspace_index.node(node_id)
+            if node is None or node.kind != KIND_REQUEST:
+                self._quick_open_index.remove(node_id)
                 continue
-            folder_id = self._ensure_item_id(child, self._TYPE_FOLDER)
-            folders.append(
-                WorkspaceFolder(
-                    id=folder_id,
-                    collection_id=collection_id,
-                    parent_id=parent_folder_id,
-                    name=child.text(0),
-                    order=index,
-                )
+            path = " / ".join(
+                ancestor.name
+                for ancestor in map(workspace_index.node, workspace_index.ancestors(node_id))
+                if ancestor is not None
             )
-            self._collect_folders(child, collection_id, folder_id, folders)
-
-    def _create_item(self, name: str, item_type: str, item_id: str | None = None) -> QTreeWidgetItem:
-        resolved_id = item_id or self._next_id(item_type)
-        item = QTreeWidgetItem([name])
-        item.setData(0, self._ID_ROLE, resolved_id)
-        item.setData(0, self._TYPE_ROLE, item_type)
-        self._items_by_id[resolved_id] = item
-        if item_id is not None:
-            self._track_counter(item_type, resolved_id)
-        return item
-
-    def _ensure_item_id(self, item: QTreeWidgetItem, item_type: str) -> str:
-        item_id = item.data(0, self._ID_ROLE)
-        if isinstance(item_id, str) and 0 < len(item_id):
-            return item_id
-        resolved_id = self._next_id(item_type)
-        item.setData(0, self._ID_ROLE, resolved_id)
-        item.setData(0, self._TYPE_ROLE, item_type)
-        return resolved_id
-
-    def _item_type(self, item: QTreeWidgetItem) -> str:
-        value = item.data(0, self._TYPE_ROLE)
-        if isinstance(value, str):
-            return value
-        if 0 < item.childCount():
-            return self._TYPE_FOLDER
-        return self._TYPE_REQUEST
-
-    def _next_id(self, item_type: str) -> str:
-        if item_type == self._TYPE_COLLECTION:
-            current = self._collection_id_counter
-            self._collection_id_counter += 1
-            return f"col-{current}"
-        if item_type == self._TYPE_FOLDER:
-            current = self._folder_id_counter
-            self._folder_id_counter += 1
-            return f"folder-{current}"
-        current = self._request_id_counter
-        self._request_id_counter += 1
-        return f"req-{current}"
-
-    def _reset_counters(self) -> None:
-        self._collection_id_counter = 1
-        self._folder_id_counter = 1
-        self._request_id_counter = 1
-        self._items_by_id.clear()
-
-    def _track_counter(self, item_type: str, item_id: str) -> None:
-        if item_type == self._TYPE_COLLECTION:
-            prefix = "col-"
-            counter_name = "_collection_id_counter"
-        elif item_type == self._TYPE_FOLDER:
-            prefix = "folder-"
-            counter_name = "_folder_id_counter"
-        else:
-            prefix = "req-"
-            counter_name = "_request_id_counter"
+            self._quick_open_index.add(
+                FuzzyEntry(key=node.id, name=node.name, method=node.method, url=node.url, path=path)
+            )
+
+    def _reindex_subtree(self, node_id: str) -> None:
+        self._reindex_quick_open(list(self._model.workspace_index.subtree_ids(node_id)))
 
-        if not item_id.startswith(prefix):
+    def _apply_filter(self) -> None:
+        visible = self._model.workspace_index.search(self._filter_edit.text())
+        if visible is not None:
+            self._model.ensure_visible_loaded(visible)
+        self._proxy.set_visible_ids(visible)
+        if visible is not None and len(visible) <= FILTER_EXPAND_LIMIT:
+            self._tree.expandAll()
+        else:
+            self._tree.expandToDepth(0)
+
+    def _on_current_changed(self, current: QModelIndex, _previous: QModelIndex) -> None:
+        node = self._model.node(self._proxy.mapToSource(current))
+        if node is not None and node.kind == KIND_REQUEST:
+            self.request_selected.emit(node.id)
+
+    def _on_node_renamed(self, node_id: str, name: str) -> None:
+        self._reindex_subtree(node_id)
+        node = self._model.workspace_index.node(node_id)
+        if node is not None and node.kind == KIND_REQUEST:
+            self.request_renamed.emit(node_id, name)
+
+    def _on_node_moved(self, node_id: str, parent_id: str) -> None:
+        self._reindex_subtree(node_id)
+        node = self._model.workspace_index.node(node_id)
+        if node is not None and node.kind == KIND_REQUEST:
+            self.request_moved.emit(node_id, parent_id)
+
+    def _on_context_menu(self, pos: QPoint) -> None:
+        proxy_index = self._tree.indexAt(pos)
+        node = self._model.node(self._proxy.mapToSource(proxy_index))
+        menu = QMenu(self)
+        new_collection_action = menu.addAction("New Collection")
+        new_folder_action = None
+        rename_action = None
+        if node is not None:
+            if node.kind != KIND_REQUEST:
+                new_folder_action = menu.addAction("New Folder")
+            rename_action = menu.addAction("Rename")
+
+        chosen = menu.exec(self._tree.viewport().mapToGlobal(pos))
+        if chosen is None:
             return
-        suffix = item_id[len(prefix) :]
-        if not suffix.isdigit():
+        if chosen is new_collection_action:
+            created = self._model.add_node(KIND_COLLECTION, "New Collection", None)
+            self._edit_node(created.id)
+        elif chosen is new_folder_action and node is not None:
+            created = self._model.add_node(KIND_FOLDER, "New Folder", node.id)
+            self._tree.expand(proxy_index)
+            self._edit_node(created.id)
+        elif chosen is rename_action:
+            self._tree.edit(proxy_index)
+
+    def _edit_node(self, node_id: str) -> None:
+        visible = self._model.workspace_index.search(self._filter_edit.text())
+        if visible is not None:
+            # Keep freshly created items visible while a filter is active.
+            visible.add(node_id)
+            visible.update(self._model.workspace_index.ancestors(node_id))
+            self._proxy.set_visible_ids(visible)
+        index = self._proxy.mapFromSource(self._model.index_for_id(node_id))
+        if not index.isValid():
             return
-        value = int(suffix) + 1
-        current = getattr(self, counter_name)
-        if current < value:
-            setattr(self, counter_name, value)
+        self._tree.selectionModel().setCurrentIndex(
+            index, QItemSelectionModel.SelectionFlag.ClearAndSelect
+        )
+        self._tree.scrollTo(index)
+        self._tree.edit(index)
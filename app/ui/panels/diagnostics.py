@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtGui import QFont, QGuiApplication
+from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QDialog,
+    QHBoxLayout,
+    QLabel,
+    QPlainTextEdit,
+    QPushButton,
+    QSplitter,
+    QTableWidget,
+    QTableWidgetItem,
+    QVBoxLayout,
+)
+
+from core.stall import StallStats, StallWatchdog, format_report
+
+REFRESH_INTERVAL_MS = 1000
+
+
+class _NumericItem(QTableWidgetItem):
+    def __init__(self, value: float, text: str) -> None:
+        super().__init__(text)
+        self._value = value
+        self.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+
+    def __lt__(self, other: QTableWidgetItem) -> bool:
+        if isinstance(other, _NumericItem):
+            return self._value < other._value
+        return super().__lt__(other)
+
+
+class DiagnosticsDialog(QDialog):
+    """Aggregated UI stall statistics from the ``StallWatchdog``.
+
+    Modeless; while visible it refreshes itself once a second. Selecting a
+    hot spot or a recent stall shows the UI thread's stack at that moment.
+    """
+
+    _STACK_ROLE = int(Qt.ItemDataRole.UserRole) + 1
+
+    def __init__(self, watchdog: StallWatchdog | None, parent=None) -> None:
+        super().__init__(parent)
+        self.setWindowTitle("Diagnostics")
+        self.setModal(False)
+        self.resize(960, 640)
+
+        self._watchdog = watchdog
+
+        layout = QVBoxLayout(self)
+        self._summary_label = QLabel()
+        self._summary_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+        layout.addWidget(self._summary_label)
+
+        self._hot_spot_table = self._make_table(["Location", "Stalls", "Total (ms)", "Longest (ms)"])
+        self._recent_table = self._make_table(["Time", "Duration (ms)", "Location"])
+        self._stack_view = QPlainTextEdit()
+        self._stack_view.setReadOnly(True)
+        self._stack_view.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+        self._stack_view.setFont(QFont("Monospace"))
+        self._stack_view.setPlaceholderText("항목을 선택하면 UI 스레드의 스택이 표시됩니다.")
+
+        tables = QSplitter(Qt.Orientation.Horizontal)
+        tables.addWidget(self._hot_spot_table)
+        tables.addWidget(self._recent_table)
+        splitter = QSplitter(Qt.Orientation.Vertical)
+        splitter.addWidget(tables)
+        splitter.addWidget(self._stack_view)
+        splitter.setSizes([320, 280])
+        layout.addWidget(splitter, 1)
+
+        buttons = QHBoxLayout()
+        self._refresh_button = QPushButton("Refresh")
+        self._reset_button = QPushButton("Reset")
+        self._copy_button = QPushButton("Copy Report")
+        close_button = QPushButton("Close")
+        buttons.addWidget(self._refresh_button)
+        buttons.addWidget(self._reset_button)
+        buttons.addWidget(self._copy_button)
+        buttons.addStretch()
+        buttons.addWidget(close_button)
+        layout.addLayout(buttons)
+
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setInterval(REFRESH_INTERVAL_MS)
+        self._refresh_timer.timeout.connect(self.refresh)
+
+        self._refresh_button.clicked.connect(self.refresh)
+        self._reset_button.clicked.connect(self._on_reset)
+        self._copy_button.clicked.connect(self._on_copy)
+        close_button.clicked.connect(self.close)
+        self._hot_spot_table.itemSelectionChanged.connect(lambda: self._show_stack(self._hot_spot_table))
+        self._recent_table.itemSelectionChanged.connect(lambda: self._show_stack(self._recent_table))
+
+        self.refresh()
+
+    def set_watchdog(self, watchdog: StallWatchdog | None) -> None:
+        self._watchdog = watchdog
+        self.refresh()
+
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        self._refresh_timer.start()
+        self.refresh()
+
+    def hideEvent(self, event) -> None:
+        self._refresh_timer.stop()
+        super().hideEvent(event)
+
+    def refresh(self) -> None:
+        watchdog = self._watchdog
+        enabled = watchdog is not None
+        self._reset_button.setEnabled(enabled)
+        self._copy_button.setEnabled(enabled)
+        if watchdog is None:
+            self._summary_label.setText("UI 멈춤 감시가 꺼져 있습니다. (설정: stall_threshold_ms)")
+            self._hot_spot_table.setRowCount(0)
+            self._recent_table.setRowCount(0)
+            return
+        stats = watchdog.stats()
+        self._summary_label.setText(self._summary_text(stats, watchdog.threshold_ms))
+        self._fill_hot_spots(stats)
+        self._fill_recent(stats)
+
+    @staticmethod
+    def _summary_text(stats: StallStats, threshold_ms: float) -> str:
+        latency = stats.latency_percentiles()
+        latency_text = " / ".join("-" if value is None else f"{value:.1f}" for value in latency.values())
+        return (
+            f"Threshold {threshold_ms:.0f} ms · Stalls {stats.stall_count} · "
+            f"Blocked {stats.stall_total_ms:.0f} ms total, longest {stats.stall_max_ms:.0f} ms · "
+            f"Event-loop latency p50/p95/p99 {latency_text} ms ({len(stats.latencies_ms)} beats)"
+        )
+
+    def _fill_hot_spots(self, stats: StallStats) -> None:
+        table = self._hot_spot_table
+        selected = self._selected_text(table)
+        table.setSortingEnabled(False)
+        table.setRowCount(0)
+        for spot in stats.top_hot_spots():
+            row = table.rowCount()
+            table.insertRow(row)
+            location = QTableWidgetItem(spot.location)
+            location.setData(self._STACK_ROLE, "".join(spot.stack))
+            table.setItem(row, 0, location)
+            table.setItem(row, 1, _NumericItem(spot.count, str(spot.count)))
+            table.setItem(row, 2, _NumericItem(spot.total_ms, f"{spot.total_ms:.0f}"))
+            table.setItem(row, 3, _NumericItem(spot.max_ms, f"{spot.max_ms:.0f}"))
+        table.setSortingEnabled(True)
+        self._restore_selection(table, selected)
+
+    def _fill_recent(self, stats: StallStats) -> None:
+        table = self._recent_table
+        selected = self._selected_text(table)
+        table.setSortingEnabled(False)
+        table.setRowCount(0)
+        for record in reversed(stats.recent):
+            row = table.rowCount()
+            table.insertRow(row)
+            started = QTableWidgetItem(record.started_at.strftime("%H:%M:%S.%f")[:-3])
+            started.setData(self._STACK_ROLE, "".join(record.stack))
+            table.setItem(row, 0, started)
+            table.setItem(row, 1, _NumericItem(record.duration_ms, f"{record.duration_ms:.0f}"))
+            table.setItem(row, 2, QTableWidgetItem(record.location))
+        table.setSortingEnabled(True)
+        self._restore_selection(table, selected)
+
+    def _show_stack(self, table: QTableWidget) -> None:
+        rows = table.selectionModel().selectedRows()
+        if not rows:
+            return
+        item = table.item(rows[0].row(), 0)
+        self._stack_view.setPlainText(item.data(self._STACK_ROLE) or "")
+
+    def _on_reset(self) -> None:
+        if self._watchdog is not None:
+            self._watchdog.reset()
+        self._stack_view.clear()
+        self.refresh()
+
+    def _on_copy(self) -> None:
+        if self._watchdog is None:
+            return
+        QGuiApplication.clipboard().setText(format_report(self._watchdog.stats(), self._watchdog.threshold_ms))
+
+    @staticmethod
+    def _make_table(headers: list[str]) -> QTableWidget:
+        table = QTableWidget(0, len(headers))
+        table.setHorizontalHeaderLabels(headers)
+        table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        table.verticalHeader().setVisible(False)
+        table.horizontalHeader().setStretchLastSection(True)
+        return table
+
+    @staticmethod
+    def _selected_text(table: QTableWidget) -> str | None:
+        rows = table.selectionModel().selectedRows()
+        if not rows:
+            return None
+        return table.item(rows[0].row(), 0).text()
+
+    @staticmethod
+    def _restore_selection(table: QTableWidget, text: str | None) -> None:
+        if text is None:
+            return
+        for row in range(table.rowCount()):
+            if table.item(row, 0).text() == text:
+                # Re-selecting would replace the stack the user is reading with the same text.
+                table.blockSignals(True)
+                table.selectRow(row)
+                table.blockSignals(False)
+                return
@@ -1,115 +1,151 @@
 from __future__ import annotations
 
 import datetime
+from typing import Any
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import (
+    QAbstractTableModel,
+    QModelIndex,
+    QPersistentModelIndex,
+    QSortFilterProxyModel,
+    Qt,
+    Signal,
+)
 from PySide6.QtGui import QBrush, QColor
 from PySide6.QtWidgets import (
     QAbstractItemView,
     QComboBox,
     QHBoxLayout,
+    QHeaderView,
     QLabel,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
 
 from core.model import HistoryEntry
 
+_ModelIndex = QModelIndex | QPersistentModelIndex
+# beginFilterChange()/endFilterChange() replace invalidateRowsFilter() from Qt 6.9.
+_HAS_FILTER_CHANGE = hasattr(QSortFilterProxyModel, "beginFilterChange")
 
-class HistoryPanel(QWidget):
-    entry_selected = Signal(HistoryEntry)
+_SUCCESS_BRUSH = QBrush(QColor("#0f5132"))
+_FAILURE_BRUSH = QBrush(QColor("#b02a37"))
 
-    def __init__(self) -> None:
-        super().__init__()
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
 
-        header_row = QHBoxLayout()
-        header_label = QLabel("History")
-        self._filter_combo = QComboBox()
-        self._filter_combo.addItems(["All", "Success", "Failure"])
-        self._filter_combo.currentIndexChanged.connect(self._render_entries)
+class HistoryTableModel(QAbstractTableModel):
+    """Newest-first table over history entries.
 
-        header_row.addWidget(header_label)
-        header_row.addStretch()
-        header_row.addWidget(QLabel("Filter"))
-        header_row.addWidget(self._filter_combo)
-        layout.addLayout(header_row)
-
-        self._table = QTableWidget()
-        self._table.setColumnCount(6)
-        self._table.setHorizontalHeaderLabels(
-            ["Time", "Name", "Method", "URL", "Status", "Elapsed"]
-        )
-        self._table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
-        self._table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
-        self._table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
-        self._table.setAlternatingRowColors(True)
-        self._table.verticalHeader().setVisible(False)
-        self._table.horizontalHeader().setStretchLastSection(True)
-        self._table.itemSelectionChanged.connect(self._emit_selection)
+    Entries are stored oldest-first so appending a new one is O(1); row ``r``
+    maps to ``entries[-1 - r]``. Rows are exposed in pages through
+    ``fetchMore`` so the view only ever asks for what it scrolls into.
+    """
 
-        layout.addWidget(self._table)
+    HEADERS = ["Time", "Name", "Method", "URL", "Status", "Elapsed"]
+    FETCH_BATCH = 500
 
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
         self._entries: list[HistoryEntry] = []
+        self._loaded = 0
 
     def set_entries(self, entries: list[HistoryEntry]) -> None:
-        self._entries = list(reversed(entries))
-        self._render_entries()
+        self.beginResetModel()
+        self._entries = list(entries)
+        self._loaded = min(self.FETCH_BATCH, len(self._entries))
+        self.endResetModel()
 
     def add_entry(self, entry: HistoryEntry) -> None:
-        self._entries.insert(0, entry)
-        self._render_entries()
-
-    def _render_entries(self) -> None:
-        filtered_entries = self._filtered_entries()
-        self._table.setRowCount(len(filtered_entries))
-
-        for row, entry in enumerate(filtered_entries):
-            time_text = self._format_timestamp(entry.timestamp)
-            status_text = self._format_status(entry)
-            elapsed_text = f"{entry.elapsed_ms} ms" if entry.elapsed_ms is not None else ""
-
-            row_values = [
-                time_text,
-                entry.name,
-                entry.method,
-                entry.url,
-                status_text,
-                elapsed_text,
-            ]
-            for column, value in enumerate(row_values):
-                item = QTableWidgetItem(value)
-                if 0 == column:
-                    item.setData(Qt.ItemDataRole.UserRole, entry)
-                if column == 4:
-                    self._apply_status_style(item, entry)
-                if column == 3:
-                    item.setToolTip(entry.url)
-                self._table.setItem(row, column, item)
+        self.beginInsertRows(QModelIndex(), 0, 0)
+        self._entries.append(entry)
+        self._loaded += 1
+        self.endInsertRows()
 
-        self._table.resizeColumnsToContents()
+    def entry_at(self, row: int) -> HistoryEntry | None:
+        if row < 0 or row >= self._loaded:
+            return None
+        return self._entries[len(self._entries) - 1 - row]
+
+    def total_count(self) -> int:
+        return len(self._entries)
+
+    def entries(self) -> list[HistoryEntry]:
+        """All entries, newest first, regardless of how many rows are fetched."""
+        return self._entries[::-1]
+
+    def rowCount(self, parent: _ModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return self._loaded
 
-    def _filtered_entries(self) -> list[HistoryEntry]:
-        filter_value = self._filter_combo.currentText()
-        if filter_value == "Success":
-            return [entry for entry in self._entries if entry.error is None]
-        if filter_value == "Failure":
-            return [entry for entry in self._entries if entry.error]
-        return list(self._entries)
-
-    def _emit_selection(self) -> None:
-        row = self._table.currentRow()
-        if row < 0:
+    def columnCount(self, parent: _ModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self.HEADERS)
+
+    def canFetchMore(self, parent: _ModelIndex) -> bool:
+        if parent.isValid():
+            return False
+        return self._loaded < len(self._entries)
+
+    def fetchMore(self, parent: _ModelIndex) -> None:
+        if parent.isValid():
             return
-        item = self._table.item(row, 0)
-        if item is None:
+        remaining = len(self._entries) - self._loaded
+        if 0 >= remaining:
             return
-        entry = item.data(Qt.ItemDataRole.UserRole)
-        if isinstance(entry, HistoryEntry):
-            self.entry_selected.emit(entry)
+        count = min(self.FETCH_BATCH, remaining)
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> Any:
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index: _ModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        entry = self.entry_at(index.row())
+        if entry is None:
+            return None
+
+        column = index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._display_text(entry, column)
+        if role == Qt.ItemDataRole.UserRole:
+            return entry
+        if role == Qt.ItemDataRole.ToolTipRole:
+            if column == 3:
+                return entry.url
+            if column == 4 and entry.error:
+                return entry.error
+            return None
+        if role == Qt.ItemDataRole.ForegroundRole and column == 4:
+            return self._status_brush(entry)
+        return None
+
+    @classmethod
+    def _display_text(cls, entry: HistoryEntry, column: int) -> str:
+        if column == 0:
+            return cls._format_timestamp(entry.timestamp)
+        if column == 1:
+            return entry.name
+        if column == 2:
+            return entry.method
+        if column == 3:
+            return entry.url
+        if column == 4:
+            return cls._format_status(entry)
+        if entry.elapsed_ms is not None:
+            return f"{entry.elapsed_ms} ms"
+        return ""
 
     @staticmethod
     def _format_timestamp(timestamp: str) -> str:
@@ -128,14 +164,116 @@ class HistoryPanel(QWidget):
         return "-"
 
     @staticmethod
-    def _apply_status_style(item: QTableWidgetItem, entry: HistoryEntry) -> None:
+    def _status_brush(entry: HistoryEntry) -> QBrush | None:
         if entry.error:
-            item.setForeground(QBrush(QColor("#b02a37")))
-            item.setToolTip(entry.error)
-            return
+            return _FAILURE_BRUSH
         if entry.status_code is None:
-            return
+            return None
         if 200 <= entry.status_code < 400:
-            item.setForeground(QBrush(QColor("#0f5132")))
-        elif 400 <= entry.status_code:
-            item.setForeground(QBrush(QColor("#b02a37")))
+            return _SUCCESS_BRUSH
+        if 400 <= entry.status_code:
+            return _FAILURE_BRUSH
+        return None
+
+
+class HistoryFilterProxyModel(QSortFilterProxyModel):
+    FILTER_ALL = "All"
+    FILTER_SUCCESS = "Success"
+    FILTER_FAILURE = "Failure"
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._mode = self.FILTER_ALL
+
+    def set_mode(self, mode: str) -> None:
+        if mode == self._mode:
+            return
+        if _HAS_FILTER_CHANGE:
+            self.beginFilterChange()
+        self._mode = mode
+        if _HAS_FILTER_CHANGE:
+            self.endFilterChange(QSortFilterProxyModel.Direction.Rows)
+        else:
+            self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: _ModelIndex) -> bool:
+        if self._mode == self.FILTER_ALL:
+            return True
+        model = self.sourceModel()
+        if not isinstance(model, HistoryTableModel):
+            return True
+        entry = model.entry_at(source_row)
+        if entry is None:
+            return False
+        if self._mode == self.FILTER_SUCCESS:
+            return entry.error is None
+        return bool(entry.error)
+
+
+class HistoryPanel(QWidget):
+    entry_selected = Signal(HistoryEntry)
+
+    def __init__(self) -> None:
+        super().__init__()
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        header_row = QHBoxLayout()
+        self._header_label = QLabel("History")
+        self._filter_combo = QComboBox()
+        self._filter_combo.addItems(
+            [
+                HistoryFilterProxyModel.FILTER_ALL,
+                HistoryFilterProxyModel.FILTER_SUCCESS,
+                HistoryFilterProxyModel.FILTER_FAILURE,
+            ]
+        )
+        self._filter_combo.currentTextChanged.connect(self._on_filter_changed)
+
+        header_row.addWidget(self._header_label)
+        header_row.addStretch()
+        header_row.addWidget(QLabel("Filter"))
+        header_row.addWidget(self._filter_combo)
+        layout.addLayout(header_row)
+
+        self._model = HistoryTableModel(self)
+        self._proxy = HistoryFilterProxyModel(self)
+        self._proxy.setSourceModel(self._model)
+
+        self._table = QTableView()
+        self._table.setModel(self._proxy)
+        self._table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self._table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self._table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self._table.setAlternatingRowColors(True)
+        self._table.setWordWrap(False)
+        self._table.verticalHeader().setVisible(False)
+        self._table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self._table.horizontalHeader().setStretchLastSection(True)
+        self._table.selectionModel().currentRowChanged.connect(self._emit_selection)
+
+        layout.addWidget(self._table)
+
+    def set_entries(self, entries: list[HistoryEntry]) -> None:
+        self._model.set_entries(entries)
+        self._table.resizeColumnsToContents()
+
+    def add_entry(self, entry: HistoryEntry) -> None:
+        self._model.add_entry(entry)
+
+    def set_loading(self, loading: bool) -> None:
+        self._header_label.setText("History (loading...)" if loading else "History")
+
+    def entries(self) -> list[HistoryEntry]:
+        return self._model.entries()
+
+    def _on_filter_changed(self, mode: str) -> None:
+        self._proxy.set_mode(mode)
+
+    def _emit_selection(self, current: QModelIndex, _previous: QModelIndex) -> None:
+        if not current.isValid():
+            return
+        source_index = self._proxy.mapToSource(current)
+        entry = self._model.entry_at(source_index.row())
+        if isinstance(entry, HistoryEntry):
+            self.entry_selected.emit(entry)
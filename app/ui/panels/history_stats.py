@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import datetime
+from pathlib import Path
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QComboBox,
+    QDialog,
+    QHBoxLayout,
+    QLabel,
+    QSplitter,
+    QTableWidget,
+    QTableWidgetItem,
+    QVBoxLayout,
+)
+
+from core.analytics import (
+    EndpointStats,
+    HistoryColumns,
+    compute_endpoint_stats,
+    compute_trend,
+)
+from workers.history_stats_worker import HistoryColumnsWorker
+
+RANGE_OPTIONS: list[tuple[str, int | None]] = [
+    ("Last 24 hours", 24 * 3600),
+    ("Last 7 days", 7 * 24 * 3600),
+    ("Last 30 days", 30 * 24 * 3600),
+    ("All time", None),
+]
+BUCKET_OPTIONS: list[tuple[str, int]] = [
+    ("Hourly", 3600),
+    ("Daily", 24 * 3600),
+    ("Weekly", 7 * 24 * 3600),
+]
+
+
+class _NumericItem(QTableWidgetItem):
+    def __init__(self, value: float | None, text: str) -> None:
+        super().__init__(text)
+        self._value = float("-inf") if value is None else value
+        self.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+
+    def __lt__(self, other: QTableWidgetItem) -> bool:
+        if isinstance(other, _NumericItem):
+            return self._value < other._value
+        return super().__lt__(other)
+
+
+class HistoryStatsDialog(QDialog):
+    _ENDPOINT_ROLE = int(Qt.ItemDataRole.UserRole) + 1
+
+    def __init__(self, history_path: Path, parent=None) -> None:
+        super().__init__(parent)
+        self.setWindowTitle("History Statistics")
+        self.resize(960, 620)
+
+        # Filled in by the worker; the tables stay empty until then.
+        self._columns = HistoryColumns()
+
+        layout = QVBoxLayout(self)
+
+        controls = QHBoxLayout()
+        self._range_combo = QComboBox()
+        for label, _ in RANGE_OPTIONS:
+            self._range_combo.addItem(label)
+        self._range_combo.setCurrentIndex(1)
+        self._bucket_combo = QComboBox()
+        for label, _ in BUCKET_OPTIONS:
+            self._bucket_combo.addItem(label)
+        self._bucket_combo.setCurrentIndex(1)
+        self._summary_label = QLabel()
+
+        controls.addWidget(QLabel("Range"))
+        controls.addWidget(self._range_combo)
+        controls.addWidget(QLabel("Trend"))
+        controls.addWidget(self._bucket_combo)
+        controls.addStretch()
+        controls.addWidget(self._summary_label)
+        layout.addLayout(controls)
+
+        self._stats_table = self._create_table(
+            ["Endpoint", "Count", "p50 (ms)", "p95 (ms)", "p99 (ms)", "Error %", "Last Seen"]
+        )
+        self._stats_table.setSortingEnabled(True)
+        self._stats_table.itemSelectionChanged.connect(self._render_trend)
+
+        self._trend_table = self._create_table(["Bucket", "Count", "p50 (ms)", "p95 (ms)", "Error %"])
+
+        splitter = QSplitter(orientation=Qt.Orientation.Vertical)
+        splitter.addWidget(self._stats_table)
+        splitter.addWidget(self._trend_table)
+        splitter.setStretchFactor(0, 3)
+        splitter.setStretchFactor(1, 2)
+        layout.addWidget(splitter)
+
+        self._range_combo.currentIndexChanged.connect(self._render_stats)
+        self._bucket_combo.currentIndexChanged.connect(self._render_trend)
+
+        self._set_loading(True)
+        self._worker: HistoryColumnsWorker | None = HistoryColumnsWorker(history_path)
+        self._worker.loaded.connect(self._on_columns_loaded)
+        self._worker.failed.connect(self._on_columns_failed)
+        self._worker.finished.connect(self._on_worker_finished)
+        self._worker.start()
+
+    def is_loading(self) -> bool:
+        return self._worker is not None
+
+    def done(self, result: int) -> None:
+        if self._worker is not None:
+            self._worker.requestInterruption()
+            self._worker.wait()
+        super().done(result)
+
+    def _set_loading(self, loading: bool) -> None:
+        self._range_combo.setEnabled(not loading)
+        self._bucket_combo.setEnabled(not loading)
+        if loading:
+            self._summary_label.setText("Loading history...")
+
+    def _on_columns_loaded(self, columns: HistoryColumns) -> None:
+        self._columns = columns
+        self._set_loading(False)
+        self._render_stats()
+
+    def _on_columns_failed(self, message: str) -> None:
+        self._set_loading(False)
+        self._summary_label.setText(f"Failed to load history: {message}")
+
+    def _on_worker_finished(self) -> None:
+        worker = self.sender()
+        if worker is not self._worker:
+            return
+        self._worker = None
+        worker.deleteLater()
+
+    def _render_stats(self) -> None:
+        since = self._selected_since()
+        stats = compute_endpoint_stats(self._columns, since=since)
+        total = sum(item.count for item in stats)
+        self._summary_label.setText(f"{len(stats)} endpoints / {total} requests")
+
+        self._stats_table.setSortingEnabled(False)
+        self._stats_table.setRowCount(len(stats))
+        for row, item in enumerate(stats):
+            self._set_stats_row(row, item)
+        self._stats_table.setSortingEnabled(True)
+        self._stats_table.sortItems(1, Qt.SortOrder.DescendingOrder)
+        self._stats_table.resizeColumnsToContents()
+
+        if 0 < len(stats):
+            self._stats_table.selectRow(0)
+        else:
+            self._trend_table.setRowCount(0)
+
+    def _set_stats_row(self, row: int, item: EndpointStats) -> None:
+        endpoint_item = QTableWidgetItem(item.endpoint)
+        endpoint_item.setData(self._ENDPOINT_ROLE, item.endpoint)
+        endpoint_item.setToolTip(item.endpoint)
+        self._stats_table.setItem(row, 0, endpoint_item)
+        self._stats_table.setItem(row, 1, _NumericItem(item.count, str(item.count)))
+        self._stats_table.setItem(row, 2, _NumericItem(item.p50_ms, self._format_ms(item.p50_ms)))
+        self._stats_table.setItem(row, 3, _NumericItem(item.p95_ms, self._format_ms(item.p95_ms)))
+        self._stats_table.setItem(row, 4, _NumericItem(item.p99_ms, self._format_ms(item.p99_ms)))
+        self._stats_table.setItem(
+            row, 5, _NumericItem(item.error_rate, f"{item.error_rate * 100:.1f}")
+        )
+        self._stats_table.setItem(
+            row, 6, _NumericItem(item.last_seen, self._format_time(item.last_seen))
+        )
+
+    def _render_trend(self) -> None:
+        row = self._stats_table.currentRow()
+        endpoint_item = self._stats_table.item(row, 0) if 0 <= row else None
+        if endpoint_item is None:
+            self._trend_table.setRowCount(0)
+            return
+
+        _, bucket_seconds = BUCKET_OPTIONS[self._bucket_combo.currentIndex()]
+        trend = compute_trend(
+            self._columns,
+            bucket_seconds=bucket_seconds,
+            endpoint=endpoint_item.data(self._ENDPOINT_ROLE),
+            since=self._selected_since(),
+        )
+        self._trend_table.setRowCount(len(trend))
+        for trend_row, bucket in enumerate(reversed(trend)):
+            error_rate = bucket.error_count / bucket.count if bucket.count else 0.0
+            self._trend_table.setItem(trend_row, 0, QTableWidgetItem(self._format_time(bucket.start)))
+            self._trend_table.setItem(trend_row, 1, _NumericItem(bucket.count, str(bucket.count)))
+            self._trend_table.setItem(
+                trend_row, 2, _NumericItem(bucket.p50_ms, self._format_ms(bucket.p50_ms))
+            )
+            self._trend_table.setItem(
+                trend_row, 3, _NumericItem(bucket.p95_ms, self._format_ms(bucket.p95_ms))
+            )
+            self._trend_table.setItem(
+                trend_row, 4, _NumericItem(error_rate, f"{error_rate * 100:.1f}")
+            )
+        self._trend_table.resizeColumnsToContents()
+
+    def _selected_since(self) -> float | None:
+        _, window_seconds = RANGE_OPTIONS[self._range_combo.currentIndex()]
+        if window_seconds is None:
+            return None
+        now = datetime.datetime.now(tz=datetime.timezone.utc).timestamp()
+        return now - window_seconds
+
+    @staticmethod
+    def _create_table(labels: list[str]) -> QTableWidget:
+        table = QTableWidget()
+        table.setColumnCount(len(labels))
+        table.setHorizontalHeaderLabels(labels)
+        table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        table.setAlternatingRowColors(True)
+        table.verticalHeader().setVisible(False)
+        table.horizontalHeader().setStretchLastSection(True)
+        return table
+
+    @staticmethod
+    def _format_ms(value: float | None) -> str:
+        if value is None:
+            return "-"
+        return f"{value:.0f}"
+
+    @staticmethod
+    def _format_time(timestamp: float) -> str:
+        parsed = datetime.datetime.fromtimestamp(timestamp)
+        return parsed.strftime("%Y-%m-%d %H:%M")
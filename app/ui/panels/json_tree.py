@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+from itertools import islice
+from typing import Any, Iterator
+
+from PySide6.QtCore import QAbstractItemModel, QModelIndex, QPersistentModelIndex, Qt
+
+from core.json_index import JsonIndex, JsonNode, JsonNodeKind
+
+_ModelIndex = QModelIndex | QPersistentModelIndex
+
+
+class _TreeItem:
+    __slots__ = ("node", "parent", "row", "children", "pending", "exhausted")
+
+    def __init__(self, node: JsonNode | None, parent: _TreeItem | None, row: int) -> None:
+        self.node = node
+        self.parent = parent
+        self.row = row
+        self.children: list[_TreeItem] = []
+        self.pending: Iterator[JsonNode] | None = None
+        self.exhausted = node is not None and not node.is_container
+
+
+class JsonTreeModel(QAbstractItemModel):
+    """Lazily expanded tree over a JsonIndex.
+
+    Children of a node are only pulled from the index when the view asks for
+    them, in batches of ``FETCH_BATCH``, so huge arrays open immediately.
+    """
+
+    HEADERS = ["Key", "Value", "Type"]
+    FETCH_BATCH = 1000
+    NODE_ROLE = int(Qt.ItemDataRole.UserRole) + 1
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._index: JsonIndex | None = None
+        self._root = _TreeItem(None, None, 0)
+        self._root.exhausted = True
+
+    def set_index(self, index: JsonIndex | None) -> None:
+        self.beginResetModel()
+        self._index = index
+        self._root = _TreeItem(None, None, 0)
+        if index is not None:
+            self._root.children = [
+                _TreeItem(node, self._root, row) for row, node in enumerate(index.roots())
+            ]
+        self._root.exhausted = True
+        self.endResetModel()
+
+    def node(self, index: _ModelIndex) -> JsonNode | None:
+        if not index.isValid():
+            return None
+        item = index.internalPointer()
+        if isinstance(item, _TreeItem):
+            return item.node
+        return None
+
+    def index(self, row: int, column: int, parent: _ModelIndex = QModelIndex()) -> QModelIndex:
+        parent_item = self._item(parent)
+        if row < 0 or row >= len(parent_item.children) or column < 0 or column >= len(self.HEADERS):
+            return QModelIndex()
+        return self.createIndex(row, column, parent_item.children[row])
+
+    def parent(self, index: _ModelIndex = QModelIndex()) -> QModelIndex:  # type: ignore[override]
+        if not index.isValid():
+            return QModelIndex()
+        item = index.internalPointer()
+        if not isinstance(item, _TreeItem) or item.parent is None or item.parent is self._root:
+            return QModelIndex()
+        return self.createIndex(item.parent.row, 0, item.parent)
+
+    def rowCount(self, parent: _ModelIndex = QModelIndex()) -> int:
+        if parent.isValid() and parent.column() != 0:
+            return 0
+        return len(self._item(parent).children)
+
+    def columnCount(self, parent: _ModelIndex = QModelIndex()) -> int:
+        return len(self.HEADERS)
+
+    def hasChildren(self, parent: _ModelIndex = QModelIndex()) -> bool:
+        item = self._item(parent)
+        if 0 < len(item.children):
+            return True
+        return not item.exhausted
+
+    def canFetchMore(self, parent: _ModelIndex) -> bool:
+        return not self._item(parent).exhausted
+
+    def fetchMore(self, parent: _ModelIndex) -> None:
+        item = self._item(parent)
+        if item.exhausted or self._index is None or item.node is None:
+            return
+        if item.pending is None:
+            item.pending = self._index.iter_children(item.node)
+
+        batch = list(islice(item.pending, self.FETCH_BATCH))
+        if len(batch) < self.FETCH_BATCH:
+            item.exhausted = True
+            item.pending = None
+        if 0 == len(batch):
+            if 0 == len(item.children):
+                # Let the view drop the expand arrow of an empty container.
+                self.dataChanged.emit(parent, parent)
+            return
+
+        first = len(item.children)
+        self.beginInsertRows(parent, first, first + len(batch) - 1)
+        item.children.extend(
+            _TreeItem(node, item, first + offset) for offset, node in enumerate(batch)
+        )
+        self.endInsertRows()
+
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> Any:
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index: _ModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        node = self.node(index)
+        if node is None:
+            return None
+        if role == self.NODE_ROLE:
+            return node
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return node.path
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+
+        column = index.column()
+        if column == 0:
+            if node.key is None:
+                return "$"
+            if isinstance(node.key, int):
+                return f"[{node.key}]"
+            return node.key
+        if column == 1:
+            item = index.internalPointer()
+            if node.is_container and isinstance(item, _TreeItem) and item.exhausted:
+                count = len(item.children)
+                return f"{{{count}}}" if node.kind is JsonNodeKind.OBJECT else f"[{count}]"
+            return node.preview
+        return node.kind.value
+
+    def _item(self, index: _ModelIndex) -> _TreeItem:
+        if index.isValid():
+            item = index.internalPointer()
+            if isinstance(item, _TreeItem):
+                return item
+        return self._root
@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+
+from PySide6.QtCore import Qt, QThreadPool
+from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QDialog,
+    QFormLayout,
+    QHBoxLayout,
+    QLabel,
+    QListWidget,
+    QListWidgetItem,
+    QPlainTextEdit,
+    QPushButton,
+    QSpinBox,
+    QTableWidget,
+    QTableWidgetItem,
+    QVBoxLayout,
+)
+
+from core.http_client import HttpClient
+from core.latency_compare import (
+    DEFAULT_MAX_SAMPLES,
+    DEFAULT_MIN_SAMPLES,
+    ComparisonReport,
+    CompareOptions,
+    format_report,
+)
+from core.model import RequestData
+from workers.compare_worker import LatencyCompareTask
+
+RESULT_COLUMNS = ["Environment", "Samples", "Errors", "Mean (ms)", "95% CI (ms)", "p50", "p95", "p99"]
+
+
+class LatencyCompareDialog(QDialog):
+    """Sends one request against several environments and compares latency.
+
+    The comparison runs as a task on the window's request pool; the first
+    checked environment (in list order, drag to reorder) is the baseline.
+    """
+
+    def __init__(
+        self,
+        request: RequestData,
+        environments: Mapping[str, Mapping[str, str]],
+        pool: QThreadPool,
+        http_client: HttpClient | None = None,
+        parent=None,
+    ) -> None:
+        super().__init__(parent)
+        self.setWindowTitle(f"Compare Environments - {request.name}")
+        self.resize(900, 620)
+
+        self._request = request
+        self._environments = environments
+        self._pool = pool
+        self._http_client = http_client
+        self._generation = 0
+        self._task: LatencyCompareTask | None = None
+        self._sample_counts: dict[str, int] = {}
+        self._error_counts: dict[str, int] = {}
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(QLabel(f"{request.method} {request.url}"))
+
+        self._environment_list = QListWidget()
+        self._environment_list.setDragDropMode(QAbstractItemView.DragDropMode.InternalMove)
+        self._environment_list.setMaximumHeight(120)
+        for position, name in enumerate(environments):
+            item = QListWidgetItem(name)
+            item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
+            item.setCheckState(Qt.CheckState.Checked if position < 3 else Qt.CheckState.Unchecked)
+            self._environment_list.addItem(item)
+
+        form = QFormLayout()
+        self._min_samples_spin = QSpinBox()
+        self._min_samples_spin.setRange(2, 10000)
+        self._min_samples_spin.setValue(DEFAULT_MIN_SAMPLES)
+        self._max_samples_spin = QSpinBox()
+        self._max_samples_spin.setRange(2, 10000)
+        self._max_samples_spin.setValue(DEFAULT_MAX_SAMPLES)
+        self._concurrency_spin = QSpinBox()
+        self._concurrency_spin.setRange(1, 64)
+        self._concurrency_spin.setValue(4)
+        form.addRow("Environments", self._environment_list)
+        form.addRow("Min samples / env", self._min_samples_spin)
+        form.addRow("Max samples / env", self._max_samples_spin)
+        form.addRow("Concurrency", self._concurrency_spin)
+        layout.addLayout(form)
+
+        controls = QHBoxLayout()
+        self._start_button = QPushButton("Start")
+        self._stop_button = QPushButton("Stop")
+        self._stop_button.setEnabled(False)
+        self._progress_label = QLabel()
+        controls.addWidget(self._start_button)
+        controls.addWidget(self._stop_button)
+        controls.addWidget(self._progress_label, stretch=1)
+        layout.addLayout(controls)
+
+        self._result_table = QTableWidget(0, len(RESULT_COLUMNS))
+        self._result_table.setHorizontalHeaderLabels(RESULT_COLUMNS)
+        self._result_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self._result_table.verticalHeader().setVisible(False)
+        layout.addWidget(self._result_table, stretch=1)
+
+        self._summary_view = QPlainTextEdit()
+        self._summary_view.setReadOnly(True)
+        self._summary_view.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+        self._summary_view.setMaximumHeight(140)
+        layout.addWidget(self._summary_view)
+
+        self._start_button.clicked.connect(self._start)
+        self._stop_button.clicked.connect(self._stop)
+        if len(environments) < 2:
+            self._start_button.setEnabled(False)
+            self._progress_label.setText("Need at least two environments.")
+
+    def done(self, result: int) -> None:
+        # The task keeps running until its in-flight sends return; its
+        # results are ignored once the generation has moved on.
+        self._stop()
+        super().done(result)
+
+    def _selected_environments(self) -> dict[str, dict[str, str]]:
+        selected: dict[str, dict[str, str]] = {}
+        for row in range(self._environment_list.count()):
+            item = self._environment_list.item(row)
+            if item.checkState() == Qt.CheckState.Checked:
+                selected[item.text()] = dict(self._environments[item.text()])
+        return selected
+
+    def _start(self) -> None:
+        environments = self._selected_environments()
+        if len(environments) < 2:
+            self._progress_label.setText("Check at least two environments.")
+            return
+        self._stop()
+        options = CompareOptions(
+            min_samples=self._min_samples_spin.value(),
+            max_samples=max(self._min_samples_spin.value(), self._max_samples_spin.value()),
+            concurrency=self._concurrency_spin.value(),
+        )
+        task = LatencyCompareTask(self._generation, self._request, environments, options, self._http_client)
+        task.signals.sample.connect(self._on_sample)
+        task.signals.completed.connect(self._on_completed)
+        task.signals.failed.connect(self._on_failed)
+        task.signals.finished.connect(self._on_finished)
+        self._task = task
+        self._sample_counts = {name: 0 for name in environments}
+        self._error_counts = {name: 0 for name in environments}
+        self._result_table.setRowCount(0)
+        self._summary_view.clear()
+        self._update_progress()
+        self._start_button.setEnabled(False)
+        self._stop_button.setEnabled(True)
+        self._pool.start(task)
+
+    def _stop(self) -> None:
+        self._generation += 1
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+            self._progress_label.setText("Stopped.")
+        self._start_button.setEnabled(2 <= len(self._environments))
+        self._stop_button.setEnabled(False)
+
+    def _on_sample(self, generation: int, name: str, latency_ms: object) -> None:
+        if generation != self._generation:
+            return
+        if latency_ms is None:
+            self._error_counts[name] = self._error_counts.get(name, 0) + 1
+        else:
+            self._sample_counts[name] = self._sample_counts.get(name, 0) + 1
+        self._update_progress()
+
+    def _on_completed(self, generation: int, report: ComparisonReport) -> None:
+        if generation != self._generation:
+            return
+        self._show_report(report)
+        self._progress_label.setText("Done.")
+
+    def _on_failed(self, generation: int, message: str) -> None:
+        if generation != self._generation:
+            return
+        self._progress_label.setText(f"Comparison failed: {message}")
+
+    def _on_finished(self, generation: int) -> None:
+        if generation != self._generation:
+            return
+        self._task = None
+        self._start_button.setEnabled(True)
+        self._stop_button.setEnabled(False)
+
+    def _update_progress(self) -> None:
+        parts = []
+        for name, count in self._sample_counts.items():
+            errors = self._error_counts.get(name, 0)
+            parts.append(f"{name}: {count}" + (f" ({errors} errors)" if errors else ""))
+        self._progress_label.setText("Sampling... " + ", ".join(parts))
+
+    def _show_report(self, report: ComparisonReport) -> None:
+        self._result_table.setRowCount(len(report.environments))
+        for row, entry in enumerate(report.environments):
+            interval = entry.confidence_interval(report.confidence)
+            values = [
+                entry.name,
+                str(entry.count),
+                str(entry.errors),
+                _format_ms(entry.mean()),
+                f"{interval[0]:.1f} .. {interval[1]:.1f}" if interval else "-",
+                _format_ms(entry.percentile(50)),
+                _format_ms(entry.percentile(95)),
+                _format_ms(entry.percentile(99)),
+            ]
+            for column, text in enumerate(values):
+                item = QTableWidgetItem(text)
+                if 0 < column:
+                    item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+                self._result_table.setItem(row, column, item)
+        self._result_table.resizeColumnsToContents()
+        self._summary_view.setPlainText(format_report(report))
+
+
+def _format_ms(value: float | None) -> str:
+    return f"{value:.1f}" if value is not None else "-"
@@ -0,0 +1,414 @@
+from __future__ import annotations
+
+import datetime
+import time
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from PySide6.QtCore import QPointF, QRectF, Qt, QTimer, Signal
+from PySide6.QtGui import QColor, QPainter, QPainterPath, QPaintEvent, QPen
+from PySide6.QtWidgets import (
+    QComboBox,
+    QDialog,
+    QFormLayout,
+    QHBoxLayout,
+    QLabel,
+    QListWidget,
+    QListWidgetItem,
+    QPushButton,
+    QSizePolicy,
+    QSpinBox,
+    QSplitter,
+    QVBoxLayout,
+    QWidget,
+)
+
+from core.http_client import HttpClient
+from core.model import WorkspaceRequest
+from core.monitor import (
+    ALERT_RECOVERED,
+    DEFAULT_ALERT_AFTER,
+    DEFAULT_INTERVAL_S,
+    DEFAULT_JITTER,
+    AlertRule,
+    MonitorAlert,
+    MonitorSample,
+    MonitorTarget,
+    summarize,
+)
+from core.runner import to_request_data
+from core.template import render_request
+from core.timeseries import RESOLUTION_RAW, SeriesPoint
+from workers.monitor_worker import MonitorWorker
+
+RANGE_OPTIONS: list[tuple[str, int]] = [
+    ("Last 15 minutes", 15 * 60),
+    ("Last hour", 3600),
+    ("Last 24 hours", 24 * 3600),
+    ("Last 7 days", 7 * 24 * 3600),
+    ("Last 90 days", 90 * 24 * 3600),
+]
+# Redraws are batched; samples only mark the chart stale.
+CHART_REFRESH_MS = 1000
+ALERT_LIST_LIMIT = 500
+
+
+class LatencyChart(QWidget):
+    """Mean latency line with a min/max band, failed buckets in red and the
+    alert threshold as a dashed line."""
+
+    _MARGIN_LEFT = 56
+    _MARGIN_RIGHT = 12
+    _MARGIN_TOP = 12
+    _MARGIN_BOTTOM = 24
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self.setMinimumHeight(200)
+        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        self._points: list[SeriesPoint] = []
+        self._since = 0.0
+        self._until = 1.0
+        self._threshold_ms: float | None = None
+
+    def set_points(
+        self, points: Sequence[SeriesPoint], since: float, until: float, threshold_ms: float | None = None
+    ) -> None:
+        self._points = list(points)
+        self._since = since
+        self._until = max(until, since + 1.0)
+        self._threshold_ms = threshold_ms
+        self.update()
+
+    def paintEvent(self, event: QPaintEvent) -> None:
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        palette = self.palette()
+        area = QRectF(
+            self._MARGIN_LEFT,
+            self._MARGIN_TOP,
+            max(1, self.width() - self._MARGIN_LEFT - self._MARGIN_RIGHT),
+            max(1, self.height() - self._MARGIN_TOP - self._MARGIN_BOTTOM),
+        )
+        painter.fillRect(area, palette.base())
+        painter.setPen(QPen(palette.mid().color()))
+        painter.drawRect(area)
+
+        highest = max((point.max_ms for point in self._points if point.max_ms is not None), default=0.0)
+        if self._threshold_ms is not None:
+            highest = max(highest, self._threshold_ms)
+        top = max(1.0, highest * 1.1)
+        span = self._until - self._since
+
+        def _x(timestamp: float) -> float:
+            return area.left() + (timestamp - self._since) / span * area.width()
+
+        def _y(value: float) -> float:
+            return area.bottom() - value / top * area.height()
+
+        text_color = palette.text().color()
+        painter.setPen(text_color)
+        label_width = self._MARGIN_LEFT - 6
+        painter.drawText(QRectF(0, area.top() - 6, label_width, 14), Qt.AlignmentFlag.AlignRight, f"{top:.0f} ms")
+        painter.drawText(QRectF(0, area.bottom() - 8, label_width, 14), Qt.AlignmentFlag.AlignRight, "0")
+        painter.drawText(
+            QRectF(area.left(), area.bottom() + 4, area.width(), 16),
+            Qt.AlignmentFlag.AlignLeft,
+            _format_time(self._since, span),
+        )
+        painter.drawText(
+            QRectF(area.left(), area.bottom() + 4, area.width(), 16),
+            Qt.AlignmentFlag.AlignRight,
+            _format_time(self._until, span),
+        )
+        if not self._points:
+            painter.drawText(area, Qt.AlignmentFlag.AlignCenter, "No samples in this range")
+            return
+
+        painter.setClipRect(area)
+        band_color = QColor(palette.highlight().color())
+        band_color.setAlpha(50)
+        line = QPainterPath()
+        started = False
+        for point in self._points:
+            if point.mean_ms is None:
+                started = False
+                continue
+            x = _x(point.timestamp)
+            if point.count > 1 and point.min_ms is not None and point.max_ms is not None:
+                band = QRectF(x - 1.5, _y(point.max_ms), 3.0, _y(point.min_ms) - _y(point.max_ms) + 1)
+                painter.fillRect(band, band_color)
+            if started:
+                line.lineTo(x, _y(point.mean_ms))
+            else:
+                line.moveTo(x, _y(point.mean_ms))
+                started = True
+        painter.setPen(QPen(palette.highlight().color(), 1.5))
+        painter.drawPath(line)
+
+        error_pen = QPen(QColor("#d9534f"), 2.0)
+        painter.setPen(error_pen)
+        for point in self._points:
+            if point.errors:
+                x = _x(point.timestamp)
+                painter.drawLine(QPointF(x, area.bottom()), QPointF(x, area.bottom() - 8))
+
+        if self._threshold_ms is not None:
+            threshold_pen = QPen(QColor("#f0ad4e"), 1.0, Qt.PenStyle.DashLine)
+            painter.setPen(threshold_pen)
+            y = _y(self._threshold_ms)
+            painter.drawLine(QPointF(area.left(), y), QPointF(area.right(), y))
+
+
+class MonitorDialog(QDialog):
+    """Configures the background monitor and shows its time series and alerts.
+
+    The dialog is modeless and only a view: closing it leaves the monitor
+    running in ``MonitorWorker``. ``config_changed`` carries the form values
+    whenever monitoring is started, so the window can remember them.
+    """
+
+    _KEY_ROLE = int(Qt.ItemDataRole.UserRole) + 1
+
+    config_changed = Signal(dict)
+
+    def __init__(
+        self,
+        worker: MonitorWorker,
+        requests: Sequence[WorkspaceRequest],
+        environments: Mapping[str, Mapping[str, str]],
+        environment_name: str,
+        http_client: HttpClient | None = None,
+        config: Mapping[str, Any] | None = None,
+        parent=None,
+    ) -> None:
+        super().__init__(parent)
+        self.setWindowTitle("Monitor")
+        self.setModal(False)
+        self.resize(960, 680)
+
+        self._worker = worker
+        self._http_client = http_client
+        self._environments = environments
+        self._requests: list[WorkspaceRequest] = []
+        self._chart_stale = True
+        config = dict(config or {})
+
+        self._request_list = QListWidget()
+        self._request_list.setMaximumHeight(140)
+        self._environment_combo = QComboBox()
+        self._interval_spin = QSpinBox()
+        self._interval_spin.setRange(1, 24 * 3600)
+        self._interval_spin.setSuffix(" s")
+        self._interval_spin.setValue(int(config.get("interval_s", DEFAULT_INTERVAL_S)))
+        self._jitter_spin = QSpinBox()
+        self._jitter_spin.setRange(0, 100)
+        self._jitter_spin.setSuffix(" %")
+        self._jitter_spin.setValue(int(config.get("jitter_pct", DEFAULT_JITTER * 100)))
+        self._latency_spin = QSpinBox()
+        self._latency_spin.setRange(0, 600000)
+        self._latency_spin.setSuffix(" ms")
+        self._latency_spin.setSpecialValueText("Off")
+        self._latency_spin.setValue(int(config.get("alert_latency_ms", 0)))
+        self._alert_after_spin = QSpinBox()
+        self._alert_after_spin.setRange(1, 100)
+        self._alert_after_spin.setValue(int(config.get("alert_after", DEFAULT_ALERT_AFTER)))
+
+        form = QFormLayout()
+        form.addRow("Requests", self._request_list)
+        form.addRow("Environment", self._environment_combo)
+        form.addRow("Interval", self._interval_spin)
+        form.addRow("Jitter", self._jitter_spin)
+        form.addRow("Alert when slower than", self._latency_spin)
+        form.addRow("Alert after (in a row)", self._alert_after_spin)
+
+        controls = QHBoxLayout()
+        self._start_button = QPushButton("Start")
+        self._stop_button = QPushButton("Stop")
+        self._status_label = QLabel()
+        controls.addWidget(self._start_button)
+        controls.addWidget(self._stop_button)
+        controls.addWidget(self._status_label, stretch=1)
+
+        chart_controls = QHBoxLayout()
+        self._series_combo = QComboBox()
+        self._series_combo.setSizeAdjustPolicy(QComboBox.SizeAdjustPolicy.AdjustToContents)
+        self._range_combo = QComboBox()
+        for label, seconds in RANGE_OPTIONS:
+            self._range_combo.addItem(label, seconds)
+        self._summary_label = QLabel()
+        chart_controls.addWidget(QLabel("Series"))
+        chart_controls.addWidget(self._series_combo)
+        chart_controls.addWidget(self._range_combo)
+        chart_controls.addWidget(self._summary_label, stretch=1)
+
+        self._chart = LatencyChart()
+        self._alert_list = QListWidget()
+
+        chart_panel = QWidget()
+        chart_layout = QVBoxLayout(chart_panel)
+        chart_layout.setContentsMargins(0, 0, 0, 0)
+        chart_layout.addLayout(chart_controls)
+        chart_layout.addWidget(self._chart, stretch=1)
+        splitter = QSplitter(Qt.Orientation.Vertical)
+        splitter.addWidget(chart_panel)
+        splitter.addWidget(self._alert_list)
+        splitter.setStretchFactor(0, 3)
+        splitter.setStretchFactor(1, 1)
+
+        layout = QVBoxLayout(self)
+        layout.addLayout(form)
+        layout.addLayout(controls)
+        layout.addWidget(splitter, stretch=1)
+
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setInterval(CHART_REFRESH_MS)
+        self._refresh_timer.timeout.connect(self._refresh_chart)
+
+        self._start_button.clicked.connect(self._start)
+        self._stop_button.clicked.connect(self._worker.stop)
+        self._series_combo.currentIndexChanged.connect(self._mark_chart_stale)
+        self._range_combo.currentIndexChanged.connect(self._mark_chart_stale)
+        self._worker.sample_recorded.connect(self._on_sample)
+        self._worker.alert_raised.connect(self._on_alert)
+        self._worker.running_changed.connect(self._on_running_changed)
+
+        self.set_requests(requests, environments, environment_name, config.get("request_ids"))
+        self._on_running_changed(self._worker.is_running())
+
+    def set_requests(
+        self,
+        requests: Sequence[WorkspaceRequest],
+        environments: Mapping[str, Mapping[str, str]],
+        environment_name: str,
+        checked_ids: Sequence[str] | None = None,
+    ) -> None:
+        """Refresh the request and environment choices, keeping checked rows."""
+        if checked_ids is None:
+            checked_ids = self._checked_ids() or [target.key for target in self._worker.targets()]
+        checked = set(checked_ids)
+        self._requests = list(requests)
+        self._environments = environments
+        self._request_list.clear()
+        for request in self._requests:
+            item = QListWidgetItem(f"{request.name}  ({request.method} {request.url})")
+            item.setData(self._KEY_ROLE, request.id)
+            item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
+            item.setCheckState(Qt.CheckState.Checked if request.id in checked else Qt.CheckState.Unchecked)
+            self._request_list.addItem(item)
+        self._environment_combo.clear()
+        self._environment_combo.addItems(list(environments))
+        self._environment_combo.setCurrentText(environment_name)
+        self._reload_series()
+
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        self._refresh_timer.start()
+        self._refresh_chart(force=True)
+
+    def hideEvent(self, event) -> None:
+        self._refresh_timer.stop()
+        super().hideEvent(event)
+
+    def _checked_ids(self) -> list[str]:
+        checked = []
+        for row in range(self._request_list.count()):
+            item = self._request_list.item(row)
+            if item.checkState() == Qt.CheckState.Checked:
+                checked.append(item.data(self._KEY_ROLE))
+        return checked
+
+    def _threshold_ms(self) -> float | None:
+        return float(self._latency_spin.value()) or None
+
+    def _start(self) -> None:
+        checked = set(self._checked_ids())
+        if not checked:
+            self._status_label.setText("요청을 선택해주세요.")
+            return
+        variables = self._environments.get(self._environment_combo.currentText(), {})
+        interval_s = float(self._interval_spin.value())
+        jitter = self._jitter_spin.value() / 100.0
+        targets = [
+            MonitorTarget(request.id, render_request(to_request_data(request), variables), interval_s, jitter)
+            for request in self._requests
+            if request.id in checked
+        ]
+        rule = AlertRule(self._threshold_ms(), self._alert_after_spin.value())
+        self._worker.start(targets, rule, self._http_client)
+        self.config_changed.emit(
+            {
+                "request_ids": sorted(checked),
+                "interval_s": self._interval_spin.value(),
+                "jitter_pct": self._jitter_spin.value(),
+                "alert_latency_ms": self._latency_spin.value(),
+                "alert_after": self._alert_after_spin.value(),
+            }
+        )
+        self._reload_series()
+
+    def _on_running_changed(self, running: bool) -> None:
+        self._start_button.setText("Restart" if running else "Start")
+        self._stop_button.setEnabled(running)
+        if running:
+            count = len(self._worker.targets())
+            self._status_label.setText(f"Monitoring {count} request(s)")
+        else:
+            self._status_label.setText("Stopped")
+
+    def _on_sample(self, sample: MonitorSample) -> None:
+        if self._series_combo.findData(sample.key) < 0:
+            self._series_combo.addItem(sample.name, sample.key)
+        if sample.key == self._series_combo.currentData():
+            self._chart_stale = True
+
+    def _on_alert(self, alert: MonitorAlert) -> None:
+        time_text = datetime.datetime.fromtimestamp(alert.timestamp).strftime("%m-%d %H:%M:%S")
+        item = QListWidgetItem(f"{time_text}  {alert.message}")
+        if alert.kind != ALERT_RECOVERED:
+            item.setForeground(QColor("#d9534f"))
+        self._alert_list.insertItem(0, item)
+        while self._alert_list.count() > ALERT_LIST_LIMIT:
+            self._alert_list.takeItem(self._alert_list.count() - 1)
+
+    def _reload_series(self) -> None:
+        current = self._series_combo.currentData()
+        self._series_combo.blockSignals(True)
+        self._series_combo.clear()
+        for key in self._worker.store.keys():
+            self._series_combo.addItem(self._worker.store.name(key), key)
+        index = self._series_combo.findData(current)
+        self._series_combo.setCurrentIndex(max(0, index))
+        self._series_combo.blockSignals(False)
+        self._mark_chart_stale()
+
+    def _mark_chart_stale(self) -> None:
+        self._chart_stale = True
+        if self.isVisible():
+            self._refresh_chart()
+
+    def _refresh_chart(self, force: bool = False) -> None:
+        if not (self._chart_stale or force):
+            return
+        self._chart_stale = False
+        key = self._series_combo.currentData()
+        until = time.time()
+        since = until - int(self._range_combo.currentData())
+        points = self._worker.store.points(key, since=since) if key is not None else []
+        self._chart.set_points(points, since, until, self._threshold_ms())
+        summary = summarize(points)
+        if summary["samples"]:
+            mean = summary["mean_ms"]
+            mean_text = f"mean {mean:.1f} ms" if mean is not None else "no successful samples"
+            resolution = self._worker.store.resolution_for(key, since)
+            raw_note = "" if resolution == RESOLUTION_RAW else f" ({resolution // 60}-minute rollups)"
+            self._summary_label.setText(
+                f"{summary['samples']} samples, {summary['errors']} errors, {mean_text}{raw_note}"
+            )
+        else:
+            self._summary_label.setText("")
+
+
+def _format_time(timestamp: float, span: float) -> str:
+    moment = datetime.datetime.fromtimestamp(timestamp)
+    return moment.strftime("%H:%M:%S" if span <= 24 * 3600 else "%m-%d %H:%M")
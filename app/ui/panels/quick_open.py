@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtWidgets import (
+    QDialog,
+    QLabel,
+    QLineEdit,
+    QListWidget,
+    QListWidgetItem,
+    QVBoxLayout,
+)
+
+from core.fuzzy_index import FuzzyIndex
+
+RESULT_LIMIT = 50
+PROGRESS_INTERVAL_MS = 100
+SEARCH_DEBOUNCE_MS = 80
+
+
+class QuickOpenDialog(QDialog):
+    """Ctrl+P style jump-to-request list over a ``FuzzyIndex``.
+
+    Queries run once typing pauses for ``SEARCH_DEBOUNCE_MS``; the index
+    keeps each search under a few milliseconds even for large workspaces.
+    While the index is still being built, results are refreshed as more
+    requests become searchable.
+    """
+
+    def __init__(
+        self,
+        index: FuzzyIndex,
+        pending_count: Callable[[], int] | None = None,
+        parent=None,
+    ) -> None:
+        super().__init__(parent)
+        self.setWindowTitle("Quick Open")
+        self.resize(560, 420)
+
+        self._index = index
+        self._pending_count = pending_count
+        self._selected_id: str | None = None
+
+        layout = QVBoxLayout(self)
+        self._query_edit = QLineEdit()
+        self._query_edit.setPlaceholderText("Request name, method, folder or URL")
+        self._query_edit.installEventFilter(self)
+        layout.addWidget(self._query_edit)
+
+        self._result_list = QListWidget()
+        self._result_list.setUniformItemSizes(True)
+        layout.addWidget(self._result_list)
+
+        self._status_label = QLabel()
+        layout.addWidget(self._status_label)
+
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(PROGRESS_INTERVAL_MS)
+        self._progress_timer.timeout.connect(self._on_progress)
+
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self._refresh)
+
+        self._query_edit.textChanged.connect(self._search_timer.start)
+        self._query_edit.returnPressed.connect(self._accept_current)
+        self._result_list.itemActivated.connect(self._accept_item)
+
+        self._refresh()
+        if self._pending() > 0:
+            self._progress_timer.start()
+
+    def selected_request_id(self) -> str | None:
+        return self._selected_id
+
+    def eventFilter(self, watched, event) -> bool:  # type: ignore[override]
+        # Arrow keys in the query edit move through the result list.
+        if watched is self._query_edit and event.type() == event.Type.KeyPress:
+            key = event.key()
+            if key in (Qt.Key.Key_Down, Qt.Key.Key_Up, Qt.Key.Key_PageDown, Qt.Key.Key_PageUp):
+                self._result_list.keyPressEvent(event)
+                return True
+        return super().eventFilter(watched, event)
+
+    def _pending(self) -> int:
+        if self._pending_count is None:
+            return 0
+        return self._pending_count()
+
+    def _refresh(self) -> None:
+        self._search_timer.stop()
+        self._result_list.clear()
+        for match in self._index.search(self._query_edit.text(), RESULT_LIMIT):
+            entry = match.entry
+            label = f"{entry.method:<7} {entry.name}" if entry.method else entry.name
+            detail = " — ".join(part for part in (entry.path, entry.url) if part)
+            item = QListWidgetItem(f"{label}    {detail}" if detail else label)
+            item.setData(Qt.ItemDataRole.UserRole, entry.key)
+            item.setToolTip(detail)
+            self._result_list.addItem(item)
+        if 0 < self._result_list.count():
+            self._result_list.setCurrentRow(0)
+        self._update_status()
+
+    def _update_status(self) -> None:
+        pending = self._pending()
+        if pending > 0:
+            self._status_label.setText(f"Indexing... {len(self._index)} requests, {pending} left")
+        else:
+            self._status_label.setText(f"{len(self._index)} requests")
+
+    def _on_progress(self) -> None:
+        if self._pending() <= 0:
+            self._progress_timer.stop()
+        if self._query_edit.text().strip():
+            self._refresh()
+        else:
+            self._update_status()
+
+    def _accept_current(self) -> None:
+        if self._search_timer.isActive():
+            # Enter pressed before the debounce fired: match the typed query.
+            self._refresh()
+        item = self._result_list.currentItem()
+        if item is not None:
+            self._accept_item(item)
+
+    def _accept_item(self, item: QListWidgetItem) -> None:
+        self._selected_id = item.data(Qt.ItemDataRole.UserRole)
+        self.accept()
@@ -26,6 +26,10 @@ from core.model import AuthConfig, AuthType, HistoryEntry, NetworkConfig, Reques
 METHODS = ["GET", "POST", "PUT", "PATCH", "DELETE"]
 AUTH_OPTIONS = ["No Auth", "Basic Auth", "Bearer Token"]
 BODY_TYPES = ["Raw (Text/JSON)", "Multipart/Form-Data"]
+DEFAULT_HEADERS = [("Accept", "application/json"), ("Content-Type", "application/json")]
+DEFAULT_PARAMS = [("limit", "25"), ("offset", "0")]
+DEFAULT_FOLDER_ID = "folder-1"
+MAX_OPEN_TABS = 12
 
 
 @dataclass(slots=True)
@@ -50,10 +54,12 @@ class RequestTabWidgets:
     verify_ssl_check: QCheckBox
     follow_redirects_check: QCheckBox
     trust_env_check: QCheckBox
+    simulate_edit: QLineEdit
 
 
 class RequestEditorPanel(QWidget):
     request_selected = Signal(str)
+    request_changed = Signal(object)
 
     def __init__(self) -> None:
         super().__init__()
@@ -61,47 +67,26 @@ class RequestEditorPanel(QWidget):
         layout.setContentsMargins(0, 0, 0, 0)
 
         self._request_tabs = QTabWidget()
+        self._request_tabs.setTabsClosable(True)
         self._request_tabs.currentChanged.connect(self._on_tab_changed)
+        self._request_tabs.tabCloseRequested.connect(self._close_tab)
         layout.addWidget(self._request_tabs)
+
+        # Every request lives in the model; only up to ``_max_open_tabs`` of
+        # them have editor widgets. Closed and evicted tabs are written back.
+        self._request_order: list[str] = []
+        self._requests: dict[str, WorkspaceRequest] = {}
         self._request_tab_data: list[RequestTabWidgets] = []
+        self._tab_activation: dict[str, int] = {}
+        self._activation_tick = 0
+        self._max_open_tabs = MAX_OPEN_TABS
         self._request_id_counter = 1
 
-        self._request_tabs.addTab(
-            self._build_request_tab(
-                name="List Users",
-                method="GET",
-                url="https://api.example.com/users",
-                body_text="",
-            ),
-            "List Users",
-        )
-        self._request_tabs.addTab(
-            self._build_request_tab(
-                name="Create User",
-                method="POST",
-                url="https://api.example.com/users",
-                body_text="{\n    \"name\": \"Jane\"\n}",
-            ),
-            "Create User",
-        )
-
-    def _build_request_tab(
-        self,
-        name: str,
-        method: str,
-        url: str,
-        body_text: str,
-        headers: list[tuple[str, str]] | None = None,
-        params: list[tuple[str, str]] | None = None,
-        auth: AuthConfig | None = None,
-        timeout_ms: int = 10000,
-        network: NetworkConfig | None = None,
-        request_id: str | None = None,
-        folder_id: str | None = None,
-        body_type: str = "raw",
-        form_fields: list[tuple[str, str]] | None = None,
-        files: list[tuple[str, str]] | None = None,
-    ) -> QWidget:
+    def _build_request_tab(self, request: WorkspaceRequest) -> tuple[QWidget, RequestTabWidgets]:
+        method = request.method
+        url = request.url
+        timeout_ms = request.timeout_ms
+        body_type = request.body_type
         container = QWidget()
         layout = QVBoxLayout(container)
 
@@ -126,18 +111,13 @@ class RequestEditorPanel(QWidget):
         layout.addLayout(top_row)
 
         editor_tabs = QTabWidget()
-        resolved_headers = headers or [
-            ("Accept", "application/json"),
-            ("Content-Type", "application/json"),
-        ]
         headers_table = self._create_key_value_table(
-            pairs=resolved_headers,
+            pairs=request.headers,
             key_label="Header",
             value_label="Value",
         )
-        resolved_params = params or [("limit", "25"), ("offset", "0")]
         params_table = self._create_key_value_table(
-            pairs=resolved_params,
+            pairs=request.params,
             key_label="Param",
             value_label="Value",
         )
@@ -165,7 +145,7 @@ class RequestEditorPanel(QWidget):
         
         # 1. Raw Editor
         body_editor = QPlainTextEdit()
-        body_editor.setPlainText(body_text)
+        body_editor.setPlainText(request.body)
         if hasattr(self, "_current_font_size"):
              font = body_editor.font()
              font.setPointSize(self._current_font_size)
@@ -173,7 +153,7 @@ class RequestEditorPanel(QWidget):
         body_stack.addWidget(body_editor)
 
         # 2. Multipart Editor
-        multipart_table = self._create_multipart_table(form_fields or [], files or [])
+        multipart_table = self._create_multipart_table(request.form_fields, request.files)
         body_stack.addWidget(multipart_table)
 
         # Sync combo with stack
@@ -194,7 +174,7 @@ class RequestEditorPanel(QWidget):
         auth_token_edit = QLineEdit()
         auth_token_edit.setPlaceholderText("Bearer token")
 
-        resolved_auth = auth or AuthConfig.none()
+        resolved_auth = request.auth
         if resolved_auth.auth_type is AuthType.BASIC:
             auth_type_combo.setCurrentText("Basic Auth")
             auth_user_edit.setText(resolved_auth.username)
@@ -219,17 +199,25 @@ class RequestEditorPanel(QWidget):
         follow_redirects_check = QCheckBox("Follow Redirects")
         trust_env_check = QCheckBox("Trust Environment Proxies")
         trust_env_check.setChecked(True)
+        simulate_edit = QLineEdit()
+        simulate_edit.setPlaceholderText("3g error=0.05 seed=1")
+        simulate_edit.setToolTip(
+            "Preset (slow-3g, 3g, 4g, flaky) and/or latency, jitter, down, up, reset, error, status, seed.\n"
+            "Empty uses the environment's network_simulation variable; off disables it."
+        )
 
-        resolved_network = network or NetworkConfig()
+        resolved_network = request.network
         proxy_edit.setText(resolved_network.proxy_url)
         verify_ssl_check.setChecked(resolved_network.verify_ssl)
         follow_redirects_check.setChecked(resolved_network.follow_redirects)
         trust_env_check.setChecked(resolved_network.trust_env)
+        simulate_edit.setText(resolved_network.simulate)
 
         network_layout.addRow(QLabel("Proxy URL"), proxy_edit)
         network_layout.addRow(verify_ssl_check)
         network_layout.addRow(follow_redirects_check)
         network_layout.addRow(trust_env_check)
+        network_layout.addRow(QLabel("Simulate Network"), simulate_edit)
 
         editor_tabs.addTab(headers_table, "Headers")
         editor_tabs.addTab(params_table, "Params")
@@ -238,38 +226,31 @@ class RequestEditorPanel(QWidget):
         editor_tabs.addTab(network_tab, "Network")
 
         layout.addWidget(editor_tabs)
-        resolved_request_id = request_id
-        if resolved_request_id is None or 0 == len(resolved_request_id):
-            resolved_request_id = f"req-{self._request_id_counter}"
-            self._request_id_counter += 1
-
-        resolved_folder_id = folder_id or "folder-1"
-
-        self._request_tab_data.append(
-            RequestTabWidgets(
-                name=name,
-                request_id=resolved_request_id,
-                folder_id=resolved_folder_id,
-                method_combo=method_combo,
-                url_edit=url_edit,
-                timeout_spin=timeout_spin,
-                headers_table=headers_table,
-                params_table=params_table,
-                body_type_combo=body_type_combo,
-                body_stack=body_stack,
-                body_editor=body_editor,
-                multipart_table=multipart_table,
-                auth_type_combo=auth_type_combo,
-                auth_user_edit=auth_user_edit,
-                auth_password_edit=auth_password_edit,
-                auth_token_edit=auth_token_edit,
-                proxy_edit=proxy_edit,
-                verify_ssl_check=verify_ssl_check,
-                follow_redirects_check=follow_redirects_check,
-                trust_env_check=trust_env_check,
-            )
+
+        tab_data = RequestTabWidgets(
+            name=request.name,
+            request_id=request.id,
+            folder_id=request.folder_id,
+            method_combo=method_combo,
+            url_edit=url_edit,
+            timeout_spin=timeout_spin,
+            headers_table=headers_table,
+            params_table=params_table,
+            body_type_combo=body_type_combo,
+            body_stack=body_stack,
+            body_editor=body_editor,
+            multipart_table=multipart_table,
+            auth_type_combo=auth_type_combo,
+            auth_user_edit=auth_user_edit,
+            auth_password_edit=auth_password_edit,
+            auth_token_edit=auth_token_edit,
+            proxy_edit=proxy_edit,
+            verify_ssl_check=verify_ssl_check,
+            follow_redirects_check=follow_redirects_check,
+            trust_env_check=trust_env_check,
+            simulate_edit=simulate_edit,
         )
-        return container
+        return container, tab_data
 
     def build_request(self) -> RequestData:
         tab_index = self._request_tabs.currentIndex()
@@ -299,73 +280,28 @@ class RequestEditorPanel(QWidget):
                 verify_ssl=tab_data.verify_ssl_check.isChecked(),
                 follow_redirects=tab_data.follow_redirects_check.isChecked(),
                 trust_env=tab_data.trust_env_check.isChecked(),
+                simulate=tab_data.simulate_edit.text().strip(),
             ),
         )
         return request
 
     def build_workspace_requests(self) -> list[WorkspaceRequest]:
-        requests: list[WorkspaceRequest] = []
-        for index, tab_data in enumerate(self._request_tab_data):
-            name = self._request_tabs.tabText(index)
-            
-            body_type_str = "raw"
-            if tab_data.body_type_combo.currentIndex() == 1:
-                body_type_str = "multipart"
-            
-            form_fields, files = self._collect_multipart_data(tab_data.multipart_table)
-
-            requests.append(
-                WorkspaceRequest(
-                    id=tab_data.request_id,
-                    folder_id=tab_data.folder_id,
-                    name=name,
-                    method=tab_data.method_combo.currentText(),
-                    url=tab_data.url_edit.text().strip(),
-                    headers=self._collect_pairs(tab_data.headers_table),
-                    params=self._collect_pairs(tab_data.params_table),
-                    body=tab_data.body_editor.toPlainText(),
-                    form_fields=form_fields,
-                    files=files,
-                    body_type=body_type_str,
-                    auth=self._resolve_auth(tab_data),
-                    timeout_ms=int(tab_data.timeout_spin.value()),
-                    network=NetworkConfig(
-                        proxy_url=tab_data.proxy_edit.text().strip(),
-                        verify_ssl=tab_data.verify_ssl_check.isChecked(),
-                        follow_redirects=tab_data.follow_redirects_check.isChecked(),
-                        trust_env=tab_data.trust_env_check.isChecked(),
-                    ),
-                )
-            )
-        return requests
+        for index in range(len(self._request_tab_data)):
+            self._store_tab(index)
+        return [self._requests[request_id] for request_id in self._request_order]
 
     def load_workspace_requests(self, requests: list[WorkspaceRequest]) -> None:
-        self._request_tabs.clear()
         self._request_tab_data = []
+        self._clear_tabs()
+        self._request_order = []
+        self._requests = {}
+        self._tab_activation = {}
         self._request_id_counter = len(requests) + 1
 
         for request in requests:
-            tab_widget = self._build_request_tab(
-                name=request.name,
-                method=request.method,
-                url=request.url,
-                body_text=request.body,
-                headers=request.headers,
-                params=request.params,
-                auth=request.auth,
-                timeout_ms=request.timeout_ms,
-                network=request.network,
-                request_id=request.id,
-                folder_id=request.folder_id,
-                body_type=request.body_type,
-                form_fields=request.form_fields,
-                files=request.files,
-            )
-            self._request_tabs.addTab(tab_widget, request.name)
-        
-        # Re-apply font size to all new tabs if set
-        if hasattr(self, "_current_font_size"):
-             self.set_font_size(self._current_font_size)
+            self._add_request(request)
+        if 0 < len(requests):
+            self._open_request_tab(requests[0])
 
     def set_font_size(self, size: int) -> None:
         self._current_font_size = size
@@ -374,16 +310,24 @@ class RequestEditorPanel(QWidget):
             font.setPointSize(size)
             tab_data.body_editor.setFont(font)
 
+    def set_max_open_tabs(self, count: int) -> None:
+        self._max_open_tabs = max(1, count)
+        self._evict_tabs(self._max_open_tabs)
+
+    def current_request_id(self) -> str | None:
+        tab_index = self._request_tabs.currentIndex()
+        if tab_index < 0 or tab_index >= len(self._request_tab_data):
+            return None
+        return self._request_tab_data[tab_index].request_id
+
+    def open_tab_count(self) -> int:
+        return len(self._request_tab_data)
+
     def apply_history_entry(self, entry: HistoryEntry) -> None:
         if 0 == self._request_tabs.count():
-            tab_widget = self._build_request_tab(
-                name=entry.name,
-                method=entry.method,
-                url=entry.url,
-                body_text="",
-            )
-            self._request_tabs.addTab(tab_widget, entry.name)
-            self._request_tabs.setCurrentWidget(tab_widget)
+            request = self._new_request(entry.name, entry.method, entry.url)
+            self._add_request(request)
+            self._request_tabs.setCurrentIndex(self._open_request_tab(request))
             return
 
         tab_index = self._request_tabs.currentIndex()
@@ -396,16 +340,152 @@ class RequestEditorPanel(QWidget):
         # Ideally history should store full request data.
 
     def select_request(self, request_id: str) -> None:
+        index = self._tab_index(request_id)
+        if index < 0:
+            request = self._requests.get(request_id)
+            if request is None:
+                return
+            index = self._open_request_tab(request)
+        if self._request_tabs.currentIndex() != index:
+            self._request_tabs.setCurrentIndex(index)
+
+    def rename_request(self, request_id: str, name: str) -> None:
+        index = self._tab_index(request_id)
+        if 0 <= index:
+            self._request_tab_data[index].name = name
+            self._request_tabs.setTabText(index, name)
+            return
+        request = self._requests.get(request_id)
+        if request is not None:
+            request.name = name
+
+    def move_request(self, request_id: str, folder_id: str) -> None:
+        index = self._tab_index(request_id)
+        if 0 <= index:
+            self._request_tab_data[index].folder_id = folder_id
+        request = self._requests.get(request_id)
+        if request is not None:
+            request.folder_id = folder_id
+
+    def _new_request(
+        self,
+        name: str,
+        method: str,
+        url: str,
+        body: str = "",
+        folder_id: str = DEFAULT_FOLDER_ID,
+    ) -> WorkspaceRequest:
+        request_id = f"req-{self._request_id_counter}"
+        self._request_id_counter += 1
+        return WorkspaceRequest(
+            id=request_id,
+            folder_id=folder_id,
+            name=name,
+            method=method,
+            url=url,
+            headers=list(DEFAULT_HEADERS),
+            params=list(DEFAULT_PARAMS),
+            body=body,
+        )
+
+    def _add_request(self, request: WorkspaceRequest) -> None:
+        if request.id not in self._requests:
+            self._request_order.append(request.id)
+        self._requests[request.id] = request
+
+    def _tab_index(self, request_id: str) -> int:
         for index, tab_data in enumerate(self._request_tab_data):
             if tab_data.request_id == request_id:
-                if self._request_tabs.currentIndex() != index:
-                    self._request_tabs.setCurrentIndex(index)
+                return index
+        return -1
+
+    def _open_request_tab(self, request: WorkspaceRequest) -> int:
+        index = self._tab_index(request.id)
+        if 0 <= index:
+            return index
+        self._evict_tabs(self._max_open_tabs - 1)
+
+        container, tab_data = self._build_request_tab(request)
+        # Register before addTab: adding the first tab emits currentChanged.
+        self._request_tab_data.append(tab_data)
+        return self._request_tabs.addTab(container, request.name)
+
+    def _evict_tabs(self, limit: int) -> None:
+        """Close least recently used tabs, never the current one, down to ``limit``."""
+        while limit < len(self._request_tab_data):
+            current = self._request_tabs.currentIndex()
+            candidates = [index for index in range(len(self._request_tab_data)) if index != current]
+            if not candidates:
                 return
+            oldest = min(
+                candidates,
+                key=lambda index: self._tab_activation.get(self._request_tab_data[index].request_id, -1),
+            )
+            self._close_tab(oldest)
+
+    def _close_tab(self, index: int) -> None:
+        if index < 0 or index >= len(self._request_tab_data):
+            return
+        self._store_tab(index)
+        tab_data = self._request_tab_data.pop(index)
+        self._tab_activation.pop(tab_data.request_id, None)
+        widget = self._request_tabs.widget(index)
+        self._request_tabs.removeTab(index)
+        if widget is not None:
+            widget.deleteLater()
+
+    def _clear_tabs(self) -> None:
+        while 0 < self._request_tabs.count():
+            widget = self._request_tabs.widget(0)
+            self._request_tabs.removeTab(0)
+            if widget is not None:
+                widget.deleteLater()
+
+    def _store_tab(self, index: int) -> None:
+        """Write the editor state of tab ``index`` back into the model."""
+        tab_data = self._request_tab_data[index]
+        body_type_str = "raw"
+        if tab_data.body_type_combo.currentIndex() == 1:
+            body_type_str = "multipart"
+
+        form_fields, files = self._collect_multipart_data(tab_data.multipart_table)
+        previous = self._requests.get(tab_data.request_id)
+        request = WorkspaceRequest(
+            id=tab_data.request_id,
+            folder_id=tab_data.folder_id,
+            name=self._request_tabs.tabText(index),
+            method=tab_data.method_combo.currentText(),
+            url=tab_data.url_edit.text().strip(),
+            headers=self._collect_pairs(tab_data.headers_table),
+            params=self._collect_pairs(tab_data.params_table),
+            body=tab_data.body_editor.toPlainText(),
+            form_fields=form_fields,
+            files=files,
+            body_type=body_type_str,
+            auth=self._resolve_auth(tab_data),
+            timeout_ms=int(tab_data.timeout_spin.value()),
+            network=NetworkConfig(
+                proxy_url=tab_data.proxy_edit.text().strip(),
+                verify_ssl=tab_data.verify_ssl_check.isChecked(),
+                follow_redirects=tab_data.follow_redirects_check.isChecked(),
+                trust_env=tab_data.trust_env_check.isChecked(),
+                simulate=tab_data.simulate_edit.text().strip(),
+            ),
+        )
+        self._add_request(request)
+        if previous is None or (previous.name, previous.method, previous.url) != (
+            request.name,
+            request.method,
+            request.url,
+        ):
+            self.request_changed.emit(request)
 
     def _on_tab_changed(self, index: int) -> None:
         if index < 0 or index >= len(self._request_tab_data):
             return
         tab_data = self._request_tab_data[index]
+        self._activation_tick += 1
+        self._tab_activation[tab_data.request_id] = self._activation_tick
         self.request_selected.emit(tab_data.request_id)
 
     def _create_key_value_table(
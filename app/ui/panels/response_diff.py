@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+from itertools import islice
+
+from PySide6.QtWidgets import (
+    QComboBox,
+    QDialog,
+    QFormLayout,
+    QHBoxLayout,
+    QLabel,
+    QLineEdit,
+    QPlainTextEdit,
+    QPushButton,
+    QVBoxLayout,
+)
+
+from core.diff import DiffMode, DiffOptions, DiffResult, DiffSource, parse_ignore_fields
+from workers.diff_worker import DiffWorker
+
+MAX_RENDERED_LINES = 50000
+MODE_OPTIONS: list[tuple[str, DiffMode]] = [
+    ("Auto", DiffMode.AUTO),
+    ("JSON (structural)", DiffMode.JSON),
+    ("Text (lines)", DiffMode.TEXT),
+]
+
+
+class ResponseDiffDialog(QDialog):
+    """Compares two captured response bodies on a worker thread."""
+
+    def __init__(
+        self,
+        sources: list[DiffSource],
+        ignore_fields: tuple[str, ...] = (),
+        parent=None,
+    ) -> None:
+        super().__init__(parent)
+        self.setWindowTitle("Compare Responses")
+        self.resize(960, 680)
+
+        self._sources = list(sources)
+        self._generation = 0
+        self._workers: set[DiffWorker] = set()
+
+        layout = QVBoxLayout(self)
+        form = QFormLayout()
+        self._left_combo = self._create_source_combo()
+        self._right_combo = self._create_source_combo()
+        if 1 < len(self._sources):
+            # Sources are newest first; default to "previous vs latest".
+            self._left_combo.setCurrentIndex(1)
+            self._right_combo.setCurrentIndex(0)
+        self._mode_combo = QComboBox()
+        for label, _ in MODE_OPTIONS:
+            self._mode_combo.addItem(label)
+        self._ignore_edit = QLineEdit(", ".join(ignore_fields))
+        self._ignore_edit.setPlaceholderText("timestamp, *_at, $.meta.request_id")
+        self._ignore_edit.setToolTip(
+            "Comma separated. Plain names match a key at any depth; "
+            "patterns starting with $ match the full path. Wildcards allowed."
+        )
+        form.addRow("Left", self._left_combo)
+        form.addRow("Right", self._right_combo)
+        form.addRow("Mode", self._mode_combo)
+        form.addRow("Ignore fields", self._ignore_edit)
+        layout.addLayout(form)
+
+        controls = QHBoxLayout()
+        self._compare_button = QPushButton("Compare")
+        self._summary_label = QLabel()
+        controls.addWidget(self._compare_button)
+        controls.addWidget(self._summary_label, stretch=1)
+        layout.addLayout(controls)
+
+        self._output_view = QPlainTextEdit()
+        self._output_view.setReadOnly(True)
+        self._output_view.setUndoRedoEnabled(False)
+        self._output_view.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+        layout.addWidget(self._output_view)
+
+        self._compare_button.clicked.connect(self._start_diff)
+        self._compare_button.setEnabled(1 < len(self._sources))
+        if len(self._sources) < 2:
+            self._summary_label.setText(
+                "Need at least two responses. Send requests or enable history body capture."
+            )
+        else:
+            self._start_diff()
+
+    def ignore_fields(self) -> tuple[str, ...]:
+        return parse_ignore_fields(self._ignore_edit.text())
+
+    def done(self, result: int) -> None:
+        self._cancel_diff()
+        for worker in list(self._workers):
+            worker.wait()
+        super().done(result)
+
+    def _create_source_combo(self) -> QComboBox:
+        combo = QComboBox()
+        for source in self._sources:
+            combo.addItem(source.label)
+        return combo
+
+    def _cancel_diff(self) -> None:
+        self._generation += 1
+        for worker in self._workers:
+            worker.requestInterruption()
+
+    def _start_diff(self) -> None:
+        left_row = self._left_combo.currentIndex()
+        right_row = self._right_combo.currentIndex()
+        if left_row < 0 or right_row < 0:
+            return
+
+        self._cancel_diff()
+        _, mode = MODE_OPTIONS[self._mode_combo.currentIndex()]
+        options = DiffOptions(mode=mode, ignore_fields=self.ignore_fields())
+        worker = DiffWorker(
+            self._generation,
+            self._sources[left_row],
+            self._sources[right_row],
+            options,
+        )
+        worker.completed.connect(self._on_diff_completed)
+        worker.failed.connect(self._on_diff_failed)
+        worker.finished.connect(self._on_worker_finished)
+        self._workers.add(worker)
+        self._summary_label.setText("Comparing...")
+        self._output_view.clear()
+        worker.start()
+
+    def _on_diff_completed(self, generation: int, result: DiffResult) -> None:
+        if generation != self._generation:
+            return
+        if result.identical:
+            self._summary_label.setText("No differences.")
+            return
+
+        unit = "changes" if result.mode is DiffMode.JSON else "changed lines"
+        summary = f"{result.change_count} {unit} ({result.mode.value} diff)"
+        lines = list(islice(result.render(), MAX_RENDERED_LINES + 1))
+        if MAX_RENDERED_LINES < len(lines):
+            lines[MAX_RENDERED_LINES:] = [f"... (showing first {MAX_RENDERED_LINES} lines)"]
+        if result.truncated:
+            summary += ", truncated"
+        self._summary_label.setText(summary)
+        self._output_view.setPlainText("\n".join(lines))
+
+    def _on_diff_failed(self, generation: int, message: str) -> None:
+        if generation != self._generation:
+            return
+        self._summary_label.setText(f"Diff failed: {message}")
+
+    def _on_worker_finished(self) -> None:
+        worker = self.sender()
+        if not isinstance(worker, DiffWorker):
+            return
+        self._workers.discard(worker)
+        worker.deleteLater()
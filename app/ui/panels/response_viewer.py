@@ -1,14 +1,30 @@
-import json
+from core.json_index import JsonIndex
 from core.model import HistoryEntry, ResponseData
+from core.text_search import SearchQuery, astral_offsets, utf16_position
+from PySide6.QtCore import QModelIndex, QPoint, Qt, QTimer
+from PySide6.QtGui import QGuiApplication, QKeySequence, QShortcut, QTextCursor
 from PySide6.QtWidgets import (
+    QCheckBox,
     QHBoxLayout,
     QLabel,
+    QLineEdit,
+    QMenu,
     QPlainTextEdit,
+    QPushButton,
     QTabWidget,
+    QTreeView,
     QVBoxLayout,
     QWidget,
 )
 
+from app.ui.panels.json_tree import JsonTreeModel
+from workers.format_worker import ResponseFormatWorker
+from workers.json_index_worker import JsonIndexWorker
+from workers.search_worker import SearchWorker
+
+DEFAULT_PREVIEW_LIMIT_CHARS = 1024 * 1024
+SEARCH_DEBOUNCE_MS = 200
+
 
 class ResponseViewerPanel(QWidget):
     def __init__(self) -> None:
@@ -25,53 +41,146 @@ class ResponseViewerPanel(QWidget):
 
         layout.addLayout(header_row)
 
+        self._truncation_bar = QWidget()
+        truncation_layout = QHBoxLayout(self._truncation_bar)
+        truncation_layout.setContentsMargins(0, 0, 0, 0)
+        self._truncation_label = QLabel()
+        self._load_full_button = QPushButton("Load full")
+        self._load_full_button.clicked.connect(self._on_load_full_clicked)
+        truncation_layout.addWidget(self._truncation_label)
+        truncation_layout.addStretch()
+        truncation_layout.addWidget(self._load_full_button)
+        self._truncation_bar.setVisible(False)
+        layout.addWidget(self._truncation_bar)
+
+        search_row = QHBoxLayout()
+        self._find_edit = QLineEdit()
+        self._find_edit.setPlaceholderText("Find in body")
+        self._find_edit.setClearButtonEnabled(True)
+        self._regex_check = QCheckBox("Regex")
+        self._case_check = QCheckBox("Aa")
+        self._case_check.setToolTip("Match case")
+        self._match_label = QLabel()
+        self._prev_match_button = QPushButton("Prev")
+        self._next_match_button = QPushButton("Next")
+        search_row.addWidget(self._find_edit, stretch=1)
+        search_row.addWidget(self._regex_check)
+        search_row.addWidget(self._case_check)
+        search_row.addWidget(self._match_label)
+        search_row.addWidget(self._prev_match_button)
+        search_row.addWidget(self._next_match_button)
+        layout.addLayout(search_row)
+
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self._run_search)
+        self._find_edit.textChanged.connect(self._search_timer.start)
+        self._regex_check.toggled.connect(self._search_timer.start)
+        self._case_check.toggled.connect(self._search_timer.start)
+        self._find_edit.returnPressed.connect(self._select_next_match)
+        self._next_match_button.clicked.connect(self._select_next_match)
+        self._prev_match_button.clicked.connect(self._select_previous_match)
+
+        find_shortcut = QShortcut(QKeySequence(QKeySequence.StandardKey.Find), self)
+        find_shortcut.setContext(Qt.ShortcutContext.WidgetWithChildrenShortcut)
+        find_shortcut.activated.connect(self._focus_find)
+        previous_shortcut = QShortcut(QKeySequence("Shift+Return"), self._find_edit)
+        previous_shortcut.setContext(Qt.ShortcutContext.WidgetShortcut)
+        previous_shortcut.activated.connect(self._select_previous_match)
+
         self._response_tabs = QTabWidget()
         self._body_view = QPlainTextEdit()
         self._body_view.setReadOnly(True)
+        self._body_view.setUndoRedoEnabled(False)
         self._headers_view = QPlainTextEdit()
         self._headers_view.setReadOnly(True)
 
+        self._tree_tab = QWidget()
+        tree_layout = QVBoxLayout(self._tree_tab)
+        tree_layout.setContentsMargins(0, 0, 0, 0)
+        self._tree_status = QLabel("No JSON body.")
+        self._tree_model = JsonTreeModel(self)
+        self._tree_view = QTreeView()
+        self._tree_view.setModel(self._tree_model)
+        self._tree_view.setUniformRowHeights(True)
+        self._tree_view.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self._tree_view.customContextMenuRequested.connect(self._on_tree_context_menu)
+        self._tree_view.doubleClicked.connect(self._show_node_in_text)
+        tree_layout.addWidget(self._tree_status)
+        tree_layout.addWidget(self._tree_view)
+
         self._response_tabs.addTab(self._body_view, "Body")
         self._response_tabs.addTab(self._headers_view, "Headers")
+        self._response_tabs.addTab(self._tree_tab, "Tree")
+        self._response_tabs.currentChanged.connect(self._on_response_tab_changed)
 
         layout.addWidget(self._response_tabs)
 
+        self._preview_limit_chars = DEFAULT_PREVIEW_LIMIT_CHARS
+        self._current_body: str | None = None
+        self._render_generation = 0
+        self._awaiting_first_chunk = False
+        self._format_workers: set[ResponseFormatWorker] = set()
+        self._index_workers: set[JsonIndexWorker] = set()
+        self._render_is_json = False
+        self._tree_needs_index = False
+        self._tree_index: JsonIndex | None = None
+        self._displayed_text: str | None = None
+        # Offsets of non-BMP characters in the displayed text, for selections.
+        self._astral_offsets: list[int] = []
+        # Formatted output of the running render, kept so search and the JSON
+        # index get the text without reading it back from the document.
+        self._render_chunks: list[str] = []
+        self._search_generation = 0
+        self._search_workers: set[SearchWorker] = set()
+        self._matches: list[tuple[int, int]] = []
+        self._match_index = -1
+        self._search_complete = False
+
+    def set_preview_limit(self, limit_chars: int) -> None:
+        """Bodies longer than this are shown raw and truncated until "Load full" is used. 0 disables."""
+        self._preview_limit_chars = max(0, limit_chars)
+
+    def clear(self) -> None:
+        """Back to the empty state, e.g. for a tab that has not been sent yet."""
+        self._status_label.setText("Status: --")
+        self._time_label.setText("Time: --")
+        self._set_body_text("")
+        self._headers_view.setPlainText("")
+
     def set_loading(self, request_name: str) -> None:
         self._status_label.setText(f"Status: Sending ({request_name})")
         self._time_label.setText("Time: --")
-        self._body_view.setPlainText("Sending request...")
+        self._set_body_text("Sending request...")
         self._headers_view.setPlainText("")
 
     def set_canceling(self) -> None:
         self._status_label.setText("Status: Canceling")
         self._time_label.setText("Time: --")
-        self._body_view.setPlainText("Canceling request...")
+        self._set_body_text("Canceling request...")
         self._headers_view.setPlainText("")
 
-    def set_response(self, response: ResponseData) -> None:
+    def set_response(self, response: ResponseData, body_length: int | None = None) -> None:
+        """Show ``response``; ``body_length`` is the original size when its body was cut short."""
         self._status_label.setText(f"Status: {response.status_code}")
         self._time_label.setText(f"Time: {response.elapsed_ms} ms")
-        
-        display_body = response.body
-        try:
-            parsed = json.loads(display_body)
-            display_body = json.dumps(parsed, indent=4, ensure_ascii=False)
-        except (json.JSONDecodeError, TypeError):
-            pass
-            
-        self._body_view.setPlainText(display_body)
         self._headers_view.setPlainText(self._format_headers(response.headers))
+        if body_length is not None and len(response.body) < body_length:
+            self._show_partial_body(response.body, body_length)
+            return
+        self._show_body(response.body)
 
     def set_canceled(self) -> None:
         self._status_label.setText("Status: Canceled")
         self._time_label.setText("Time: --")
-        self._body_view.setPlainText("Request canceled by user.")
+        self._set_body_text("Request canceled by user.")
         self._headers_view.setPlainText("")
 
     def set_error(self, message: str) -> None:
         self._status_label.setText("Status: Error")
         self._time_label.setText("Time: --")
-        self._body_view.setPlainText(message)
+        self._set_body_text(message)
         self._headers_view.setPlainText("")
 
     def set_font_size(self, size: int) -> None:
@@ -106,8 +215,297 @@ class ResponseViewerPanel(QWidget):
         if entry.elapsed_ms is not None:
             body_lines.append(f"Elapsed: {entry.elapsed_ms} ms")
 
-        self._body_view.setPlainText("\n".join(body_lines))
         self._headers_view.setPlainText("")
+        if entry.response_body is not None:
+            self._show_body(entry.response_body)
+            return
+        self._set_body_text("\n".join(body_lines))
+
+    def shutdown(self) -> None:
+        self._cancel_render()
+        self._cancel_search()
+        workers = list(self._format_workers) + list(self._index_workers) + list(self._search_workers)
+        for worker in workers:
+            worker.wait()
+
+    def _set_body_text(self, text: str) -> None:
+        self._cancel_render()
+        self._current_body = None
+        self._truncation_bar.setVisible(False)
+        self._body_view.setPlainText(text)
+        self._set_displayed_text(text, astral_offsets(text))
+
+    def _show_body(self, body: str) -> None:
+        self._current_body = body
+        limit = self._preview_limit_chars
+        if 0 < limit < len(body):
+            self._truncation_label.setText(
+                f"Showing first {self._format_size(limit)} of {self._format_size(len(body))} (raw)."
+            )
+            self._load_full_button.setVisible(True)
+            self._truncation_bar.setVisible(True)
+            self._start_render(body[:limit], pretty=False)
+            return
+
+        self._truncation_bar.setVisible(False)
+        self._start_render(body, pretty=True)
+
+    def _show_partial_body(self, body: str, body_length: int) -> None:
+        # Only the start of the body was kept, so there is nothing more to load.
+        self._current_body = None
+        self._truncation_label.setText(
+            f"Showing first {self._format_size(len(body))} of {self._format_size(body_length)} (raw). "
+            "Send the request again to see the rest."
+        )
+        self._load_full_button.setVisible(False)
+        self._truncation_bar.setVisible(True)
+        self._start_render(body, pretty=False)
+
+    def _on_load_full_clicked(self) -> None:
+        if self._current_body is None:
+            return
+        self._truncation_bar.setVisible(False)
+        self._start_render(self._current_body, pretty=True)
+
+    def _start_render(self, text: str, pretty: bool) -> None:
+        self._cancel_render()
+        generation = self._render_generation
+        self._awaiting_first_chunk = True
+        self._render_chunks = []
+        self._render_is_json = pretty and ResponseFormatWorker.looks_like_json(text)
+        self._body_view.setPlainText("Formatting response...")
+
+        worker = ResponseFormatWorker(generation, text, pretty=pretty)
+        worker.chunk_ready.connect(self._on_chunk_ready)
+        worker.reset.connect(self._on_render_reset)
+        worker.completed.connect(self._on_render_completed)
+        worker.finished.connect(self._on_worker_finished)
+        self._format_workers.add(worker)
+        worker.start()
+
+    def _cancel_render(self) -> None:
+        self._render_generation += 1
+        for worker in self._format_workers:
+            worker.requestInterruption()
+        for worker in self._index_workers:
+            worker.requestInterruption()
+        self._render_is_json = False
+        self._tree_needs_index = False
+        self._tree_index = None
+        self._tree_model.set_index(None)
+        self._tree_status.setText("No JSON body.")
+        self._tree_status.setVisible(True)
+        self._displayed_text = None
+        self._astral_offsets = []
+        self._render_chunks = []
+        self._cancel_search()
+
+    def _on_chunk_ready(self, generation: int, chunk: str) -> None:
+        if generation != self._render_generation:
+            return
+        if self._awaiting_first_chunk:
+            self._awaiting_first_chunk = False
+            self._body_view.clear()
+        cursor = QTextCursor(self._body_view.document())
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.insertText(chunk)
+        self._render_chunks.append(chunk)
+
+    def _on_render_reset(self, generation: int) -> None:
+        if generation != self._render_generation:
+            return
+        self._awaiting_first_chunk = False
+        self._render_is_json = False
+        self._render_chunks = []
+        self._body_view.clear()
+
+    def _on_render_completed(self, generation: int, astral: list[int]) -> None:
+        if generation != self._render_generation:
+            return
+        if self._awaiting_first_chunk:
+            self._awaiting_first_chunk = False
+            self._body_view.clear()
+        text = "".join(self._render_chunks)
+        self._render_chunks = []
+        self._set_displayed_text(text, astral)
+        if not self._render_is_json:
+            return
+        self._tree_needs_index = True
+        self._tree_status.setText("Open this tab to explore the JSON structure.")
+        if self._response_tabs.currentWidget() is self._tree_tab:
+            self._start_indexing()
+
+    def _on_response_tab_changed(self, _index: int) -> None:
+        if self._response_tabs.currentWidget() is self._tree_tab and self._tree_needs_index:
+            self._start_indexing()
+
+    def _start_indexing(self) -> None:
+        self._tree_needs_index = False
+        self._tree_status.setText("Indexing JSON...")
+        worker = JsonIndexWorker(self._render_generation, self._displayed_text or "")
+        worker.index_ready.connect(self._on_index_ready)
+        worker.failed.connect(self._on_index_failed)
+        worker.finished.connect(self._on_worker_finished)
+        self._index_workers.add(worker)
+        worker.start()
+
+    def _on_index_ready(self, generation: int, index: object) -> None:
+        if generation != self._render_generation or not isinstance(index, JsonIndex):
+            return
+        self._tree_index = index
+        self._tree_model.set_index(index)
+        self._tree_status.setVisible(False)
+        if 1 == self._tree_model.rowCount():
+            self._tree_view.expand(self._tree_model.index(0, 0))
+
+    def _on_index_failed(self, generation: int, message: str) -> None:
+        if generation != self._render_generation:
+            return
+        self._tree_status.setText(f"Cannot build tree: {message}")
+
+    def _on_tree_context_menu(self, pos: QPoint) -> None:
+        index = self._tree_view.indexAt(pos)
+        node = self._tree_model.node(index)
+        if node is None or self._tree_index is None:
+            return
+        text = self._tree_index.text
+        menu = QMenu(self._tree_view)
+        copy_path_action = menu.addAction("Copy Path")
+        copy_value_action = menu.addAction("Copy Value")
+        show_action = menu.addAction("Show in Text")
+        chosen = menu.exec(self._tree_view.viewport().mapToGlobal(pos))
+        if chosen is copy_path_action:
+            QGuiApplication.clipboard().setText(node.path)
+        elif chosen is copy_value_action:
+            QGuiApplication.clipboard().setText(text[node.start : node.end])
+        elif chosen is show_action:
+            self._show_node_in_text(index)
+
+    def _show_node_in_text(self, index: QModelIndex) -> None:
+        node = self._tree_model.node(index)
+        if node is None or self._tree_index is None:
+            return
+        # The index was built from the displayed text, so its offsets line up.
+        self._select_text_range(node.start, node.end)
+
+    def _set_displayed_text(self, text: str, astral: list[int]) -> None:
+        self._displayed_text = text
+        self._astral_offsets = astral
+        if 0 < len(self._find_edit.text()):
+            self._run_search()
+
+    def _focus_find(self) -> None:
+        self._find_edit.setFocus()
+        self._find_edit.selectAll()
+
+    def _cancel_search(self) -> None:
+        self._search_timer.stop()
+        self._search_generation += 1
+        for worker in self._search_workers:
+            worker.requestInterruption()
+        self._matches = []
+        self._match_index = -1
+        self._search_complete = False
+
+    def _run_search(self) -> None:
+        self._cancel_search()
+        pattern = self._find_edit.text()
+        if 0 == len(pattern):
+            self._match_label.setText("")
+            return
+        if self._displayed_text is None:
+            self._match_label.setText("Waiting for body...")
+            return
+
+        query = SearchQuery(
+            pattern=pattern,
+            regex=self._regex_check.isChecked(),
+            case_sensitive=self._case_check.isChecked(),
+        )
+        self._match_label.setText("Searching...")
+        worker = SearchWorker(self._search_generation, self._displayed_text, query)
+        worker.matches_found.connect(self._on_matches_found)
+        worker.completed.connect(self._on_search_completed)
+        worker.failed.connect(self._on_search_failed)
+        worker.finished.connect(self._on_worker_finished)
+        self._search_workers.add(worker)
+        worker.start()
+
+    def _on_matches_found(self, generation: int, batch: list) -> None:
+        if generation != self._search_generation:
+            return
+        self._matches.extend(batch)
+        if -1 == self._match_index:
+            self._match_index = 0
+            self._select_match()
+        self._update_match_label()
+
+    def _on_search_completed(self, generation: int) -> None:
+        if generation != self._search_generation:
+            return
+        self._search_complete = True
+        self._update_match_label()
+
+    def _on_search_failed(self, generation: int, message: str) -> None:
+        if generation != self._search_generation:
+            return
+        self._match_label.setText(f"Invalid pattern: {message}")
+
+    def _select_next_match(self) -> None:
+        if 0 == len(self._matches):
+            return
+        self._match_index = (self._match_index + 1) % len(self._matches)
+        self._select_match()
+        self._update_match_label()
+
+    def _select_previous_match(self) -> None:
+        if 0 == len(self._matches):
+            return
+        self._match_index = (self._match_index - 1) % len(self._matches)
+        self._select_match()
+        self._update_match_label()
+
+    def _select_match(self) -> None:
+        if self._displayed_text is None or not (0 <= self._match_index < len(self._matches)):
+            return
+        start, end = self._matches[self._match_index]
+        self._select_text_range(start, end)
+
+    def _update_match_label(self) -> None:
+        count = len(self._matches)
+        if 0 == count:
+            self._match_label.setText("No matches" if self._search_complete else "Searching...")
+            return
+        suffix = "" if self._search_complete else "+"
+        self._match_label.setText(f"{self._match_index + 1} / {count}{suffix}")
+
+    def _select_text_range(self, start: int, end: int) -> None:
+        cursor = self._body_view.textCursor()
+        cursor.setPosition(utf16_position(self._astral_offsets, start))
+        cursor.setPosition(utf16_position(self._astral_offsets, end), QTextCursor.MoveMode.KeepAnchor)
+        self._response_tabs.setCurrentWidget(self._body_view)
+        self._body_view.setTextCursor(cursor)
+        self._body_view.centerCursor()
+
+    def _on_worker_finished(self) -> None:
+        worker = self.sender()
+        if isinstance(worker, ResponseFormatWorker):
+            self._format_workers.discard(worker)
+        elif isinstance(worker, JsonIndexWorker):
+            self._index_workers.discard(worker)
+        elif isinstance(worker, SearchWorker):
+            self._search_workers.discard(worker)
+        else:
+            return
+        worker.deleteLater()
+
+    @staticmethod
+    def _format_size(length: int) -> str:
+        if length < 1024:
+            return f"{length} chars"
+        if length < 1024 * 1024:
+            return f"{length / 1024:.1f} K chars"
+        return f"{length / (1024 * 1024):.1f} M chars"
 
     @staticmethod
     def _format_headers(headers: list[tuple[str, str]]) -> str:
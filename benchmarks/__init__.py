@@ -0,0 +1,6 @@
+"""Benchmark suite: ``python -m benchmarks run`` / ``python -m benchmarks compare``.
+
+Importing the package registers every benchmark in ``harness.REGISTRY``.
+"""
+
+from benchmarks import bench_core, bench_http  # noqa: F401
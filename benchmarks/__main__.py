@@ -0,0 +1,89 @@
+"""Run the benchmarks or compare two result files.
+
+    python -m benchmarks run -o bench-results.json
+    python -m benchmarks run --quick -k workspace -k http.send
+    python -m benchmarks compare baseline.json bench-results.json --threshold 0.15
+
+``compare`` exits with status 1 when any benchmark got slower than the
+threshold (a fraction of the baseline median time).
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+from pathlib import Path
+
+from benchmarks.harness import (
+    DEFAULT_REPEAT,
+    DEFAULT_THRESHOLD,
+    REGISTRY,
+    BenchContext,
+    compare,
+    format_comparison,
+    format_result,
+    load_results,
+    run_benchmarks,
+    save_results,
+    select,
+)
+
+
+def _parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="run benchmarks and optionally save the results")
+    run.add_argument("-k", "--match", action="append", default=[], help="only names containing this (repeatable)")
+    run.add_argument("--quick", action="store_true", help="skip the slowest sizes (100k workspaces, 1M history)")
+    run.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="timed runs per benchmark")
+    run.add_argument("-o", "--output", help="write results JSON here")
+
+    listing = commands.add_parser("list", help="list benchmark names")
+    listing.add_argument("--quick", action="store_true", help="only those run with --quick")
+
+    comparison = commands.add_parser("compare", help="compare two results files")
+    comparison.add_argument("baseline")
+    comparison.add_argument("current")
+    comparison.add_argument(
+        "--threshold", type=float, default=DEFAULT_THRESHOLD, help="allowed slowdown as a fraction (default 0.10)"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(sys.argv[1:] if argv is None else argv)
+    if args.command == "list":
+        for item in select(REGISTRY, quick=args.quick):
+            sys.stdout.write(f"{item.name}\t{item.group}\t{item.unit}\n")
+        return 0
+
+    if args.command == "compare":
+        try:
+            baseline = load_results(args.baseline)
+            current = load_results(args.current)
+        except (OSError, ValueError) as exc:
+            sys.stderr.write(f"error: {exc}\n")
+            return 2
+        comparisons = compare(baseline, current)
+        sys.stdout.write(format_comparison(comparisons, args.threshold) + "\n")
+        return 1 if any(item.is_regression(args.threshold) for item in comparisons) else 0
+
+    selected = select(REGISTRY, args.match, args.quick)
+    if not selected:
+        sys.stderr.write("error: no benchmark matches\n")
+        return 2
+    with tempfile.TemporaryDirectory(prefix="bench-") as work_dir:
+        context = BenchContext(Path(work_dir), quick=args.quick)
+        results = run_benchmarks(
+            selected, context, args.repeat, on_result=lambda result: print(format_result(result), flush=True)
+        )
+    if args.output:
+        save_results(args.output, results, args.quick)
+        sys.stderr.write(f"Results written to {args.output}\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+"""Template rendering, Quick Open search, workspace storage and history loading."""
+
+from __future__ import annotations
+
+import random
+from collections.abc import Callable
+from pathlib import Path
+
+from benchmarks.harness import BenchContext, benchmark
+from benchmarks.synthetic import make_variables, make_workspace, write_history
+from core.fuzzy_index import FuzzyEntry, FuzzyIndex
+from core.runner import to_request_data
+from core.storage.history_jsonl import load_history_entries
+from core.storage.json_storage import load_workspace, save_workspace
+from core.template import render_request
+
+_WORKSPACE_SIZES = {"1k": 1_000, "10k": 10_000, "100k": 100_000}
+_HISTORY_SIZES = {"100k": 100_000, "1M": 1_000_000}
+# Matches the ``history_max_items`` the startup loader asks for by default.
+_HISTORY_TAIL = 100
+_QUICK_OPEN_REQUESTS = 50_000
+# Broad prefixes match most of the workspace; the last one is misspelt.
+_QUICK_OPEN_QUERIES = ("g", "get", "s", "api", "user", "post items", "delete tem", "sesions")
+
+
+@benchmark("template.render_request", group="core", unit="requests")
+def render_templated_requests(context: BenchContext) -> Callable[[], int]:
+    requests = [to_request_data(request) for request in make_workspace(2_000).requests]
+    variables = make_variables(random.Random(1))
+
+    def run() -> int:
+        for request in requests:
+            render_request(request, variables)
+        return len(requests)
+
+    return run
+
+
+@benchmark("quick_open.search[50k]", group="core", unit="queries")
+def search_quick_open(context: BenchContext) -> Callable[[], int]:
+    workspace = make_workspace(_QUICK_OPEN_REQUESTS)
+    folders = {folder.id: folder.name for folder in workspace.folders}
+    index = FuzzyIndex()
+    for request in workspace.requests:
+        index.add(FuzzyEntry(request.id, request.name, request.method, request.url, folders[request.folder_id]))
+
+    def run() -> int:
+        for query in _QUICK_OPEN_QUERIES:
+            index.search(query)
+        return len(_QUICK_OPEN_QUERIES)
+
+    return run
+
+
+def _workspace_path(context: BenchContext, label: str) -> Path:
+    def _build() -> Path:
+        path = context.work_dir / f"workspace-{label}.json"
+        save_workspace(path, make_workspace(_WORKSPACE_SIZES[label]))
+        return path
+
+    return context.shared(f"workspace:{label}", _build)
+
+
+def _register_workspace(label: str) -> None:
+    full_only = _WORKSPACE_SIZES[label] > 10_000
+
+    @benchmark(f"workspace.load[{label}]", group="storage", unit="requests", full_only=full_only)
+    def load(context: BenchContext) -> Callable[[], int]:
+        path = _workspace_path(context, label)
+        return lambda: len(load_workspace(path).requests)
+
+    @benchmark(f"workspace.save[{label}]", group="storage", unit="requests", full_only=full_only)
+    def save(context: BenchContext) -> Callable[[], int]:
+        workspace = load_workspace(_workspace_path(context, label))
+        target = context.work_dir / f"workspace-{label}-saved.json"
+
+        def run() -> int:
+            save_workspace(target, workspace)
+            return len(workspace.requests)
+
+        return run
+
+
+def _register_history(label: str) -> None:
+    full_only = _HISTORY_SIZES[label] > 100_000
+
+    def _history_path(context: BenchContext) -> Path:
+        return context.shared(
+            f"history:{label}",
+            lambda: write_history(context.work_dir / f"history-{label}.jsonl", _HISTORY_SIZES[label]),
+        )
+
+    @benchmark(f"history.load[{label}]", group="storage", unit="lines", full_only=full_only)
+    def load(context: BenchContext) -> Callable[[], int]:
+        path = _history_path(context)
+        return lambda: len(load_history_entries(path))
+
+    @benchmark(f"history.load_tail[{label}]", group="storage", unit="lines", full_only=full_only)
+    def load_tail(context: BenchContext) -> Callable[[], int]:
+        path = _history_path(context)
+
+        def run() -> int:
+            load_history_entries(path, limit=_HISTORY_TAIL)
+            # Every line is still scanned to find the tail.
+            return _HISTORY_SIZES[label]
+
+        return run
+
+
+for _label in _WORKSPACE_SIZES:
+    _register_workspace(_label)
+for _label in _HISTORY_SIZES:
+    _register_history(_label)
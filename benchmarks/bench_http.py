@@ -0,0 +1,114 @@
+"""``HttpClient`` against the in-process mock server: per-request overhead, upload and download."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+
+import httpx
+
+from benchmarks.harness import UNIT_BYTES, BenchContext, benchmark
+from core.http_client import HttpClient
+from core.mock_server import MockResponse, MockRoute, MockServerThread, RouteTable
+from core.model import NetworkConfig, RequestData
+
+_SMALL_REQUESTS = 200
+# A new client per send sets up TLS context and pool each time, so fewer calls suffice.
+_NEW_CLIENT_REQUESTS = 25
+_UPLOAD_BYTES = 8 * 1024 * 1024
+_UPLOADS = 4
+_DOWNLOAD_BYTES = 32 * 1024 * 1024
+_DOWNLOADS = 2
+
+
+def _server(context: BenchContext) -> MockServerThread:
+    def _start() -> MockServerThread:
+        routes = RouteTable.build(
+            [
+                MockRoute("GET", "/ping", "ping", MockResponse(200, body=b'{"ok": true}')),
+                MockRoute("POST", "/upload", "upload", MockResponse(204)),
+                MockRoute(
+                    "GET",
+                    "/download",
+                    "download",
+                    MockResponse(200, (("Content-Type", "text/plain"),), b"x" * _DOWNLOAD_BYTES),
+                ),
+            ]
+        )
+        server = MockServerThread(routes)
+        server.start()
+        return server
+
+    return context.shared("mock_server", _start, MockServerThread.stop)
+
+
+def _request(url: str, method: str = "GET", **fields) -> RequestData:
+    # Benchmarks must not pick up a proxy from the environment.
+    return RequestData(name="bench", method=method, url=url, network=NetworkConfig(trust_env=False), **fields)
+
+
+def _client(context: BenchContext, key: str, http_client: HttpClient, request: RequestData) -> httpx.Client:
+    return context.shared(key, lambda: http_client.create_client(request), lambda client: client.close())
+
+
+@benchmark("http.send[new_client]", group="http", unit="requests")
+def send_with_new_client(context: BenchContext) -> Callable[[], int]:
+    request = _request(_server(context).url + "/ping")
+    http_client = HttpClient()
+
+    def run() -> int:
+        for _ in range(_NEW_CLIENT_REQUESTS):
+            http_client.send(request)
+        return _NEW_CLIENT_REQUESTS
+
+    return run
+
+
+@benchmark("http.send[pooled]", group="http", unit="requests")
+def send_with_pooled_client(context: BenchContext) -> Callable[[], int]:
+    request = _request(_server(context).url + "/ping")
+    http_client = HttpClient()
+    client = _client(context, "client:ping", http_client, request)
+
+    def run() -> int:
+        for _ in range(_SMALL_REQUESTS):
+            http_client.send(request, client)
+        return _SMALL_REQUESTS
+
+    return run
+
+
+@benchmark("http.upload[multipart]", group="http", unit=UNIT_BYTES)
+def multipart_upload(context: BenchContext) -> Callable[[], int]:
+    upload_path = context.work_dir / "upload.bin"
+    upload_path.write_bytes(bytes(range(256)) * (_UPLOAD_BYTES // 256))
+    request = _request(
+        _server(context).url + "/upload",
+        method="POST",
+        body_type="multipart",
+        form_fields=[("description", "benchmark upload")],
+        files=[("file", str(upload_path))],
+    )
+    http_client = HttpClient()
+    client = _client(context, "client:upload", http_client, request)
+
+    def run() -> int:
+        for _ in range(_UPLOADS):
+            http_client.send(request, client)
+        return _UPLOADS * _UPLOAD_BYTES
+
+    return run
+
+
+@benchmark("http.download[large]", group="http", unit=UNIT_BYTES)
+def large_download(context: BenchContext) -> Callable[[], int]:
+    request = _request(_server(context).url + "/download")
+    http_client = HttpClient()
+    client = _client(context, "client:download", http_client, request)
+
+    def run() -> int:
+        received = 0
+        for _ in range(_DOWNLOADS):
+            received += len(http_client.send(request, client).body)
+        return received
+
+    return run
@@ -0,0 +1,97 @@
+"""Wall-time and memory budgets for scale tests.
+
+``measure_usage`` runs the callable twice: once plainly for wall time, and
+once under ``tracemalloc`` for the peak of Python allocations, because
+tracing slows allocation-heavy code down several times. The process's peak
+RSS is recorded as well where the platform reports it; it only grows when
+the call sets a new high-water mark, so it is a coarse, secondary signal.
+"""
+
+from __future__ import annotations
+
+import gc
+import os
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TypeVar
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None  # type: ignore[assignment]
+
+T = TypeVar("T")
+
+_MB = 1024 * 1024
+# Multiplies every time budget, for slow or shared CI machines.
+TIME_FACTOR_ENV = "BUDGET_TIME_FACTOR"
+
+
+@dataclass(frozen=True, slots=True)
+class Budget:
+    max_seconds: float
+    max_peak_mb: float
+    # Growth of the process's peak RSS; None skips the check.
+    max_rss_growth_mb: float | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class Usage:
+    seconds: float
+    peak_mb: float
+    # None where the platform does not report peak RSS.
+    rss_growth_mb: float | None
+
+    def describe(self) -> str:
+        rss = "n/a" if self.rss_growth_mb is None else f"{self.rss_growth_mb:.1f} MB"
+        return f"{self.seconds:.3f} s, traced peak {self.peak_mb:.1f} MB, peak RSS growth {rss}"
+
+
+def measure_usage(func: Callable[[], T]) -> tuple[T, Usage]:
+    """Return ``func()``'s result (from the traced run) and its usage."""
+    gc.collect()
+    started = time.perf_counter()
+    func()
+    seconds = time.perf_counter() - started
+
+    gc.collect()
+    rss_before = _peak_rss_bytes()
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        result = func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    rss_after = _peak_rss_bytes()
+    rss_growth = None if rss_before is None or rss_after is None else (rss_after - rss_before) / _MB
+    return result, Usage(seconds, peak / _MB, rss_growth)
+
+
+def check_budget(label: str, usage: Usage, budget: Budget) -> None:
+    """Raise ``AssertionError`` naming every exceeded limit."""
+    problems = []
+    max_seconds = budget.max_seconds * float(os.environ.get(TIME_FACTOR_ENV) or 1.0)
+    if usage.seconds > max_seconds:
+        problems.append(f"took {usage.seconds:.3f} s (budget {max_seconds:.3f} s)")
+    if usage.peak_mb > budget.max_peak_mb:
+        problems.append(f"allocated a {usage.peak_mb:.1f} MB peak (budget {budget.max_peak_mb:.1f} MB)")
+    if (
+        budget.max_rss_growth_mb is not None
+        and usage.rss_growth_mb is not None
+        and usage.rss_growth_mb > budget.max_rss_growth_mb
+    ):
+        problems.append(f"grew peak RSS by {usage.rss_growth_mb:.1f} MB (budget {budget.max_rss_growth_mb:.1f} MB)")
+    if problems:
+        raise AssertionError(f"{label} over budget: " + "; ".join(problems) + f" [{usage.describe()}]")
+
+
+def _peak_rss_bytes() -> int | None:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS.
+    return peak if sys.platform == "darwin" else peak * 1024
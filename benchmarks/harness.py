@@ -0,0 +1,266 @@
+"""Registry, timing loop, result files and baseline comparison for the benchmarks.
+
+A benchmark is a setup function decorated with ``@benchmark``. It receives
+the shared ``BenchContext``, does its (untimed) preparation and returns the
+callable to time. That callable returns how much work one call did, in the
+benchmark's ``unit`` (requests, bytes, lines...), so results can be shown
+both as time per call and as throughput.
+"""
+
+from __future__ import annotations
+
+import datetime
+import gc
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+RESULTS_VERSION = 1
+DEFAULT_REPEAT = 5
+DEFAULT_THRESHOLD = 0.10
+
+UNIT_BYTES = "bytes"
+
+
+@dataclass(frozen=True, slots=True)
+class Benchmark:
+    name: str
+    group: str
+    unit: str
+    setup: Callable[[BenchContext], Callable[[], int]]
+    # Benchmarks too slow for a quick run (e.g. million-line files).
+    full_only: bool = False
+
+
+@dataclass(slots=True)
+class BenchResult:
+    name: str
+    group: str
+    unit: str
+    repeat: int
+    # Work done by one timed call, in ``unit``.
+    work: int
+    median_s: float
+    min_s: float
+    max_s: float
+    stdev_s: float
+
+    @property
+    def throughput(self) -> float:
+        """``unit`` per second at the median time."""
+        return self.work / self.median_s if self.median_s > 0 else 0.0
+
+
+@dataclass(slots=True)
+class Comparison:
+    name: str
+    baseline_s: float | None
+    current_s: float | None
+
+    @property
+    def ratio(self) -> float | None:
+        """Current over baseline median; above 1 is slower."""
+        if not self.baseline_s or self.current_s is None:
+            return None
+        return self.current_s / self.baseline_s
+
+    def is_regression(self, threshold: float) -> bool:
+        ratio = self.ratio
+        return ratio is not None and ratio > 1.0 + threshold
+
+
+@dataclass(slots=True)
+class BenchContext:
+    """What setups share: a scratch directory and lazily started helpers.
+
+    ``cleanup`` callbacks run when the whole run ends, so an expensive
+    fixture (a generated million-line file, the local server) is built once.
+    """
+
+    work_dir: Path
+    quick: bool = False
+    _cache: dict[str, Any] = field(default_factory=dict)
+    _cleanups: list[Callable[[], None]] = field(default_factory=list)
+
+    def shared(self, key: str, factory: Callable[[], Any], cleanup: Callable[[Any], None] | None = None) -> Any:
+        if key not in self._cache:
+            value = factory()
+            self._cache[key] = value
+            if cleanup is not None:
+                self._cleanups.append(lambda: cleanup(value))
+        return self._cache[key]
+
+    def close(self) -> None:
+        while self._cleanups:
+            self._cleanups.pop()()
+        self._cache.clear()
+
+
+REGISTRY: list[Benchmark] = []
+
+
+def benchmark(
+    name: str, group: str, unit: str, full_only: bool = False
+) -> Callable[[Callable[[BenchContext], Callable[[], int]]], Callable[[BenchContext], Callable[[], int]]]:
+    def _register(setup: Callable[[BenchContext], Callable[[], int]]) -> Callable[[BenchContext], Callable[[], int]]:
+        if any(item.name == name for item in REGISTRY):
+            raise ValueError(f"duplicate benchmark: {name}")
+        REGISTRY.append(Benchmark(name, group, unit, setup, full_only))
+        return setup
+
+    return _register
+
+
+def select(benchmarks: Iterable[Benchmark], patterns: Sequence[str] = (), quick: bool = False) -> list[Benchmark]:
+    """Benchmarks whose name contains any of ``patterns`` (all when empty)."""
+    return [
+        item
+        for item in benchmarks
+        if (not patterns or any(pattern in item.name for pattern in patterns)) and not (quick and item.full_only)
+    ]
+
+
+def measure(item: Benchmark, context: BenchContext, repeat: int = DEFAULT_REPEAT) -> BenchResult:
+    """Run ``item`` once to warm up, then ``repeat`` timed times."""
+    run = item.setup(context)
+    work = run()
+    timings: list[float] = []
+    for _ in range(max(1, repeat)):
+        # Garbage from the previous call should not be collected on this one's clock.
+        gc.collect()
+        started = time.perf_counter()
+        work = run()
+        timings.append(time.perf_counter() - started)
+    return BenchResult(
+        name=item.name,
+        group=item.group,
+        unit=item.unit,
+        repeat=len(timings),
+        work=work,
+        median_s=statistics.median(timings),
+        min_s=min(timings),
+        max_s=max(timings),
+        stdev_s=statistics.stdev(timings) if len(timings) > 1 else 0.0,
+    )
+
+
+def run_benchmarks(
+    benchmarks: Sequence[Benchmark],
+    context: BenchContext,
+    repeat: int = DEFAULT_REPEAT,
+    on_result: Callable[[BenchResult], None] | None = None,
+) -> list[BenchResult]:
+    results: list[BenchResult] = []
+    try:
+        for item in benchmarks:
+            result = measure(item, context, repeat)
+            results.append(result)
+            if on_result is not None:
+                on_result(result)
+    finally:
+        context.close()
+    return results
+
+
+def results_to_json(results: Sequence[BenchResult], quick: bool = False) -> dict[str, Any]:
+    return {
+        "version": RESULTS_VERSION,
+        "created": datetime.datetime.now(tz=datetime.timezone.utc).isoformat(),
+        "quick": quick,
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "commit": _git_commit(),
+        "results": [{**asdict(result), "throughput": result.throughput} for result in results],
+    }
+
+
+def save_results(path: str | Path, results: Sequence[BenchResult], quick: bool = False) -> None:
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text(json.dumps(results_to_json(results, quick), indent=2) + "\n", encoding="utf-8")
+
+
+def load_results(path: str | Path) -> dict[str, BenchResult]:
+    payload = json.loads(Path(path).read_text(encoding="utf-8"))
+    if not isinstance(payload, dict) or payload.get("version") != RESULTS_VERSION:
+        raise ValueError(f"{path} is not a benchmark results file (version {RESULTS_VERSION})")
+    fields = BenchResult.__dataclass_fields__
+    return {
+        item["name"]: BenchResult(**{key: value for key, value in item.items() if key in fields})
+        for item in payload.get("results", [])
+    }
+
+
+def compare(baseline: dict[str, BenchResult], current: dict[str, BenchResult]) -> list[Comparison]:
+    """Pair results by name, in current order; names only in one file get ``None`` on the other side."""
+    comparisons = [
+        Comparison(name, baseline[name].median_s if name in baseline else None, result.median_s)
+        for name, result in current.items()
+    ]
+    comparisons.extend(
+        Comparison(name, result.median_s, None) for name, result in baseline.items() if name not in current
+    )
+    return comparisons
+
+
+def format_result(result: BenchResult) -> str:
+    return (
+        f"{result.name:<36} {_format_seconds(result.median_s):>10} "
+        f"± {_format_seconds(result.stdev_s):<10} {_format_throughput(result.throughput, result.unit):>16}"
+    )
+
+
+def format_comparison(comparisons: Sequence[Comparison], threshold: float = DEFAULT_THRESHOLD) -> str:
+    lines = [f"{'benchmark':<36} {'baseline':>10} {'current':>10} {'change':>8}"]
+    for item in comparisons:
+        ratio = item.ratio
+        if ratio is None:
+            change = "new" if item.baseline_s is None else "missing"
+        else:
+            change = f"{(ratio - 1.0) * 100:+.1f}%"
+        flag = "  REGRESSION" if item.is_regression(threshold) else ""
+        lines.append(
+            f"{item.name:<36} {_format_seconds(item.baseline_s):>10} {_format_seconds(item.current_s):>10} "
+            f"{change:>8}{flag}"
+        )
+    return "\n".join(lines)
+
+
+def _format_seconds(value: float | None) -> str:
+    if value is None:
+        return "-"
+    if value >= 1.0:
+        return f"{value:.2f} s"
+    if value >= 1e-3:
+        return f"{value * 1e3:.2f} ms"
+    return f"{value * 1e6:.1f} us"
+
+
+def _format_throughput(value: float, unit: str) -> str:
+    if unit == UNIT_BYTES:
+        return f"{value / (1024 * 1024):.1f} MiB/s"
+    return f"{value:,.0f} {unit}/s"
+
+
+def _git_commit() -> str | None:
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=Path(__file__).resolve().parent,
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if completed.returncode != 0:
+        return None
+    return completed.stdout.strip() or None
@@ -0,0 +1,204 @@
+"""Deterministic synthetic workspaces and history files for benchmarks and scale tests.
+
+The shapes follow what real workspaces look like rather than uniform rows:
+collections hold nested folders, requests mix JSON and multipart
+bodies, header counts and auth types vary, a few bodies are large, and
+environments exist at global, collection and request scope. The same
+arguments and ``seed`` always produce the same data.
+"""
+
+from __future__ import annotations
+
+import datetime
+import json
+import random
+from pathlib import Path
+
+from core.model import (
+    AuthConfig,
+    EnvironmentScope,
+    WorkspaceCollection,
+    WorkspaceData,
+    WorkspaceEnvironment,
+    WorkspaceFolder,
+    WorkspaceRequest,
+)
+from core.storage.json_storage import SCHEMA_VERSION
+
+_METHODS = ("GET", "GET", "GET", "POST", "PUT", "PATCH", "DELETE")
+_RESOURCES = ("users", "orders", "items", "invoices", "sessions", "reports", "teams", "projects")
+_EXTRA_HEADERS = (
+    ("Accept-Language", "ko-KR,en;q=0.8"),
+    ("Cache-Control", "no-cache"),
+    ("X-Correlation-Id", "{{correlation_id}}"),
+    ("X-Feature-Flags", "beta,new-search"),
+    ("If-None-Match", '"etag-{{etag}}"'),
+    ("X-Client-Version", "3.14.2"),
+)
+# One request in this many gets a large JSON body.
+_LARGE_BODY_EVERY = 200
+_LARGE_BODY_ITEMS = 400
+_FOLDERS_PER_COLLECTION = 20
+
+
+def make_workspace(
+    request_count: int,
+    requests_per_folder: int = 50,
+    folder_depth: int = 3,
+    seed: int = 0,
+) -> WorkspaceData:
+    """A workspace of ``request_count`` requests, ``requests_per_folder`` to a folder.
+
+    Folders are nested up to ``folder_depth`` levels inside collections of
+    about 20 folders each. Each collection has a collection-scoped
+    environment, and about one request in a hundred has its own.
+    """
+    rng = random.Random(seed)
+    per_folder = max(1, requests_per_folder)
+    folder_count = max(1, -(-request_count // per_folder))
+    collection_count = max(1, -(-folder_count // _FOLDERS_PER_COLLECTION))
+    collections = [
+        WorkspaceCollection(f"col-{index + 1}", f"Service {index + 1}", f"Synthetic service #{index + 1}")
+        for index in range(collection_count)
+    ]
+    folders = _make_folders(folder_count, collections, max(1, folder_depth))
+    requests = [
+        make_request(f"req-{index + 1}", folders[index // per_folder].id, rng) for index in range(request_count)
+    ]
+
+    environments = [
+        WorkspaceEnvironment(EnvironmentScope.GLOBAL, None, {"name": name, **make_variables(rng)})
+        for name in ("Local", "Staging", "Prod")
+    ]
+    environments.extend(
+        WorkspaceEnvironment(
+            EnvironmentScope.COLLECTION,
+            collection.id,
+            {"base_url": f"https://{collection.id}.example.com", "service_token": f"svc-{rng.randrange(10**9)}"},
+        )
+        for collection in collections
+    )
+    environments.extend(
+        WorkspaceEnvironment(EnvironmentScope.REQUEST, request.id, {"page_size": str(rng.choice((10, 100, 500)))})
+        for request in requests[::100]
+    )
+    return WorkspaceData(SCHEMA_VERSION, None, collections, folders, requests, environments)
+
+
+def _make_folders(
+    folder_count: int, collections: list[WorkspaceCollection], depth: int
+) -> list[WorkspaceFolder]:
+    folders: list[WorkspaceFolder] = []
+    sibling_counts: dict[str | None, int] = {}
+    for index in range(folder_count):
+        collection = collections[index // _FOLDERS_PER_COLLECTION]
+        position = index % _FOLDERS_PER_COLLECTION
+        # Walk down: top-level folder, then its child, grandchild, ... then a new top-level folder.
+        level = position % depth
+        parent_id = folders[-1].id if level > 0 else None
+        key = parent_id or collection.id
+        order = sibling_counts.get(key, 0)
+        sibling_counts[key] = order + 1
+        name = f"{_RESOURCES[index % len(_RESOURCES)].title()} {index + 1}"
+        folders.append(WorkspaceFolder(f"folder-{index + 1}", collection.id, parent_id, name, order))
+    return folders
+
+
+def make_request(request_id: str, folder_id: str, rng: random.Random) -> WorkspaceRequest:
+    method = rng.choice(_METHODS)
+    resource = rng.choice(_RESOURCES)
+    headers = [("Accept", "application/json"), ("X-Tenant", "{{tenant_id}}")]
+    headers.extend(rng.sample(_EXTRA_HEADERS, rng.randrange(len(_EXTRA_HEADERS) + 1)))
+    request = WorkspaceRequest(
+        id=request_id,
+        folder_id=folder_id,
+        name=f"{method.title()} {resource} {request_id}",
+        method=method,
+        url=f"{{{{base_url}}}}/v{{{{api_version}}}}/{resource}/{{{{{resource}_id}}}}",
+        headers=headers,
+        params=[("page", str(rng.randrange(1, 50))), ("limit", "{{page_size}}")],
+        timeout_ms=rng.choice((5000, 10000, 30000)),
+    )
+
+    roll = rng.random()
+    if roll < 0.6:
+        request.auth = AuthConfig.bearer("{{token}}")
+    elif roll < 0.7:
+        request.auth = AuthConfig.basic("{{user_name}}", "{{password}}")
+
+    if method in ("POST", "PUT", "PATCH"):
+        if rng.random() < 0.1:
+            request.body_type = "multipart"
+            request.form_fields = [("description", f"{resource} upload"), ("tenant", "{{tenant_id}}")]
+            request.files = [("file", f"/data/uploads/{resource}-{rng.randrange(1000)}.csv")]
+        else:
+            headers.append(("Content-Type", "application/json"))
+            item_count = _LARGE_BODY_ITEMS if rng.randrange(_LARGE_BODY_EVERY) == 0 else rng.randrange(1, 6)
+            request.body = json.dumps(
+                {
+                    "name": "{{user_name}}",
+                    "tenant": "{{tenant_id}}",
+                    "items": [
+                        {
+                            "sku": f"SKU-{rng.randrange(10**6)}",
+                            "quantity": rng.randrange(1, 20),
+                            "note": "정기 주문",
+                        }
+                        for _ in range(item_count)
+                    ],
+                },
+                ensure_ascii=False,
+                indent=2,
+            )
+    return request
+
+
+def make_variables(rng: random.Random, extra: int = 40) -> dict[str, str]:
+    variables = {
+        "base_url": "http://127.0.0.1:8787",
+        "api_version": "2",
+        "tenant_id": f"tenant-{rng.randrange(1000)}",
+        "user_name": "bench user",
+        "password": "secret",
+        "page_size": "50",
+        "token": "t" * 64,
+        "correlation_id": f"{rng.getrandbits(64):016x}",
+        "etag": f"{rng.getrandbits(32):08x}",
+    }
+    variables.update({f"{resource}_id": str(rng.randrange(1, 10**6)) for resource in _RESOURCES})
+    variables.update({f"var_{index}": f"value-{rng.randrange(10**6)}" for index in range(extra)})
+    return variables
+
+
+def write_history(path: str | Path, line_count: int, body_every: int = 10, seed: int = 0) -> Path:
+    """Write ``line_count`` history lines, oldest first.
+
+    Every ``body_every``-th entry carries a captured response body (of mixed
+    size), and about 2% are transport errors without a status.
+    """
+    rng = random.Random(seed)
+    target = Path(path)
+    start = datetime.datetime(2026, 1, 1, tzinfo=datetime.timezone.utc)
+    timestamp = start
+    with target.open("w", encoding="utf-8") as file_handle:
+        for index in range(line_count):
+            method = rng.choice(_METHODS)
+            resource = rng.choice(_RESOURCES)
+            timestamp += datetime.timedelta(milliseconds=rng.randrange(50, 5000))
+            entry: dict[str, object] = {
+                "timestamp": timestamp.isoformat(),
+                "name": f"{method.title()} {resource}",
+                "method": method,
+                "url": f"https://api.example.com/v2/{resource}/{rng.randrange(10**6)}?page={rng.randrange(1, 50)}",
+            }
+            if rng.random() < 0.02:
+                entry["error"] = "ConnectError: [Errno 111] Connection refused"
+            else:
+                status = rng.choice((200, 200, 200, 200, 201, 204, 304, 400, 404, 500, 503))
+                entry["status_code"] = status
+                entry["elapsed_ms"] = int(rng.lognormvariate(4.5, 0.8))
+                if body_every and index % body_every == 0:
+                    rows = [{"id": rng.randrange(10**6), "resource": resource} for _ in range(rng.choice((1, 5, 50)))]
+                    entry["response_body"] = json.dumps({"ok": status < 400, "data": rows})
+            file_handle.write(json.dumps(entry, ensure_ascii=False) + "\n")
+    return target
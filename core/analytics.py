@@ -0,0 +1,319 @@
+from __future__ import annotations
+
+import datetime
+import json
+import re
+from array import array
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterable
+from urllib.parse import urlsplit
+
+from core.logger import get_logger
+from core.model import HistoryEntry
+
+logger = get_logger("analytics")
+
+_MISSING = -1
+# Lines read between checks of ``should_stop`` while loading history columns.
+_STOP_CHECK_LINES = 1000
+_NUMERIC_SEGMENT = re.compile(r"^\d+$")
+_UUID_SEGMENT = re.compile(
+    r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$"
+)
+_HASH_SEGMENT = re.compile(r"^[0-9a-fA-F]{16,}$")
+
+
+@dataclass(slots=True)
+class HistoryColumns:
+    """Column-oriented view of history entries.
+
+    Every array has one slot per entry. Missing status codes and elapsed times
+    are stored as -1 so the columns stay homogeneous.
+    """
+
+    timestamps: array = field(default_factory=lambda: array("d"))
+    endpoint_ids: array = field(default_factory=lambda: array("l"))
+    status_codes: array = field(default_factory=lambda: array("l"))
+    elapsed_ms: array = field(default_factory=lambda: array("l"))
+    failed: array = field(default_factory=lambda: array("b"))
+    endpoints: list[str] = field(default_factory=list)
+    _endpoint_lookup: dict[str, int] = field(default_factory=dict, repr=False)
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def endpoint_id(self, endpoint: str) -> int | None:
+        return self._endpoint_lookup.get(endpoint)
+
+    def append(
+        self,
+        timestamp: float,
+        endpoint: str,
+        status_code: int | None,
+        elapsed_ms: int | None,
+        error: str | None,
+    ) -> None:
+        endpoint_id = self._endpoint_lookup.get(endpoint)
+        if endpoint_id is None:
+            endpoint_id = len(self.endpoints)
+            self.endpoints.append(endpoint)
+            self._endpoint_lookup[endpoint] = endpoint_id
+
+        self.timestamps.append(timestamp)
+        self.endpoint_ids.append(endpoint_id)
+        self.status_codes.append(_MISSING if status_code is None else status_code)
+        self.elapsed_ms.append(_MISSING if elapsed_ms is None else elapsed_ms)
+        self.failed.append(1 if _is_failure(status_code, error) else 0)
+
+
+@dataclass(slots=True)
+class EndpointStats:
+    endpoint: str
+    count: int
+    error_count: int
+    p50_ms: float | None
+    p95_ms: float | None
+    p99_ms: float | None
+    first_seen: float
+    last_seen: float
+
+    @property
+    def error_rate(self) -> float:
+        if 0 == self.count:
+            return 0.0
+        return self.error_count / self.count
+
+
+@dataclass(slots=True)
+class TrendBucket:
+    start: float
+    count: int
+    error_count: int
+    p50_ms: float | None
+    p95_ms: float | None
+
+
+def normalize_endpoint(method: str, url: str) -> str:
+    """Collapse a concrete URL into an endpoint template such as ``GET https://host/users/{id}``."""
+    parts = urlsplit(url.strip())
+    segments = []
+    for segment in parts.path.split("/"):
+        if _NUMERIC_SEGMENT.match(segment):
+            segments.append("{id}")
+        elif _UUID_SEGMENT.match(segment):
+            segments.append("{uuid}")
+        elif _HASH_SEGMENT.match(segment):
+            segments.append("{hash}")
+        else:
+            segments.append(segment)
+    path = "/".join(segments) or "/"
+    if parts.scheme and parts.netloc:
+        location = f"{parts.scheme.lower()}://{parts.netloc.lower()}{path}"
+    else:
+        location = path
+    return f"{method.upper()} {location}"
+
+
+def build_history_columns(entries: Iterable[HistoryEntry]) -> HistoryColumns:
+    columns = HistoryColumns()
+    for entry in entries:
+        timestamp = parse_timestamp(entry.timestamp)
+        if timestamp is None:
+            continue
+        columns.append(
+            timestamp,
+            normalize_endpoint(entry.method, entry.url),
+            entry.status_code,
+            entry.elapsed_ms,
+            entry.error,
+        )
+    return columns
+
+
+def load_history_columns(path: str | Path, should_stop: Callable[[], bool] | None = None) -> HistoryColumns:
+    """Read a history JSONL file straight into columns without building HistoryEntry rows.
+
+    ``should_stop`` is polled every thousand lines; when it returns True
+    the columns read so far are returned.
+    """
+    columns = HistoryColumns()
+    target_path = Path(path)
+    if not target_path.exists():
+        return columns
+
+    with target_path.open(mode="r", encoding="utf-8") as file_handle:
+        for line_number, line in enumerate(file_handle, start=1):
+            if should_stop is not None and 0 == line_number % _STOP_CHECK_LINES and should_stop():
+                break
+            payload_text = line.strip()
+            if 0 == len(payload_text):
+                continue
+            try:
+                payload = json.loads(payload_text)
+            except ValueError:
+                logger.warning("Skipping malformed history line %s", line_number)
+                continue
+            if not isinstance(payload, dict):
+                continue
+
+            timestamp = parse_timestamp(payload.get("timestamp"))
+            method = payload.get("method")
+            url = payload.get("url")
+            if timestamp is None or not isinstance(method, str) or not isinstance(url, str):
+                continue
+            error = payload.get("error")
+            columns.append(
+                timestamp,
+                normalize_endpoint(method, url),
+                _read_int(payload.get("status_code")),
+                _read_int(payload.get("elapsed_ms")),
+                error if isinstance(error, str) and 0 < len(error) else None,
+            )
+    return columns
+
+
+def compute_endpoint_stats(
+    columns: HistoryColumns,
+    since: float | None = None,
+    until: float | None = None,
+) -> list[EndpointStats]:
+    endpoint_count = len(columns.endpoints)
+    latencies: list[array] = [array("l") for _ in range(endpoint_count)]
+    counts = [0] * endpoint_count
+    errors = [0] * endpoint_count
+    first_seen = [0.0] * endpoint_count
+    last_seen = [0.0] * endpoint_count
+
+    timestamps = columns.timestamps
+    endpoint_ids = columns.endpoint_ids
+    elapsed = columns.elapsed_ms
+    failed = columns.failed
+    for index in _selected_rows(timestamps, since, until):
+        endpoint_id = endpoint_ids[index]
+        timestamp = timestamps[index]
+        if 0 == counts[endpoint_id]:
+            first_seen[endpoint_id] = timestamp
+            last_seen[endpoint_id] = timestamp
+        else:
+            first_seen[endpoint_id] = min(first_seen[endpoint_id], timestamp)
+            last_seen[endpoint_id] = max(last_seen[endpoint_id], timestamp)
+        counts[endpoint_id] += 1
+        errors[endpoint_id] += failed[index]
+        if elapsed[index] != _MISSING:
+            latencies[endpoint_id].append(elapsed[index])
+
+    stats: list[EndpointStats] = []
+    for endpoint_id, endpoint in enumerate(columns.endpoints):
+        if 0 == counts[endpoint_id]:
+            continue
+        ordered = sorted(latencies[endpoint_id])
+        stats.append(
+            EndpointStats(
+                endpoint=endpoint,
+                count=counts[endpoint_id],
+                error_count=errors[endpoint_id],
+                p50_ms=percentile(ordered, 50),
+                p95_ms=percentile(ordered, 95),
+                p99_ms=percentile(ordered, 99),
+                first_seen=first_seen[endpoint_id],
+                last_seen=last_seen[endpoint_id],
+            )
+        )
+    return stats
+
+
+def compute_trend(
+    columns: HistoryColumns,
+    bucket_seconds: int,
+    endpoint: str | None = None,
+    since: float | None = None,
+    until: float | None = None,
+) -> list[TrendBucket]:
+    if 0 >= bucket_seconds:
+        raise ValueError("bucket_seconds must be positive")
+
+    endpoint_id: int | None = None
+    if endpoint is not None:
+        endpoint_id = columns.endpoint_id(endpoint)
+        if endpoint_id is None:
+            return []
+
+    buckets: dict[int, tuple[list[int], array]] = {}
+    timestamps = columns.timestamps
+    for index in _selected_rows(timestamps, since, until):
+        if endpoint_id is not None and columns.endpoint_ids[index] != endpoint_id:
+            continue
+        key = int(timestamps[index] // bucket_seconds)
+        bucket = buckets.get(key)
+        if bucket is None:
+            bucket = ([0, 0], array("l"))
+            buckets[key] = bucket
+        bucket[0][0] += 1
+        bucket[0][1] += columns.failed[index]
+        if columns.elapsed_ms[index] != _MISSING:
+            bucket[1].append(columns.elapsed_ms[index])
+
+    trend: list[TrendBucket] = []
+    for key in sorted(buckets):
+        (count, error_count), latencies = buckets[key]
+        ordered = sorted(latencies)
+        trend.append(
+            TrendBucket(
+                start=float(key * bucket_seconds),
+                count=count,
+                error_count=error_count,
+                p50_ms=percentile(ordered, 50),
+                p95_ms=percentile(ordered, 95),
+            )
+        )
+    return trend
+
+
+def percentile(ordered: list[int] | list[float], rank: float) -> float | None:
+    """Linear-interpolated percentile of an already sorted sequence."""
+    if 0 == len(ordered):
+        return None
+    if 1 == len(ordered):
+        return float(ordered[0])
+    position = (len(ordered) - 1) * (rank / 100.0)
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    fraction = position - lower
+    return float(ordered[lower] + (ordered[upper] - ordered[lower]) * fraction)
+
+
+def _selected_rows(timestamps: array, since: float | None, until: float | None) -> Iterable[int]:
+    if since is None and until is None:
+        return range(len(timestamps))
+    lower = float("-inf") if since is None else since
+    upper = float("inf") if until is None else until
+    return (index for index, value in enumerate(timestamps) if lower <= value < upper)
+
+
+def _is_failure(status_code: int | None, error: str | None) -> bool:
+    if error:
+        return True
+    return status_code is not None and 400 <= status_code
+
+
+def parse_timestamp(value: object) -> float | None:
+    if not isinstance(value, str) or 0 == len(value):
+        return None
+    try:
+        parsed = datetime.datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=datetime.timezone.utc)
+    return parsed.timestamp()
+
+
+def _read_int(value: object) -> int | None:
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str) and value.isdigit():
+        return int(value)
+    return None
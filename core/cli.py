@@ -0,0 +1,574 @@
+"""Run saved workspace requests without the GUI.
+
+    python -m core.cli workspace.json -e Staging -f "Smoke tests" --format junit -o report.xml
+    python -m core.cli workspace.json -r "List users" --compare Prod --compare Staging
+    python -m core.cli workspace.json -f Health --monitor 30 --duration 86400 --alert-latency-ms 500
+    python -m core.cli workspace.json -e Staging --replay traffic.har --target "{{base_url}}" --speed 10
+    python -m core.cli workspace.json -c "My API" --serve 8787 --history history.jsonl --mocks mocks.json
+    python -m core.cli workspace.json --record 8888 --record-host "*.example.com" --record-collection
+    python -m core.cli workspace.json -e Staging -j 16 --simulate "3g reset=0.02 error=0.05 seed=7"
+
+Nothing here imports PySide6, so the runner works on headless CI machines
+with only httpx installed. Exit status is 0 when every request passed, 1 when
+any failed, and 2 for usage or workspace errors.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from core.environments import NO_ENVIRONMENT, build_environment_map
+from core.http_client import HttpClient
+from core.latency_compare import (
+    DEFAULT_MAX_SAMPLES,
+    DEFAULT_MIN_SAMPLES,
+    CompareOptions,
+    compare_environments,
+    format_report,
+    report_to_json,
+)
+from core.analytics import parse_timestamp
+from core.mock_server import DEFAULT_MOCK_PORT, MockServer, MockSource
+from core.monitor import (
+    DEFAULT_ALERT_AFTER,
+    DEFAULT_JITTER,
+    AlertRule,
+    MonitorAlert,
+    MonitorSample,
+    MonitorScheduler,
+    MonitorTarget,
+    summarize,
+)
+from core.netsim import parse_profile
+from core.recording_proxy import (
+    DEFAULT_CAPTURE_BYTES,
+    DEFAULT_PROXY_PORT,
+    DEFAULT_RECORDED_COLLECTION,
+    CollectionRecorder,
+    HistoryRecorder,
+    RecordedExchange,
+    RecordFilter,
+    RecordingProxyThread,
+    add_recorded_requests,
+)
+from core.replay import (
+    DEFAULT_REPLAY_CONCURRENCY,
+    ReplayResult,
+    format_replay_report,
+    load_replay_items,
+    replay,
+    replay_report_to_json,
+)
+from core.runner import (
+    RunResult,
+    request_path,
+    results_to_json,
+    results_to_junit,
+    run_requests,
+    select_requests,
+    to_request_data,
+)
+from core.model import WorkspaceRequest
+from core.storage.json_storage import load_workspace, save_workspace
+from core.template import render_request
+from core.timeseries import TimeSeriesStore
+from core.workspace_index import WorkspaceIndex
+
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_USAGE = 2
+
+DEFAULT_CONCURRENCY = 4
+
+
+def _parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m core.cli", description=__doc__.splitlines()[0])
+    parser.add_argument("workspace", help="workspace JSON file")
+    parser.add_argument("-e", "--environment", default=NO_ENVIRONMENT, help="environment name")
+    parser.add_argument(
+        "--var",
+        action="append",
+        default=[],
+        metavar="KEY=VALUE",
+        help="set or override an environment variable (repeatable)",
+    )
+    parser.add_argument("-r", "--request", action="append", default=[], help="request id or name (repeatable)")
+    parser.add_argument("-f", "--folder", action="append", default=[], help="folder id or name (repeatable)")
+    parser.add_argument(
+        "-c", "--collection", action="append", default=[], help="collection id or name (repeatable)"
+    )
+    parser.add_argument(
+        "-j", "--concurrency", type=int, default=None, help="requests in flight (default 4, 16 for --replay)"
+    )
+    parser.add_argument("--timeout-ms", type=int, default=10000, help="timeout for requests without one")
+    parser.add_argument(
+        "--simulate",
+        default="",
+        metavar="PROFILE",
+        help='simulate a bad network for requests without their own profile, e.g. "3g error=0.05 seed=1"',
+    )
+    parser.add_argument(
+        "--compare",
+        action="append",
+        default=[],
+        metavar="ENVIRONMENT",
+        help="compare latency across these environments (repeat; the first is the baseline)",
+    )
+    parser.add_argument(
+        "--min-samples", type=int, default=DEFAULT_MIN_SAMPLES, help="compare: minimum samples per environment"
+    )
+    parser.add_argument(
+        "--max-samples", type=int, default=DEFAULT_MAX_SAMPLES, help="compare: maximum samples per environment"
+    )
+    parser.add_argument(
+        "--monitor",
+        type=float,
+        metavar="SECONDS",
+        help="probe the selected requests every SECONDS until --duration passes or Ctrl+C",
+    )
+    parser.add_argument(
+        "--jitter", type=float, default=DEFAULT_JITTER, help="monitor: interval jitter fraction (default 0.1)"
+    )
+    parser.add_argument("--duration", type=float, metavar="SECONDS", help="monitor/record: stop after this long")
+    parser.add_argument("--alert-latency-ms", type=float, help="monitor: alert when slower than this")
+    parser.add_argument(
+        "--alert-after",
+        type=int,
+        default=DEFAULT_ALERT_AFTER,
+        help="monitor: failing or slow probes in a row before alerting (default 3)",
+    )
+    parser.add_argument("--store", help="monitor: keep the latency time series in this file across runs")
+    parser.add_argument(
+        "--replay",
+        metavar="FILE",
+        help="replay a history .jsonl or .har file instead of running workspace requests",
+    )
+    parser.add_argument(
+        "--target",
+        metavar="URL",
+        help="replay: send to this scheme://host[/prefix] instead (environment variables are applied)",
+    )
+    parser.add_argument(
+        "--speed", type=float, default=1.0, help="replay: timing factor (2 = twice as fast, 0 = no waits)"
+    )
+    parser.add_argument("--since", help="replay: first recorded timestamp to include (ISO 8601)")
+    parser.add_argument("--until", help="replay: last recorded timestamp to include (ISO 8601)")
+    parser.add_argument(
+        "--serve",
+        type=int,
+        nargs="?",
+        const=DEFAULT_MOCK_PORT,
+        metavar="PORT",
+        help=f"serve the selected requests as a local mock server (default port {DEFAULT_MOCK_PORT})",
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="serve/record: interface to listen on")
+    parser.add_argument("--mocks", help="serve: JSON file of configured responses by request id or name")
+    parser.add_argument(
+        "--history",
+        help="serve: answer with the newest responses captured in this history file; record: append exchanges to it",
+    )
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="serve: delay added to every response")
+    parser.add_argument("--no-reload", action="store_true", help="serve: do not reload when the files change")
+    parser.add_argument(
+        "--record",
+        type=int,
+        nargs="?",
+        const=DEFAULT_PROXY_PORT,
+        metavar="PORT",
+        help=f"run a recording HTTP proxy until --duration passes or Ctrl+C (default port {DEFAULT_PROXY_PORT})",
+    )
+    parser.add_argument(
+        "--record-collection",
+        nargs="?",
+        const=DEFAULT_RECORDED_COLLECTION,
+        metavar="NAME",
+        help=f"record: add new endpoints to this collection (default {DEFAULT_RECORDED_COLLECTION!r})",
+    )
+    parser.add_argument(
+        "--record-host", action="append", default=[], metavar="GLOB", help="record: only these hosts (repeatable)"
+    )
+    parser.add_argument(
+        "--record-path", action="append", default=[], metavar="GLOB", help="record: only these paths (repeatable)"
+    )
+    parser.add_argument("--exclude-host", action="append", default=[], metavar="GLOB", help="record: skip these hosts")
+    parser.add_argument("--exclude-path", action="append", default=[], metavar="GLOB", help="record: skip these paths")
+    parser.add_argument(
+        "--capture-kb",
+        type=int,
+        default=DEFAULT_CAPTURE_BYTES // 1024,
+        help="record: keep at most this much of each body (default 256)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=("json", "junit", "text"),
+        default=None,
+        help="report format (json by default; junit for runs, text for comparisons, monitoring and replays)",
+    )
+    parser.add_argument("-o", "--output", help="write the report to this file instead of stdout")
+    parser.add_argument("--list", action="store_true", help="list the selected requests and exit")
+    parser.add_argument("-v", "--verbose", action="store_true", help="log progress to stderr")
+    return parser.parse_args(argv)
+
+
+def _parse_variables(pairs: list[str]) -> dict[str, str]:
+    variables: dict[str, str] = {}
+    for pair in pairs:
+        key, separator, value = pair.partition("=")
+        if not separator or not key:
+            raise ValueError(f"--var expects KEY=VALUE, got {pair!r}")
+        variables[key] = value
+    return variables
+
+
+def _print_progress(result: RunResult) -> None:
+    outcome = result.error or str(result.status_code)
+    sys.stderr.write(f"{'PASS' if result.passed else 'FAIL'} {result.method} {result.name} -> {outcome}\n")
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(sys.argv[1:] if argv is None else argv)
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        stream=sys.stderr,
+        format="%(levelname)s %(name)s: %(message)s",
+    )
+
+    try:
+        workspace = load_workspace(args.workspace)
+    except Exception as exc:
+        sys.stderr.write(f"error: failed to load workspace {args.workspace}: {exc}\n")
+        return EXIT_USAGE
+
+    environments = build_environment_map(workspace)
+    if args.environment not in environments:
+        available = ", ".join(environments)
+        sys.stderr.write(f"error: unknown environment {args.environment!r} (available: {available})\n")
+        return EXIT_USAGE
+    try:
+        overrides = _parse_variables(args.var)
+        variables = {**environments[args.environment], **overrides}
+        index = WorkspaceIndex.for_workspace(workspace)
+        requests = select_requests(workspace, index, args.request, args.folder, args.collection)
+        parse_profile(args.simulate)
+    except ValueError as exc:
+        sys.stderr.write(f"error: {exc}\n")
+        return EXIT_USAGE
+
+    if args.serve is not None:
+        return _run_serve(args, overrides)
+    if args.record is not None:
+        return _run_record(args)
+    if args.replay:
+        return _run_replay(args, variables)
+    if args.compare:
+        return _run_compare(args, environments, overrides, requests)
+    if args.monitor is not None:
+        return _run_monitor(args, variables, requests)
+
+    if args.format == "text":
+        sys.stderr.write("error: --format text is only available with --compare, --monitor or --replay\n")
+        return EXIT_USAGE
+
+    if args.list:
+        for request in requests:
+            path = request_path(index, request.id)
+            sys.stdout.write(f"{request.id}\t{request.method}\t{path} / {request.name}\n")
+        return EXIT_OK
+
+    results = run_requests(
+        requests,
+        variables,
+        index=index,
+        concurrency=args.concurrency or DEFAULT_CONCURRENCY,
+        http_client=HttpClient(default_timeout_ms=args.timeout_ms, simulate=args.simulate),
+        on_result=_print_progress if args.verbose else None,
+    )
+
+    if args.format == "junit":
+        report = results_to_junit(results, suite_name=Path(args.workspace).stem)
+    else:
+        report = json.dumps(
+            results_to_json(results, workspace=str(args.workspace), environment=args.environment),
+            ensure_ascii=False,
+            indent=2,
+        )
+    _write_report(report, args.output)
+    return EXIT_OK if all(result.passed for result in results) else EXIT_FAILED
+
+
+def _run_compare(
+    args: argparse.Namespace,
+    environments: dict[str, dict[str, str]],
+    overrides: dict[str, str],
+    requests: list[WorkspaceRequest],
+) -> int:
+    """Latency comparison of each selected request; exit 1 if any environment had errors."""
+    unknown = [name for name in args.compare if name not in environments]
+    if unknown or len(args.compare) < 2:
+        sys.stderr.write("error: --compare needs at least two known environments\n")
+        return EXIT_USAGE
+    if args.format == "junit":
+        sys.stderr.write("error: --format junit is not available with --compare\n")
+        return EXIT_USAGE
+
+    # --var overrides apply on top of every compared environment.
+    selected = {name: {**environments[name], **overrides} for name in args.compare}
+    options = CompareOptions(
+        min_samples=max(2, args.min_samples),
+        max_samples=max(2, args.min_samples, args.max_samples),
+        concurrency=args.concurrency or DEFAULT_CONCURRENCY,
+    )
+    http_client = HttpClient(default_timeout_ms=args.timeout_ms, simulate=args.simulate)
+    reports = []
+    for request in requests:
+        if args.verbose:
+            sys.stderr.write(f"Comparing {request.name} across {', '.join(selected)}\n")
+        reports.append(compare_environments(to_request_data(request), selected, options, http_client))
+
+    if args.format == "text":
+        output = "\n\n".join(format_report(report) for report in reports)
+    else:
+        output = json.dumps([report_to_json(report) for report in reports], ensure_ascii=False, indent=2)
+    _write_report(output, args.output)
+    has_errors = any(entry.errors for report in reports for entry in report.environments)
+    return EXIT_FAILED if has_errors else EXIT_OK
+
+
+def _run_monitor(
+    args: argparse.Namespace, variables: dict[str, str], requests: list[WorkspaceRequest]
+) -> int:
+    """Probe the selected requests on an interval; exit 1 if any alert was raised."""
+    if args.monitor <= 0 or (args.duration is not None and args.duration <= 0):
+        sys.stderr.write("error: --monitor and --duration need a positive number of seconds\n")
+        return EXIT_USAGE
+    if args.format == "junit":
+        sys.stderr.write("error: --format junit is not available with --monitor\n")
+        return EXIT_USAGE
+    if not requests:
+        sys.stderr.write("error: no requests to monitor\n")
+        return EXIT_USAGE
+
+    store = TimeSeriesStore.load(args.store) if args.store else TimeSeriesStore()
+    targets = [
+        MonitorTarget(request.id, render_request(to_request_data(request), variables), args.monitor, args.jitter)
+        for request in requests
+    ]
+
+    def _print_sample(sample: MonitorSample) -> None:
+        outcome = f"{sample.status_code} {sample.latency_ms:.1f} ms" if sample.ok else sample.error
+        sys.stderr.write(f"{'OK' if sample.ok else 'FAIL'} {sample.name} -> {outcome}\n")
+
+    def _print_alert(alert: MonitorAlert) -> None:
+        sys.stderr.write(f"ALERT {alert.kind}: {alert.message}\n")
+
+    scheduler = MonitorScheduler(
+        targets,
+        store,
+        http_client=HttpClient(default_timeout_ms=args.timeout_ms, simulate=args.simulate),
+        rule=AlertRule(args.alert_latency_ms, max(1, args.alert_after)),
+        on_sample=_print_sample if args.verbose else None,
+        on_alert=_print_alert,
+        max_workers=args.concurrency or DEFAULT_CONCURRENCY,
+        autosave_path=args.store,
+    )
+    started = time.time()
+    scheduler.start()
+    try:
+        scheduler.wait(args.duration)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        scheduler.stop()
+
+    alerts = scheduler.alerts()
+    summaries = []
+    for target in targets:
+        summary = summarize(store.points(target.key, since=started))
+        summaries.append({"request": target.request.name, "url": target.request.url, **summary})
+    if args.format == "text":
+        lines = [
+            f"{item['request']}: {item['samples']} samples, {item['errors']} errors, "
+            f"mean {_format_ms(item['mean_ms'])}, min {_format_ms(item['min_ms'])}, max {_format_ms(item['max_ms'])}"
+            for item in summaries
+        ]
+        lines.extend(f"alert {alert.kind}: {alert.message}" for alert in alerts)
+        output = "\n".join(lines)
+    else:
+        payload = {
+            "requests": summaries,
+            "alerts": [
+                {"request": alert.name, "timestamp": alert.timestamp, "kind": alert.kind, "message": alert.message}
+                for alert in alerts
+            ],
+        }
+        output = json.dumps(payload, ensure_ascii=False, indent=2)
+    _write_report(output, args.output)
+    return EXIT_FAILED if alerts else EXIT_OK
+
+
+def _run_replay(args: argparse.Namespace, variables: dict[str, str]) -> int:
+    """Replay recorded traffic; exit 1 if any replayed status differs from the recording."""
+    if args.format == "junit":
+        sys.stderr.write("error: --format junit is not available with --replay\n")
+        return EXIT_USAGE
+    if args.speed < 0:
+        sys.stderr.write("error: --speed cannot be negative\n")
+        return EXIT_USAGE
+    bounds = []
+    for option, value in (("--since", args.since), ("--until", args.until)):
+        timestamp = parse_timestamp(value) if value else None
+        if value and timestamp is None:
+            sys.stderr.write(f"error: {option} expects an ISO 8601 timestamp, got {value!r}\n")
+            return EXIT_USAGE
+        bounds.append(timestamp)
+    try:
+        items = load_replay_items(args.replay, *bounds)
+    except Exception as exc:
+        sys.stderr.write(f"error: failed to load {args.replay}: {exc}\n")
+        return EXIT_USAGE
+    if not items:
+        sys.stderr.write("error: no recorded requests in that range\n")
+        return EXIT_USAGE
+
+    def _print_result(result: ReplayResult) -> None:
+        outcome = result.error or f"{result.status_code} {result.elapsed_ms:.1f} ms"
+        marker = "SAME" if result.status_matches else "DIFF"
+        sys.stderr.write(f"{marker} {result.item.request.method} {result.url} -> {outcome}\n")
+
+    try:
+        report = replay(
+            items,
+            target=args.target,
+            variables=variables,
+            speed=args.speed,
+            concurrency=args.concurrency or DEFAULT_REPLAY_CONCURRENCY,
+            http_client=HttpClient(default_timeout_ms=args.timeout_ms, simulate=args.simulate),
+            on_result=_print_result if args.verbose else None,
+        )
+    except ValueError as exc:
+        sys.stderr.write(f"error: {exc}\n")
+        return EXIT_USAGE
+
+    if args.format == "text":
+        output = format_replay_report(report)
+    else:
+        output = json.dumps(replay_report_to_json(report), ensure_ascii=False, indent=2)
+    _write_report(output, args.output)
+    return EXIT_OK if all(result.status_matches for result in report.results) else EXIT_FAILED
+
+
+def _run_serve(args: argparse.Namespace, overrides: dict[str, str]) -> int:
+    """Serve the selected requests until Ctrl+C."""
+    source = MockSource(
+        workspace_path=Path(args.workspace),
+        environment=args.environment,
+        variables=overrides,
+        requests=tuple(args.request),
+        folders=tuple(args.folder),
+        collections=tuple(args.collection),
+        mocks_path=Path(args.mocks) if args.mocks else None,
+        history_path=Path(args.history) if args.history else None,
+    )
+    try:
+        routes = source.load()
+    except Exception as exc:
+        sys.stderr.write(f"error: failed to build mock routes: {exc}\n")
+        return EXIT_USAGE
+
+    async def _serve() -> None:
+        server = MockServer(routes, args.host, args.serve, args.latency_ms)
+        await server.start()
+        if not args.no_reload:
+            server.watch(source)
+        for route in routes.routes:
+            sys.stderr.write(f"{route.method:<7} {route.path}  [{route.source} {route.response.status}] {route.name}\n")
+        sys.stderr.write(f"Mock server listening on {server.url} (Ctrl+C to stop)\n")
+        try:
+            await server.serve_forever()
+        finally:
+            await server.close()
+
+    try:
+        asyncio.run(_serve())
+    except KeyboardInterrupt:
+        pass
+    except OSError as exc:
+        sys.stderr.write(f"error: cannot listen on {args.host}:{args.serve}: {exc}\n")
+        return EXIT_USAGE
+    return EXIT_OK
+
+
+def _run_record(args: argparse.Namespace) -> int:
+    """Record proxied traffic into history and/or a workspace collection."""
+    if not args.history and not args.record_collection:
+        sys.stderr.write("error: --record needs --history FILE and/or --record-collection\n")
+        return EXIT_USAGE
+    if args.duration is not None and args.duration <= 0:
+        sys.stderr.write("error: --duration needs a positive number of seconds\n")
+        return EXIT_USAGE
+
+    recorders: list[Callable[[RecordedExchange], None]] = []
+    if args.history:
+        recorders.append(HistoryRecorder(args.history))
+    collection_recorder = CollectionRecorder()
+    if args.record_collection:
+        recorders.append(collection_recorder)
+    if args.verbose:
+        recorders.append(
+            lambda exchange: sys.stderr.write(
+                f"{exchange.method} {exchange.url} -> {exchange.error or exchange.status_code}\n"
+            )
+        )
+    record_filter = RecordFilter(
+        tuple(args.record_host), tuple(args.record_path), tuple(args.exclude_host), tuple(args.exclude_path)
+    )
+    proxy = RecordingProxyThread(recorders, record_filter, args.host, args.record, max(0, args.capture_kb) * 1024)
+    try:
+        proxy.start()
+    except OSError as exc:
+        sys.stderr.write(f"error: cannot listen on {args.host}:{args.record}: {exc}\n")
+        return EXIT_USAGE
+    sys.stderr.write(f"Recording proxy listening on {proxy.url} (Ctrl+C to stop)\n")
+    try:
+        threading.Event().wait(args.duration)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        proxy.stop()
+
+    sys.stderr.write(f"Recorded {proxy.proxy.recorded_count} of {proxy.proxy.exchange_count} exchanges\n")
+    if args.record_collection:
+        try:
+            # Re-read so edits made while recording are kept.
+            workspace = load_workspace(args.workspace)
+            added = add_recorded_requests(workspace, collection_recorder.exchanges, args.record_collection)
+            if added:
+                save_workspace(args.workspace, workspace)
+        except Exception as exc:
+            sys.stderr.write(f"error: failed to save recorded requests to {args.workspace}: {exc}\n")
+            return EXIT_FAILED
+        sys.stderr.write(f"Added {len(added)} requests to collection {args.record_collection!r}\n")
+    return EXIT_OK
+
+
+def _format_ms(value: float | None) -> str:
+    return f"{value:.1f} ms" if value is not None else "-"
+
+
+def _write_report(report: str, output: str | None) -> None:
+    if output:
+        Path(output).write_text(report + "\n", encoding="utf-8")
+    else:
+        sys.stdout.write(report + "\n")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
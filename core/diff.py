@@ -0,0 +1,500 @@
+from __future__ import annotations
+
+import difflib
+import json
+from bisect import bisect_left
+from collections import Counter
+from dataclasses import dataclass, field
+from enum import Enum
+from fnmatch import fnmatchcase
+from itertools import islice
+from typing import Any, Callable, Iterator
+
+from core.json_index import key_segment
+from core.model import HistoryEntry, ResponseData
+
+DEFAULT_CONTEXT_LINES = 3
+DEFAULT_MAX_CHANGES = 10000
+_STOP_CHECK_INTERVAL = 4096
+_VALUE_PREVIEW_CHARS = 200
+# Gaps without unique anchor lines fall back to difflib up to this many
+# line pairs; anything larger is reported as a block replacement.
+_DIFFLIB_CELL_LIMIT = 4_000_000
+
+
+class DiffMode(Enum):
+    AUTO = "auto"
+    JSON = "json"
+    TEXT = "text"
+
+
+class ChangeKind(Enum):
+    ADDED = "added"
+    REMOVED = "removed"
+    CHANGED = "changed"
+
+
+class DiffCancelled(Exception):
+    pass
+
+
+@dataclass(slots=True)
+class DiffSource:
+    label: str
+    body: str
+
+    @classmethod
+    def from_response(cls, label: str, response: ResponseData) -> "DiffSource":
+        return cls(label=label, body=response.body)
+
+    @classmethod
+    def from_history(cls, entry: HistoryEntry) -> "DiffSource":
+        if entry.response_body is None:
+            raise ValueError("history entry has no captured response body")
+        label = f"{entry.timestamp} {entry.method} {entry.url}"
+        return cls(label=label, body=entry.response_body)
+
+
+@dataclass(slots=True)
+class DiffOptions:
+    mode: DiffMode = DiffMode.AUTO
+    ignore_fields: tuple[str, ...] = ()
+    context_lines: int = DEFAULT_CONTEXT_LINES
+    max_changes: int = DEFAULT_MAX_CHANGES
+
+
+@dataclass(slots=True)
+class JsonChange:
+    path: str
+    kind: ChangeKind
+    old: Any = None
+    new: Any = None
+
+
+@dataclass(slots=True)
+class DiffResult:
+    mode: DiffMode
+    json_changes: list[JsonChange] = field(default_factory=list)
+    text_diff: list[str] = field(default_factory=list)
+    truncated: bool = False
+
+    @property
+    def identical(self) -> bool:
+        return 0 == len(self.json_changes) and 0 == len(self.text_diff)
+
+    @property
+    def change_count(self) -> int:
+        if self.mode is DiffMode.JSON:
+            return len(self.json_changes)
+        return sum(
+            1
+            for line in self.text_diff
+            if line[:1] in "+-" and not line.startswith(("+++", "---"))
+        )
+
+    def render(self) -> Iterator[str]:
+        if self.mode is DiffMode.JSON:
+            yield from format_json_changes(self.json_changes)
+        else:
+            yield from self.text_diff
+        if self.truncated:
+            yield "... (diff truncated)"
+
+
+class FieldMatcher:
+    """Decides which object members a diff skips.
+
+    Patterns starting with ``$`` are matched against the full path
+    (``$.meta.request_id``, ``$.items[*].updated_at``); anything else is
+    matched against the member name alone, so ``timestamp`` or ``*_at`` skip
+    that key at any depth. Shell-style wildcards are supported in both.
+    """
+
+    def __init__(self, patterns: tuple[str, ...] | list[str]) -> None:
+        cleaned = [pattern.strip() for pattern in patterns if pattern.strip()]
+        self._path_patterns = [pattern for pattern in cleaned if pattern.startswith("$")]
+        self._key_patterns = [pattern for pattern in cleaned if not pattern.startswith("$")]
+        self._exact_keys = {
+            pattern for pattern in self._key_patterns if not any(c in pattern for c in "*?[")
+        }
+
+    @property
+    def has_key_patterns(self) -> bool:
+        return 0 < len(self._key_patterns)
+
+    @property
+    def has_path_patterns(self) -> bool:
+        return 0 < len(self._path_patterns)
+
+    def matches_key(self, key: str) -> bool:
+        if key in self._exact_keys:
+            return True
+        for pattern in self._key_patterns:
+            if fnmatchcase(key, pattern):
+                return True
+        return False
+
+    def matches_path(self, path: str) -> bool:
+        for pattern in self._path_patterns:
+            if fnmatchcase(path, pattern):
+                return True
+        return False
+
+
+def parse_ignore_fields(text: str) -> tuple[str, ...]:
+    """Split a comma or newline separated field list as typed in the UI."""
+    fields = (part.strip() for part in text.replace("\n", ",").split(","))
+    return tuple(part for part in fields if part)
+
+
+def diff_sources(
+    left: DiffSource,
+    right: DiffSource,
+    options: DiffOptions | None = None,
+    should_stop: Callable[[], bool] | None = None,
+) -> DiffResult:
+    """Diff two bodies, structurally when both are JSON.
+
+    In ``AUTO`` mode a body pair that does not parse as JSON falls back to a
+    line diff; forcing ``JSON`` raises ValueError instead.
+    """
+    options = options or DiffOptions()
+    if options.mode is not DiffMode.TEXT:
+        try:
+            left_value = json.loads(left.body)
+            right_value = json.loads(right.body)
+        except ValueError as exc:
+            if options.mode is DiffMode.JSON:
+                raise ValueError(f"body is not valid JSON: {exc}") from exc
+        else:
+            changes, truncated = diff_json(
+                left_value,
+                right_value,
+                ignore_fields=options.ignore_fields,
+                max_changes=options.max_changes,
+                should_stop=should_stop,
+            )
+            return DiffResult(mode=DiffMode.JSON, json_changes=changes, truncated=truncated)
+
+    lines = diff_text(
+        left.body,
+        right.body,
+        left_label=left.label,
+        right_label=right.label,
+        context_lines=options.context_lines,
+        should_stop=should_stop,
+    )
+    return DiffResult(mode=DiffMode.TEXT, text_diff=lines)
+
+
+def diff_json(
+    left: Any,
+    right: Any,
+    ignore_fields: tuple[str, ...] | list[str] = (),
+    max_changes: int = DEFAULT_MAX_CHANGES,
+    should_stop: Callable[[], bool] | None = None,
+) -> tuple[list[JsonChange], bool]:
+    """Structural diff of two decoded JSON values.
+
+    Object members are compared by key, so member order never matters;
+    arrays are compared position by position. Changes come back in document
+    order. Returns ``(changes, truncated)`` where ``truncated`` is set once
+    ``max_changes`` is reached.
+    """
+    matcher = FieldMatcher(ignore_fields)
+    check_keys = matcher.has_key_patterns
+    check_paths = matcher.has_path_patterns
+    changes: list[JsonChange] = []
+    # Items are either a pending container comparison ``(path, left, right)``
+    # or an already decided JsonChange, kept on one stack to preserve order.
+    stack: list[tuple[str, Any, Any] | JsonChange] = [("$", left, right)]
+    steps = 0
+    while stack:
+        item = stack.pop()
+        if type(item) is JsonChange:
+            changes.append(item)
+            if 0 < max_changes <= len(changes):
+                return changes, 0 < len(stack)
+            continue
+
+        steps += 1
+        if should_stop is not None and 0 == steps % _STOP_CHECK_INTERVAL and should_stop():
+            raise DiffCancelled()
+
+        path, old, new = item
+        pending: list[tuple[str, Any, Any] | JsonChange] = []
+        old_type = type(old)
+        if old_type is not type(new) or (old_type is not dict and old_type is not list):
+            if not _same_value(old, new):
+                pending.append(JsonChange(path, ChangeKind.CHANGED, old=old, new=new))
+        elif old_type is dict:
+            for key, old_value in old.items():
+                if check_keys and matcher.matches_key(key):
+                    continue
+                child_path = None
+                if check_paths:
+                    child_path = path + key_segment(key)
+                    if matcher.matches_path(child_path):
+                        continue
+                if key not in new:
+                    child_path = child_path or path + key_segment(key)
+                    pending.append(JsonChange(child_path, ChangeKind.REMOVED, old=old_value))
+                    continue
+                new_value = new[key]
+                value_type = type(old_value)
+                # Equal scalars are by far the common case; skip building a path.
+                if (
+                    value_type is type(new_value)
+                    and value_type is not dict
+                    and value_type is not list
+                    and old_value == new_value
+                ):
+                    continue
+                pending.append((child_path or path + key_segment(key), old_value, new_value))
+            for key, new_value in new.items():
+                if key in old:
+                    continue
+                if check_keys and matcher.matches_key(key):
+                    continue
+                child_path = path + key_segment(key)
+                if check_paths and matcher.matches_path(child_path):
+                    continue
+                pending.append(JsonChange(child_path, ChangeKind.ADDED, new=new_value))
+        else:
+            shared = min(len(old), len(new))
+            for index in range(shared):
+                old_value = old[index]
+                new_value = new[index]
+                value_type = type(old_value)
+                if (
+                    value_type is type(new_value)
+                    and value_type is not dict
+                    and value_type is not list
+                    and old_value == new_value
+                ):
+                    continue
+                child_path = f"{path}[{index}]"
+                if check_paths and matcher.matches_path(child_path):
+                    continue
+                pending.append((child_path, old_value, new_value))
+            for index in range(shared, len(old)):
+                pending.append(JsonChange(f"{path}[{index}]", ChangeKind.REMOVED, old=old[index]))
+            for index in range(shared, len(new)):
+                pending.append(JsonChange(f"{path}[{index}]", ChangeKind.ADDED, new=new[index]))
+        stack.extend(reversed(pending))
+    return changes, False
+
+
+def diff_text(
+    left: str,
+    right: str,
+    left_label: str = "left",
+    right_label: str = "right",
+    context_lines: int = DEFAULT_CONTEXT_LINES,
+    should_stop: Callable[[], bool] | None = None,
+) -> list[str]:
+    """Unified line diff in the same format as difflib.unified_diff.
+
+    Lines are aligned patience-style: lines that occur exactly once on both
+    sides anchor the alignment and only the gaps between anchors go through
+    difflib, which keeps multi-MB bodies with scattered edits tractable.
+    """
+    left_lines = left.splitlines()
+    right_lines = right.splitlines()
+    if left_lines == right_lines:
+        return []
+
+    opcodes = _line_opcodes(left_lines, right_lines, should_stop)
+    output = [f"--- {left_label}", f"+++ {right_label}"]
+    for group in _group_opcodes(opcodes, max(0, context_lines)):
+        first, last = group[0], group[-1]
+        left_range = _unified_range(first[1], last[2])
+        right_range = _unified_range(first[3], last[4])
+        output.append(f"@@ -{left_range} +{right_range} @@")
+        for tag, i1, i2, j1, j2 in group:
+            if tag == "equal":
+                output.extend(" " + line for line in left_lines[i1:i2])
+                continue
+            if tag in ("replace", "delete"):
+                output.extend("-" + line for line in left_lines[i1:i2])
+            if tag in ("replace", "insert"):
+                output.extend("+" + line for line in right_lines[j1:j2])
+    return output
+
+
+def _line_opcodes(
+    left: list[str],
+    right: list[str],
+    should_stop: Callable[[], bool] | None,
+) -> list[tuple[str, int, int, int, int]]:
+    opcodes: list[tuple[str, int, int, int, int]] = []
+    # Work items are either a range still to align, ``(None, alo, ahi, blo, bhi)``,
+    # or a finished opcode; both live on one stack so output stays in order.
+    stack: list[tuple[str | None, int, int, int, int]] = [(None, 0, len(left), 0, len(right))]
+    while stack:
+        tag, alo, ahi, blo, bhi = stack.pop()
+        if tag is not None:
+            _append_opcode(opcodes, tag, alo, ahi, blo, bhi)
+            continue
+        if should_stop is not None and should_stop():
+            raise DiffCancelled()
+
+        start_a, start_b = alo, blo
+        while alo < ahi and blo < bhi and left[alo] == right[blo]:
+            alo += 1
+            blo += 1
+        end_a, end_b = ahi, bhi
+        while alo < ahi and blo < bhi and left[ahi - 1] == right[bhi - 1]:
+            ahi -= 1
+            bhi -= 1
+
+        pending: list[tuple[str | None, int, int, int, int]] = []
+        if start_a < alo:
+            pending.append(("equal", start_a, alo, start_b, blo))
+        if alo == ahi or blo == bhi:
+            if alo < ahi:
+                pending.append(("delete", alo, ahi, blo, blo))
+            elif blo < bhi:
+                pending.append(("insert", alo, alo, blo, bhi))
+        else:
+            anchors = _unique_anchors(left, alo, ahi, right, blo, bhi)
+            if anchors:
+                # Gaps that already line up are folded into one equal run
+                # instead of being queued, which is most of them on big bodies.
+                run_a, run_b = alo, blo
+                prev_a, prev_b = alo, blo
+                for anchor_a, anchor_b in anchors + [(ahi, bhi)]:
+                    if left[prev_a:anchor_a] != right[prev_b:anchor_b]:
+                        if run_a < prev_a:
+                            pending.append(("equal", run_a, prev_a, run_b, prev_b))
+                        pending.append((None, prev_a, anchor_a, prev_b, anchor_b))
+                        run_a, run_b = anchor_a, anchor_b
+                    prev_a, prev_b = anchor_a + 1, anchor_b + 1
+                if run_a < ahi:
+                    pending.append(("equal", run_a, ahi, run_b, bhi))
+            elif (ahi - alo) * (bhi - blo) <= _DIFFLIB_CELL_LIMIT:
+                matcher = difflib.SequenceMatcher(None, left[alo:ahi], right[blo:bhi], autojunk=False)
+                for op, i1, i2, j1, j2 in matcher.get_opcodes():
+                    pending.append((op, i1 + alo, i2 + alo, j1 + blo, j2 + blo))
+            else:
+                pending.append(("replace", alo, ahi, blo, bhi))
+        if ahi < end_a:
+            pending.append(("equal", ahi, end_a, bhi, end_b))
+        stack.extend(reversed(pending))
+    return opcodes
+
+
+def _unique_anchors(
+    left: list[str], alo: int, ahi: int, right: list[str], blo: int, bhi: int
+) -> list[tuple[int, int]]:
+    """Longest increasing run of lines that are unique on both sides."""
+    left_slice = left[alo:ahi]
+    right_slice = right[blo:bhi]
+    left_counts = Counter(left_slice)
+    right_counts = Counter(right_slice)
+    common = {line for line, count in left_counts.items() if 1 == count}
+    common.intersection_update(line for line, count in right_counts.items() if 1 == count)
+    if not common:
+        return []
+
+    right_positions = dict(zip(right_slice, range(blo, bhi)))
+    pairs = [
+        (index, right_positions[line])
+        for index, line in enumerate(left_slice, start=alo)
+        if line in common
+    ]
+    if all(first[1] < second[1] for first, second in zip(pairs, islice(pairs, 1, None))):
+        return pairs
+
+    tails: list[int] = []
+    tail_pairs: list[int] = []
+    previous: list[int] = [-1] * len(pairs)
+    for position, (_, right_index) in enumerate(pairs):
+        slot = bisect_left(tails, right_index)
+        if slot == len(tails):
+            tails.append(right_index)
+            tail_pairs.append(position)
+        else:
+            tails[slot] = right_index
+            tail_pairs[slot] = position
+        previous[position] = tail_pairs[slot - 1] if 0 < slot else -1
+
+    anchors: list[tuple[int, int]] = []
+    position = tail_pairs[-1]
+    while 0 <= position:
+        anchors.append(pairs[position])
+        position = previous[position]
+    anchors.reverse()
+    return anchors
+
+
+def _append_opcode(
+    opcodes: list[tuple[str, int, int, int, int]], tag: str, i1: int, i2: int, j1: int, j2: int
+) -> None:
+    if i1 == i2 and j1 == j2:
+        return
+    if opcodes and opcodes[-1][0] == tag == "equal":
+        opcodes[-1] = (tag, opcodes[-1][1], i2, opcodes[-1][3], j2)
+        return
+    opcodes.append((tag, i1, i2, j1, j2))
+
+
+def format_json_changes(changes: list[JsonChange]) -> Iterator[str]:
+    for change in changes:
+        if change.kind is ChangeKind.ADDED:
+            yield f"+ {change.path}: {_preview(change.new)}"
+        elif change.kind is ChangeKind.REMOVED:
+            yield f"- {change.path}: {_preview(change.old)}"
+        else:
+            yield f"~ {change.path}: {_preview(change.old)} -> {_preview(change.new)}"
+
+
+def _same_value(old: Any, new: Any) -> bool:
+    # bool is an int subclass; keep true/1 and false/0 apart.
+    if isinstance(old, bool) or isinstance(new, bool):
+        return type(old) is type(new) and old == new
+    return old == new
+
+
+def _group_opcodes(
+    opcodes: list[tuple[str, int, int, int, int]], context: int
+) -> Iterator[list[tuple[str, int, int, int, int]]]:
+    """Same grouping as difflib.SequenceMatcher.get_grouped_opcodes."""
+    if not opcodes:
+        return
+    codes = list(opcodes)
+    if codes[0][0] == "equal":
+        tag, i1, i2, j1, j2 = codes[0]
+        codes[0] = (tag, max(i1, i2 - context), i2, max(j1, j2 - context), j2)
+    if codes[-1][0] == "equal":
+        tag, i1, i2, j1, j2 = codes[-1]
+        codes[-1] = (tag, i1, min(i2, i1 + context), j1, min(j2, j1 + context))
+
+    window = context + context
+    group: list[tuple[str, int, int, int, int]] = []
+    for tag, i1, i2, j1, j2 in codes:
+        if tag == "equal" and i2 - i1 > window:
+            group.append((tag, i1, min(i2, i1 + context), j1, min(j2, j1 + context)))
+            yield group
+            group = []
+            i1, j1 = max(i1, i2 - context), max(j1, j2 - context)
+        group.append((tag, i1, i2, j1, j2))
+    if group and not (len(group) == 1 and group[0][0] == "equal"):
+        yield group
+
+
+def _unified_range(start: int, stop: int) -> str:
+    beginning = start + 1
+    length = stop - start
+    if length == 1:
+        return f"{beginning}"
+    if not length:
+        beginning -= 1
+    return f"{beginning},{length}"
+
+
+def _preview(value: Any) -> str:
+    text = json.dumps(value, ensure_ascii=False, sort_keys=True)
+    if len(text) <= _VALUE_PREVIEW_CHARS:
+        return text
+    return text[: _VALUE_PREVIEW_CHARS - 1] + "…"
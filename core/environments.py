@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from core.model import EnvironmentScope, WorkspaceData
+
+NO_ENVIRONMENT = "No Environment"
+
+
+def build_environment_map(workspace: WorkspaceData) -> dict[str, dict[str, str]]:
+    """Global environments by display name, starting with an empty "No Environment".
+
+    The name comes from the environment's ``name`` variable, or "Env N" when
+    it has none.
+    """
+    environment_map: dict[str, dict[str, str]] = {NO_ENVIRONMENT: {}}
+    index = 1
+    for env in workspace.environments:
+        if env.scope is not EnvironmentScope.GLOBAL:
+            continue
+        name = env.variables.get("name")
+        if name is None or 0 == len(name):
+            name = f"Env {index}"
+        index += 1
+        environment_map[name] = dict(env.variables)
+    return environment_map
@@ -0,0 +1,296 @@
+from __future__ import annotations
+
+import heapq
+import re
+from collections import Counter
+from dataclasses import dataclass
+
+DEFAULT_LIMIT = 50
+_FALLBACK_GRAMS = 8
+# Candidate sets up to this size are scored outright.
+_SCORE_ALL_LIMIT = 1000
+# A broad query stops after scoring this many candidates once it has
+# ``limit`` matches; the shortest names are scored first.
+_MAX_SCORED = 3000
+_WORD_SEPARATORS = re.compile(r"[\s/.?&=\-_:{}]+")
+
+
+@dataclass(slots=True)
+class FuzzyEntry:
+    key: str
+    name: str
+    method: str = ""
+    url: str = ""
+    path: str = ""
+
+
+@dataclass(slots=True)
+class FuzzyMatch:
+    entry: FuzzyEntry
+    score: float
+
+
+class FuzzyIndex:
+    """Trigram index for quick-open style lookups.
+
+    Each entry is indexed by the trigrams of ``name method path url`` plus the
+    one- and two-character prefixes of its words, so short queries resolve
+    without a scan. Candidates are the intersection of the query's trigram
+    postings; a token with unknown trigrams instead matches entries sharing
+    at least half of its rarer trigrams, which tolerates typos.
+
+    Small candidate sets are scored outright. Larger ones are scored in order
+    of name length, the tie-breaker, and the scan stops once ``limit`` matches
+    reach the best score any token could still get (known from which terms
+    occur in any name, path or method) or after ``_MAX_SCORED`` candidates,
+    in which case the results are the best of those scanned.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[int, FuzzyEntry] = {}
+        self._texts: dict[int, str] = {}
+        self._names: dict[int, str] = {}
+        self._slots: dict[str, int] = {}
+        self._postings: dict[str, set[int]] = {}
+        self._by_length: dict[int, set[int]] = {}
+        # Terms that occur in any name or folder path, and the methods in
+        # use: they bound the score a query token can reach.
+        self._name_terms: Counter[str] = Counter()
+        self._path_terms: Counter[str] = Counter()
+        self._methods: Counter[str] = Counter()
+        self._next_slot = 0
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._slots
+
+    def entry(self, key: str) -> FuzzyEntry | None:
+        slot = self._slots.get(key)
+        if slot is None:
+            return None
+        return self._entries[slot]
+
+    def add(self, entry: FuzzyEntry) -> None:
+        """Index an entry, replacing any previous entry with the same key."""
+        self.remove(entry.key)
+        slot = self._next_slot
+        self._next_slot += 1
+        text = " ".join(part for part in (entry.name, entry.method, entry.path, entry.url) if part).lower()
+        self._entries[slot] = entry
+        self._texts[slot] = text
+        self._names[slot] = entry.name.lower()
+        self._slots[entry.key] = slot
+        postings = self._postings
+        for gram in _index_terms(text):
+            bucket = postings.get(gram)
+            if bucket is None:
+                postings[gram] = {slot}
+            else:
+                bucket.add(slot)
+        self._by_length.setdefault(len(entry.name), set()).add(slot)
+        self._name_terms.update(_name_terms(entry.name.lower()))
+        self._path_terms.update(_index_terms(entry.path.lower()))
+        self._methods[entry.method.lower()] += 1
+
+    def remove(self, key: str) -> None:
+        slot = self._slots.pop(key, None)
+        if slot is None:
+            return
+        text = self._texts.pop(slot)
+        entry = self._entries.pop(slot)
+        del self._names[slot]
+        postings = self._postings
+        for gram in _index_terms(text):
+            bucket = postings.get(gram)
+            if bucket is None:
+                continue
+            bucket.discard(slot)
+            if not bucket:
+                del postings[gram]
+        length_bucket = self._by_length[len(entry.name)]
+        length_bucket.discard(slot)
+        if not length_bucket:
+            del self._by_length[len(entry.name)]
+        self._name_terms.subtract(_name_terms(entry.name.lower()))
+        self._path_terms.subtract(_index_terms(entry.path.lower()))
+        self._methods[entry.method.lower()] -= 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._texts.clear()
+        self._names.clear()
+        self._slots.clear()
+        self._postings.clear()
+        self._by_length.clear()
+        self._name_terms.clear()
+        self._path_terms.clear()
+        self._methods.clear()
+
+    def search(self, query: str, limit: int = DEFAULT_LIMIT) -> list[FuzzyMatch]:
+        tokens = query.lower().split()
+        if not tokens or limit <= 0:
+            return []
+
+        candidates = self._candidates(tokens)
+        if not candidates:
+            return []
+
+        names = self._names
+        texts = self._texts
+        entries = self._entries
+        if len(candidates) <= _SCORE_ALL_LIMIT:
+            scored = (
+                (-score, len(names[slot]), slot)
+                for slot in candidates
+                if (score := _score(tokens, names[slot], entries[slot], texts[slot])) > 0
+            )
+            # Slot breaks ties, so equal matches come back in insertion order.
+            return [
+                FuzzyMatch(entry=entries[slot], score=-negative)
+                for negative, _, slot in heapq.nsmallest(limit, scored)
+            ]
+
+        best_possible = sum(self._token_bound(token) for token in tokens)
+        # Min-heap of (score, -length, -slot): the weakest kept match is first.
+        kept: list[tuple[float, int, int]] = []
+        scanned = 0
+        for length in sorted(self._by_length):
+            if len(kept) == limit and kept[0][0] >= best_possible:
+                break
+            for slot in sorted(self._by_length[length] & candidates):
+                if scanned >= _MAX_SCORED and len(kept) == limit:
+                    break
+                scanned += 1
+                score = _score(tokens, names[slot], entries[slot], texts[slot])
+                if score <= 0:
+                    continue
+                item = (score, -length, -slot)
+                if len(kept) < limit:
+                    heapq.heappush(kept, item)
+                elif item > kept[0]:
+                    heapq.heapreplace(kept, item)
+            else:
+                continue
+            break
+        return [FuzzyMatch(entry=entries[-slot], score=score) for score, _, slot in sorted(kept, reverse=True)]
+
+    def _token_bound(self, token: str) -> float:
+        """The highest score ``token`` can reach in ``_score`` for any entry."""
+        if len(token) >= 3 and not all(gram in self._postings for gram in _query_terms(token)):
+            # Not a substring of any entry, so at best a subsequence of a name.
+            return 2
+        if self._name_terms["<" + token[:3]] > 0:
+            return 12
+        if self._name_terms["^" + token[:3]] > 0:
+            return 9
+        if len(token) < 3 or all(self._name_terms[gram] > 0 for gram in _query_terms(token)):
+            return 6
+        if self._methods[token] > 0:
+            return 5
+        if all(self._path_terms[gram] > 0 for gram in _query_terms(token)):
+            return 4
+        return 3
+
+    def _candidates(self, tokens: list[str]) -> set[int]:
+        buckets: list[set[int]] = []
+        for token in tokens:
+            grams = _query_terms(token)
+            token_buckets = [self._postings.get(gram) for gram in grams]
+            if all(bucket for bucket in token_buckets):
+                buckets.extend(token_buckets)
+                continue
+            fuzzy = self._fallback_candidates(grams)
+            if not fuzzy:
+                return set()
+            buckets.append(fuzzy)
+        buckets.sort(key=len)
+        result = set(buckets[0])
+        for bucket in buckets[1:]:
+            if len(bucket) == len(self._entries):
+                break  # This and every larger bucket holds every entry.
+            result.intersection_update(bucket)
+            if not result:
+                break
+        return result
+
+    def _fallback_candidates(self, grams: list[str]) -> set[int]:
+        """Entries sharing at least half of a misspelt token's rarer grams."""
+        buckets = sorted(
+            (self._postings[gram] for gram in set(grams) if gram in self._postings), key=len
+        )[:_FALLBACK_GRAMS]
+        if not buckets:
+            return set()
+        needed = max(1, (min(len(set(grams)), _FALLBACK_GRAMS) + 1) // 2)
+        # Grams every entry has count for every slot without being counted.
+        partial = [bucket for bucket in buckets if len(bucket) < len(self._entries)]
+        needed -= len(buckets) - len(partial)
+        if needed <= 0:
+            return set(self._entries)
+        # A slot in none of the smallest ``len - needed + 1`` buckets is in
+        # fewer than ``needed`` of them, so only those slots are counted.
+        seeds: set[int] = set().union(*partial[: len(partial) - needed + 1])
+        if needed == 1:
+            return seeds
+        counts: Counter[int] = Counter()
+        for bucket in partial:
+            counts.update(bucket & seeds)
+        return {slot for slot, count in counts.items() if count >= needed}
+
+
+def _index_terms(text: str) -> set[str]:
+    terms = {text[index : index + 3] for index in range(len(text) - 2)}
+    for word in _WORD_SEPARATORS.split(text):
+        if word:
+            terms.add(word[:2])
+            terms.add(word[:1])
+    return terms
+
+
+def _name_terms(name: str) -> set[str]:
+    # Trigrams and word prefixes, plus "^" and up to three leading characters
+    # of each word, and "<" and those of the whole name.
+    terms = _index_terms(name)
+    for word in _WORD_SEPARATORS.split(name):
+        terms.update("^" + word[:size] for size in range(1, min(len(word), 3) + 1))
+    terms.update("<" + name[:size] for size in range(1, min(len(name), 3) + 1))
+    return terms
+
+
+def _query_terms(token: str) -> list[str]:
+    if len(token) < 3:
+        return [token]
+    return [token[index : index + 3] for index in range(len(token) - 2)]
+
+
+def _score(tokens: list[str], name: str, entry: FuzzyEntry, text: str) -> float:
+    score = 0.0
+    for token in tokens:
+        if name.startswith(token):
+            score += 12
+        elif (" " + token) in name:
+            score += 9
+        elif token in name:
+            score += 6
+        elif token == entry.method.lower():
+            score += 5
+        elif token in entry.path.lower():
+            score += 4
+        elif token in text:
+            score += 3
+        elif _is_subsequence(token, name):
+            score += 2
+        elif _is_subsequence(token, text):
+            score += 1
+    return score
+
+
+def _is_subsequence(token: str, text: str) -> bool:
+    position = 0
+    for char in token:
+        position = text.find(char, position)
+        if position < 0:
+            return False
+        position += 1
+    return True
@@ -1,25 +1,56 @@
 from __future__ import annotations
 
 import contextlib
+import logging
+import threading
 from pathlib import Path
 
 import httpx
 
-from core.logger import get_logger
+from core.logger import get_logger, redact_pairs, redact_url, truncate_for_log
 from core.model import AuthType, RequestData, ResponseData
+from core.netsim import AsyncSimulatedTransport, NetworkSimulator, SimulatedTransport, parse_profile
 
 logger = get_logger("http_client")
 
 
 class HttpClient:
-    def __init__(self, default_timeout_ms: int = 10000) -> None:
+    """Sends ``RequestData`` with httpx.
+
+    Requests whose ``network.simulate`` profile is set (or all requests, when
+    ``simulate`` is given and a request has none) go through a
+    ``core.netsim`` transport. One simulator per profile is shared by every
+    client this instance creates, so a seeded profile yields the same
+    sequence of conditions across a whole run.
+    """
+
+    def __init__(self, default_timeout_ms: int = 10000, simulate: str = "") -> None:
         self._default_timeout_ms = default_timeout_ms
+        self._simulate = simulate
+        self._simulators: dict[str, NetworkSimulator | None] = {}
+        self._simulators_lock = threading.Lock()
 
     def create_client(self, request: RequestData) -> httpx.Client:
         timeout_ms = request.timeout_ms
         if 0 >= timeout_ms:
             timeout_ms = self._default_timeout_ms
 
+        simulator = self._simulator(request)
+        if simulator is not None:
+            # With a custom transport httpx would route environment proxies
+            # around it, so the proxy is configured on the wrapped transport.
+            transport = httpx.HTTPTransport(
+                verify=request.network.verify_ssl,
+                proxy=request.network.proxy_url or None,
+                trust_env=request.network.trust_env,
+            )
+            return httpx.Client(
+                timeout=httpx.Timeout(timeout_ms / 1000.0),
+                follow_redirects=request.network.follow_redirects,
+                transport=SimulatedTransport(simulator, transport),
+                trust_env=False,
+            )
+
         return httpx.Client(
             timeout=httpx.Timeout(timeout_ms / 1000.0),
             verify=request.network.verify_ssl,
@@ -29,6 +60,81 @@ class HttpClient:
         )
 
     def send(self, request: RequestData, client: httpx.Client | None = None) -> ResponseData:
+        if client is None and self._simulator(request) is not None:
+            with self.create_client(request) as simulated_client:
+                return self.send(request, simulated_client)
+
+        # Use ExitStack to ensure files are closed properly
+        with contextlib.ExitStack() as stack:
+            request_kwargs = self._build_request_kwargs(request, stack)
+
+            if client is None:
+                response = httpx.request(
+                    request.method,
+                    request.url,
+                    proxy=request.network.proxy_url or None,
+                    verify=request.network.verify_ssl,
+                    trust_env=request.network.trust_env,
+                    **request_kwargs,
+                )
+            else:
+                response = client.request(
+                    request.method,
+                    request.url,
+                    **request_kwargs,
+                )
+            return self._to_response(response)
+
+    def create_async_client(self, request: RequestData, max_connections: int | None = None) -> httpx.AsyncClient:
+        """Like ``create_client``, but async and with a bounded connection pool."""
+        timeout_ms = request.timeout_ms
+        if 0 >= timeout_ms:
+            timeout_ms = self._default_timeout_ms
+
+        limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+        simulator = self._simulator(request)
+        if simulator is not None:
+            transport = httpx.AsyncHTTPTransport(
+                verify=request.network.verify_ssl,
+                proxy=request.network.proxy_url or None,
+                trust_env=request.network.trust_env,
+                limits=limits,
+            )
+            return httpx.AsyncClient(
+                timeout=httpx.Timeout(timeout_ms / 1000.0),
+                follow_redirects=request.network.follow_redirects,
+                transport=AsyncSimulatedTransport(simulator, transport),
+                trust_env=False,
+            )
+
+        return httpx.AsyncClient(
+            timeout=httpx.Timeout(timeout_ms / 1000.0),
+            verify=request.network.verify_ssl,
+            proxy=request.network.proxy_url or None,
+            follow_redirects=request.network.follow_redirects,
+            trust_env=request.network.trust_env,
+            limits=limits,
+        )
+
+    async def send_async(self, request: RequestData, client: httpx.AsyncClient) -> ResponseData:
+        with contextlib.ExitStack() as stack:
+            request_kwargs = self._build_request_kwargs(request, stack)
+            response = await client.request(request.method, request.url, **request_kwargs)
+            return self._to_response(response)
+
+    def _simulator(self, request: RequestData) -> NetworkSimulator | None:
+        """The shared simulator for the request's profile; raises ``ValueError`` for a bad profile."""
+        spec = request.network.simulate.strip() or self._simulate.strip()
+        if not spec:
+            return None
+        with self._simulators_lock:
+            if spec not in self._simulators:
+                profile = parse_profile(spec)
+                self._simulators[spec] = None if profile is None else NetworkSimulator(profile)
+            return self._simulators[spec]
+
+    def _build_request_kwargs(self, request: RequestData, stack: contextlib.ExitStack) -> dict:
+        """httpx keyword arguments for ``request``; upload files are opened on ``stack``."""
         timeout_ms = request.timeout_ms
         if 0 >= timeout_ms:
             timeout_ms = self._default_timeout_ms
@@ -65,91 +171,58 @@ class HttpClient:
             "follow_redirects": request.network.follow_redirects,
         }
 
-        # Use ExitStack to ensure files are closed properly
-        with contextlib.ExitStack() as stack:
-            if request.body_type == "multipart":
-                files_payload = []
-                for key, path_str in request.files:
-                    path_str = path_str.strip()
-                    if not path_str:
-                        continue
-                    try:
-                        file_path = Path(path_str)
-                        # Open file and register for closing
-                        f = stack.enter_context(open(file_path, "rb"))
-                        content = f.read()
-                        # (filename, content)
-                        files_payload.append((key, (file_path.name, content)))
-                    except OSError as e:
-                        logger.error(f"Failed to open file '{path_str}': {e}")
-                        # We might want to stop here or proceed. 
-                        # For now, let's allow it to fail at httpx level or proceed partially.
-                        # But typically if a user uploads a file, they expect it to be there.
-                        # Let's assume valid paths for now or user catches log.
-                
-                # Form fields as data (list of tuples handles duplicates)
-                data_payload = request.form_fields
-                
-                request_kwargs["files"] = files_payload
-                if data_payload:
-                    request_kwargs["data"] = data_payload
-                
-            else:
-                # Raw body
-                body_text = request.body
-                content = body_text if 0 < len(body_text.strip()) else None
-                request_kwargs["content"] = content
-
-            # --- Debug Logging ---
-            logger.debug("=== Request Details ===")
-            logger.debug(f"Method: {request.method}")
-            logger.debug(f"URL: {request.url}")
-            
-            if request_kwargs.get("params"):
-                logger.debug(f"Params: {request_kwargs['params']}")
-            
-            if request_kwargs.get("headers"):
-                logger.debug(f"Headers: {request_kwargs['headers']}")
-            
-            if request_kwargs.get("content"):
-                logger.debug(f"Body (Raw): {request_kwargs['content']}")
-            
-            if request_kwargs.get("data"):
-                logger.debug(f"Body (Form Data): {request_kwargs['data']}")
-            
-            if request_kwargs.get("files"):
-                # files is list of (key, (filename, stream))
-                files_log = []
-                for key, val in request_kwargs["files"]:
-                    filename = val[0] if isinstance(val, tuple) and len(val) > 0 else "unknown"
-                    files_log.append(f"{key}: {filename}")
-                logger.debug(f"Body (Files): {files_log}")
-            logger.debug("=======================")
-            # ---------------------
+        if request.body_type == "multipart":
+            files_payload = []
+            for key, path_str in request.files:
+                path_str = path_str.strip()
+                if not path_str:
+                    continue
+                try:
+                    file_path = Path(path_str)
+                    # Open file and register for closing
+                    f = stack.enter_context(open(file_path, "rb"))
+                    content = f.read()
+                    # (filename, content)
+                    files_payload.append((key, (file_path.name, content)))
+                except OSError as e:
+                    logger.error(f"Failed to open file '{path_str}': {e}")
+                    # We might want to stop here or proceed. 
+                    # For now, let's allow it to fail at httpx level or proceed partially.
+                    # But typically if a user uploads a file, they expect it to be there.
+                    # Let's assume valid paths for now or user catches log.
 
-            if client is None:
-                response = httpx.request(
-                    request.method,
-                    request.url,
-                    proxy=request.network.proxy_url or None,
-                    verify=request.network.verify_ssl,
-                    trust_env=request.network.trust_env,
-                    **request_kwargs,
-                )
-            else:
-                response = client.request(
-                    request.method,
-                    request.url,
-                    **request_kwargs,
-                )
+            # httpx sends a non-dict ``data`` as raw content, so repeated
+            # form fields are grouped into lists instead of passed as tuples.
+            data_payload: dict[str, list[str]] = {}
+            for key, value in request.form_fields:
+                data_payload.setdefault(key, []).append(value)
 
-            elapsed_ms = int(response.elapsed.total_seconds() * 1000)
-            return ResponseData(
-                status_code=response.status_code,
-                headers=list(response.headers.items()),
-                body=response.text,
-                elapsed_ms=elapsed_ms,
-            )
+            request_kwargs["files"] = files_payload
+            if data_payload:
+                request_kwargs["data"] = data_payload
+
+        else:
+            # Raw body
+            body_text = request.body
+            content = body_text if 0 < len(body_text.strip()) else None
+            request_kwargs["content"] = content
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s", _describe_request(request, request_kwargs))
+        return request_kwargs
+
+    @staticmethod
+    def _to_response(response: httpx.Response) -> ResponseData:
+        elapsed_ms = int(response.elapsed.total_seconds() * 1000)
+        result = ResponseData(
+            status_code=response.status_code,
+            headers=list(response.headers.items()),
+            body=response.text,
+            elapsed_ms=elapsed_ms,
+        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s", _describe_response(result))
+        return result
 
     @staticmethod
     def _normalize_pairs(pairs: list[tuple[str, str]]) -> list[tuple[str, str]]:
@@ -159,3 +232,37 @@ class HttpClient:
             if 0 < len(key_text):
                 normalized.append((key_text, value.strip()))
         return normalized
+
+
+def _describe_request(request: RequestData, request_kwargs: dict) -> str:
+    """Multi-line request dump with credentials masked and bodies truncated."""
+    lines = ["=== Request Details ===", f"Method: {request.method}", f"URL: {redact_url(request.url)}"]
+    if request_kwargs.get("params"):
+        lines.append(f"Params: {redact_pairs(request_kwargs['params'])}")
+    if request_kwargs.get("headers"):
+        lines.append(f"Headers: {redact_pairs(request_kwargs['headers'])}")
+    if request_kwargs.get("content"):
+        lines.append(f"Body (Raw): {truncate_for_log(request_kwargs['content'])}")
+    if request_kwargs.get("data"):
+        # Multipart form fields are grouped by name: {name: [value, ...]}.
+        fields = [(key, value) for key, values in request_kwargs["data"].items() for value in values]
+        lines.append(f"Body (Form Data): {redact_pairs(fields)}")
+    if request_kwargs.get("files"):
+        # files is list of (key, (filename, content))
+        files_log = []
+        for key, val in request_kwargs["files"]:
+            filename = val[0] if isinstance(val, tuple) and len(val) > 0 else "unknown"
+            files_log.append(f"{key}: {filename}")
+        lines.append(f"Body (Files): {files_log}")
+    lines.append("=======================")
+    return "\n".join(lines)
+
+
+def _describe_response(response: ResponseData) -> str:
+    return "\n".join(
+        [
+            f"=== Response {response.status_code} ({response.elapsed_ms} ms) ===",
+            f"Headers: {redact_pairs(response.headers)}",
+            f"Body: {truncate_for_log(response.body)}",
+        ]
+    )
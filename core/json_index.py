@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import dataclass
+from enum import Enum
+from typing import Iterator
+
+_STRUCTURE = re.compile(r'"(?:[^"\\]++|\\.)*+"|[\[\]{}]')
+_STRING = re.compile(r'"(?:[^"\\]++|\\.)*+"')
+_SCALAR = re.compile(r"[^\s,\]}]+")
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+_PREVIEW_CHARS = 80
+
+
+class JsonNodeKind(Enum):
+    OBJECT = "object"
+    ARRAY = "array"
+    STRING = "string"
+    NUMBER = "number"
+    BOOLEAN = "boolean"
+    NULL = "null"
+
+
+@dataclass(slots=True)
+class JsonNode:
+    key: str | int | None
+    kind: JsonNodeKind
+    start: int
+    end: int
+    path: str
+    preview: str
+
+    @property
+    def is_container(self) -> bool:
+        return self.kind == JsonNodeKind.OBJECT or self.kind == JsonNodeKind.ARRAY
+
+
+class JsonIndex:
+    """Structural index over a JSON document held as text.
+
+    Construction makes one pass that records where every object and array
+    ends. Children are then enumerated on demand by walking a single level and
+    jumping over nested containers, so nothing below the expanded node is
+    materialised. Offsets are character offsets into ``text``.
+    """
+
+    def __init__(self, text: str) -> None:
+        self._text = text
+        self._ends: dict[int, int] = {}
+        self._roots: list[int] = []
+        self._build()
+
+    @property
+    def text(self) -> str:
+        return self._text
+
+    def roots(self) -> list[JsonNode]:
+        """Top-level values; more than one for NDJSON-style documents."""
+        if 1 == len(self._roots):
+            return [self._node(None, self._roots[0], "$")]
+        return [
+            self._node(index, start, f"$[{index}]") for index, start in enumerate(self._roots)
+        ]
+
+    def iter_children(self, node: JsonNode) -> Iterator[JsonNode]:
+        if not node.is_container:
+            return
+        text = self._text
+        is_object = node.kind == JsonNodeKind.OBJECT
+        end = node.end - 1
+        pos = node.start + 1
+        index = 0
+        while True:
+            pos = _WHITESPACE.match(text, pos).end()
+            if pos >= end:
+                return
+
+            key: str | int
+            if is_object:
+                match = _STRING.match(text, pos)
+                if match is None:
+                    raise ValueError(f"expected object key at offset {pos}")
+                key = json.loads(match.group(0))
+                pos = _WHITESPACE.match(text, match.end()).end()
+                if text[pos] != ":":
+                    raise ValueError(f"expected ':' at offset {pos}")
+                pos = _WHITESPACE.match(text, pos + 1).end()
+                path = node.path + key_segment(key)
+            else:
+                key = index
+                path = f"{node.path}[{index}]"
+
+            child = self._node(key, pos, path)
+            yield child
+            index += 1
+
+            pos = _WHITESPACE.match(text, child.end).end()
+            if pos < end and text[pos] == ",":
+                pos += 1
+
+    def children(self, node: JsonNode) -> list[JsonNode]:
+        return list(self.iter_children(node))
+
+    def _node(self, key: str | int | None, start: int, path: str) -> JsonNode:
+        text = self._text
+        char = text[start]
+        if char == "{" or char == "[":
+            end = self._ends[start] + 1
+            kind = JsonNodeKind.OBJECT if char == "{" else JsonNodeKind.ARRAY
+            preview = "{…}" if char == "{" else "[…]"
+        elif char == '"':
+            match = _STRING.match(text, start)
+            if match is None:
+                raise ValueError(f"unterminated string at offset {start}")
+            end = match.end()
+            kind = JsonNodeKind.STRING
+            preview = _truncate(text[start:end])
+        else:
+            match = _SCALAR.match(text, start)
+            if match is None:
+                raise ValueError(f"expected value at offset {start}")
+            end = match.end()
+            preview = text[start:end]
+            if preview == "null":
+                kind = JsonNodeKind.NULL
+            elif preview == "true" or preview == "false":
+                kind = JsonNodeKind.BOOLEAN
+            else:
+                kind = JsonNodeKind.NUMBER
+        return JsonNode(key=key, kind=kind, start=start, end=end, path=path, preview=preview)
+
+    def _build(self) -> None:
+        text = self._text
+        stack: list[int] = []
+        ends = self._ends
+        roots = self._roots
+        for match in _STRUCTURE.finditer(text):
+            start = match.start()
+            char = text[start]
+            if char == '"':
+                if 0 == len(stack):
+                    roots.append(start)
+                continue
+            if char == "{" or char == "[":
+                if 0 == len(stack):
+                    roots.append(start)
+                stack.append(start)
+                continue
+            if 0 == len(stack):
+                raise ValueError(f"unbalanced '{char}' at offset {start}")
+            opener = stack.pop()
+            if (text[opener] == "{") != (char == "}"):
+                raise ValueError(f"mismatched '{char}' at offset {start}")
+            ends[opener] = start
+        if 0 < len(stack):
+            raise ValueError(f"unclosed container at offset {stack[-1]}")
+        if 0 == len(roots):
+            self._find_scalar_roots()
+
+    def _find_scalar_roots(self) -> None:
+        text = self._text
+        pos = _WHITESPACE.match(text, 0).end()
+        while pos < len(text):
+            match = _SCALAR.match(text, pos)
+            if match is None:
+                break
+            self._roots.append(pos)
+            pos = _WHITESPACE.match(text, match.end()).end()
+
+
+def key_segment(key: str) -> str:
+    """Path segment for an object key: ``.name`` or ``["odd key"]``."""
+    if _IDENTIFIER.match(key):
+        return f".{key}"
+    return f"[{json.dumps(key, ensure_ascii=False)}]"
+
+
+def _truncate(text: str) -> str:
+    if len(text) <= _PREVIEW_CHARS:
+        return text
+    return text[: _PREVIEW_CHARS - 1] + "…"
@@ -0,0 +1,362 @@
+from __future__ import annotations
+
+import codecs
+import re
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, NoReturn, Protocol
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_STRING_BODY = re.compile(r'(?:[^"\\\x00-\x1f]++|\\(?:["\\/bfnrt]|u[0-9a-fA-F]{4}))*+')
+_NUMBER_CHARS = re.compile(r"[-+0-9.eE]*")
+_TOKEN = re.compile(
+    r"[ \t\n\r]*+(?:"
+    r'(?P<string>"(?:[^"\\\x00-\x1f]++|\\(?:["\\/bfnrt]|u[0-9a-fA-F]{4}))*+")'
+    r"|(?P<number>-?(?:0|[1-9][0-9]*+)(?:\.[0-9]++)?(?:[eE][+-]?[0-9]++)?)"
+    r"|(?P<punct>[{}\[\],:])"
+    r"|(?P<literal>true|false|null)"
+    r")"
+)
+# Group numbers of the alternatives in _TOKEN.
+_TOKEN_STRING = 1
+_TOKEN_NUMBER = 2
+_TOKEN_PUNCT = 3
+_LITERALS = {"t": "true", "f": "false", "n": "null"}
+_MAX_ESCAPE_LENGTH = 6
+_FLUSH_PARTS = 4096
+
+# Parser states: what the next significant token is allowed to be.
+_TOP = 0
+_VALUE = 1
+_FIRST_VALUE_OR_END = 2
+_KEY = 3
+_FIRST_KEY_OR_END = 4
+_COLON = 5
+_COMMA_OR_END = 6
+
+
+class JsonStreamError(ValueError):
+    def __init__(self, message: str, offset: int) -> None:
+        super().__init__(f"{message} (offset {offset})")
+        self.offset = offset
+
+
+class _Writable(Protocol):
+    def write(self, text: str) -> object: ...
+
+
+Sink = Callable[[str], object] | _Writable
+
+
+class JsonStreamFormatter:
+    """Incremental JSON validator and re-formatter.
+
+    Input is fed as bytes (or text) in arbitrary chunks and formatted output is
+    handed to ``sink`` after every chunk, so memory use depends on nesting
+    depth and chunk size rather than document size. Strings that span chunks
+    are passed through as they arrive. Several top-level values in a row
+    (NDJSON, concatenated JSON) are accepted and written one per line.
+
+    Tokens are copied verbatim: escapes and number spellings are not
+    normalised. ``indent=None`` minifies; ``sink=None`` only validates.
+    """
+
+    def __init__(self, sink: Sink | None = None, indent: int | None = 4) -> None:
+        self._sink = _resolve_sink(sink)
+        self._indent = indent
+        self._decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="strict")
+
+        self._buffer = ""
+        self._consumed = 0
+        self._stack: list[str] = []
+        self._state = _TOP
+        self._in_string = False
+        self._values = 0
+        self._closed = False
+
+        self._out: list[str] = []
+        self._newlines: list[str] = []
+
+    @property
+    def values(self) -> int:
+        """Number of complete top-level values seen so far."""
+        return self._values
+
+    def feed(self, data: bytes) -> None:
+        try:
+            text = self._decoder.decode(data)
+        except UnicodeDecodeError as exc:
+            raise JsonStreamError(f"invalid UTF-8: {exc.reason}", self._consumed + len(self._buffer)) from exc
+        self.feed_text(text)
+
+    def feed_text(self, text: str) -> None:
+        if self._closed:
+            raise RuntimeError("formatter is closed")
+        if 0 == len(text):
+            return
+        self._buffer = self._buffer + text if self._buffer else text
+        self._process(final=False)
+        self._flush()
+
+    def close(self) -> int:
+        """Finish the stream, raising JsonStreamError if it ended mid-value."""
+        if self._closed:
+            return self._values
+        try:
+            tail = self._decoder.decode(b"", final=True)
+        except UnicodeDecodeError as exc:
+            raise JsonStreamError(f"invalid UTF-8: {exc.reason}", self._consumed + len(self._buffer)) from exc
+        self._buffer += tail
+        self._process(final=True)
+        self._closed = True
+
+        offset = self._consumed
+        if self._in_string:
+            raise JsonStreamError("unterminated string", offset)
+        if 0 < len(self._stack) or self._state != _TOP:
+            raise JsonStreamError("unexpected end of input", offset)
+        if 0 == self._values:
+            raise JsonStreamError("no JSON value found", offset)
+        self._flush()
+        return self._values
+
+    def _process(self, final: bool) -> None:
+        buffer = self._buffer
+        length = len(buffer)
+        pos = 0
+        state = self._state
+        stack = self._stack
+        out = self._out
+        write = out.append
+        pretty = self._indent is not None
+        token_match = _TOKEN.match
+
+        while True:
+            if self._in_string:
+                end = _STRING_BODY.match(buffer, pos).end()
+                if end > pos:
+                    write(buffer[pos:end])
+                    pos = end
+                if pos >= length:
+                    break
+                char = buffer[pos]
+                if char == '"':
+                    write('"')
+                    pos += 1
+                    self._in_string = False
+                    if state == _COLON:
+                        continue
+                    if stack:
+                        state = _COMMA_OR_END
+                    else:
+                        state = _TOP
+                        self._values += 1
+                    continue
+                if char == "\\" and length - pos < _MAX_ESCAPE_LENGTH and not final:
+                    break
+                self._state = state
+                if char == "\\":
+                    self._fail("invalid escape sequence", pos)
+                self._fail("control character in string", pos)
+
+            if len(out) >= _FLUSH_PARTS:
+                self._flush()
+
+            match = token_match(buffer, pos)
+            if match is None:
+                pos = _WHITESPACE.match(buffer, pos).end()
+                if pos >= length:
+                    break
+                char = buffer[pos]
+                self._state = state
+                if char == '"':
+                    # A string running past the end of this chunk: stream it.
+                    state = self._open_string(pos)
+                    write('"')
+                    self._in_string = True
+                    pos += 1
+                    continue
+                if not final:
+                    literal = _LITERALS.get(char)
+                    if literal is not None and literal.startswith(buffer[pos:]):
+                        break
+                    if (char == "-" or "0" <= char <= "9") and _NUMBER_CHARS.match(buffer, pos).end() >= length:
+                        break
+                if char in _LITERALS:
+                    self._fail("invalid literal", pos)
+                if char == "-" or "0" <= char <= "9":
+                    self._fail("invalid number", pos)
+                self._fail(f"unexpected character {char!r}", pos)
+
+            kind = match.lastindex
+            text = match.group(kind)
+            end = match.end()
+            start = end - len(text)
+
+            if kind == _TOKEN_PUNCT:
+                if text == ",":
+                    if state != _COMMA_OR_END:
+                        self._state = state
+                        self._fail("unexpected ','", start)
+                    write(",")
+                    if stack[-1] == "{":
+                        state = _KEY
+                    else:
+                        state = _VALUE
+                    if pretty:
+                        write(self._newline(len(stack)))
+                elif text == ":":
+                    if state != _COLON:
+                        self._state = state
+                        self._fail("unexpected ':'", start)
+                    write(": " if pretty else ":")
+                    state = _VALUE
+                elif text == "{" or text == "[":
+                    if state == _FIRST_VALUE_OR_END:
+                        if pretty:
+                            write(self._newline(len(stack)))
+                    elif state == _TOP:
+                        if self._values:
+                            write("\n")
+                    elif state != _VALUE:
+                        self._state = state
+                        self._fail(f"unexpected '{text}'", start)
+                    write(text)
+                    stack.append(text)
+                    state = _FIRST_KEY_OR_END if text == "{" else _FIRST_VALUE_OR_END
+                else:
+                    opener = "{" if text == "}" else "["
+                    if not stack or stack[-1] != opener:
+                        self._state = state
+                        self._fail(f"unexpected '{text}'", start)
+                    if state == _COMMA_OR_END:
+                        stack.pop()
+                        if pretty:
+                            write(self._newline(len(stack)))
+                    elif state == (_FIRST_KEY_OR_END if text == "}" else _FIRST_VALUE_OR_END):
+                        stack.pop()
+                    else:
+                        self._state = state
+                        self._fail(f"unexpected '{text}'", start)
+                    write(text)
+                    if stack:
+                        state = _COMMA_OR_END
+                    else:
+                        state = _TOP
+                        self._values += 1
+            else:
+                if kind == _TOKEN_STRING and (state == _KEY or state == _FIRST_KEY_OR_END):
+                    if state == _FIRST_KEY_OR_END and pretty:
+                        write(self._newline(len(stack)))
+                    write(text)
+                    state = _COLON
+                    pos = end
+                    continue
+
+                if kind == _TOKEN_NUMBER and not final and _NUMBER_CHARS.match(buffer, start).end() >= length:
+                    pos = start
+                    break
+
+                if state == _FIRST_VALUE_OR_END:
+                    if pretty:
+                        write(self._newline(len(stack)))
+                elif state == _TOP:
+                    if self._values:
+                        write("\n")
+                elif state != _VALUE:
+                    self._state = state
+                    self._fail("unexpected value", start)
+                write(text)
+                if stack:
+                    state = _COMMA_OR_END
+                else:
+                    state = _TOP
+                    self._values += 1
+
+            pos = end
+
+        self._state = state
+        self._consumed += pos
+        self._buffer = buffer[pos:]
+
+    def _open_string(self, pos: int) -> int:
+        state = self._state
+        if state == _KEY or state == _FIRST_KEY_OR_END:
+            if state == _FIRST_KEY_OR_END and self._indent is not None:
+                self._out.append(self._newline(len(self._stack)))
+            return _COLON
+        if state == _FIRST_VALUE_OR_END:
+            if self._indent is not None:
+                self._out.append(self._newline(len(self._stack)))
+        elif state == _TOP:
+            if self._values:
+                self._out.append("\n")
+        elif state != _VALUE:
+            self._fail("unexpected value", pos)
+        return _VALUE
+
+    def _newline(self, depth: int) -> str:
+        newlines = self._newlines
+        while len(newlines) <= depth:
+            newlines.append("\n" + " " * ((self._indent or 0) * len(newlines)))
+        return newlines[depth]
+
+    def _flush(self) -> None:
+        if 0 == len(self._out):
+            return
+        if self._sink is None:
+            self._out.clear()
+            return
+        text = "".join(self._out)
+        self._out.clear()
+        self._sink(text)
+
+    def _fail(self, message: str, pos: int) -> NoReturn:
+        self._closed = True
+        raise JsonStreamError(message, self._consumed + pos)
+
+
+def iter_file_chunks(path: str | Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    with Path(path).open(mode="rb") as file_handle:
+        while True:
+            chunk = file_handle.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+
+def format_json_stream(
+    chunks: Iterable[bytes],
+    sink: Sink | None,
+    indent: int | None = 4,
+) -> int:
+    formatter = JsonStreamFormatter(sink=sink, indent=indent)
+    for chunk in chunks:
+        formatter.feed(chunk)
+    return formatter.close()
+
+
+def validate_json_stream(chunks: Iterable[bytes]) -> int:
+    return format_json_stream(chunks, sink=None, indent=None)
+
+
+def format_json_file(
+    source: str | Path,
+    target: str | Path,
+    indent: int | None = 4,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    with Path(target).open(mode="w", encoding="utf-8") as file_handle:
+        return format_json_stream(iter_file_chunks(source, chunk_size), file_handle, indent=indent)
+
+
+def _resolve_sink(sink: Sink | None) -> Callable[[str], object] | None:
+    if sink is None:
+        return None
+    write = getattr(sink, "write", None)
+    if callable(write):
+        return write
+    if callable(sink):
+        return sink
+    raise TypeError("sink must be callable or have a write() method")
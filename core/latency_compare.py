@@ -0,0 +1,278 @@
+from __future__ import annotations
+
+import statistics
+import threading
+import time
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+from core.analytics import percentile
+from core.http_client import HttpClient
+from core.logger import get_logger
+from core.model import RequestData
+from core.stats import mann_whitney_u, mean_confidence_interval, welch_t_test
+from core.template import render_request
+
+logger = get_logger("latency_compare")
+
+DEFAULT_MIN_SAMPLES = 30
+DEFAULT_MAX_SAMPLES = 200
+# Sampling stops once every environment's 95% CI half-width is within this
+# fraction of its mean (or at max_samples).
+DEFAULT_TARGET_PRECISION = 0.05
+# Rounds added per step after the first min_samples rounds.
+_ROUNDS_PER_STEP = 10
+
+SampleCallback = Callable[[str, float | None], None]
+
+
+class CompareCancelled(Exception):
+    pass
+
+
+@dataclass(frozen=True, slots=True)
+class CompareOptions:
+    min_samples: int = DEFAULT_MIN_SAMPLES
+    max_samples: int = DEFAULT_MAX_SAMPLES
+    target_precision: float = DEFAULT_TARGET_PRECISION
+    concurrency: int = 4
+    confidence: float = 0.95
+
+
+@dataclass(slots=True)
+class EnvironmentLatency:
+    name: str
+    samples_ms: list[float] = field(default_factory=list)
+    errors: int = 0
+    statuses: dict[int, int] = field(default_factory=dict)
+
+    @property
+    def count(self) -> int:
+        return len(self.samples_ms)
+
+    def mean(self) -> float | None:
+        return statistics.fmean(self.samples_ms) if self.samples_ms else None
+
+    def percentile(self, rank: float) -> float | None:
+        return percentile(sorted(self.samples_ms), rank)
+
+    def confidence_interval(self, confidence: float = 0.95) -> tuple[float, float] | None:
+        if not self.samples_ms:
+            return None
+        return mean_confidence_interval(self.samples_ms, confidence)
+
+    def relative_precision(self, confidence: float = 0.95) -> float:
+        """CI half-width as a fraction of the mean; infinite until there are 2 samples."""
+        if len(self.samples_ms) < 2:
+            return float("inf")
+        low, high = mean_confidence_interval(self.samples_ms, confidence)
+        center = (low + high) / 2.0
+        return (high - low) / 2.0 / center if center > 0 else float("inf")
+
+
+@dataclass(frozen=True, slots=True)
+class PairComparison:
+    baseline: str
+    other: str
+    # other minus baseline, in ms.
+    mean_difference: float
+    ci_low: float
+    ci_high: float
+    welch_p: float
+    mann_whitney_p: float
+    median_ratio: float | None
+
+    def is_significant(self, alpha: float = 0.05) -> bool:
+        return self.welch_p < alpha and self.mann_whitney_p < alpha
+
+
+@dataclass(slots=True)
+class ComparisonReport:
+    request_name: str
+    environments: list[EnvironmentLatency]
+    comparisons: list[PairComparison]
+    confidence: float = 0.95
+
+
+def interleaved_schedule(names: Sequence[str], rounds: int, start_round: int = 0) -> list[str]:
+    """One send per environment per round, rotating who goes first.
+
+    Rotation means no environment is always first in a round, so slow drift
+    in the network or the servers affects every environment evenly.
+    """
+    schedule: list[str] = []
+    count = len(names)
+    for round_index in range(start_round, start_round + rounds):
+        offset = round_index % count
+        schedule.extend(names[offset:] + names[:offset])
+    return schedule
+
+
+def compare_environments(
+    request: RequestData,
+    environments: Mapping[str, Mapping[str, str]],
+    options: CompareOptions | None = None,
+    http_client: HttpClient | None = None,
+    on_sample: SampleCallback | None = None,
+    should_stop: Callable[[], bool] | None = None,
+) -> ComparisonReport:
+    """Send ``request`` rendered for each environment and compare latencies.
+
+    The first environment is the baseline. Sends are interleaved and run
+    ``options.concurrency`` at a time. Each environment reuses one HTTP
+    client, so samples measure request latency rather than connection setup.
+    ``on_sample(name, latency_ms or None)`` is called from pool threads.
+    """
+    options = options or CompareOptions()
+    if len(environments) < 2:
+        raise ValueError("pick at least two environments to compare")
+    names = list(environments)
+    client_factory = http_client or HttpClient()
+    rendered = {name: render_request(request, variables) for name, variables in environments.items()}
+    results = {name: EnvironmentLatency(name) for name in names}
+    lock = threading.Lock()
+    stop = should_stop or (lambda: False)
+
+    clients = {name: client_factory.create_client(rendered[name]) for name in names}
+
+    def _send(name: str) -> None:
+        if stop():
+            return
+        started = time.perf_counter()
+        try:
+            response = client_factory.send(rendered[name], clients[name])
+        except Exception as exc:
+            logger.info("Compare send to %s failed: %s", name, exc)
+            with lock:
+                results[name].errors += 1
+            if on_sample is not None:
+                on_sample(name, None)
+            return
+        latency_ms = (time.perf_counter() - started) * 1000.0
+        with lock:
+            entry = results[name]
+            entry.samples_ms.append(latency_ms)
+            entry.statuses[response.status_code] = entry.statuses.get(response.status_code, 0) + 1
+        if on_sample is not None:
+            on_sample(name, latency_ms)
+
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, options.concurrency), thread_name_prefix="compare") as pool:
+            rounds_done = 0
+            step = max(1, options.min_samples)
+            while rounds_done < options.max_samples:
+                step = min(step, options.max_samples - rounds_done)
+                list(pool.map(_send, interleaved_schedule(names, step, rounds_done)))
+                rounds_done += step
+                if stop():
+                    raise CompareCancelled()
+                if _precise_enough(results.values(), options):
+                    break
+                step = _ROUNDS_PER_STEP
+    finally:
+        for client in clients.values():
+            client.close()
+
+    return build_report(request.name, [results[name] for name in names], options.confidence)
+
+
+def build_report(
+    request_name: str, environments: list[EnvironmentLatency], confidence: float = 0.95
+) -> ComparisonReport:
+    comparisons: list[PairComparison] = []
+    baseline = environments[0]
+    for other in environments[1:]:
+        if baseline.count < 2 or other.count < 2:
+            continue
+        welch = welch_t_test(baseline.samples_ms, other.samples_ms, confidence)
+        rank_test = mann_whitney_u(baseline.samples_ms, other.samples_ms)
+        baseline_median = baseline.percentile(50)
+        other_median = other.percentile(50)
+        ratio = other_median / baseline_median if baseline_median else None
+        comparisons.append(
+            PairComparison(
+                baseline=baseline.name,
+                other=other.name,
+                mean_difference=welch.difference,
+                ci_low=welch.ci_low,
+                ci_high=welch.ci_high,
+                welch_p=welch.p_value,
+                mann_whitney_p=rank_test.p_value,
+                median_ratio=ratio,
+            )
+        )
+    return ComparisonReport(request_name, environments, comparisons, confidence)
+
+
+def format_report(report: ComparisonReport) -> str:
+    """Plain-text side-by-side table, shared by the CLI and the GUI panel."""
+    confidence_label = f"{report.confidence * 100:.0f}% CI"
+    lines = [
+        f"Latency comparison: {report.request_name}",
+        f"{'environment':<20} {'n':>5} {'err':>4} {'mean':>9} {confidence_label:>19} "
+        f"{'p50':>9} {'p95':>9} {'p99':>9}",
+    ]
+    for entry in report.environments:
+        interval = entry.confidence_interval(report.confidence)
+        interval_text = f"{interval[0]:.1f}..{interval[1]:.1f}" if interval else "-"
+        lines.append(
+            f"{entry.name:<20} {entry.count:>5} {entry.errors:>4} {_ms(entry.mean())} {interval_text:>19} "
+            f"{_ms(entry.percentile(50))} {_ms(entry.percentile(95))} {_ms(entry.percentile(99))}"
+        )
+    for comparison in report.comparisons:
+        verdict = "significant" if comparison.is_significant() else "not significant"
+        ratio = f", median x{comparison.median_ratio:.2f}" if comparison.median_ratio is not None else ""
+        lines.append(
+            f"{comparison.other} vs {comparison.baseline}: {comparison.mean_difference:+.1f} ms "
+            f"({confidence_label} {comparison.ci_low:+.1f}..{comparison.ci_high:+.1f}{ratio}); "
+            f"Welch p={comparison.welch_p:.4f}, Mann-Whitney p={comparison.mann_whitney_p:.4f} -> {verdict}"
+        )
+    return "\n".join(lines)
+
+
+def report_to_json(report: ComparisonReport) -> dict[str, Any]:
+    return {
+        "request": report.request_name,
+        "confidence": report.confidence,
+        "environments": [
+            {
+                "name": entry.name,
+                "samples": entry.count,
+                "errors": entry.errors,
+                "statuses": {str(status): count for status, count in sorted(entry.statuses.items())},
+                "mean_ms": entry.mean(),
+                "ci_ms": list(entry.confidence_interval(report.confidence) or ()),
+                "p50_ms": entry.percentile(50),
+                "p95_ms": entry.percentile(95),
+                "p99_ms": entry.percentile(99),
+            }
+            for entry in report.environments
+        ],
+        "comparisons": [
+            {
+                "baseline": comparison.baseline,
+                "other": comparison.other,
+                "mean_difference_ms": comparison.mean_difference,
+                "ci_ms": [comparison.ci_low, comparison.ci_high],
+                "welch_p": comparison.welch_p,
+                "mann_whitney_p": comparison.mann_whitney_p,
+                "median_ratio": comparison.median_ratio,
+                "significant": comparison.is_significant(),
+            }
+            for comparison in report.comparisons
+        ],
+    }
+
+
+def _precise_enough(results: Iterable[EnvironmentLatency], options: CompareOptions) -> bool:
+    return all(
+        entry.count >= options.min_samples
+        and entry.relative_precision(options.confidence) <= options.target_precision
+        for entry in results
+    )
+
+
+def _ms(value: float | None) -> str:
+    return f"{value:9.1f}" if value is not None else f"{'-':>9}"
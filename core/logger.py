@@ -1,16 +1,63 @@
 from __future__ import annotations
 
+import atexit
 import logging
+import logging.handlers
+import queue
+from collections.abc import Iterable, Mapping
 from pathlib import Path
+from urllib.parse import unquote_plus, urlsplit, urlunsplit
 
 _LOGGER_PREFIX = "rest_client"
 _DEFAULT_LOG_NAME = "rest_client.log"
 
+DEFAULT_LOG_MAX_BYTES = 5 * 1024 * 1024
+DEFAULT_LOG_BACKUP_COUNT = 3
+# Request/response dumps are cut to this many characters per body.
+LOG_BODY_LIMIT = 2048
+REDACTED = "***"
+SENSITIVE_NAMES = frozenset(
+    {
+        "authorization",
+        "proxy-authorization",
+        "cookie",
+        "set-cookie",
+        "x-api-key",
+        "api-key",
+        "api_key",
+        "apikey",
+        "x-auth-token",
+        "access_token",
+        "refresh_token",
+        "token",
+        "password",
+        "secret",
+        "client_secret",
+    }
+)
+
+_listener: logging.handlers.QueueListener | None = None
+
+
+def configure_logging(
+    log_path: Path | None = None,
+    level: int = logging.INFO,
+    levels: Mapping[str, int | str] | None = None,
+    max_bytes: int = DEFAULT_LOG_MAX_BYTES,
+    backup_count: int = DEFAULT_LOG_BACKUP_COUNT,
+) -> Path:
+    """Route all logging through a queue to a rotating file and the console.
+
+    Callers only pay for building the record and putting it on the queue;
+    formatting and file I/O happen on the ``QueueListener`` thread.
+    ``levels`` maps subsystem names (``"http_client"``) to their own level.
+    """
+    global _listener
 
-def configure_logging(log_path: Path | None = None, level: int = logging.INFO) -> Path:
     root_logger = logging.getLogger()
     if root_logger.handlers:
         root_logger.setLevel(level)
+        apply_logger_levels(levels or {})
         return Path(log_path) if log_path else _default_log_path()
 
     log_file = log_path or _default_log_path()
@@ -21,25 +68,107 @@ def configure_logging(log_path: Path | None = None, level: int = logging.INFO) -
         datefmt="%Y-%m-%d %H:%M:%S",
     )
 
-    file_handler = logging.FileHandler(log_file, encoding="utf-8")
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_file,
+        maxBytes=max(0, max_bytes),
+        backupCount=max(0, backup_count),
+        encoding="utf-8",
+    )
     file_handler.setFormatter(formatter)
 
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(formatter)
 
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _listener = logging.handlers.QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    _listener.start()
+    atexit.register(shutdown_logging)
+
     root_logger.setLevel(level)
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(console_handler)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    apply_logger_levels(levels or {})
 
     return log_file
 
 
+def shutdown_logging() -> None:
+    """Drain the log queue and stop the listener thread."""
+    global _listener
+    listener, _listener = _listener, None
+    if listener is not None:
+        listener.stop()
+
+
+def apply_logger_levels(levels: Mapping[str, int | str]) -> None:
+    for name, level in levels.items():
+        resolved = _resolve_level(level)
+        if resolved is None:
+            get_logger("logger").warning("Ignoring unknown log level %r for %s", level, name)
+            continue
+        get_logger(name).setLevel(resolved)
+
+
 def get_logger(name: str) -> logging.Logger:
     if name.startswith(_LOGGER_PREFIX):
         return logging.getLogger(name)
     return logging.getLogger(f"{_LOGGER_PREFIX}.{name}")
 
 
+def redact_pairs(pairs: Iterable[tuple[str, str]] | None) -> list[tuple[str, str]]:
+    """Copy header/param pairs with credential values masked."""
+    if not pairs:
+        return []
+    return [
+        (key, REDACTED if key.strip().lower() in SENSITIVE_NAMES else value)
+        for key, value in pairs
+    ]
+
+
+def redact_url(url: str) -> str:
+    """Copy ``url`` with its userinfo and credential query parameters masked."""
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        # Unparseable: keep only what comes before any query string.
+        return url.split("?", 1)[0]
+    netloc = parts.netloc
+    if "@" in netloc:
+        netloc = f"{REDACTED}@{netloc.rsplit('@', 1)[1]}"
+    query = parts.query
+    if query:
+        fields = []
+        for field in query.split("&"):
+            name, separator, _value = field.partition("=")
+            if separator and unquote_plus(name).strip().lower() in SENSITIVE_NAMES:
+                field = f"{name}={REDACTED}"
+            fields.append(field)
+        query = "&".join(fields)
+    if (netloc, query) == (parts.netloc, parts.query):
+        return url
+    return urlunsplit(parts._replace(netloc=netloc, query=query))
+
+
+def truncate_for_log(text: str | bytes | None, limit: int = LOG_BODY_LIMIT) -> str:
+    if text is None:
+        return ""
+    if isinstance(text, bytes):
+        if len(text) <= limit:
+            return text.decode("utf-8", errors="replace")
+        return f"{text[:limit].decode('utf-8', errors='replace')}... ({len(text)} bytes)"
+    if len(text) <= limit:
+        return text
+    return f"{text[:limit]}... ({len(text)} chars)"
+
+
+def _resolve_level(level: int | str) -> int | None:
+    if isinstance(level, int):
+        return level
+    resolved = logging.getLevelName(str(level).upper())
+    return resolved if isinstance(resolved, int) else None
+
+
 def _default_log_path() -> Path:
     project_root = Path(__file__).resolve().parents[1]
     return project_root / "logs" / _DEFAULT_LOG_NAME
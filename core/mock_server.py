@@ -0,0 +1,570 @@
+"""Local HTTP mock server built from workspace requests.
+
+Every selected ``WorkspaceRequest`` becomes a route: its method plus the
+path of its rendered URL, where ``{{var}}``, ``{var}`` and ``:var`` path
+segments match anything. A route answers with, in order of preference, a
+response configured in a mocks file, the newest response captured for it in
+history, or 501.
+
+The server is a small HTTP/1.1 implementation on ``asyncio`` streams with
+keep-alive. Response bytes are built once per route when the table is
+loaded, so serving is a dictionary lookup and a write. With a
+``MockSource``, the table is rebuilt whenever the workspace, mocks or
+history file changes on disk.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import random
+import re
+import threading
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlsplit
+
+from core.environments import NO_ENVIRONMENT, build_environment_map
+from core.logger import get_logger
+from core.model import HistoryEntry, WorkspaceRequest
+from core.template import render_text
+
+logger = get_logger("mock_server")
+
+DEFAULT_MOCK_PORT = 8787
+RELOAD_INTERVAL_S = 1.0
+MAX_HEADER_BYTES = 64 * 1024
+SERVER_NAME = "pyRestClient-mock"
+
+SOURCE_CONFIG = "config"
+SOURCE_HISTORY = "history"
+SOURCE_DEFAULT = "default"
+
+# A leading template such as "{{base_url}}" stands for scheme and host.
+_LEADING_TEMPLATE = re.compile(r"^\s*\{\{[^}]*\}\}")
+_PATH_PARAMETER = re.compile(r"^(\{\{.*\}\}|\{.*\}|:.+)$")
+_WILDCARD = "*"
+
+
+@dataclass(frozen=True, slots=True)
+class MockResponse:
+    status: int = 200
+    headers: tuple[tuple[str, str], ...] = ()
+    body: bytes = b""
+    latency_ms: float = 0.0
+    # Uniform extra delay in [0, jitter_ms).
+    jitter_ms: float = 0.0
+
+    def encode_head(self) -> bytes:
+        """Status line and headers up to, not including, the Connection header."""
+        reason = _reason(self.status)
+        lines = [f"HTTP/1.1 {self.status} {reason}", f"Server: {SERVER_NAME}"]
+        names = {name.lower() for name, _ in self.headers}
+        lines.extend(f"{name}: {value}" for name, value in self.headers if name.lower() != "content-length")
+        if "content-type" not in names and self.body:
+            lines.append(f"Content-Type: {_guess_content_type(self.body)}")
+        lines.append(f"Content-Length: {len(self.body)}")
+        return ("\r\n".join(lines) + "\r\n").encode("latin-1")
+
+
+@dataclass(frozen=True, slots=True)
+class MockRoute:
+    method: str
+    path: str
+    name: str
+    response: MockResponse
+    source: str = SOURCE_DEFAULT
+    request_id: str = ""
+
+
+@dataclass(slots=True)
+class _CompiledRoute:
+    route: MockRoute
+    head: bytes
+
+
+@dataclass(slots=True)
+class RouteTable:
+    """Routes indexed for matching: exact paths first, then templated ones."""
+
+    _routes: dict[tuple[str, str], MockRoute] = field(default_factory=dict)
+    _exact: dict[tuple[str, str], _CompiledRoute] = field(default_factory=dict, repr=False)
+    # Keyed by (method, template segments), with the order routes were first
+    # added in; when several templates match, the earliest one wins.
+    _templated: dict[tuple[str, tuple[str, ...]], tuple[int, _CompiledRoute]] = field(default_factory=dict, repr=False)
+    # Templates by (method, segment count, first path segment), so a lookup
+    # only tries templates that can match.
+    _template_buckets: dict[tuple[str, int, str], list[tuple[str, ...]]] = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def build(cls, routes: Iterable[MockRoute]) -> RouteTable:
+        table = cls()
+        for route in routes:
+            table.add(route)
+        return table
+
+    @property
+    def routes(self) -> list[MockRoute]:
+        return list(self._routes.values())
+
+    def add(self, route: MockRoute) -> None:
+        """Add ``route``; a later route for the same method and path replaces an earlier one."""
+        compiled = _CompiledRoute(route, route.response.encode_head())
+        segments = _template_segments(route.path)
+        if _WILDCARD in segments:
+            key = (route.method, segments)
+            previous = self._templated.get(key)
+            if previous is None:
+                order = len(self._templated)
+                bucket = (route.method, len(segments), _first_segment(segments))
+                self._template_buckets.setdefault(bucket, []).append(segments)
+            else:
+                order = previous[0]
+            self._templated[key] = (order, compiled)
+        else:
+            self._exact[(route.method, _normalize_path(route.path))] = compiled
+        self._routes[(route.method, route.path)] = route
+
+    def match(self, method: str, path: str) -> MockRoute | None:
+        compiled = self._match(method, path)
+        return compiled.route if compiled is not None else None
+
+    def allowed_methods(self, path: str) -> list[str]:
+        normalized = _normalize_path(path)
+        segments = tuple(normalized.split("/"))
+        methods = {method for method, route_path in self._exact if route_path == normalized}
+        methods.update(method for method, template in self._templated if _segments_match(template, segments))
+        return sorted(methods)
+
+    def _match(self, method: str, path: str) -> _CompiledRoute | None:
+        normalized = _normalize_path(path)
+        compiled = self._exact.get((method, normalized))
+        if compiled is not None:
+            return compiled
+        segments = tuple(normalized.split("/"))
+        first = _first_segment(segments)
+        best: tuple[int, _CompiledRoute] | None = None
+        for bucket_first in (first,) if first == _WILDCARD else (first, _WILDCARD):
+            for template in self._template_buckets.get((method, len(segments), bucket_first), ()):
+                if _segments_match(template, segments):
+                    candidate = self._templated[(method, template)]
+                    if best is None or candidate[0] < best[0]:
+                        best = candidate
+                    break
+        return best[1] if best is not None else None
+
+
+@dataclass(frozen=True, slots=True)
+class MockSource:
+    """Where a route table comes from; ``load()`` re-reads every file."""
+
+    workspace_path: Path
+    environment: str = NO_ENVIRONMENT
+    variables: Mapping[str, str] = field(default_factory=dict)
+    requests: tuple[str, ...] = ()
+    folders: tuple[str, ...] = ()
+    collections: tuple[str, ...] = ()
+    mocks_path: Path | None = None
+    history_path: Path | None = None
+
+    def paths(self) -> list[Path]:
+        return [path for path in (self.workspace_path, self.mocks_path, self.history_path) if path is not None]
+
+    def load(self) -> RouteTable:
+        from core.runner import select_requests
+        from core.storage.history_jsonl import load_history_entries
+        from core.storage.json_storage import load_workspace
+        from core.workspace_index import WorkspaceIndex
+
+        workspace = load_workspace(self.workspace_path)
+        environments = build_environment_map(workspace)
+        if self.environment not in environments:
+            raise ValueError(f"unknown environment {self.environment!r}")
+        variables = {**environments[self.environment], **self.variables}
+        index = WorkspaceIndex.for_workspace(workspace)
+        selected = select_requests(workspace, index, self.requests, self.folders, self.collections)
+        mocks = load_mocks(self.mocks_path) if self.mocks_path is not None and self.mocks_path.exists() else {}
+        history: list[HistoryEntry] = []
+        if self.history_path is not None:
+            history = load_history_entries(self.history_path)
+        return build_routes(selected, variables, mocks, history)
+
+
+def route_path(url: str, variables: Mapping[str, str] | None = None) -> str:
+    """Path of a request URL, with an unresolved leading ``{{base}}`` dropped."""
+    rendered = render_text(url, variables or {})
+    rendered = _LEADING_TEMPLATE.sub("", rendered)
+    split = urlsplit(rendered)
+    if split.scheme and split.netloc:
+        path = split.path
+    else:
+        path = rendered.split("?", 1)[0].split("#", 1)[0]
+    return _normalize_path(path)
+
+
+def load_mocks(path: str | Path) -> dict[str, MockResponse]:
+    """Configured responses keyed by request id or name.
+
+    The file maps each key to ``{"status", "headers", "body", "latency_ms",
+    "jitter_ms"}``, all optional; a non-string body is served as JSON.
+    """
+    with Path(path).open("r", encoding="utf-8") as file_handle:
+        payload = json.load(file_handle)
+    if not isinstance(payload, dict):
+        raise ValueError("mocks file must map request ids or names to responses")
+    return {str(key): _mock_from_dict(value) for key, value in payload.items()}
+
+
+def build_routes(
+    requests: Sequence[WorkspaceRequest],
+    variables: Mapping[str, str],
+    mocks: Mapping[str, MockResponse] | None = None,
+    history: Sequence[HistoryEntry] = (),
+) -> RouteTable:
+    mocks = mocks or {}
+    table = RouteTable()
+    configured: set[tuple[str, str]] = set()
+    for request in requests:
+        method = request.method.upper()
+        path = route_path(request.url, variables)
+        response = mocks.get(request.id) or mocks.get(request.name)
+        if response is not None:
+            configured.add((method, path))
+            table.add(MockRoute(method, path, request.name, response, SOURCE_CONFIG, request.id))
+            continue
+        body = json.dumps({"error": f"No response configured or captured for {method} {path}"}).encode("utf-8")
+        fallback = MockResponse(501, (("Content-Type", "application/json"),), body)
+        table.add(MockRoute(method, path, request.name, fallback, SOURCE_DEFAULT, request.id))
+
+    # Newest capture wins. History is in file (oldest first) order, so walk it
+    # backwards and take the first capture per route; each URL is matched once.
+    matched: dict[tuple[str, str], MockRoute | None] = {}
+    captured: dict[tuple[str, str], tuple[MockRoute, int, str | None]] = {}
+    for entry in reversed(history):
+        status_code = entry.status_code
+        if status_code is None:
+            continue
+        request_key = (entry.method.upper(), entry.url)
+        if request_key not in matched:
+            matched[request_key] = table.match(request_key[0], route_path(entry.url))
+        route = matched[request_key]
+        if route is None:
+            continue
+        key = (route.method, route.path)
+        if key not in configured and key not in captured:
+            captured[key] = (route, status_code, entry.response_body)
+    for route, status_code, body in captured.values():
+        response = MockResponse(status_code, body=(body or "").encode("utf-8"))
+        table.add(MockRoute(route.method, route.path, route.name, response, SOURCE_HISTORY, route.request_id))
+    return table
+
+
+class MockServer:
+    """Serves a ``RouteTable`` on an asyncio event loop.
+
+    ``latency_ms`` is added to every route's own latency. ``set_routes``
+    swaps the table atomically; requests already being answered keep the
+    route they matched.
+    """
+
+    def __init__(
+        self,
+        routes: RouteTable,
+        host: str = "127.0.0.1",
+        port: int = DEFAULT_MOCK_PORT,
+        latency_ms: float = 0.0,
+    ) -> None:
+        self._routes = routes
+        self._host = host
+        self._port = port
+        self._latency_s = max(0.0, latency_ms) / 1000.0
+        self._server: asyncio.Server | None = None
+        self._reload_task: asyncio.Task[None] | None = None
+        self._rng = random.Random()
+        self.request_count = 0
+
+    @property
+    def routes(self) -> RouteTable:
+        return self._routes
+
+    @property
+    def port(self) -> int:
+        if self._server is not None and self._server.sockets:
+            return self._server.sockets[0].getsockname()[1]
+        return self._port
+
+    @property
+    def url(self) -> str:
+        return f"http://{self._host}:{self.port}"
+
+    def set_routes(self, routes: RouteTable) -> None:
+        self._routes = routes
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(
+            self._handle_connection, self._host, self._port, limit=MAX_HEADER_BYTES
+        )
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            await self.start()
+        assert self._server is not None
+        async with self._server:
+            await self._server.serve_forever()
+
+    def watch(self, source: MockSource, interval_s: float = RELOAD_INTERVAL_S) -> None:
+        """Rebuild the routes from ``source`` whenever one of its files changes."""
+        self._reload_task = asyncio.get_running_loop().create_task(self._watch(source, interval_s))
+
+    async def close(self) -> None:
+        if self._reload_task is not None:
+            self._reload_task.cancel()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def _watch(self, source: MockSource, interval_s: float) -> None:
+        loop = asyncio.get_running_loop()
+        last = _file_signatures(source.paths())
+        while True:
+            await asyncio.sleep(interval_s)
+            current = _file_signatures(source.paths())
+            if current == last:
+                continue
+            last = current
+            try:
+                # Parsing a large workspace or history must not stall serving.
+                routes = await loop.run_in_executor(None, source.load)
+            except Exception as exc:
+                logger.error("Mock reload failed, keeping the previous routes: %s", exc)
+                continue
+            self.set_routes(routes)
+            logger.info("Mock routes reloaded: %s routes", len(routes.routes))
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except asyncio.IncompleteReadError:
+                    return
+                except asyncio.LimitOverrunError:
+                    await self._write_error(writer, 431, keep_alive=False)
+                    return
+                keep_alive = await self._handle_request(head, reader, writer)
+                if not keep_alive:
+                    return
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _handle_request(self, head: bytes, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> bool:
+        lines = head.decode("latin-1").split("\r\n")
+        try:
+            method, target, version = lines[0].split(" ", 2)
+        except ValueError:
+            await self._write_error(writer, 400, keep_alive=False)
+            return False
+        headers: dict[str, str] = {}
+        for line in lines[1:]:
+            name, separator, value = line.partition(":")
+            if separator:
+                headers[name.strip().lower()] = value.strip()
+
+        if "chunked" in headers.get("transfer-encoding", "").lower():
+            await self._write_error(writer, 411, keep_alive=False)
+            return False
+        try:
+            length = int(headers.get("content-length", "0"))
+        except ValueError:
+            await self._write_error(writer, 400, keep_alive=False)
+            return False
+        if length > 0:
+            await reader.readexactly(length)
+
+        connection = headers.get("connection", "").lower()
+        keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+        self.request_count += 1
+
+        path = target.split("?", 1)[0]
+        routes = self._routes
+        lookup_method = "GET" if method == "HEAD" else method
+        compiled = routes._match(lookup_method, path)
+        if compiled is None:
+            allowed = routes.allowed_methods(path)
+            if allowed:
+                await self._write_error(writer, 405, keep_alive, (("Allow", ", ".join(allowed)),))
+            else:
+                await self._write_error(writer, 404, keep_alive)
+            return keep_alive
+
+        response = compiled.route.response
+        delay = self._latency_s + response.latency_ms / 1000.0
+        if response.jitter_ms > 0:
+            delay += self._rng.random() * response.jitter_ms / 1000.0
+        if delay > 0:
+            await asyncio.sleep(delay)
+        writer.write(compiled.head)
+        writer.write(b"Connection: keep-alive\r\n\r\n" if keep_alive else b"Connection: close\r\n\r\n")
+        if method != "HEAD" and response.body:
+            writer.write(response.body)
+        await writer.drain()
+        return keep_alive
+
+    async def _write_error(
+        self,
+        writer: asyncio.StreamWriter,
+        status: int,
+        keep_alive: bool,
+        headers: tuple[tuple[str, str], ...] = (),
+    ) -> None:
+        body = json.dumps({"error": _reason(status)}).encode("utf-8")
+        response = MockResponse(status, (("Content-Type", "application/json"), *headers), body)
+        writer.write(response.encode_head())
+        writer.write(b"Connection: keep-alive\r\n\r\n" if keep_alive else b"Connection: close\r\n\r\n")
+        writer.write(body)
+        await writer.drain()
+
+
+class MockServerThread:
+    """Runs a ``MockServer`` on its own event loop thread, for tests and benchmarks.
+
+        with MockServerThread(routes) as server:
+            httpx.get(server.url + "/users")
+    """
+
+    def __init__(
+        self,
+        routes: RouteTable,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency_ms: float = 0.0,
+        source: MockSource | None = None,
+        reload_interval_s: float = RELOAD_INTERVAL_S,
+    ) -> None:
+        self.server = MockServer(routes, host, port, latency_ms)
+        self._source = source
+        self._reload_interval_s = reload_interval_s
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._ready = threading.Event()
+        self._error: BaseException | None = None
+
+    @property
+    def url(self) -> str:
+        return self.server.url
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="mock-server", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        if self._error is not None:
+            raise self._error
+
+    def stop(self) -> None:
+        if self._loop is None or self._thread is None:
+            return
+        asyncio.run_coroutine_threadsafe(self.server.close(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+    def __enter__(self) -> MockServerThread:
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    def _run(self) -> None:
+        loop = asyncio.new_event_loop()
+        self._loop = loop
+        try:
+            loop.run_until_complete(self.server.start())
+            if self._source is not None:
+                loop.call_soon(self.server.watch, self._source, self._reload_interval_s)
+        except BaseException as exc:
+            self._error = exc
+            self._ready.set()
+            loop.close()
+            return
+        self._ready.set()
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
+
+
+def _mock_from_dict(payload: Any) -> MockResponse:
+    if not isinstance(payload, dict):
+        raise ValueError("each mock must be an object")
+    body = payload.get("body", "")
+    if not isinstance(body, str):
+        body = json.dumps(body, ensure_ascii=False)
+        headers = {"Content-Type": "application/json"}
+    else:
+        headers = {}
+    headers.update({str(name): str(value) for name, value in (payload.get("headers") or {}).items()})
+    return MockResponse(
+        status=int(payload.get("status", 200)),
+        headers=tuple(headers.items()),
+        body=body.encode("utf-8"),
+        latency_ms=float(payload.get("latency_ms", 0.0)),
+        jitter_ms=float(payload.get("jitter_ms", 0.0)),
+    )
+
+
+def _template_segments(path: str) -> tuple[str, ...]:
+    return tuple(
+        _WILDCARD if _PATH_PARAMETER.match(segment) else segment for segment in _normalize_path(path).split("/")
+    )
+
+
+def _first_segment(segments: tuple[str, ...]) -> str:
+    # segments[0] is the empty string before the leading "/".
+    return segments[1] if 1 < len(segments) else ""
+
+
+def _segments_match(template: tuple[str, ...], segments: tuple[str, ...]) -> bool:
+    if len(template) != len(segments):
+        return False
+    return all(expected == _WILDCARD or expected == actual for expected, actual in zip(template, segments))
+
+
+def _normalize_path(path: str) -> str:
+    path = path.strip() or "/"
+    if not path.startswith("/"):
+        path = "/" + path
+    if len(path) > 1:
+        path = path.rstrip("/")
+    return path
+
+
+def _file_signatures(paths: Iterable[Path]) -> list[tuple[str, int, int] | None]:
+    signatures: list[tuple[str, int, int] | None] = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            signatures.append(None)
+            continue
+        signatures.append((str(path), stat.st_mtime_ns, stat.st_size))
+    return signatures
+
+
+def _guess_content_type(body: bytes) -> str:
+    stripped = body.lstrip()
+    if stripped[:1] in (b"{", b"["):
+        return "application/json"
+    return "text/plain; charset=utf-8"
+
+
+def _reason(status: int) -> str:
+    try:
+        return HTTPStatus(status).phrase
+    except ValueError:
+        return "Unknown"
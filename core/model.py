@@ -42,6 +42,8 @@ class NetworkConfig:
     verify_ssl: bool = True
     follow_redirects: bool = False
     trust_env: bool = True
+    # core.netsim profile such as "3g error=0.05 seed=1"; empty sends normally.
+    simulate: str = ""
 
 
 @dataclass(slots=True)
@@ -78,6 +80,7 @@ class HistoryEntry:
     status_code: int | None = None
     elapsed_ms: int | None = None
     error: str | None = None
+    response_body: str | None = None
 
 
 @dataclass(slots=True)
@@ -0,0 +1,324 @@
+from __future__ import annotations
+
+import heapq
+import random
+import threading
+import time
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from core.http_client import HttpClient
+from core.logger import get_logger
+from core.model import RequestData
+from core.timeseries import SeriesPoint, TimeSeriesStore
+
+logger = get_logger("monitor")
+
+DEFAULT_INTERVAL_S = 30.0
+# Each interval is stretched or shrunk by up to this fraction, so probes of
+# many targets (or many clients) do not line up.
+DEFAULT_JITTER = 0.1
+DEFAULT_ALERT_AFTER = 3
+AUTOSAVE_INTERVAL_S = 300.0
+
+ALERT_FAILURE = "failure"
+ALERT_LATENCY = "latency"
+ALERT_RECOVERED = "recovered"
+
+
+@dataclass(frozen=True, slots=True)
+class MonitorTarget:
+    key: str
+    # Already rendered with the environment's variables.
+    request: RequestData
+    interval_s: float = DEFAULT_INTERVAL_S
+    jitter: float = DEFAULT_JITTER
+
+
+@dataclass(frozen=True, slots=True)
+class MonitorSample:
+    key: str
+    name: str
+    timestamp: float
+    status_code: int | None
+    # Only set for successful probes; failures carry ``error`` instead.
+    latency_ms: float | None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass(frozen=True, slots=True)
+class AlertRule:
+    max_latency_ms: float | None = None
+    # Breaching samples in a row before an alert is raised.
+    consecutive: int = DEFAULT_ALERT_AFTER
+
+
+@dataclass(frozen=True, slots=True)
+class MonitorAlert:
+    key: str
+    name: str
+    timestamp: float
+    kind: str
+    message: str
+
+
+class AlertEvaluator:
+    """Turns samples into alerts with simple hysteresis.
+
+    A target alerts once after ``rule.consecutive`` failing or slow samples
+    in a row and stays quiet until a healthy sample, which raises a single
+    recovery alert. Not thread-safe; the scheduler serializes calls.
+    """
+
+    def __init__(self, rule: AlertRule | None = None) -> None:
+        self._rule = rule or AlertRule()
+        self._streaks: dict[str, int] = {}
+        self._active: dict[str, str] = {}
+
+    @property
+    def rule(self) -> AlertRule:
+        return self._rule
+
+    def active(self) -> dict[str, str]:
+        return dict(self._active)
+
+    def evaluate(self, sample: MonitorSample) -> MonitorAlert | None:
+        breach = self._breach(sample)
+        if breach is None:
+            self._streaks.pop(sample.key, None)
+            if self._active.pop(sample.key, None) is None:
+                return None
+            return MonitorAlert(
+                sample.key,
+                sample.name,
+                sample.timestamp,
+                ALERT_RECOVERED,
+                f"{sample.name} recovered ({sample.status_code}, {sample.latency_ms:.0f} ms)",
+            )
+
+        streak = self._streaks.get(sample.key, 0) + 1
+        self._streaks[sample.key] = streak
+        if streak < max(1, self._rule.consecutive) or sample.key in self._active:
+            return None
+        self._active[sample.key] = breach
+        if breach == ALERT_FAILURE:
+            message = f"{sample.name} failed {streak} times in a row: {sample.error}"
+        else:
+            message = (
+                f"{sample.name} slower than {self._rule.max_latency_ms:.0f} ms "
+                f"{streak} times in a row ({sample.latency_ms:.0f} ms)"
+            )
+        return MonitorAlert(sample.key, sample.name, sample.timestamp, breach, message)
+
+    def _breach(self, sample: MonitorSample) -> str | None:
+        if not sample.ok:
+            return ALERT_FAILURE
+        limit = self._rule.max_latency_ms
+        if limit is not None and sample.latency_ms is not None and sample.latency_ms > limit:
+            return ALERT_LATENCY
+        return None
+
+
+class MonitorScheduler:
+    """Probes each target every ``interval_s`` seconds (± jitter) until stopped.
+
+    A single scheduler thread keeps a heap of due times and hands probes to a
+    small thread pool. A target whose previous probe is still running skips
+    its turn instead of piling up, and after a stall (e.g. the machine slept)
+    targets resume from now rather than bursting to catch up. Samples go
+    into ``store``; ``on_sample`` and ``on_alert`` are called from pool
+    threads.
+    """
+
+    def __init__(
+        self,
+        targets: Sequence[MonitorTarget],
+        store: TimeSeriesStore,
+        http_client: HttpClient | None = None,
+        rule: AlertRule | None = None,
+        on_sample: Callable[[MonitorSample], None] | None = None,
+        on_alert: Callable[[MonitorAlert], None] | None = None,
+        max_workers: int = 4,
+        autosave_path: str | Path | None = None,
+        autosave_interval_s: float = AUTOSAVE_INTERVAL_S,
+        rng: random.Random | None = None,
+    ) -> None:
+        if not targets:
+            raise ValueError("select at least one request to monitor")
+        self._targets = list(targets)
+        self._store = store
+        self._http_client = http_client or HttpClient()
+        self._evaluator = AlertEvaluator(rule)
+        self._on_sample = on_sample
+        self._on_alert = on_alert
+        self._max_workers = max(1, max_workers)
+        self._autosave_path = Path(autosave_path) if autosave_path is not None else None
+        self._autosave_interval_s = autosave_interval_s
+        self._rng = rng or random.Random()
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._in_flight: set[str] = set()
+        self._alerts: list[MonitorAlert] = []
+        self._thread: threading.Thread | None = None
+        self._pool: ThreadPoolExecutor | None = None
+
+    @property
+    def targets(self) -> list[MonitorTarget]:
+        return list(self._targets)
+
+    def alerts(self) -> list[MonitorAlert]:
+        with self._lock:
+            return list(self._alerts)
+
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self._thread is not None:
+            raise RuntimeError("monitor already started")
+        self._pool = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="monitor")
+        self._thread = threading.Thread(target=self._run, name="monitor-scheduler", daemon=True)
+        self._thread.start()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until ``stop()`` is called or ``timeout`` passes; True if stopped."""
+        return self._stop.wait(timeout)
+
+    def stop(self, wait: bool = True) -> None:
+        """Stop scheduling; with ``wait`` also wait for running probes.
+
+        The store is saved afterwards when an autosave path is set.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait, cancel_futures=True)
+        self._save()
+
+    def next_interval(self, target: MonitorTarget) -> float:
+        jitter = min(max(target.jitter, 0.0), 1.0)
+        return max(0.0, target.interval_s * (1.0 + self._rng.uniform(-jitter, jitter)))
+
+    def _run(self) -> None:
+        now = time.monotonic()
+        # Spread the first round over one jitter window instead of firing together.
+        queue = [
+            (now + self._rng.uniform(0.0, target.interval_s * min(max(target.jitter, 0.0), 1.0)), position, target)
+            for position, target in enumerate(self._targets)
+        ]
+        heapq.heapify(queue)
+        last_save = now
+        while not self._stop.is_set():
+            due, position, target = queue[0]
+            delay = due - time.monotonic()
+            if delay > 0:
+                self._stop.wait(delay)
+                continue
+            heapq.heappop(queue)
+            self._submit(target)
+            now = time.monotonic()
+            next_due = due + self.next_interval(target)
+            if next_due <= now:
+                next_due = now + self.next_interval(target)
+            heapq.heappush(queue, (next_due, position, target))
+            if self._autosave_path is not None and self._autosave_interval_s <= now - last_save:
+                last_save = now
+                self._save()
+
+    def _submit(self, target: MonitorTarget) -> None:
+        with self._lock:
+            if target.key in self._in_flight:
+                logger.info("Skipping probe of %s; the previous one is still running", target.request.name)
+                return
+            self._in_flight.add(target.key)
+        try:
+            assert self._pool is not None
+            self._pool.submit(self._probe, target)
+        except RuntimeError:
+            # The pool was shut down by stop() between the checks.
+            with self._lock:
+                self._in_flight.discard(target.key)
+
+    def _probe(self, target: MonitorTarget) -> None:
+        try:
+            sample = probe(target, self._http_client)
+            self._store.add(sample.key, sample.timestamp, sample.latency_ms, sample.status_code, sample.name)
+            with self._lock:
+                alert = self._evaluator.evaluate(sample)
+                if alert is not None:
+                    self._alerts.append(alert)
+            if self._on_sample is not None:
+                self._on_sample(sample)
+            if alert is not None:
+                logger.warning("Monitor alert: %s", alert.message)
+                if self._on_alert is not None:
+                    self._on_alert(alert)
+        except Exception:
+            logger.exception("Monitor probe of %s failed", target.request.name)
+        finally:
+            with self._lock:
+                self._in_flight.discard(target.key)
+
+    def _save(self) -> None:
+        if self._autosave_path is None:
+            return
+        try:
+            self._store.save(self._autosave_path)
+        except Exception as exc:
+            logger.error("Failed to save monitor time series %s: %s", self._autosave_path, exc)
+
+
+def probe(target: MonitorTarget, http_client: HttpClient) -> MonitorSample:
+    """Send ``target.request`` once on a fresh connection.
+
+    Each probe connects anew so DNS, TCP and TLS problems show up in the
+    results rather than hiding behind a pooled keep-alive connection.
+    Responses with status 400 and above count as failures.
+    """
+    request = target.request
+    timestamp = time.time()
+    started = time.perf_counter()
+    try:
+        with http_client.create_client(request) as http:
+            response = http_client.send(request, http)
+    except Exception as exc:
+        logger.info("Monitor probe of %s failed: %s", request.name, exc)
+        return MonitorSample(target.key, request.name, timestamp, None, None, str(exc) or type(exc).__name__)
+    latency_ms = (time.perf_counter() - started) * 1000.0
+    if response.status_code >= 400:
+        return MonitorSample(
+            target.key, request.name, timestamp, response.status_code, None, f"HTTP {response.status_code}"
+        )
+    return MonitorSample(target.key, request.name, timestamp, response.status_code, latency_ms)
+
+
+def summarize(points: Iterable[SeriesPoint]) -> dict[str, Any]:
+    """Sample count, error count and latency mean/min/max over ``points``."""
+    count = errors = 0
+    total = 0.0
+    minimum: float | None = None
+    maximum: float | None = None
+    for point in points:
+        count += point.count
+        errors += point.errors
+        if point.mean_ms is None:
+            continue
+        total += point.mean_ms * (point.count - point.errors)
+        minimum = point.min_ms if minimum is None else min(minimum, point.min_ms)
+        maximum = point.max_ms if maximum is None else max(maximum, point.max_ms)
+    successes = count - errors
+    return {
+        "samples": count,
+        "errors": errors,
+        "mean_ms": total / successes if successes else None,
+        "min_ms": minimum,
+        "max_ms": maximum,
+    }
@@ -0,0 +1,350 @@
+"""Simulated bad network links as httpx transports.
+
+``SimulatedTransport`` (and ``AsyncSimulatedTransport``) wrap a real
+transport and, per request, add latency with jitter, cap upload and
+download bandwidth, answer with a synthetic 5xx instead of sending, or
+reset the connection part-way through the response body. Everything
+happens in-process; no traffic shaping on the host is needed.
+
+Conditions come from a profile string such as ``"3g error=0.05 seed=7"``:
+an optional preset followed by ``key=value`` overrides (see
+``parse_profile``). Random decisions are drawn from one seeded generator
+per ``NetworkSimulator``, a fixed number of draws per request, so the same
+seed and request order always produce the same delays and failures.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+import threading
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from dataclasses import dataclass, replace
+
+import httpx
+
+from core.logger import get_logger, redact_url
+
+logger = get_logger("netsim")
+
+# A request profile that switches simulation off even in a simulated environment.
+PROFILE_OFF = ("off", "none")
+SIMULATED_HEADER = "X-Simulated"
+DEFAULT_ERROR_STATUSES = (500, 502, 503, 504)
+# Throttled bodies are paced in slices of about this much transfer time.
+_PACING_SLICE_S = 0.05
+_MIN_SLICE_BYTES = 512
+
+
+@dataclass(frozen=True, slots=True)
+class NetworkProfile:
+    latency_ms: float = 0.0
+    # Latency varies uniformly by up to this much either way.
+    jitter_ms: float = 0.0
+    # KiB per second; None is unlimited.
+    download_kb_s: float | None = None
+    upload_kb_s: float | None = None
+    # Probabilities per request.
+    reset_rate: float = 0.0
+    error_rate: float = 0.0
+    error_statuses: tuple[int, ...] = DEFAULT_ERROR_STATUSES
+    seed: int = 0
+
+
+PRESETS: dict[str, NetworkProfile] = {
+    "slow-3g": NetworkProfile(latency_ms=2000, jitter_ms=200, download_kb_s=50, upload_kb_s=50),
+    "3g": NetworkProfile(latency_ms=560, jitter_ms=100, download_kb_s=200, upload_kb_s=94),
+    "4g": NetworkProfile(latency_ms=85, jitter_ms=20, download_kb_s=1200, upload_kb_s=900),
+    "flaky": NetworkProfile(latency_ms=100, jitter_ms=80, reset_rate=0.05, error_rate=0.05),
+}
+
+_FLOAT_KEYS = {"latency": "latency_ms", "jitter": "jitter_ms", "down": "download_kb_s", "up": "upload_kb_s"}
+_RATE_KEYS = {"reset": "reset_rate", "error": "error_rate"}
+
+
+def parse_profile(text: str) -> NetworkProfile | None:
+    """Parse ``"[preset] key=value ..."``; None for an empty, ``off`` or ``none`` profile.
+
+    Keys: ``latency`` and ``jitter`` (ms), ``down`` and ``up`` (KiB/s, 0 is
+    unlimited), ``reset`` and ``error`` (probability 0-1), ``status``
+    (e.g. ``502/503``) and ``seed``. Tokens are separated by spaces or
+    commas. Raises ``ValueError`` naming the bad token.
+    """
+    tokens = text.replace(",", " ").split()
+    if not tokens or (len(tokens) == 1 and tokens[0].lower() in PROFILE_OFF):
+        return None
+    profile = NetworkProfile()
+    if "=" not in tokens[0]:
+        preset = tokens.pop(0).lower()
+        if preset not in PRESETS:
+            raise ValueError(f"unknown network profile {preset!r} (presets: {', '.join(PRESETS)})")
+        profile = PRESETS[preset]
+    changes: dict[str, object] = {}
+    for token in tokens:
+        key, _, value = token.partition("=")
+        key = key.lower()
+        try:
+            if key in _FLOAT_KEYS:
+                number = float(value)
+                if number < 0:
+                    raise ValueError
+                if key in ("down", "up"):
+                    changes[_FLOAT_KEYS[key]] = number or None
+                else:
+                    changes[_FLOAT_KEYS[key]] = number
+            elif key in _RATE_KEYS:
+                rate = float(value)
+                if not 0.0 <= rate <= 1.0:
+                    raise ValueError
+                changes[_RATE_KEYS[key]] = rate
+            elif key == "status":
+                statuses = tuple(int(part) for part in value.split("/"))
+                if not statuses or any(not 500 <= status <= 599 for status in statuses):
+                    raise ValueError
+                changes["error_statuses"] = statuses
+            elif key == "seed":
+                changes["seed"] = int(value)
+            else:
+                raise ValueError(f"unknown network profile key {key!r} in {token!r}")
+        except ValueError as exc:
+            if exc.args:
+                raise
+            raise ValueError(f"invalid network profile value {token!r}") from None
+    return replace(profile, **changes)
+
+
+@dataclass(frozen=True, slots=True)
+class _Plan:
+    delay_s: float
+    error_status: int | None
+    # Fraction of the response body delivered before the reset; None for no reset.
+    reset_at: float | None
+
+
+class NetworkSimulator:
+    """Draws the per-request conditions for one profile; shareable across clients and threads."""
+
+    def __init__(self, profile: NetworkProfile) -> None:
+        self.profile = profile
+        self._rng = random.Random(profile.seed)
+        self._lock = threading.Lock()
+
+    def plan(self) -> _Plan:
+        profile = self.profile
+        with self._lock:
+            # Always the same draws, whatever the outcome, so one request's
+            # result never shifts the next one's.
+            jitter = self._rng.uniform(-1.0, 1.0)
+            error_roll = self._rng.random()
+            status = self._rng.choice(profile.error_statuses)
+            reset_roll = self._rng.random()
+            reset_at = self._rng.random()
+        delay_s = max(0.0, profile.latency_ms + jitter * profile.jitter_ms) / 1000.0
+        return _Plan(
+            delay_s,
+            status if error_roll < profile.error_rate else None,
+            reset_at if reset_roll < profile.reset_rate else None,
+        )
+
+
+class SimulatedTransport(httpx.BaseTransport):
+    """Applies ``simulator``'s conditions around ``transport``."""
+
+    def __init__(
+        self,
+        simulator: NetworkSimulator,
+        transport: httpx.BaseTransport,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._simulator = simulator
+        self._transport = transport
+        self._sleep = sleep
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        plan = self._simulator.plan()
+        timeout_s = _read_timeout(request)
+        if timeout_s is not None and plan.delay_s > timeout_s:
+            self._sleep(timeout_s)
+            raise httpx.ReadTimeout("simulated latency exceeded the read timeout", request=request)
+        self._sleep(plan.delay_s)
+        if plan.error_status is not None:
+            return _error_response(request, plan.error_status)
+
+        profile = self._simulator.profile
+        if profile.upload_kb_s is not None:
+            request.stream = _ThrottledStream(request.stream, profile.upload_kb_s, self._sleep)
+        response = self._transport.handle_request(request)
+        if profile.download_kb_s is None and plan.reset_at is None:
+            return response
+        stream = _ThrottledStream(
+            response.stream,
+            profile.download_kb_s,
+            self._sleep,
+            request=request,
+            reset_after=_reset_offset(response, plan.reset_at),
+        )
+        return httpx.Response(
+            response.status_code, headers=response.headers, stream=stream, extensions=response.extensions
+        )
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncSimulatedTransport(httpx.AsyncBaseTransport):
+    """The asyncio counterpart of ``SimulatedTransport``."""
+
+    def __init__(
+        self,
+        simulator: NetworkSimulator,
+        transport: httpx.AsyncBaseTransport,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        self._simulator = simulator
+        self._transport = transport
+        self._sleep = sleep
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        plan = self._simulator.plan()
+        timeout_s = _read_timeout(request)
+        if timeout_s is not None and plan.delay_s > timeout_s:
+            await self._sleep(timeout_s)
+            raise httpx.ReadTimeout("simulated latency exceeded the read timeout", request=request)
+        await self._sleep(plan.delay_s)
+        if plan.error_status is not None:
+            return _error_response(request, plan.error_status)
+
+        profile = self._simulator.profile
+        if profile.upload_kb_s is not None:
+            request.stream = _AsyncThrottledStream(request.stream, profile.upload_kb_s, self._sleep)
+        response = await self._transport.handle_async_request(request)
+        if profile.download_kb_s is None and plan.reset_at is None:
+            return response
+        stream = _AsyncThrottledStream(
+            response.stream,
+            profile.download_kb_s,
+            self._sleep,
+            request=request,
+            reset_after=_reset_offset(response, plan.reset_at),
+        )
+        return httpx.Response(
+            response.status_code, headers=response.headers, stream=stream, extensions=response.extensions
+        )
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class _Pacer:
+    """Splits chunks into slices and says how long to wait before each one."""
+
+    def __init__(self, rate_kb_s: float | None, reset_after: int | None, request: httpx.Request | None) -> None:
+        self._rate = rate_kb_s * 1024 if rate_kb_s else None
+        self._slice = max(_MIN_SLICE_BYTES, int(self._rate * _PACING_SLICE_S)) if self._rate else None
+        self._reset_after = reset_after
+        self._request = request
+        self._sent = 0
+
+    def slices(self, chunk: bytes) -> Iterator[tuple[float, bytes]]:
+        size = self._slice or max(1, len(chunk))
+        for start in range(0, len(chunk), size):
+            part = chunk[start : start + size]
+            if self._reset_after is not None and self._sent + len(part) > self._reset_after:
+                yield 0.0, part[: self._reset_after - self._sent]
+                self.reset()
+            self._sent += len(part)
+            yield (len(part) / self._rate if self._rate else 0.0), part
+
+    def finish(self) -> None:
+        # A reset planned at the very end still cuts the connection.
+        if self._reset_after is not None:
+            self.reset()
+
+    def reset(self) -> None:
+        raise httpx.ReadError("[Errno 104] Connection reset by peer (simulated)", request=self._request)
+
+
+class _ThrottledStream(httpx.SyncByteStream):
+    def __init__(
+        self,
+        stream: httpx.SyncByteStream,
+        rate_kb_s: float | None,
+        sleep: Callable[[float], None],
+        request: httpx.Request | None = None,
+        reset_after: int | None = None,
+    ) -> None:
+        self._stream = stream
+        self._pacer = _Pacer(rate_kb_s, reset_after, request)
+        self._sleep = sleep
+
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self._stream:
+            for delay_s, part in self._pacer.slices(chunk):
+                if delay_s:
+                    self._sleep(delay_s)
+                if part:
+                    yield part
+        self._pacer.finish()
+
+    def close(self) -> None:
+        close = getattr(self._stream, "close", None)
+        if close is not None:
+            close()
+
+
+class _AsyncThrottledStream(httpx.AsyncByteStream):
+    def __init__(
+        self,
+        stream: httpx.AsyncByteStream,
+        rate_kb_s: float | None,
+        sleep: Callable[[float], Awaitable[None]],
+        request: httpx.Request | None = None,
+        reset_after: int | None = None,
+    ) -> None:
+        self._stream = stream
+        self._pacer = _Pacer(rate_kb_s, reset_after, request)
+        self._sleep = sleep
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            for delay_s, part in self._pacer.slices(chunk):
+                if delay_s:
+                    await self._sleep(delay_s)
+                if part:
+                    yield part
+        self._pacer.finish()
+
+    async def aclose(self) -> None:
+        aclose = getattr(self._stream, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+def _read_timeout(request: httpx.Request) -> float | None:
+    return request.extensions.get("timeout", {}).get("read")
+
+
+def _reset_offset(response: httpx.Response, reset_at: float | None) -> int | None:
+    """Bytes of the (wire) body delivered before a planned reset."""
+    if reset_at is None:
+        return None
+    try:
+        length = int(response.headers.get("Content-Length", ""))
+    except ValueError:
+        # Unknown length: reset before the first byte.
+        return 0
+    return int(length * reset_at)
+
+
+def _error_response(request: httpx.Request, status_code: int) -> httpx.Response:
+    logger.debug("Simulated %d for %s %s", status_code, request.method, redact_url(str(request.url)))
+    body = json.dumps({"error": "simulated", "status": status_code}).encode("utf-8")
+    # Streamed like a real response, so the client still times and closes it.
+    return httpx.Response(
+        status_code,
+        headers={"Content-Type": "application/json", "Content-Length": str(len(body)), SIMULATED_HEADER: "error"},
+        stream=httpx.ByteStream(body),
+        request=request,
+    )
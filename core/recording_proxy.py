@@ -0,0 +1,739 @@
+"""Local forward proxy that records the HTTP traffic passing through it.
+
+Point another application (or this one, via ``proxy_url`` or ``HTTP_PROXY``
+with ``trust_env``) at the proxy and every plain-HTTP exchange whose host
+and path pass a ``RecordFilter`` is handed to a recorder: appended to a
+history file, or collected and turned into workspace requests.
+
+Bodies are relayed chunk by chunk as they arrive, never buffered whole; only
+the first ``capture_bytes`` of each body are copied aside for recording.
+Each client connection is an asyncio task, so thousands of idle keep-alive
+connections cost little. ``CONNECT`` (HTTPS) is tunneled untouched and is
+not recorded, since the bytes are encrypted.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import datetime
+import threading
+import time
+import zlib
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from fnmatch import fnmatchcase
+from pathlib import Path
+from urllib.parse import SplitResult, urlsplit
+
+from core.analytics import normalize_endpoint
+from core.logger import get_logger, redact_url
+from core.model import HistoryEntry, WorkspaceCollection, WorkspaceData, WorkspaceFolder, WorkspaceRequest
+from core.storage.history_jsonl import append_history_entry
+from core.workspace_index import KIND_COLLECTION, KIND_FOLDER, KIND_REQUEST, WorkspaceIndex
+
+logger = get_logger("recording_proxy")
+
+DEFAULT_PROXY_PORT = 8888
+# Recording is explicit, so bodies are kept by default (``--capture-kb 0`` turns it off).
+DEFAULT_CAPTURE_BYTES = 256 * 1024
+DEFAULT_RECORDED_COLLECTION = "Recorded"
+CONNECT_TIMEOUT_S = 10.0
+MAX_HEADER_BYTES = 64 * 1024
+CHUNK_SIZE = 64 * 1024
+
+_HOP_BY_HOP = frozenset(
+    {
+        "connection",
+        "keep-alive",
+        "proxy-connection",
+        "proxy-authenticate",
+        "proxy-authorization",
+        "te",
+        "trailer",
+        "upgrade",
+    }
+)
+# Not worth keeping on a saved request; httpx sets them itself.
+_GENERATED_HEADERS = frozenset({"host", "content-length", "transfer-encoding", "accept-encoding", "user-agent"})
+
+
+@dataclass(frozen=True, slots=True)
+class RecordFilter:
+    """Host and path glob patterns (``fnmatch`` style) deciding what gets recorded.
+
+    Empty include lists match everything; excludes win over includes.
+    Hosts are compared lowercase, with the port only when it is not 80.
+    """
+
+    hosts: tuple[str, ...] = ()
+    paths: tuple[str, ...] = ()
+    exclude_hosts: tuple[str, ...] = ()
+    exclude_paths: tuple[str, ...] = ()
+
+    def matches(self, host: str, path: str) -> bool:
+        host = host.lower()
+        if self.hosts and not _any_match(host, self.hosts):
+            return False
+        if self.paths and not _any_match(path, self.paths):
+            return False
+        return not (_any_match(host, self.exclude_hosts) or _any_match(path, self.exclude_paths))
+
+
+@dataclass(slots=True)
+class RecordedExchange:
+    timestamp: str
+    method: str
+    url: str
+    request_headers: list[tuple[str, str]]
+    request_body: bytes = b""
+    status_code: int | None = None
+    response_headers: list[tuple[str, str]] = field(default_factory=list)
+    response_body: bytes = b""
+    elapsed_ms: int | None = None
+    error: str | None = None
+    # Set when a body was longer than the capture limit; the copy is cut short.
+    request_truncated: bool = False
+    response_truncated: bool = False
+
+    @property
+    def name(self) -> str:
+        return f"{self.method} {urlsplit(self.url).path or '/'}"
+
+    def response_text(self) -> str | None:
+        """The complete response body as text, or None when it was cut short or is not text."""
+        if self.response_truncated:
+            return None
+        return _decode_body(self.response_body, _header(self.response_headers, "content-encoding"))
+
+    def request_text(self) -> str | None:
+        if self.request_truncated:
+            return None
+        return _decode_body(self.request_body, _header(self.request_headers, "content-encoding"))
+
+    def to_history_entry(self) -> HistoryEntry:
+        return HistoryEntry(
+            timestamp=self.timestamp,
+            name=self.name,
+            method=self.method,
+            url=self.url,
+            status_code=self.status_code,
+            elapsed_ms=self.elapsed_ms,
+            error=self.error,
+            response_body=self.response_text() if self.status_code is not None else None,
+        )
+
+
+class HistoryRecorder:
+    """Appends each exchange to a history JSONL file."""
+
+    def __init__(self, path: str | Path) -> None:
+        self._path = Path(path)
+
+    def __call__(self, exchange: RecordedExchange) -> None:
+        append_history_entry(self._path, exchange.to_history_entry())
+
+
+class CollectionRecorder:
+    """Keeps exchanges so they can be added to a workspace with ``add_recorded_requests``."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._exchanges: list[RecordedExchange] = []
+
+    @property
+    def exchanges(self) -> list[RecordedExchange]:
+        with self._lock:
+            return list(self._exchanges)
+
+    def __call__(self, exchange: RecordedExchange) -> None:
+        with self._lock:
+            self._exchanges.append(exchange)
+
+
+def add_recorded_requests(
+    workspace: WorkspaceData,
+    exchanges: Iterable[RecordedExchange],
+    collection_name: str = DEFAULT_RECORDED_COLLECTION,
+) -> list[WorkspaceRequest]:
+    """Add one request per new endpoint to ``collection_name``, in a folder per host.
+
+    Endpoints are compared after ``normalize_endpoint``, so ``/users/1`` and
+    ``/users/2`` become one request, and endpoints the collection already
+    holds are skipped. The first exchange seen for an endpoint supplies the
+    URL, headers and body. Returns the requests that were added.
+    """
+    index = WorkspaceIndex.for_workspace(workspace)
+    if not workspace.collections:
+        # for_workspace() stands in a "Default" collection for older files.
+        workspace.collections.extend(index.build_collections()[0])
+
+    collection = next((item for item in workspace.collections if item.name == collection_name), None)
+    if collection is None:
+        collection = WorkspaceCollection(id=index.next_id(KIND_COLLECTION), name=collection_name)
+        workspace.collections.append(collection)
+        index.add(KIND_COLLECTION, collection.name, None, node_id=collection.id)
+
+    folders = {
+        folder.name: folder
+        for folder in workspace.folders
+        if folder.collection_id == collection.id and folder.parent_id is None
+    }
+    collection_ids = set(index.subtree_ids(collection.id))
+    known = {
+        normalize_endpoint(request.method, request.url)
+        for request in workspace.requests
+        if request.id in collection_ids
+    }
+
+    added: list[WorkspaceRequest] = []
+    for exchange in exchanges:
+        endpoint = normalize_endpoint(exchange.method, exchange.url)
+        if endpoint in known or exchange.error is not None:
+            continue
+        known.add(endpoint)
+        host = urlsplit(exchange.url).netloc
+        folder = folders.get(host)
+        if folder is None:
+            order = sum(1 for item in workspace.folders if item.collection_id == collection.id)
+            folder = WorkspaceFolder(index.next_id(KIND_FOLDER), collection.id, None, host, order)
+            workspace.folders.append(folder)
+            index.add(KIND_FOLDER, folder.name, collection.id, node_id=folder.id)
+            folders[host] = folder
+        request = WorkspaceRequest(
+            id=index.next_id(KIND_REQUEST),
+            folder_id=folder.id,
+            name=exchange.name,
+            method=exchange.method,
+            url=exchange.url,
+            headers=[
+                (name, value) for name, value in exchange.request_headers if name.lower() not in _GENERATED_HEADERS
+            ],
+            body=exchange.request_text() or "",
+        )
+        index.add(KIND_REQUEST, request.name, folder.id, node_id=request.id)
+        workspace.requests.append(request)
+        added.append(request)
+    return added
+
+
+class RecordingProxy:
+    """HTTP/1.1 forward proxy on an asyncio event loop.
+
+    Each client connection keeps one upstream connection open for as long
+    as it talks to the same host. ``recorders`` are called in order on a
+    single background thread, so file writes never stall relaying.
+    """
+
+    def __init__(
+        self,
+        recorders: Sequence[Callable[[RecordedExchange], None]],
+        record_filter: RecordFilter | None = None,
+        host: str = "127.0.0.1",
+        port: int = DEFAULT_PROXY_PORT,
+        capture_bytes: int = DEFAULT_CAPTURE_BYTES,
+    ) -> None:
+        self._recorders = list(recorders)
+        self._filter = record_filter or RecordFilter()
+        self._host = host
+        self._port = port
+        self._capture_bytes = max(0, capture_bytes)
+        self._server: asyncio.Server | None = None
+        self._record_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="proxy-record")
+        self.exchange_count = 0
+        self.recorded_count = 0
+
+    @property
+    def port(self) -> int:
+        if self._server is not None and self._server.sockets:
+            return self._server.sockets[0].getsockname()[1]
+        return self._port
+
+    @property
+    def url(self) -> str:
+        return f"http://{self._host}:{self.port}"
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(
+            self._handle_connection, self._host, self._port, limit=MAX_HEADER_BYTES
+        )
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            await self.start()
+        assert self._server is not None
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        # Let queued recordings finish so nothing captured is lost.
+        await asyncio.get_running_loop().run_in_executor(None, self._record_executor.shutdown)
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        upstream: _Upstream | None = None
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except asyncio.IncompleteReadError:
+                    return
+                except asyncio.LimitOverrunError:
+                    await _write_error(writer, 431, "Request header too large")
+                    return
+                try:
+                    method, target, version, headers = _parse_head(head)
+                except ValueError:
+                    await _write_error(writer, 400, "Malformed request")
+                    return
+                if method == "CONNECT":
+                    await self._tunnel(target, reader, writer)
+                    return
+                keep_alive, upstream = await self._forward(method, target, version, headers, reader, writer, upstream)
+                if not keep_alive:
+                    return
+        except (ConnectionError, asyncio.IncompleteReadError) as exc:
+            logger.debug("Proxy connection ended: %s", exc)
+        finally:
+            if upstream is not None:
+                upstream.writer.close()
+            writer.close()
+
+    async def _forward(
+        self,
+        method: str,
+        target: str,
+        version: str,
+        headers: list[tuple[str, str]],
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        upstream: _Upstream | None,
+    ) -> tuple[bool, _Upstream | None]:
+        """Relay one exchange; returns whether the client connection stays open and the upstream to reuse."""
+        parts = urlsplit(target)
+        if parts.scheme != "http" or not parts.hostname:
+            await _write_error(writer, 400, "Only absolute http:// URLs can be proxied")
+            return False, upstream
+        try:
+            port = parts.port or 80
+        except ValueError:
+            await _write_error(writer, 400, "Invalid port")
+            return False, upstream
+
+        self.exchange_count += 1
+        origin = parts.hostname.lower() if port == 80 else f"{parts.hostname.lower()}:{port}"
+        path = parts.path or "/"
+        capture_limit = self._capture_bytes if self._filter.matches(origin, path) else None
+        client_keep_alive = _keep_alive(version, headers)
+        exchange = RecordedExchange(
+            timestamp=datetime.datetime.now(tz=datetime.timezone.utc).isoformat(),
+            method=method,
+            url=target,
+            request_headers=[(name, value) for name, value in headers if name.lower() not in _HOP_BY_HOP],
+        )
+        started = time.perf_counter()
+
+        if upstream is not None and (upstream.key != (parts.hostname, port) or upstream.reader.at_eof()):
+            # Also dropped when upstream already closed it while it sat idle.
+            upstream.writer.close()
+            upstream = None
+        # Upstream can still close a pooled connection just as the request goes
+        # out. Without a request body there is nothing to replay, so the request
+        # is then resent once on a new connection.
+        resend = upstream is not None and not _has_body(headers)
+        request_capture = _Capture(capture_limit)
+        response_capture = _Capture(capture_limit)
+        while True:
+            if upstream is None:
+                try:
+                    upstream_reader, upstream_writer = await asyncio.wait_for(
+                        asyncio.open_connection(parts.hostname, port, limit=MAX_HEADER_BYTES), CONNECT_TIMEOUT_S
+                    )
+                except (OSError, asyncio.TimeoutError) as exc:
+                    message = str(exc) or type(exc).__name__
+                    exchange.error = message
+                    # The request body was never read, so the connection cannot be reused.
+                    await _write_error(writer, 502, f"Cannot reach {origin}: {message}")
+                    self._record(exchange, capture_limit)
+                    return False, None
+                upstream = _Upstream((parts.hostname, port), upstream_reader, upstream_writer)
+
+            responded = False
+            try:
+                if "100-continue" in (_header(headers, "expect") or "").lower():
+                    # Answered here so the client sends its body without waiting on upstream.
+                    writer.write(b"HTTP/1.1 100 Continue\r\n\r\n")
+                    headers = [(name, value) for name, value in headers if name.lower() != "expect"]
+                request_line = f"{method} {_origin_form(parts)} HTTP/1.1\r\n"
+                upstream.writer.write(_encode_head(request_line, _forward_headers(headers, origin), "keep-alive"))
+                await _relay_body(reader, upstream.writer, headers, request_capture)
+
+                while True:
+                    response_head = await asyncio.wait_for(
+                        upstream.reader.readuntil(b"\r\n\r\n"), CONNECT_TIMEOUT_S * 6
+                    )
+                    responded = True
+                    response_version, status, reason, response_headers = _parse_status(response_head)
+                    if 100 <= status < 200:
+                        writer.write(response_head)
+                        continue
+                    break
+                exchange.status_code = status
+                exchange.response_headers = [
+                    (name, value) for name, value in response_headers if name.lower() not in _HOP_BY_HOP
+                ]
+                has_body = method != "HEAD" and status not in (204, 304)
+                # A body without length or chunking ends when upstream closes, so neither side can be reused.
+                framed = (
+                    not has_body
+                    or _is_chunked(response_headers)
+                    or _header(response_headers, "content-length") is not None
+                )
+                upstream_keep_alive = framed and _keep_alive(response_version, response_headers)
+                client_keep_alive = client_keep_alive and framed
+                writer.write(
+                    _encode_head(
+                        f"HTTP/1.1 {status} {reason}\r\n",
+                        _forward_headers(response_headers, None),
+                        "keep-alive" if client_keep_alive else "close",
+                    )
+                )
+                if has_body:
+                    await _relay_body(
+                        upstream.reader, writer, response_headers, response_capture, until_close=not framed
+                    )
+                await writer.drain()
+            except (
+                OSError,
+                asyncio.IncompleteReadError,
+                asyncio.LimitOverrunError,
+                asyncio.TimeoutError,
+                ValueError,
+            ) as exc:
+                upstream.writer.close()
+                upstream = None
+                if resend and not responded and isinstance(exc, (ConnectionError, asyncio.IncompleteReadError)):
+                    logger.debug("Resending %s %s on a new connection: %s", method, redact_url(target), exc)
+                    resend = False
+                    continue
+                exchange.error = str(exc) or type(exc).__name__
+                if exchange.status_code is None:
+                    await _write_error(writer, 502, f"Upstream {origin} failed: {exchange.error}")
+                self._record(exchange, capture_limit, request_capture, response_capture, started)
+                return False, None
+            break
+
+        self._record(exchange, capture_limit, request_capture, response_capture, started)
+        if not upstream_keep_alive:
+            upstream.writer.close()
+            upstream = None
+        return client_keep_alive, upstream
+
+    async def _tunnel(self, target: str, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        host, _, port_text = target.rpartition(":")
+        try:
+            upstream_reader, upstream_writer = await asyncio.wait_for(
+                asyncio.open_connection(host.strip("[]"), int(port_text)), CONNECT_TIMEOUT_S
+            )
+        except (OSError, ValueError, asyncio.TimeoutError) as exc:
+            await _write_error(writer, 502, f"Cannot reach {target}: {exc}")
+            return
+        writer.write(b"HTTP/1.1 200 Connection Established\r\n\r\n")
+        try:
+            await asyncio.gather(_pipe(reader, upstream_writer), _pipe(upstream_reader, writer))
+        finally:
+            upstream_writer.close()
+
+    def _record(
+        self,
+        exchange: RecordedExchange,
+        capture_limit: int | None,
+        request_capture: _Capture | None = None,
+        response_capture: _Capture | None = None,
+        started: float | None = None,
+    ) -> None:
+        if capture_limit is None:
+            return
+        if request_capture is not None:
+            exchange.request_body = bytes(request_capture.data)
+            exchange.request_truncated = request_capture.truncated
+        if response_capture is not None:
+            exchange.response_body = bytes(response_capture.data)
+            exchange.response_truncated = response_capture.truncated
+        if started is not None and exchange.status_code is not None:
+            exchange.elapsed_ms = int((time.perf_counter() - started) * 1000)
+        self.recorded_count += 1
+        for recorder in self._recorders:
+            self._record_executor.submit(_call_recorder, recorder, exchange)
+
+
+class RecordingProxyThread:
+    """Runs a ``RecordingProxy`` on its own event loop thread.
+
+        with RecordingProxyThread([HistoryRecorder("history.jsonl")]) as proxy:
+            httpx.get("http://example.com/", proxy=proxy.url)
+    """
+
+    def __init__(
+        self,
+        recorders: Sequence[Callable[[RecordedExchange], None]],
+        record_filter: RecordFilter | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        capture_bytes: int = DEFAULT_CAPTURE_BYTES,
+    ) -> None:
+        self.proxy = RecordingProxy(recorders, record_filter, host, port, capture_bytes)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._ready = threading.Event()
+        self._error: BaseException | None = None
+
+    @property
+    def url(self) -> str:
+        return self.proxy.url
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="recording-proxy", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        if self._error is not None:
+            raise self._error
+
+    def stop(self) -> None:
+        """Stop accepting connections and wait until every recorder call has run."""
+        if self._loop is None or self._thread is None:
+            return
+        asyncio.run_coroutine_threadsafe(self.proxy.close(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+    def __enter__(self) -> RecordingProxyThread:
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    def _run(self) -> None:
+        loop = asyncio.new_event_loop()
+        self._loop = loop
+        try:
+            loop.run_until_complete(self.proxy.start())
+        except BaseException as exc:
+            self._error = exc
+            self._ready.set()
+            loop.close()
+            return
+        self._ready.set()
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
+
+
+@dataclass(slots=True)
+class _Upstream:
+    key: tuple[str, int]
+    reader: asyncio.StreamReader
+    writer: asyncio.StreamWriter
+
+
+class _Capture:
+    """Copies the first ``limit`` bytes of a relayed body; ``None`` copies nothing."""
+
+    __slots__ = ("limit", "data", "truncated")
+
+    def __init__(self, limit: int | None) -> None:
+        self.limit = limit
+        self.data = bytearray()
+        self.truncated = False
+
+    def feed(self, chunk: bytes) -> None:
+        if self.limit is None or self.truncated:
+            return
+        room = self.limit - len(self.data)
+        if len(chunk) > room:
+            self.data += chunk[:room]
+            self.truncated = True
+        else:
+            self.data += chunk
+
+
+async def _relay_body(
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+    headers: list[tuple[str, str]],
+    capture: _Capture,
+    until_close: bool = False,
+) -> None:
+    """Copy one message body, keeping its framing, and feed the payload to ``capture``."""
+    if _is_chunked(headers):
+        while True:
+            size_line = await reader.readuntil(b"\r\n")
+            writer.write(size_line)
+            size = int(size_line.split(b";", 1)[0].strip(), 16)
+            if size == 0:
+                # Trailer fields, then the empty line that ends the message.
+                while True:
+                    line = await reader.readuntil(b"\r\n")
+                    writer.write(line)
+                    if line == b"\r\n":
+                        break
+                await writer.drain()
+                return
+            await _copy(reader, writer, size, capture)
+            writer.write(await reader.readexactly(2))
+    elif until_close:
+        await _copy(reader, writer, None, capture)
+    else:
+        length = _header(headers, "content-length")
+        if length:
+            await _copy(reader, writer, int(length), capture)
+
+
+async def _copy(
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+    length: int | None,
+    capture: _Capture,
+) -> None:
+    remaining = length
+    while remaining is None or remaining > 0:
+        chunk = await reader.read(CHUNK_SIZE if remaining is None else min(CHUNK_SIZE, remaining))
+        if not chunk:
+            if remaining is None:
+                return
+            raise asyncio.IncompleteReadError(b"", remaining)
+        capture.feed(chunk)
+        writer.write(chunk)
+        # Back-pressure: a slow receiver slows the sender instead of growing a buffer.
+        await writer.drain()
+        if remaining is not None:
+            remaining -= len(chunk)
+
+
+async def _pipe(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    try:
+        while True:
+            chunk = await reader.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            writer.write(chunk)
+            await writer.drain()
+    except ConnectionError:
+        pass
+    finally:
+        if writer.can_write_eof():
+            try:
+                writer.write_eof()
+            except OSError:
+                pass
+
+
+async def _write_error(writer: asyncio.StreamWriter, status: int, message: str) -> None:
+    body = message.encode("utf-8")
+    writer.write(
+        (
+            f"HTTP/1.1 {status} {_REASONS.get(status, 'Error')}\r\n"
+            f"Content-Type: text/plain; charset=utf-8\r\nContent-Length: {len(body)}\r\nConnection: close\r\n\r\n"
+        ).encode("latin-1")
+        + body
+    )
+    try:
+        await writer.drain()
+    except ConnectionError:
+        pass
+
+
+_REASONS = {400: "Bad Request", 431: "Request Header Fields Too Large", 502: "Bad Gateway"}
+
+
+def _parse_head(head: bytes) -> tuple[str, str, str, list[tuple[str, str]]]:
+    lines = head.decode("latin-1").split("\r\n")
+    method, target, version = lines[0].split(" ", 2)
+    return method.upper(), target, version, _parse_headers(lines[1:])
+
+
+def _parse_status(head: bytes) -> tuple[str, int, str, list[tuple[str, str]]]:
+    lines = head.decode("latin-1").split("\r\n")
+    version, status, *reason = lines[0].split(" ", 2)
+    return version, int(status), reason[0] if reason else "", _parse_headers(lines[1:])
+
+
+def _parse_headers(lines: Iterable[str]) -> list[tuple[str, str]]:
+    headers: list[tuple[str, str]] = []
+    for line in lines:
+        name, separator, value = line.partition(":")
+        if separator:
+            headers.append((name.strip(), value.strip()))
+    return headers
+
+
+def _header(headers: Iterable[tuple[str, str]], name: str) -> str | None:
+    for key, value in headers:
+        if key.lower() == name:
+            return value
+    return None
+
+
+def _is_chunked(headers: Iterable[tuple[str, str]]) -> bool:
+    return "chunked" in (_header(headers, "transfer-encoding") or "").lower()
+
+
+def _has_body(headers: Iterable[tuple[str, str]]) -> bool:
+    return _is_chunked(headers) or (_header(headers, "content-length") or "0").strip() != "0"
+
+
+def _keep_alive(version: str, headers: Iterable[tuple[str, str]]) -> bool:
+    connection = (_header(headers, "connection") or _header(headers, "proxy-connection") or "").lower()
+    return connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+
+
+def _forward_headers(headers: list[tuple[str, str]], host: str | None) -> list[tuple[str, str]]:
+    """Drop hop-by-hop headers, including any the Connection header names."""
+    named = {token.strip().lower() for token in (_header(headers, "connection") or "").split(",")}
+    forwarded = [
+        (name, value) for name, value in headers if name.lower() not in _HOP_BY_HOP and name.lower() not in named
+    ]
+    if host is not None and _header(forwarded, "host") is None:
+        forwarded.insert(0, ("Host", host))
+    return forwarded
+
+
+def _encode_head(start_line: str, headers: list[tuple[str, str]], connection: str) -> bytes:
+    lines = [start_line]
+    lines.extend(f"{name}: {value}\r\n" for name, value in headers)
+    lines.append(f"Connection: {connection}\r\n\r\n")
+    return "".join(lines).encode("latin-1")
+
+
+def _origin_form(parts: SplitResult) -> str:
+    path = parts.path or "/"
+    return f"{path}?{parts.query}" if parts.query else path
+
+
+def _decode_body(body: bytes, encoding: str | None) -> str | None:
+    encoding = (encoding or "").strip().lower()
+    try:
+        if encoding in ("gzip", "x-gzip"):
+            body = zlib.decompress(body, 16 + zlib.MAX_WBITS)
+        elif encoding == "deflate":
+            body = zlib.decompress(body)
+        elif encoding not in ("", "identity"):
+            return None
+        return body.decode("utf-8")
+    except (zlib.error, UnicodeDecodeError):
+        return None
+
+
+def _any_match(value: str, patterns: Iterable[str]) -> bool:
+    return any(fnmatchcase(value, pattern) for pattern in patterns)
+
+
+def _call_recorder(recorder: Callable[[RecordedExchange], None], exchange: RecordedExchange) -> None:
+    try:
+        recorder(exchange)
+    except Exception:
+        logger.exception("Recording %s %s failed", exchange.method, redact_url(exchange.url))
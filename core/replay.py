@@ -0,0 +1,354 @@
+"""Replay recorded traffic against another environment.
+
+Requests come from ``history.jsonl`` entries or a HAR file. They are sent on
+one asyncio loop through a pooled ``httpx.AsyncClient``, keeping the
+original inter-arrival times divided by ``speed``. The replay's statuses and
+latencies are then compared with the recorded ones.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlsplit, urlunsplit
+
+from core.analytics import parse_timestamp, percentile
+from core.http_client import HttpClient
+from core.logger import get_logger, redact_url
+from core.model import HistoryEntry, RequestData
+from core.template import render_request, render_text
+
+logger = get_logger("replay")
+
+DEFAULT_REPLAY_CONCURRENCY = 16
+# HAR headers that describe the recorded connection rather than the request.
+_SKIPPED_HAR_HEADERS = frozenset(
+    {"host", "content-length", "connection", "keep-alive", "transfer-encoding", "accept-encoding"}
+)
+
+
+class ReplayCancelled(Exception):
+    pass
+
+
+@dataclass(frozen=True, slots=True)
+class ReplayItem:
+    # Seconds after the first recorded request.
+    offset_s: float
+    request: RequestData
+    status_code: int | None = None
+    elapsed_ms: float | None = None
+    error: str | None = None
+
+
+@dataclass(slots=True)
+class ReplayResult:
+    item: ReplayItem
+    url: str
+    # Offsets from the start of the replay, in seconds.
+    scheduled_s: float
+    started_s: float = 0.0
+    status_code: int | None = None
+    elapsed_ms: float | None = None
+    error: str | None = None
+
+    @property
+    def lag_ms(self) -> float:
+        """How late the send started compared with the scaled schedule."""
+        return max(0.0, (self.started_s - self.scheduled_s) * 1000.0)
+
+    @property
+    def status_matches(self) -> bool:
+        return self.error is None and self.status_code == self.item.status_code
+
+
+@dataclass(slots=True)
+class ReplayReport:
+    results: list[ReplayResult]
+    speed: float
+    duration_s: float
+
+
+def items_from_history(
+    entries: Iterable[HistoryEntry], since: float | None = None, until: float | None = None
+) -> list[ReplayItem]:
+    """History entries between ``since`` and ``until`` (epoch seconds), oldest first.
+
+    History stores method and URL only, so headers and bodies are not
+    replayed; use a HAR export when they matter.
+    """
+    timed: list[tuple[float, HistoryEntry]] = []
+    for entry in entries:
+        timestamp = parse_timestamp(entry.timestamp)
+        if timestamp is None:
+            continue
+        if (since is not None and timestamp < since) or (until is not None and timestamp > until):
+            continue
+        timed.append((timestamp, entry))
+    timed.sort(key=lambda pair: pair[0])
+    if not timed:
+        return []
+    first = timed[0][0]
+    return [
+        ReplayItem(
+            offset_s=timestamp - first,
+            request=RequestData(name=entry.name, method=entry.method, url=entry.url),
+            status_code=entry.status_code,
+            elapsed_ms=float(entry.elapsed_ms) if entry.elapsed_ms is not None else None,
+            error=entry.error,
+        )
+        for timestamp, entry in timed
+    ]
+
+
+def load_har(path: str | Path, since: float | None = None, until: float | None = None) -> list[ReplayItem]:
+    """Requests of a HAR 1.2 file, with headers and text bodies, oldest first."""
+    with Path(path).open("r", encoding="utf-8") as file_handle:
+        payload = json.load(file_handle)
+    entries = payload.get("log", {}).get("entries") if isinstance(payload, dict) else None
+    if not isinstance(entries, list):
+        raise ValueError("not a HAR file: log.entries is missing")
+
+    timed: list[tuple[float, ReplayItem]] = []
+    for position, entry in enumerate(entries):
+        try:
+            timestamp, item = _har_item(entry)
+        except (KeyError, TypeError, ValueError) as exc:
+            logger.warning("Skipping HAR entry %s: %s", position, exc)
+            continue
+        if (since is not None and timestamp < since) or (until is not None and timestamp > until):
+            continue
+        timed.append((timestamp, item))
+    timed.sort(key=lambda pair: pair[0])
+    if not timed:
+        return []
+    first = timed[0][0]
+    return [replace(item, offset_s=timestamp - first) for timestamp, item in timed]
+
+
+def load_replay_items(path: str | Path, since: float | None = None, until: float | None = None) -> list[ReplayItem]:
+    """HAR files by their ``.har`` suffix, anything else as history JSONL."""
+    if Path(path).suffix.lower() == ".har":
+        return load_har(path, since, until)
+    from core.storage.history_jsonl import load_history_entries
+
+    return items_from_history(load_history_entries(path), since, until)
+
+
+def retarget_url(url: str, target: str) -> str:
+    """Swap the scheme and host of ``url`` for ``target``'s, keeping the path and query.
+
+    A path in ``target`` (e.g. ``https://staging/api``) is put in front of the
+    recorded path.
+    """
+    recorded = urlsplit(url)
+    destination = urlsplit(target)
+    if not destination.scheme or not destination.netloc:
+        raise ValueError(f"replay target must be an absolute URL, got {target!r}")
+    path = destination.path.rstrip("/") + (recorded.path or "/")
+    return urlunsplit((destination.scheme, destination.netloc, path, recorded.query, ""))
+
+
+def replay(
+    items: Sequence[ReplayItem],
+    target: str | None = None,
+    variables: Mapping[str, str] | None = None,
+    speed: float = 1.0,
+    concurrency: int = DEFAULT_REPLAY_CONCURRENCY,
+    http_client: HttpClient | None = None,
+    on_result: Callable[[ReplayResult], None] | None = None,
+    should_stop: Callable[[], bool] | None = None,
+) -> ReplayReport:
+    """Blocking wrapper around ``replay_async`` for threads without an event loop."""
+    return asyncio.run(
+        replay_async(items, target, variables, speed, concurrency, http_client, on_result, should_stop)
+    )
+
+
+async def replay_async(
+    items: Sequence[ReplayItem],
+    target: str | None = None,
+    variables: Mapping[str, str] | None = None,
+    speed: float = 1.0,
+    concurrency: int = DEFAULT_REPLAY_CONCURRENCY,
+    http_client: HttpClient | None = None,
+    on_result: Callable[[ReplayResult], None] | None = None,
+    should_stop: Callable[[], bool] | None = None,
+) -> ReplayReport:
+    """Send ``items`` at ``offset_s / speed`` after the start.
+
+    ``target`` (rendered with ``variables``, so ``{{base_url}}`` works)
+    replaces each recorded scheme and host; ``variables`` also render the
+    requests themselves. ``speed`` 2 halves every gap, and 0 sends as fast
+    as ``concurrency`` allows. With every connection busy, sends wait and
+    start late, and ``ReplayResult.lag_ms`` shows by how much.
+    """
+    variables = variables or {}
+    client_factory = http_client or HttpClient()
+    stop = should_stop or (lambda: False)
+    target_base = render_text(target, variables) if target else None
+    requests = [_prepare(item.request, target_base, variables) for item in items]
+    if not requests:
+        return ReplayReport([], speed, 0.0)
+
+    loop = asyncio.get_running_loop()
+    slots = asyncio.Semaphore(max(1, concurrency))
+    results: list[ReplayResult] = []
+    tasks: list[asyncio.Task[None]] = []
+
+    async def _send(result: ReplayResult, request: RequestData) -> None:
+        try:
+            result.started_s = loop.time() - started
+            sent = time.perf_counter()
+            try:
+                response = await client_factory.send_async(request, client)
+            except Exception as exc:
+                logger.info("Replay of %s %s failed: %s", request.method, redact_url(request.url), exc)
+                result.error = str(exc) or type(exc).__name__
+            else:
+                result.status_code = response.status_code
+                result.elapsed_ms = (time.perf_counter() - sent) * 1000.0
+            if on_result is not None:
+                on_result(result)
+        finally:
+            slots.release()
+
+    async with client_factory.create_async_client(requests[0], max_connections=max(1, concurrency)) as client:
+        started = loop.time()
+        try:
+            for item, request in zip(items, requests):
+                scheduled = item.offset_s / speed if speed > 0 else 0.0
+                delay = started + scheduled - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                await slots.acquire()
+                if stop():
+                    slots.release()
+                    raise ReplayCancelled()
+                result = ReplayResult(item=item, url=request.url, scheduled_s=scheduled)
+                results.append(result)
+                tasks.append(asyncio.create_task(_send(result, request)))
+        finally:
+            # Let sends already in flight finish, also when cancelled.
+            await asyncio.gather(*tasks, return_exceptions=True)
+        duration = loop.time() - started
+    return ReplayReport(results, speed, duration)
+
+
+def summarize_replay(report: ReplayReport) -> dict[str, Any]:
+    """Status agreement and original vs replayed latency percentiles."""
+    results = report.results
+    original = sorted(result.item.elapsed_ms for result in results if result.item.elapsed_ms is not None)
+    replayed = sorted(result.elapsed_ms for result in results if result.elapsed_ms is not None)
+    lags = sorted(result.lag_ms for result in results)
+    return {
+        "requests": len(results),
+        "errors": sum(1 for result in results if result.error is not None),
+        "status_matches": sum(1 for result in results if result.status_matches),
+        "speed": report.speed,
+        "duration_s": report.duration_s,
+        "original_ms": _percentiles(original),
+        "replay_ms": _percentiles(replayed),
+        "lag_ms": {"p95": percentile(lags, 95), "max": lags[-1] if lags else None},
+    }
+
+
+def replay_report_to_json(report: ReplayReport) -> dict[str, Any]:
+    return {
+        "summary": summarize_replay(report),
+        "results": [
+            {
+                "name": result.item.request.name,
+                "method": result.item.request.method,
+                "url": result.url,
+                "scheduled_s": result.scheduled_s,
+                "lag_ms": result.lag_ms,
+                "original": {
+                    "status_code": result.item.status_code,
+                    "elapsed_ms": result.item.elapsed_ms,
+                    "error": result.item.error,
+                },
+                "replay": {
+                    "status_code": result.status_code,
+                    "elapsed_ms": result.elapsed_ms,
+                    "error": result.error,
+                },
+            }
+            for result in report.results
+        ],
+    }
+
+
+def format_replay_report(report: ReplayReport, mismatch_limit: int = 20) -> str:
+    summary = summarize_replay(report)
+    lines = [
+        f"Replayed {summary['requests']} requests at {report.speed:g}x in {report.duration_s:.1f} s: "
+        f"{summary['status_matches']} matching statuses, {summary['errors']} errors",
+        f"{'latency':<10} {'p50':>9} {'p95':>9} {'p99':>9}",
+    ]
+    for label, key in (("original", "original_ms"), ("replay", "replay_ms")):
+        values = summary[key]
+        lines.append(f"{label:<10} {_ms(values['p50'])} {_ms(values['p95'])} {_ms(values['p99'])}")
+    lag = summary["lag_ms"]
+    lines.append(f"schedule lag p95 {_ms(lag['p95']).strip()} ms, max {_ms(lag['max']).strip()} ms")
+    mismatches = [result for result in report.results if not result.status_matches]
+    for result in mismatches[:mismatch_limit]:
+        replayed = result.error or result.status_code
+        original = result.item.error or result.item.status_code
+        lines.append(f"  {result.item.request.method} {result.url}: {original} -> {replayed}")
+    if len(mismatches) > mismatch_limit:
+        lines.append(f"  ... {len(mismatches) - mismatch_limit} more")
+    return "\n".join(lines)
+
+
+def _prepare(request: RequestData, target_base: str | None, variables: Mapping[str, str]) -> RequestData:
+    rendered = render_request(request, variables)
+    if target_base is None:
+        return rendered
+    return replace(rendered, url=retarget_url(rendered.url, target_base))
+
+
+def _har_item(entry: Any) -> tuple[float, ReplayItem]:
+    har_request = entry["request"]
+    timestamp = parse_timestamp(entry["startedDateTime"])
+    if timestamp is None:
+        raise ValueError(f"bad startedDateTime {entry['startedDateTime']!r}")
+    url = har_request["url"]
+    split = urlsplit(url)
+    headers = [
+        (str(header["name"]), str(header["value"]))
+        for header in har_request.get("headers", [])
+        if not str(header["name"]).startswith(":") and str(header["name"]).lower() not in _SKIPPED_HAR_HEADERS
+    ]
+    body = (har_request.get("postData") or {}).get("text") or ""
+    status = (entry.get("response") or {}).get("status")
+    elapsed = entry.get("time")
+    # HAR writers use status 0 for requests that got no response.
+    failed = not isinstance(status, int) or status <= 0
+    request = RequestData(
+        name=split.path or url,
+        method=str(har_request["method"]).upper(),
+        url=url,
+        headers=headers,
+        body=body,
+    )
+    return timestamp, ReplayItem(
+        offset_s=0.0,
+        request=request,
+        status_code=None if failed else status,
+        elapsed_ms=float(elapsed) if isinstance(elapsed, (int, float)) and elapsed >= 0 and not failed else None,
+        error=((entry.get("response") or {}).get("_error") or "no response") if failed else None,
+    )
+
+
+def _percentiles(ordered: list[float]) -> dict[str, float | None]:
+    return {"p50": percentile(ordered, 50), "p95": percentile(ordered, 95), "p99": percentile(ordered, 99)}
+
+
+def _ms(value: float | None) -> str:
+    return f"{value:9.1f}" if value is not None else f"{'-':>9}"
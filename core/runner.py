@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import time
+import xml.etree.ElementTree as ET
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from core.http_client import HttpClient
+from core.logger import get_logger
+from core.model import RequestData, WorkspaceData, WorkspaceRequest
+from core.template import render_request
+from core.workspace_index import KIND_COLLECTION, KIND_FOLDER, KIND_REQUEST, WorkspaceIndex
+
+logger = get_logger("runner")
+
+
+@dataclass(slots=True)
+class RunResult:
+    request_id: str
+    name: str
+    path: str
+    method: str
+    url: str
+    status_code: int | None = None
+    elapsed_ms: int | None = None
+    duration_ms: float = 0.0
+    error: str | None = None
+
+    @property
+    def passed(self) -> bool:
+        return self.error is None and self.status_code is not None and self.status_code < 400
+
+
+def to_request_data(request: WorkspaceRequest) -> RequestData:
+    return RequestData(
+        name=request.name,
+        method=request.method,
+        url=request.url,
+        headers=list(request.headers),
+        params=list(request.params),
+        body=request.body,
+        form_fields=list(request.form_fields),
+        files=list(request.files),
+        body_type=request.body_type,
+        auth=request.auth,
+        timeout_ms=request.timeout_ms,
+        network=request.network,
+    )
+
+
+def select_requests(
+    workspace: WorkspaceData,
+    index: WorkspaceIndex,
+    requests: Iterable[str] = (),
+    folders: Iterable[str] = (),
+    collections: Iterable[str] = (),
+) -> list[WorkspaceRequest]:
+    """Requests matched by id or name, in workspace order.
+
+    Folders and collections select every request below them. With no
+    selectors at all, every request is returned. Raises ``ValueError`` for a
+    selector that matches nothing.
+    """
+    selectors = [
+        *((KIND_REQUEST, value) for value in requests),
+        *((KIND_FOLDER, value) for value in folders),
+        *((KIND_COLLECTION, value) for value in collections),
+    ]
+    if not selectors:
+        return list(workspace.requests)
+
+    selected: set[str] = set()
+    for kind, value in selectors:
+        matches = _match_nodes(index, kind, value)
+        if not matches:
+            raise ValueError(f"No {kind} matches {value!r}")
+        for node_id in matches:
+            selected.update(index.subtree_ids(node_id))
+    return [request for request in workspace.requests if request.id in selected]
+
+
+def request_path(index: WorkspaceIndex, request_id: str) -> str:
+    """Collection and folder names above a request, joined with " / "."""
+    names = []
+    for node_id in index.ancestors(request_id):
+        node = index.node(node_id)
+        if node is not None:
+            names.append(node.name)
+    return " / ".join(names)
+
+
+def run_requests(
+    requests: Sequence[WorkspaceRequest],
+    variables: Mapping[str, str],
+    index: WorkspaceIndex | None = None,
+    concurrency: int = 4,
+    http_client: HttpClient | None = None,
+    on_result: Callable[[RunResult], None] | None = None,
+) -> list[RunResult]:
+    """Send ``requests`` with up to ``concurrency`` in flight; results keep input order.
+
+    ``on_result`` is called from worker threads as each request completes.
+    """
+    client = http_client or HttpClient()
+
+    def _run(request: WorkspaceRequest) -> RunResult:
+        rendered = render_request(to_request_data(request), variables)
+        result = RunResult(
+            request_id=request.id,
+            name=request.name,
+            path=request_path(index, request.id) if index is not None else "",
+            method=rendered.method,
+            url=rendered.url,
+        )
+        started = time.perf_counter()
+        try:
+            with client.create_client(rendered) as http:
+                response = client.send(rendered, http)
+        except Exception as exc:
+            logger.info("Request '%s' failed: %s", request.name, exc)
+            result.error = str(exc) or type(exc).__name__
+        else:
+            result.status_code = response.status_code
+            result.elapsed_ms = response.elapsed_ms
+        result.duration_ms = (time.perf_counter() - started) * 1000.0
+        if on_result is not None:
+            on_result(result)
+        return result
+
+    if not requests:
+        return []
+    with ThreadPoolExecutor(max_workers=max(1, concurrency), thread_name_prefix="runner") as pool:
+        return list(pool.map(_run, requests))
+
+
+def results_to_json(results: Sequence[RunResult], **metadata: Any) -> dict[str, Any]:
+    passed = sum(1 for result in results if result.passed)
+    return {
+        **metadata,
+        "summary": {"total": len(results), "passed": passed, "failed": len(results) - passed},
+        "results": [{**asdict(result), "passed": result.passed} for result in results],
+    }
+
+
+def results_to_junit(results: Sequence[RunResult], suite_name: str) -> str:
+    """JUnit XML: HTTP errors (>= 400) are failures, transport errors are errors."""
+    failures = sum(1 for result in results if result.error is None and not result.passed)
+    errors = sum(1 for result in results if result.error is not None)
+    total_seconds = sum(result.duration_ms for result in results) / 1000.0
+
+    suites = ET.Element("testsuites")
+    suite = ET.SubElement(
+        suites,
+        "testsuite",
+        name=suite_name,
+        tests=str(len(results)),
+        failures=str(failures),
+        errors=str(errors),
+        time=f"{total_seconds:.3f}",
+    )
+    for result in results:
+        case = ET.SubElement(
+            suite,
+            "testcase",
+            classname=result.path or suite_name,
+            name=result.name,
+            time=f"{result.duration_ms / 1000.0:.3f}",
+        )
+        if result.error is not None:
+            error = ET.SubElement(case, "error", message=result.error)
+            error.text = f"{result.method} {result.url}"
+        elif not result.passed:
+            failure = ET.SubElement(case, "failure", message=f"HTTP {result.status_code}")
+            failure.text = f"{result.method} {result.url} -> {result.status_code}"
+    ET.indent(suites)
+    return ET.tostring(suites, encoding="unicode", xml_declaration=True)
+
+
+def _match_nodes(index: WorkspaceIndex, kind: str, value: str) -> list[str]:
+    node = index.node(value)
+    if node is not None and node.kind == kind:
+        return [value]
+    matches = []
+    pending = list(index.roots())
+    while pending:
+        node_id = pending.pop()
+        node = index.node(node_id)
+        if node is None:
+            continue
+        if node.kind == kind and node.name == value:
+            matches.append(node_id)
+        pending.extend(node.children)
+    return matches
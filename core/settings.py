@@ -1,57 +1,281 @@
+from __future__ import annotations
+
+import copy
 import json
 import sys
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 from core.logger import get_logger
+from core.storage.json_storage import atomic_write_json
 
 logger = get_logger("settings")
 
+# Changes are written this long after the last setValue() call, so a burst
+# of updates (e.g. closing the window) ends up as one write.
+SETTINGS_WRITE_DELAY_S = 1.0
+
+SettingsListener = Callable[[str, Any], None]
+
+
+@dataclass(frozen=True, slots=True)
+class SettingSpec:
+    key: str
+    kind: type | None
+    default: Any
+    minimum: int | None = None
+
+    def coerce(self, value: Any) -> Any:
+        """Return ``value`` as this setting's type, or the default if it cannot be."""
+        if value is None:
+            return copy.deepcopy(self.default)
+        if self.kind is None:
+            return value
+        if self.kind is int:
+            if isinstance(value, bool):
+                return self.default
+            try:
+                number = int(value)
+            except (TypeError, ValueError):
+                return self.default
+            if self.minimum is not None and number < self.minimum:
+                return self.default
+            return number
+        if isinstance(value, self.kind):
+            return value
+        return copy.deepcopy(self.default)
+
+
+SETTINGS_SCHEMA: dict[str, SettingSpec] = {
+    spec.key: spec
+    for spec in (
+        SettingSpec("default_timeout_ms", int, 10000, minimum=1),
+        SettingSpec("history_max_items", int, 100, minimum=1),
+        SettingSpec("editor_font_size", int, 12, minimum=1),
+        SettingSpec("response_preview_limit_kb", int, 1024, minimum=1),
+        SettingSpec("request_max_open_tabs", int, 12, minimum=1),
+        SettingSpec("history_body_capture_kb", int, 0, minimum=0),
+        SettingSpec("max_concurrent_requests", int, 4, minimum=1),
+        SettingSpec(
+            "diff_ignore_fields",
+            list,
+            ["timestamp", "date", "request_id", "requestId", "trace_id", "traceId"],
+        ),
+        # str level names and numeric levels are both accepted.
+        SettingSpec("log_level", None, "INFO"),
+        SettingSpec("log_levels", dict, {}),
+        SettingSpec("log_path", str, None),
+        SettingSpec("log_max_bytes", int, 5 * 1024 * 1024, minimum=0),
+        SettingSpec("log_backup_count", int, 3, minimum=0),
+        SettingSpec("last_workspace", str, None),
+        SettingSpec("window", dict, None),
+        # Last Monitor dialog form: checked request ids, interval and alert rule.
+        SettingSpec("monitor", dict, {}),
+        # UI thread overdue by more than this is logged as a stall; 0 turns the watchdog off.
+        SettingSpec("stall_threshold_ms", int, 250, minimum=0),
+    )
+}
+
 
 class AppSettings:
     """
-    A simple JSON-based settings manager that mimics a subset of QSettings API.
-    Saves configuration to 'conf/settings.json' relative to the current working directory.
+    A JSON-based settings manager that mimics a subset of QSettings API.
+    Saves configuration to 'conf/settings.json' next to the project (or the
+    executable when frozen).
+
+    The file is read once; afterwards all reads are served from memory.
+    ``setValue`` notifies listeners immediately and schedules a debounced
+    write on a background thread. ``close()`` stops the writer and does the
+    final atomic write, so the UI thread never waits on disk except at
+    shutdown. Keys listed in ``SETTINGS_SCHEMA`` are type-checked on read and
+    fall back to their default.
     """
 
-    def __init__(self, filename: str = "settings.json") -> None:
-        if getattr(sys, "frozen", False):
-            # If frozen, store settings relative to the executable (or _internal)
-            # For robustness, let's use the executable dir's parent if it's in a subfolder,
-            # but usually for one-dir builds, executable is in the root of dist/app.
-            # safe option: sys.executable directory
-            base_path = Path(sys.executable).parent
+    def __init__(
+        self,
+        filename: str = "settings.json",
+        settings_path: str | Path | None = None,
+        write_delay: float = SETTINGS_WRITE_DELAY_S,
+    ) -> None:
+        if settings_path is not None:
+            self._settings_path = Path(settings_path)
         else:
-            # If source, use project root (parent of core/)
-            base_path = Path(__file__).resolve().parent.parent
+            if getattr(sys, "frozen", False):
+                # If frozen, store settings relative to the executable (or _internal)
+                # For robustness, let's use the executable dir's parent if it's in a subfolder,
+                # but usually for one-dir builds, executable is in the root of dist/app.
+                # safe option: sys.executable directory
+                base_path = Path(sys.executable).parent
+            else:
+                # If source, use project root (parent of core/)
+                base_path = Path(__file__).resolve().parent.parent
+            self._settings_path = base_path / "conf" / filename
 
-        self._conf_dir = base_path / "conf"
-        self._settings_path = self._conf_dir / filename
+        self._write_delay = write_delay
         self._data: dict[str, Any] = {}
+        self._listeners: list[SettingsListener] = []
+        # _lock guards _data and the dirty/deadline state; _write_lock keeps
+        # the writer thread and flush() from writing at the same time.
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._write_lock = threading.Lock()
+        self._dirty = False
+        self._deadline = 0.0
+        self._closed = False
+        self._writer: threading.Thread | None = None
         self._load()
 
+    @property
+    def path(self) -> Path:
+        return self._settings_path
+
     def _load(self) -> None:
-        if not self._settings_path.exists():
-            return
+        if self._settings_path.exists():
+            try:
+                with open(self._settings_path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if not isinstance(data, dict):
+                    raise ValueError("settings root must be an object")
+                self._data = data
+            except Exception as e:
+                logger.error(f"Failed to load settings from {self._settings_path}: {e}")
+                self._data = {}
+
+        # Seed missing schema defaults so users can find them in the file.
+        missing = [
+            spec for spec in SETTINGS_SCHEMA.values()
+            if spec.key not in self._data and spec.default is not None
+        ]
+        for spec in missing:
+            self._data[spec.key] = copy.deepcopy(spec.default)
+        if missing:
+            with self._lock:
+                self._schedule_write()
+
+    def value(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            if key not in self._data:
+                return default
+            value = self._data[key]
+        spec = SETTINGS_SCHEMA.get(key)
+        if spec is None:
+            return value
+        coerced = spec.coerce(value)
+        return default if coerced is None else coerced
+
+    def get(self, key: str) -> Any:
+        """Typed read of a schema key, falling back to its default."""
+        spec = SETTINGS_SCHEMA[key]
+        with self._lock:
+            value = self._data.get(key)
+        return spec.coerce(value)
 
+    def setValue(self, key: str, value: Any) -> None:
+        value = copy.deepcopy(value)
+        with self._lock:
+            if key in self._data and self._data[key] == value:
+                return
+            self._data[key] = value
+            self._schedule_write()
+            closed = self._closed
+        if closed:
+            # The background writer has stopped; write now rather than lose the change.
+            logger.warning("Setting %s changed after settings were closed; writing it immediately", key)
+            self.flush()
+        for listener in list(self._listeners):
+            try:
+                listener(key, value)
+            except Exception:
+                logger.exception("Settings listener failed for %s", key)
+
+    def add_listener(self, listener: SettingsListener) -> None:
+        """Call ``listener(key, value)`` on the thread that called setValue() after each change."""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: SettingsListener) -> None:
         try:
-            with open(self._settings_path, "r", encoding="utf-8") as f:
-                self._data = json.load(f)
-        except Exception as e:
-            logger.error(f"Failed to load settings from {self._settings_path}: {e}")
-            self._data = {}
+            self._listeners.remove(listener)
+        except ValueError:
+            pass
+
+    def is_dirty(self) -> bool:
+        with self._lock:
+            return self._dirty
+
+    def flush(self) -> None:
+        """Write pending changes now, on the calling thread."""
+        with self._write_lock:
+            with self._lock:
+                if not self._dirty:
+                    return
+                payload = copy.deepcopy(self._data)
+                self._dirty = False
+            self._write(payload)
+
+    def close(self) -> None:
+        """Stop the background writer and write any pending changes.
+
+        Later setValue() calls still work but write synchronously.
+        """
+        with self._lock:
+            self._closed = True
+            self._changed.notify_all()
+            writer = self._writer
+        if writer is not None:
+            writer.join()
+        self.flush()
 
-    def _save(self) -> None:
+    def _schedule_write(self) -> None:
+        # Called with _lock held.
+        self._dirty = True
+        self._deadline = time.monotonic() + self._write_delay
+        if self._closed:
+            return
+        if self._writer is None:
+            self._writer = threading.Thread(
+                target=self._run_writer, name="settings-writer", daemon=True
+            )
+            self._writer.start()
+        self._changed.notify_all()
+
+    def _run_writer(self) -> None:
+        while True:
+            with self._lock:
+                while not self._closed:
+                    if not self._dirty:
+                        self._changed.wait()
+                        continue
+                    remaining = self._deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._changed.wait(remaining)
+                if self._closed:
+                    return
+            self.flush()
+
+    def _write(self, payload: dict[str, Any]) -> None:
         try:
-            self._conf_dir.mkdir(parents=True, exist_ok=True)
-            with open(self._settings_path, "w", encoding="utf-8") as f:
-                json.dump(self._data, f, indent=4, ensure_ascii=False)
+            atomic_write_json(self._settings_path, payload)
         except Exception as e:
             logger.error(f"Failed to save settings to {self._settings_path}: {e}")
+            # Keep the changes pending and retry after another delay.
+            with self._lock:
+                self._dirty = True
+                self._deadline = time.monotonic() + self._write_delay
 
-    def value(self, key: str, default: Any = None) -> Any:
-        return self._data.get(key, default)
 
-    def setValue(self, key: str, value: Any) -> None:
-        self._data[key] = value
-        self._save()
+_shared_settings: AppSettings | None = None
+_shared_lock = threading.Lock()
+
+
+def get_settings() -> AppSettings:
+    """Return the process-wide settings instance, loading it on first use."""
+    global _shared_settings
+    with _shared_lock:
+        if _shared_settings is None:
+            _shared_settings = AppSettings()
+        return _shared_settings
@@ -0,0 +1,309 @@
+"""Detect event-loop stalls on the UI thread and record where they happen.
+
+The UI thread calls ``StallWatchdog.beat()`` from a repeating timer. A
+background thread checks how long ago the last beat was; once the UI thread
+is overdue by more than the threshold it captures that thread's Python stack
+(``sys._current_frames``), so the record shows what was running while the
+loop was blocked rather than after it recovered. The stall is logged and
+added to ``StallStats`` when the next beat arrives, with its full duration;
+a stall in code that never released the GIL is still counted, without a stack.
+
+Timer lateness of every beat is kept as event-loop latency, so short hitches
+below the threshold still show up in the percentiles.
+"""
+
+from __future__ import annotations
+
+import datetime
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from core.analytics import percentile
+from core.logger import get_logger
+
+logger = get_logger("stall")
+
+DEFAULT_HEARTBEAT_MS = 100
+DEFAULT_THRESHOLD_MS = 250
+RECENT_STALL_LIMIT = 50
+LATENCY_SAMPLE_LIMIT = 2000
+MAX_STACK_FRAMES = 40
+# Location of stalls whose stack could not be taken: the blocked code held the
+# GIL (a long regex, json.loads, sort...), so the checker thread never ran.
+UNAVAILABLE_LOCATION = "<stack unavailable (GIL held)>"
+
+_PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+
+@dataclass(frozen=True, slots=True)
+class StallRecord:
+    # Wall-clock time the UI thread stopped responding.
+    started_at: datetime.datetime
+    duration_ms: float
+    # Innermost project frame, "path:line in function"; groups hot spots.
+    location: str
+    # Formatted frames, outermost first, as from ``traceback.format_list``.
+    stack: tuple[str, ...]
+
+
+@dataclass(slots=True)
+class HotSpot:
+    location: str
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    # Stack of the longest stall seen here.
+    stack: tuple[str, ...] = ()
+
+    def add(self, record: StallRecord) -> None:
+        self.count += 1
+        self.total_ms += record.duration_ms
+        if record.duration_ms >= self.max_ms:
+            self.max_ms = record.duration_ms
+            self.stack = record.stack
+
+
+@dataclass(slots=True)
+class StallStats:
+    """Stall totals, hot spots by location and recent event-loop latency."""
+
+    beats: int = 0
+    stall_count: int = 0
+    stall_total_ms: float = 0.0
+    stall_max_ms: float = 0.0
+    hot_spots: dict[str, HotSpot] = field(default_factory=dict)
+    recent: deque[StallRecord] = field(default_factory=lambda: deque(maxlen=RECENT_STALL_LIMIT))
+    latencies_ms: deque[float] = field(default_factory=lambda: deque(maxlen=LATENCY_SAMPLE_LIMIT))
+
+    def add_latency(self, latency_ms: float) -> None:
+        self.beats += 1
+        self.latencies_ms.append(latency_ms)
+
+    def add_stall(self, record: StallRecord) -> None:
+        self.stall_count += 1
+        self.stall_total_ms += record.duration_ms
+        self.stall_max_ms = max(self.stall_max_ms, record.duration_ms)
+        self.recent.append(record)
+        self.hot_spots.setdefault(record.location, HotSpot(record.location)).add(record)
+
+    def latency_percentiles(self) -> dict[str, float | None]:
+        ordered = sorted(self.latencies_ms)
+        return {"p50": percentile(ordered, 50), "p95": percentile(ordered, 95), "p99": percentile(ordered, 99)}
+
+    def top_hot_spots(self, limit: int | None = None) -> list[HotSpot]:
+        """Hot spots by total blocked time, worst first."""
+        ordered = sorted(self.hot_spots.values(), key=lambda spot: (-spot.total_ms, -spot.count, spot.location))
+        return ordered if limit is None else ordered[:limit]
+
+    def copy(self) -> StallStats:
+        return StallStats(
+            beats=self.beats,
+            stall_count=self.stall_count,
+            stall_total_ms=self.stall_total_ms,
+            stall_max_ms=self.stall_max_ms,
+            hot_spots={
+                key: HotSpot(spot.location, spot.count, spot.total_ms, spot.max_ms, spot.stack)
+                for key, spot in self.hot_spots.items()
+            },
+            recent=deque(self.recent, maxlen=RECENT_STALL_LIMIT),
+            latencies_ms=deque(self.latencies_ms, maxlen=LATENCY_SAMPLE_LIMIT),
+        )
+
+
+class StallWatchdog:
+    """Watches a thread that is expected to call ``beat()`` every ``heartbeat_ms``.
+
+    ``threshold_ms`` is how far past its next expected beat the thread may
+    fall before it counts as stalled. ``thread_id`` defaults to the thread
+    that creates the watchdog. ``on_stall`` is called from the thread that
+    calls ``beat()``, after the stall has been recorded.
+    """
+
+    def __init__(
+        self,
+        threshold_ms: float = DEFAULT_THRESHOLD_MS,
+        heartbeat_ms: float = DEFAULT_HEARTBEAT_MS,
+        thread_id: int | None = None,
+        on_stall: Callable[[StallRecord], None] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if threshold_ms <= 0 or heartbeat_ms <= 0:
+            raise ValueError("threshold and heartbeat interval must be positive")
+        self._threshold_s = threshold_ms / 1000.0
+        self._heartbeat_s = heartbeat_ms / 1000.0
+        self._thread_id = threading.get_ident() if thread_id is None else thread_id
+        self._on_stall = on_stall
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._stats = StallStats()
+        self._last_beat: float | None = None
+        # Set by the checker thread while the watched thread is stalled.
+        self._pending_stack: tuple[str, ...] | None = None
+        self._pending_location = ""
+
+    @property
+    def threshold_ms(self) -> float:
+        return self._threshold_s * 1000.0
+
+    @property
+    def heartbeat_ms(self) -> float:
+        return self._heartbeat_s * 1000.0
+
+    def set_threshold(self, threshold_ms: float) -> None:
+        if threshold_ms <= 0:
+            raise ValueError("threshold must be positive")
+        with self._lock:
+            self._threshold_s = threshold_ms / 1000.0
+
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self._thread is not None:
+            raise RuntimeError("stall watchdog already started")
+        with self._lock:
+            self._last_beat = self._clock()
+        self._thread = threading.Thread(target=self._run, name="stall-watchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def stats(self) -> StallStats:
+        """A copy that is safe to read while the watchdog keeps running."""
+        with self._lock:
+            return self._stats.copy()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats = StallStats()
+
+    def beat(self) -> None:
+        """Call from the watched thread on every heartbeat."""
+        now = self._clock()
+        record: StallRecord | None = None
+        with self._lock:
+            if self._last_beat is None:
+                self._last_beat = now
+                return
+            late_s = max(0.0, now - self._last_beat - self._heartbeat_s)
+            self._last_beat = now
+            self._stats.add_latency(late_s * 1000.0)
+            stack = self._pending_stack
+            if late_s > self._threshold_s:
+                started_at = datetime.datetime.now() - datetime.timedelta(seconds=late_s)
+                if stack is None:
+                    record = StallRecord(started_at, late_s * 1000.0, UNAVAILABLE_LOCATION, ())
+                else:
+                    record = StallRecord(started_at, late_s * 1000.0, self._pending_location, stack)
+                self._stats.add_stall(record)
+            self._pending_stack = None
+        if record is None:
+            return
+        logger.warning("UI thread stalled for %.0f ms at %s", record.duration_ms, record.location)
+        logger.debug("Stack of the stalled UI thread:\n%s", "".join(record.stack))
+        if self._on_stall is not None:
+            self._on_stall(record)
+
+    def check(self) -> bool:
+        """Capture the watched thread's stack if it is overdue; True when it is.
+
+        Called by the checker thread; exposed so tests can drive it directly.
+        """
+        now = self._clock()
+        with self._lock:
+            if self._last_beat is None:
+                return False
+            overdue_s = now - self._last_beat - self._heartbeat_s
+            if overdue_s <= self._threshold_s:
+                return False
+            if self._pending_stack is not None:
+                return True
+        frames = capture_stack(self._thread_id)
+        location = hot_spot_location(frames)
+        with self._lock:
+            # The thread may have caught up while its stack was being taken.
+            if self._last_beat is None or now - self._last_beat - self._heartbeat_s <= self._threshold_s:
+                return False
+            self._pending_stack = tuple(traceback.format_list(frames))
+            self._pending_location = location
+        # Logged now as well, in case the thread never recovers.
+        logger.info("UI thread blocked for more than %.0f ms at %s", overdue_s * 1000.0, location)
+        return True
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._poll_interval()):
+            try:
+                self.check()
+            except Exception:  # never let diagnostics take the app down
+                logger.exception("Stall check failed")
+
+    def _poll_interval(self) -> float:
+        with self._lock:
+            return min(0.05, max(0.01, self._threshold_s / 4))
+
+
+def capture_stack(thread_id: int) -> traceback.StackSummary:
+    """The current stack of ``thread_id``, outermost frame first (empty if it has exited)."""
+    frame = sys._current_frames().get(thread_id)
+    if frame is None:
+        return traceback.StackSummary()
+    summary = traceback.extract_stack(frame, limit=MAX_STACK_FRAMES)
+    del frame
+    return summary
+
+
+def hot_spot_location(frames: traceback.StackSummary) -> str:
+    """The innermost frame in this project's code, or the innermost frame at all.
+
+    Blocking usually happens inside Qt or a library; the project line that
+    called into it is what can be fixed.
+    """
+    if not frames:
+        return "<unknown>"
+    chosen = frames[-1]
+    for frame in reversed(frames):
+        path = Path(frame.filename)
+        if path.is_relative_to(_PROJECT_ROOT) and "site-packages" not in path.parts:
+            chosen = frame
+            break
+    path = Path(chosen.filename)
+    name = path.relative_to(_PROJECT_ROOT).as_posix() if path.is_relative_to(_PROJECT_ROOT) else path.name
+    return f"{name}:{chosen.lineno} in {chosen.name}"
+
+
+def format_report(stats: StallStats, threshold_ms: float | None = None) -> str:
+    """Plain-text summary for the log or a bug report."""
+    latency = stats.latency_percentiles()
+    lines = ["UI stall report"]
+    if threshold_ms is not None:
+        lines.append(f"threshold: {threshold_ms:.0f} ms")
+    lines.append(
+        f"stalls: {stats.stall_count}, blocked {stats.stall_total_ms:.0f} ms in total, "
+        f"longest {stats.stall_max_ms:.0f} ms"
+    )
+    lines.append(
+        f"event-loop latency over {len(stats.latencies_ms)} beats: "
+        + ", ".join(f"{key} {_format_ms(value)}" for key, value in latency.items())
+    )
+    for spot in stats.top_hot_spots():
+        lines.append("")
+        lines.append(
+            f"{spot.location}: {spot.count} stalls, {spot.total_ms:.0f} ms total, longest {spot.max_ms:.0f} ms"
+        )
+        lines.extend(line.rstrip("\n") for line in spot.stack)
+    return "\n".join(lines)
+
+
+def _format_ms(value: float | None) -> str:
+    return "-" if value is None else f"{value:.1f} ms"
@@ -0,0 +1,179 @@
+"""Small two-sample statistics used for latency comparisons.
+
+Only the standard library is used: the t distribution goes through the
+regularized incomplete beta function and the Mann-Whitney U test uses the
+tie-corrected normal approximation, which is accurate for the sample sizes
+the comparison collects (tens or more per side).
+"""
+
+from __future__ import annotations
+
+import math
+import statistics
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+_BETA_MAX_ITERATIONS = 200
+_BETA_EPSILON = 3e-14
+
+
+@dataclass(frozen=True, slots=True)
+class WelchResult:
+    t: float
+    df: float
+    p_value: float
+    # Mean of ``b`` minus mean of ``a``, with its confidence interval.
+    difference: float
+    ci_low: float
+    ci_high: float
+
+
+@dataclass(frozen=True, slots=True)
+class MannWhitneyResult:
+    u: float
+    z: float
+    p_value: float
+
+
+def mean_confidence_interval(samples: Sequence[float], confidence: float = 0.95) -> tuple[float, float]:
+    """Student t interval for the mean; collapses to the mean for fewer than 2 samples."""
+    if 0 == len(samples):
+        raise ValueError("no samples")
+    center = statistics.fmean(samples)
+    if len(samples) < 2:
+        return center, center
+    half_width = t_ppf(0.5 + confidence / 2.0, len(samples) - 1) * statistics.stdev(samples) / math.sqrt(
+        len(samples)
+    )
+    return center - half_width, center + half_width
+
+
+def welch_t_test(a: Sequence[float], b: Sequence[float], confidence: float = 0.95) -> WelchResult:
+    """Two-sided Welch's t-test for a difference in means (unequal variances)."""
+    if len(a) < 2 or len(b) < 2:
+        raise ValueError("each sample needs at least 2 values")
+    mean_a, mean_b = statistics.fmean(a), statistics.fmean(b)
+    var_a, var_b = statistics.variance(a), statistics.variance(b)
+    se_a, se_b = var_a / len(a), var_b / len(b)
+    difference = mean_b - mean_a
+    standard_error = math.sqrt(se_a + se_b)
+    if 0.0 == standard_error:
+        # Both samples are constant: the means either match exactly or differ for certain.
+        if 0.0 == difference:
+            return WelchResult(0.0, math.inf, 1.0, 0.0, 0.0, 0.0)
+        return WelchResult(math.copysign(math.inf, difference), math.inf, 0.0, difference, difference, difference)
+    df = (se_a + se_b) ** 2 / (se_a**2 / (len(a) - 1) + se_b**2 / (len(b) - 1))
+    t = difference / standard_error
+    p_value = 2.0 * t_sf(abs(t), df)
+    half_width = t_ppf(0.5 + confidence / 2.0, df) * standard_error
+    return WelchResult(t, df, min(1.0, p_value), difference, difference - half_width, difference + half_width)
+
+
+def mann_whitney_u(a: Sequence[float], b: Sequence[float]) -> MannWhitneyResult:
+    """Two-sided Mann-Whitney U test (normal approximation with tie correction).
+
+    ``u`` counts pairs where the ``b`` value is larger, so ``u > n_a * n_b / 2``
+    means ``b`` tends to be slower.
+    """
+    n_a, n_b = len(a), len(b)
+    if 0 == n_a or 0 == n_b:
+        raise ValueError("both samples need values")
+    ranks, tie_term = _ranks([*a, *b])
+    rank_sum_b = sum(ranks[n_a:])
+    u = rank_sum_b - n_b * (n_b + 1) / 2.0
+    total = n_a + n_b
+    mean_u = n_a * n_b / 2.0
+    variance = n_a * n_b / 12.0 * ((total + 1) - tie_term / (total * (total - 1)))
+    if variance <= 0.0:
+        return MannWhitneyResult(u, 0.0, 1.0)
+    # Continuity correction towards the mean.
+    z = (u - mean_u - math.copysign(0.5, u - mean_u)) / math.sqrt(variance) if u != mean_u else 0.0
+    p_value = math.erfc(abs(z) / math.sqrt(2.0))
+    return MannWhitneyResult(u, z, min(1.0, p_value))
+
+
+def t_sf(t: float, df: float) -> float:
+    """Survival function P(T > t) of Student's t distribution, for t >= 0."""
+    if math.isinf(df):
+        return 0.5 * math.erfc(t / math.sqrt(2.0))
+    x = df / (df + t * t)
+    return 0.5 * _regularized_beta(df / 2.0, 0.5, x)
+
+
+def t_ppf(q: float, df: float) -> float:
+    """Quantile function of Student's t distribution, by bisection on ``t_sf``."""
+    if not 0.0 < q < 1.0:
+        raise ValueError("q must be in (0, 1)")
+    if q < 0.5:
+        return -t_ppf(1.0 - q, df)
+    target = 1.0 - q
+    low, high = 0.0, 1.0
+    while t_sf(high, df) > target:
+        high *= 2.0
+    for _ in range(100):
+        middle = (low + high) / 2.0
+        if t_sf(middle, df) > target:
+            low = middle
+        else:
+            high = middle
+        if high - low < 1e-10:
+            break
+    return (low + high) / 2.0
+
+
+def _ranks(values: list[float]) -> tuple[list[float], float]:
+    """Average ranks (1-based) and the tie correction term sum(t^3 - t)."""
+    order = sorted(range(len(values)), key=values.__getitem__)
+    ranks = [0.0] * len(values)
+    tie_term = 0.0
+    start = 0
+    while start < len(order):
+        end = start
+        while end + 1 < len(order) and values[order[end + 1]] == values[order[start]]:
+            end += 1
+        average = (start + end) / 2.0 + 1.0
+        for position in range(start, end + 1):
+            ranks[order[position]] = average
+        size = end - start + 1
+        tie_term += size**3 - size
+        start = end + 1
+    return ranks, tie_term
+
+
+def _regularized_beta(a: float, b: float, x: float) -> float:
+    if x <= 0.0:
+        return 0.0
+    if x >= 1.0:
+        return 1.0
+    log_front = math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b) + a * math.log(x) + b * math.log1p(-x)
+    # The continued fraction converges fastest on this side of the mean.
+    if x < (a + 1.0) / (a + b + 2.0):
+        return math.exp(log_front) * _beta_continued_fraction(a, b, x) / a
+    return 1.0 - math.exp(log_front) * _beta_continued_fraction(b, a, 1.0 - x) / b
+
+
+def _beta_continued_fraction(a: float, b: float, x: float) -> float:
+    # Modified Lentz's method.
+    tiny = 1e-300
+    c = 1.0
+    d = 1.0 - (a + b) * x / (a + 1.0)
+    d = 1.0 / (d if abs(d) > tiny else tiny)
+    result = d
+    for m in range(1, _BETA_MAX_ITERATIONS + 1):
+        m2 = 2 * m
+        numerator = m * (b - m) * x / ((a + m2 - 1.0) * (a + m2))
+        d = 1.0 + numerator * d
+        d = 1.0 / (d if abs(d) > tiny else tiny)
+        c = 1.0 + numerator / c
+        c = c if abs(c) > tiny else tiny
+        result *= d * c
+        numerator = -(a + m) * (a + b + m) * x / ((a + m2) * (a + m2 + 1.0))
+        d = 1.0 + numerator * d
+        d = 1.0 / (d if abs(d) > tiny else tiny)
+        c = 1.0 + numerator / c
+        c = c if abs(c) > tiny else tiny
+        delta = d * c
+        result *= delta
+        if abs(delta - 1.0) < _BETA_EPSILON:
+            break
+    return result
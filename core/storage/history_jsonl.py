@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import os
+from collections import deque
 from pathlib import Path
 from typing import Any
 
@@ -31,20 +32,24 @@ def load_history_entries(path: str | Path, limit: int | None = None) -> list[His
     if not target_path.exists():
         return []
 
-    entries: list[HistoryEntry] = []
+    # Only the newest ``limit`` lines are parsed; older ones are skipped
+    # without decoding JSON.
+    maxlen = limit if limit is not None and limit > 0 else None
+    lines: deque[tuple[int, str]] = deque(maxlen=maxlen)
     with target_path.open(mode="r", encoding="utf-8") as file_handle:
         for line_number, line in enumerate(file_handle, start=1):
             payload_text = line.strip()
             if 0 == len(payload_text):
                 continue
-            try:
-                payload = json.loads(payload_text)
-                entries.append(_history_from_dict(payload))
-            except Exception:
-                logger.exception("Failed to parse history line %s", line_number)
-    
-    if limit is not None and limit > 0:
-        return entries[-limit:]
+            lines.append((line_number, payload_text))
+
+    entries: list[HistoryEntry] = []
+    for line_number, payload_text in lines:
+        try:
+            payload = json.loads(payload_text)
+            entries.append(_history_from_dict(payload))
+        except Exception:
+            logger.exception("Failed to parse history line %s", line_number)
     return entries
 
 
@@ -66,6 +71,8 @@ def _history_to_dict(entry: HistoryEntry) -> dict[str, Any]:
         payload["elapsed_ms"] = entry.elapsed_ms
     if entry.error:
         payload["error"] = entry.error
+    if entry.response_body is not None:
+        payload["response_body"] = entry.response_body
     return payload
 
 
@@ -80,6 +87,7 @@ def _history_from_dict(payload: Any) -> HistoryEntry:
         status_code=_optional_int(payload, "status_code"),
         elapsed_ms=_optional_int(payload, "elapsed_ms"),
         error=_optional_str(payload, "error"),
+        response_body=_optional_str(payload, "response_body"),
     )
 
 
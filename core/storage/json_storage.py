@@ -37,7 +37,7 @@ class JsonWorkspaceStorage(WorkspaceStorage):
 
     def save(self, path: Path, workspace: WorkspaceData) -> None:
         payload = _workspace_to_dict(workspace, schema_version=self._schema_version)
-        _atomic_write_json(path, payload)
+        atomic_write_json(path, payload)
 
 
 def load_workspace(path: str | Path) -> WorkspaceData:
@@ -231,6 +231,7 @@ def _network_to_dict(network: NetworkConfig) -> dict[str, Any]:
         "verify_ssl": network.verify_ssl,
         "follow_redirects": network.follow_redirects,
         "trust_env": network.trust_env,
+        "simulate": network.simulate,
     }
 
 
@@ -240,6 +241,7 @@ def _network_from_dict(payload: dict[str, Any]) -> NetworkConfig:
         verify_ssl=_read_bool(payload, "verify_ssl", default=True),
         follow_redirects=_read_bool(payload, "follow_redirects", default=False),
         trust_env=_read_bool(payload, "trust_env", default=True),
+        simulate=_read_str(payload.get("simulate")) or "",
     )
 
 
@@ -260,7 +262,7 @@ def _pairs_from_dict_list(items: Any) -> list[tuple[str, str]]:
     return result
 
 
-def _atomic_write_json(path: Path, payload: dict[str, Any]) -> None:
+def atomic_write_json(path: Path, payload: dict[str, Any]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
 
     # Use mkstemp instead of NamedTemporaryFile to avoid file locking issues on Windows
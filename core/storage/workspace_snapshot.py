@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+import gc
+import hashlib
+import marshal
+import os
+import struct
+import sys
+import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from core.logger import get_logger
+from core.model import (
+    AuthConfig,
+    AuthType,
+    EnvironmentScope,
+    NetworkConfig,
+    WorkspaceCollection,
+    WorkspaceData,
+    WorkspaceEnvironment,
+    WorkspaceFolder,
+    WorkspaceRequest,
+)
+from core.workspace_index import WorkspaceIndex
+
+# Bump when the row layout below changes. marshal output is only stable
+# within one Python version, so the interpreter version is part of the key.
+SNAPSHOT_FORMAT = 2
+_MAGIC = b"RCWS"
+_HEADER_SIZE = struct.Struct("<I")
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+logger = get_logger("workspace_snapshot")
+
+
+@dataclass(frozen=True, slots=True)
+class SnapshotKey:
+    path: str
+    size: int
+    mtime_ns: int
+    sha256: str
+
+
+@dataclass(slots=True)
+class WorkspaceSnapshot:
+    workspace: WorkspaceData
+    index: WorkspaceIndex
+
+
+def snapshot_key(path: str | Path) -> SnapshotKey:
+    target_path = Path(path).resolve()
+    stat = target_path.stat()
+    digest = hashlib.sha256()
+    with target_path.open("rb") as file_handle:
+        while chunk := file_handle.read(_HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return SnapshotKey(str(target_path), stat.st_size, stat.st_mtime_ns, digest.hexdigest())
+
+
+def default_snapshot_dir() -> Path:
+    project_root = Path(__file__).resolve().parents[2]
+    return project_root / "cache" / "workspace"
+
+
+class WorkspaceSnapshotCache:
+    """Binary snapshots of parsed workspaces, keyed by the source file.
+
+    A snapshot stores the ``WorkspaceData`` and the ``WorkspaceIndex`` built
+    from it as plain tuples in ``marshal`` format, which loads several times
+    faster than parsing and validating the JSON. A snapshot is used only
+    when the file's path, size, mtime and SHA-256 all still match; size and
+    mtime are compared first so a stale snapshot is rejected without
+    hashing.
+    """
+
+    def __init__(self, cache_dir: str | Path | None = None) -> None:
+        self._cache_dir = Path(cache_dir) if cache_dir is not None else default_snapshot_dir()
+
+    def snapshot_path(self, workspace_path: str | Path) -> Path:
+        resolved = str(Path(workspace_path).resolve())
+        name = hashlib.sha1(resolved.encode("utf-8")).hexdigest()
+        return self._cache_dir / f"{name}.snapshot"
+
+    def load(self, workspace_path: str | Path) -> WorkspaceSnapshot | None:
+        snapshot_path = self.snapshot_path(workspace_path)
+        if not snapshot_path.exists():
+            return None
+        try:
+            with snapshot_path.open("rb") as file_handle:
+                prefix = file_handle.read(len(_MAGIC) + _HEADER_SIZE.size)
+                if len(prefix) < len(_MAGIC) + _HEADER_SIZE.size or not prefix.startswith(_MAGIC):
+                    raise ValueError("not a workspace snapshot")
+                (header_size,) = _HEADER_SIZE.unpack_from(prefix, len(_MAGIC))
+                header = marshal.loads(file_handle.read(header_size))
+                if not self._header_matches(header, workspace_path):
+                    return None
+                # marshal.load() on a file object is several times slower
+                # than decoding the bytes in one go.
+                data = file_handle.read()
+            with _gc_paused():
+                return _decode(marshal.loads(data))
+        except Exception:
+            logger.exception("Discarding unreadable workspace snapshot %s", snapshot_path)
+            self.invalidate(workspace_path)
+            return None
+
+    def encode(self, workspace: WorkspaceData, index: WorkspaceIndex) -> tuple:
+        """Copy ``workspace`` and ``index`` into plain tuples.
+
+        Call this before handing the objects to the UI thread; ``store`` can
+        then write the result later without touching live objects.
+        """
+        return _encode(workspace, index)
+
+    def store(self, key: SnapshotKey, payload: tuple) -> None:
+        header = (SNAPSHOT_FORMAT, sys.hexversion, key.path, key.size, key.mtime_ns, key.sha256)
+        snapshot_path = self.snapshot_path(key.path)
+        snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path_str = tempfile.mkstemp(dir=str(snapshot_path.parent), suffix=".tmp")
+        try:
+            header_bytes = marshal.dumps(header)
+            with os.fdopen(fd, "wb") as file_handle:
+                file_handle.write(_MAGIC + _HEADER_SIZE.pack(len(header_bytes)))
+                file_handle.write(header_bytes)
+                file_handle.write(marshal.dumps(payload))
+            os.replace(temp_path_str, snapshot_path)
+        except Exception:
+            try:
+                os.unlink(temp_path_str)
+            except OSError:
+                pass
+            raise
+
+    def invalidate(self, workspace_path: str | Path) -> None:
+        try:
+            self.snapshot_path(workspace_path).unlink()
+        except FileNotFoundError:
+            pass
+        except OSError:
+            logger.exception("Failed to remove workspace snapshot for %s", workspace_path)
+
+    @staticmethod
+    def _header_matches(header: Any, workspace_path: str | Path) -> bool:
+        if not isinstance(header, tuple) or len(header) != 6:
+            return False
+        format_version, python_version, path, size, mtime_ns, sha256 = header
+        if format_version != SNAPSHOT_FORMAT or python_version != sys.hexversion:
+            return False
+        resolved = Path(workspace_path).resolve()
+        if path != str(resolved):
+            return False
+        try:
+            stat = resolved.stat()
+        except OSError:
+            return False
+        if (stat.st_size, stat.st_mtime_ns) != (size, mtime_ns):
+            return False
+        return snapshot_key(resolved).sha256 == sha256
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    # Decoding allocates hundreds of thousands of containers at once; the
+    # cyclic collector would otherwise run repeatedly over objects that
+    # cannot be garbage yet.
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+def _encode(workspace: WorkspaceData, index: WorkspaceIndex) -> tuple:
+    collections = [(item.id, item.name, item.description) for item in workspace.collections]
+    folders = [
+        (item.id, item.collection_id, item.parent_id, item.name, item.order)
+        for item in workspace.folders
+    ]
+    requests = [
+        (
+            item.id,
+            item.folder_id,
+            item.name,
+            item.method,
+            item.url,
+            [tuple(pair) for pair in item.headers],
+            [tuple(pair) for pair in item.params],
+            item.body,
+            [tuple(pair) for pair in item.form_fields],
+            [tuple(pair) for pair in item.files],
+            item.body_type,
+            (item.auth.auth_type.value, item.auth.username, item.auth.password, item.auth.token),
+            item.timeout_ms,
+            (
+                item.network.proxy_url,
+                item.network.verify_ssl,
+                item.network.follow_redirects,
+                item.network.trust_env,
+                item.network.simulate,
+            ),
+        )
+        for item in workspace.requests
+    ]
+    environments = [
+        (item.scope.value, item.owner_id, dict(item.variables)) for item in workspace.environments
+    ]
+    return (
+        workspace.schema_version,
+        workspace.updated_at,
+        collections,
+        folders,
+        requests,
+        environments,
+        index.snapshot_state(),
+    )
+
+
+def _decode(payload: tuple) -> WorkspaceSnapshot:
+    schema_version, updated_at, collections, folders, requests, environments, index_state = payload
+    auth_types = {item.value: item for item in AuthType}
+    workspace = WorkspaceData(
+        schema_version=schema_version,
+        updated_at=updated_at,
+        collections=[WorkspaceCollection(*row) for row in collections],
+        folders=[WorkspaceFolder(*row) for row in folders],
+        requests=[
+            WorkspaceRequest(
+                request_id,
+                folder_id,
+                name,
+                method,
+                url,
+                headers,
+                params,
+                body,
+                form_fields,
+                files,
+                body_type,
+                AuthConfig(auth_types[auth[0]], auth[1], auth[2], auth[3]),
+                timeout_ms,
+                NetworkConfig(*network),
+            )
+            for (
+                request_id,
+                folder_id,
+                name,
+                method,
+                url,
+                headers,
+                params,
+                body,
+                form_fields,
+                files,
+                body_type,
+                auth,
+                timeout_ms,
+                network,
+            ) in requests
+        ],
+        environments=[
+            WorkspaceEnvironment(EnvironmentScope(scope), owner_id, variables)
+            for scope, owner_id, variables in environments
+        ],
+    )
+    return WorkspaceSnapshot(workspace, WorkspaceIndex.from_snapshot_state(index_state))
@@ -6,6 +6,8 @@ from typing import Mapping
 from core.model import AuthConfig, AuthType, NetworkConfig, RequestData
 
 _TEMPLATE_PATTERN = re.compile(r"\{\{\s*([A-Za-z0-9_.-]+)\s*\}\}")
+# Environment variable holding a core.netsim profile for requests without their own.
+SIMULATE_VARIABLE = "network_simulation"
 
 
 def render_text(text: str, variables: Mapping[str, str]) -> str:
@@ -40,6 +42,8 @@ def render_network(network: NetworkConfig, variables: Mapping[str, str]) -> Netw
         verify_ssl=network.verify_ssl,
         follow_redirects=network.follow_redirects,
         trust_env=network.trust_env,
+        # A request without its own profile takes the environment's.
+        simulate=render_text(network.simulate, variables) or variables.get(SIMULATE_VARIABLE, ""),
     )
 
 
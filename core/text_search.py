@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import re
+import time
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Callable, Iterator, Sequence
+
+DEFAULT_BATCH_SIZE = 1000
+# Characters scanned between checks for cancellation.
+WINDOW_CHARS = 256 * 1024
+# How far past a window a regex match may run and still be found whole.
+REGEX_OVERLAP_CHARS = 16 * 1024
+# A partial batch is sent once it is this old.
+FLUSH_INTERVAL_S = 0.05
+
+_ASTRAL_CHARS = re.compile("[\U00010000-\U0010FFFF]")
+
+
+@dataclass(slots=True)
+class SearchQuery:
+    pattern: str
+    regex: bool = False
+    case_sensitive: bool = False
+
+
+def compile_query(query: SearchQuery) -> re.Pattern[str]:
+    """Compile a query; raises re.error for an invalid regular expression."""
+    source = query.pattern if query.regex else re.escape(query.pattern)
+    flags = 0 if query.case_sensitive else re.IGNORECASE
+    return re.compile(source, flags | re.MULTILINE)
+
+
+def iter_match_batches(
+    text: str,
+    query: SearchQuery,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    should_stop: Callable[[], bool] | None = None,
+    window_chars: int = WINDOW_CHARS,
+    clock: Callable[[], float] = time.monotonic,
+) -> Iterator[list[tuple[int, int]]]:
+    """Yield ``(start, end)`` offsets of non-empty matches in batches.
+
+    The text is scanned in windows of ``window_chars`` and ``should_stop`` is
+    polled between windows and after each batch, so a superseded search
+    stops within one window even when the pattern is rare. A partial batch
+    is flushed after ``FLUSH_INTERVAL_S``, so sparse results still stream.
+
+    Each window is searched a little past its end so that matches crossing
+    it are found whole; a regex match longer than ``REGEX_OVERLAP_CHARS``
+    that starts near a window end can be missed.
+    """
+    if 0 == len(query.pattern):
+        return
+    pattern = compile_query(query)
+    # A literal match is exactly as long as the pattern.
+    overlap = REGEX_OVERLAP_CHARS if query.regex else len(query.pattern)
+    length = len(text)
+    batch: list[tuple[int, int]] = []
+    flushed_at = clock()
+    position = 0
+    while position < length:
+        if position > 0 and should_stop is not None and should_stop():
+            return
+        window_end = min(length, position + max(1, window_chars))
+        search_end = min(length, window_end + overlap)
+        next_position = window_end
+        for match in pattern.finditer(text, position, search_end):
+            start, end = match.span()
+            if start >= window_end:
+                break
+            if end == search_end < length:
+                # The match touches the cut-off, where "$" and "\b" hold and
+                # greedy parts stop early; match again against the full text.
+                full = pattern.match(text, start)
+                if full is None:
+                    continue
+                end = full.end()
+            if start == end:
+                continue
+            batch.append((start, end))
+            next_position = max(next_position, end)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+                flushed_at = clock()
+                if should_stop is not None and should_stop():
+                    return
+        position = next_position
+        if batch and clock() - flushed_at >= FLUSH_INTERVAL_S:
+            yield batch
+            batch = []
+            flushed_at = clock()
+    if batch:
+        yield batch
+
+
+def find_all(text: str, query: SearchQuery) -> list[tuple[int, int]]:
+    matches: list[tuple[int, int]] = []
+    for batch in iter_match_batches(text, query):
+        matches.extend(batch)
+    return matches
+
+
+def astral_offsets(text: str, base: int = 0) -> list[int]:
+    """Ascending offsets (plus ``base``) of the characters outside the BMP."""
+    if text.isascii():
+        return []
+    return [match.start() + base for match in _ASTRAL_CHARS.finditer(text)]
+
+
+def utf16_position(astral: Sequence[int], offset: int) -> int:
+    """Map a str offset to UTF-16 code units, given the text's ``astral_offsets``.
+
+    Qt documents count characters outside the BMP twice.
+    """
+    return offset + bisect_left(astral, offset)
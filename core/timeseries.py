@@ -0,0 +1,319 @@
+from __future__ import annotations
+
+import json
+import math
+import threading
+from array import array
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from core.logger import get_logger
+from core.storage.json_storage import atomic_write_json
+
+logger = get_logger("timeseries")
+
+RESOLUTION_RAW = 0
+RESOLUTION_MINUTE = 60
+RESOLUTION_HOUR = 3600
+
+# With a 30 s interval: 12 hours of raw samples, a day of minutes and
+# 90 days of hours per series.
+DEFAULT_RAW_CAPACITY = 1440
+DEFAULT_MINUTE_CAPACITY = 1440
+DEFAULT_HOUR_CAPACITY = 24 * 90
+
+TIMESERIES_FORMAT = 1
+# Row layout of every ring: start timestamp, sample count, failed samples,
+# latency sum / min / max over successful samples, last status code. Min and
+# max are stored as 0 for rows without a successful sample.
+_FIELDS = ("timestamp", "count", "errors", "sum_ms", "min_ms", "max_ms", "status")
+
+
+@dataclass(frozen=True, slots=True)
+class SeriesPoint:
+    timestamp: float
+    count: int
+    errors: int
+    mean_ms: float | None
+    min_ms: float | None
+    max_ms: float | None
+    status_code: int | None
+
+    @property
+    def error_rate(self) -> float:
+        return self.errors / self.count if self.count else 0.0
+
+
+class _Ring:
+    """Fixed-capacity columnar buffer; once full, each append overwrites the oldest row."""
+
+    __slots__ = ("_capacity", "_columns", "_start", "_size")
+
+    def __init__(self, capacity: int) -> None:
+        self._capacity = max(1, capacity)
+        self._columns = [array("d", bytes(8 * self._capacity)) for _ in _FIELDS]
+        self._start = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, row: tuple[float, ...]) -> None:
+        if self._size < self._capacity:
+            position = (self._start + self._size) % self._capacity
+            self._size += 1
+        else:
+            position = self._start
+            self._start = (self._start + 1) % self._capacity
+        for column, value in zip(self._columns, row):
+            column[position] = value
+
+    def covers(self, since: float | None) -> bool:
+        """True if no row at or after ``since`` has been overwritten yet."""
+        if self._size < self._capacity:
+            return True
+        return since is not None and self._columns[0][self._start] <= since
+
+    def rows(self) -> Iterator[tuple[float, ...]]:
+        for offset in range(self._size):
+            position = (self._start + offset) % self._capacity
+            yield tuple(column[position] for column in self._columns)
+
+    def state(self) -> list[list[float]]:
+        return [list(row) for row in self.rows()]
+
+    def load(self, rows: list[list[float]]) -> None:
+        for row in rows[-self._capacity :]:
+            if len(row) == len(_FIELDS):
+                self.append(tuple(float(value) for value in row))
+
+
+class _Bucket:
+    __slots__ = ("start", "count", "errors", "sum_ms", "min_ms", "max_ms", "status")
+
+    def __init__(self, start: float) -> None:
+        self.start = start
+        self.count = 0
+        self.errors = 0
+        self.sum_ms = 0.0
+        self.min_ms = math.inf
+        self.max_ms = -math.inf
+        self.status = 0.0
+
+    def add(self, latency_ms: float | None, status: float) -> None:
+        self.count += 1
+        if status:
+            self.status = status
+        if latency_ms is None:
+            self.errors += 1
+            return
+        self.sum_ms += latency_ms
+        self.min_ms = min(self.min_ms, latency_ms)
+        self.max_ms = max(self.max_ms, latency_ms)
+
+    @classmethod
+    def from_row(cls, row: list[float]) -> _Bucket:
+        bucket = cls(row[0])
+        bucket.count, bucket.errors = int(row[1]), int(row[2])
+        bucket.sum_ms, bucket.status = row[3], row[6]
+        if bucket.count > bucket.errors:
+            bucket.min_ms, bucket.max_ms = row[4], row[5]
+        return bucket
+
+    def row(self) -> tuple[float, ...]:
+        if self.count == self.errors:
+            return (self.start, self.count, self.errors, 0.0, 0.0, 0.0, self.status)
+        return (self.start, self.count, self.errors, self.sum_ms, self.min_ms, self.max_ms, self.status)
+
+
+class TimeSeries:
+    """Latency/status samples of one monitored request, in bounded memory.
+
+    Raw samples go into a ring buffer and are folded into running 1-minute
+    and 1-hour buckets; each completed bucket is appended to its own ring.
+    ``points()`` answers from the finest resolution that still covers the
+    requested range.
+    """
+
+    def __init__(
+        self,
+        raw_capacity: int = DEFAULT_RAW_CAPACITY,
+        minute_capacity: int = DEFAULT_MINUTE_CAPACITY,
+        hour_capacity: int = DEFAULT_HOUR_CAPACITY,
+    ) -> None:
+        self._rings = {
+            RESOLUTION_RAW: _Ring(raw_capacity),
+            RESOLUTION_MINUTE: _Ring(minute_capacity),
+            RESOLUTION_HOUR: _Ring(hour_capacity),
+        }
+        self._buckets: dict[int, _Bucket | None] = {RESOLUTION_MINUTE: None, RESOLUTION_HOUR: None}
+
+    def add(self, timestamp: float, latency_ms: float | None, status_code: int | None = None) -> None:
+        """Record one probe; ``latency_ms`` is None for a failed probe."""
+        status = float(status_code or 0)
+        if latency_ms is None:
+            self._rings[RESOLUTION_RAW].append((timestamp, 1, 1, 0.0, 0.0, 0.0, status))
+        else:
+            self._rings[RESOLUTION_RAW].append(
+                (timestamp, 1, 0, latency_ms, latency_ms, latency_ms, status)
+            )
+        for resolution in (RESOLUTION_MINUTE, RESOLUTION_HOUR):
+            start = timestamp - timestamp % resolution
+            bucket = self._buckets[resolution]
+            # Late samples from a slow probe are folded into the open bucket.
+            if bucket is not None and bucket.start < start:
+                self._rings[resolution].append(bucket.row())
+                bucket = None
+            if bucket is None:
+                bucket = _Bucket(start)
+                self._buckets[resolution] = bucket
+            bucket.add(latency_ms, status)
+
+    def points(self, since: float | None = None, resolution: int | None = None) -> list[SeriesPoint]:
+        """Points at or after ``since``, including the open rollup bucket.
+
+        Without an explicit ``resolution`` the finest one whose retained
+        history reaches back to ``since`` is used.
+        """
+        if resolution is None:
+            resolution = self.resolution_for(since)
+        rows = list(self._rings[resolution].rows())
+        bucket = self._buckets.get(resolution)
+        if bucket is not None:
+            rows.append(bucket.row())
+        if since is not None:
+            # A rollup bucket is included when any part of its period is in range.
+            rows = [row for row in rows if since < row[0] + resolution or since <= row[0]]
+        return [_to_point(row) for row in rows]
+
+    def resolution_for(self, since: float | None) -> int:
+        for resolution in (RESOLUTION_RAW, RESOLUTION_MINUTE):
+            if self._rings[resolution].covers(since):
+                return resolution
+        return RESOLUTION_HOUR
+
+    def state(self) -> dict[str, Any]:
+        return {
+            "raw": self._rings[RESOLUTION_RAW].state(),
+            "minute": self._rings[RESOLUTION_MINUTE].state(),
+            "hour": self._rings[RESOLUTION_HOUR].state(),
+            "open_minute": _bucket_state(self._buckets[RESOLUTION_MINUTE]),
+            "open_hour": _bucket_state(self._buckets[RESOLUTION_HOUR]),
+        }
+
+    def load_state(self, state: dict[str, Any]) -> None:
+        for resolution, name in ((RESOLUTION_RAW, "raw"), (RESOLUTION_MINUTE, "minute"), (RESOLUTION_HOUR, "hour")):
+            self._rings[resolution].load(state.get(name) or [])
+        # Open buckets keep accumulating after a restart within the same period;
+        # otherwise the next sample closes them as usual.
+        for resolution, name in ((RESOLUTION_MINUTE, "open_minute"), (RESOLUTION_HOUR, "open_hour")):
+            row = state.get(name)
+            if isinstance(row, list) and len(row) == len(_FIELDS):
+                self._buckets[resolution] = _Bucket.from_row([float(value) for value in row])
+
+
+class TimeSeriesStore:
+    """Thread-safe collection of ``TimeSeries`` keyed by request id."""
+
+    def __init__(
+        self,
+        raw_capacity: int = DEFAULT_RAW_CAPACITY,
+        minute_capacity: int = DEFAULT_MINUTE_CAPACITY,
+        hour_capacity: int = DEFAULT_HOUR_CAPACITY,
+    ) -> None:
+        self._capacities = (raw_capacity, minute_capacity, hour_capacity)
+        self._series: dict[str, TimeSeries] = {}
+        self._names: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def add(
+        self,
+        key: str,
+        timestamp: float,
+        latency_ms: float | None,
+        status_code: int | None = None,
+        name: str | None = None,
+    ) -> None:
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = TimeSeries(*self._capacities)
+                self._series[key] = series
+            if name:
+                self._names[key] = name
+            series.add(timestamp, latency_ms, status_code)
+
+    def keys(self) -> list[str]:
+        with self._lock:
+            return list(self._series)
+
+    def name(self, key: str) -> str:
+        return self._names.get(key, key)
+
+    def points(self, key: str, since: float | None = None, resolution: int | None = None) -> list[SeriesPoint]:
+        with self._lock:
+            series = self._series.get(key)
+            return series.points(since, resolution) if series is not None else []
+
+    def resolution_for(self, key: str, since: float | None) -> int:
+        with self._lock:
+            series = self._series.get(key)
+            return series.resolution_for(since) if series is not None else RESOLUTION_RAW
+
+    def save(self, path: str | Path) -> None:
+        with self._lock:
+            payload = {
+                "format": TIMESERIES_FORMAT,
+                "series": {
+                    key: {"name": self._names.get(key, key), **series.state()}
+                    for key, series in self._series.items()
+                },
+            }
+        atomic_write_json(Path(path), payload)
+
+    @classmethod
+    def load(cls, path: str | Path, **capacities: int) -> TimeSeriesStore:
+        """Load a saved store; a missing or unreadable file gives an empty one."""
+        store = cls(**capacities)
+        target = Path(path)
+        if not target.exists():
+            return store
+        try:
+            with target.open("r", encoding="utf-8") as file_handle:
+                payload = json.load(file_handle)
+            if payload.get("format") != TIMESERIES_FORMAT:
+                raise ValueError(f"unsupported format {payload.get('format')!r}")
+            for key, state in payload.get("series", {}).items():
+                series = TimeSeries(*store._capacities)
+                series.load_state(state)
+                store._series[key] = series
+                store._names[key] = state.get("name", key)
+        except Exception as exc:
+            logger.error("Failed to load monitor time series %s: %s", target, exc)
+            return cls(**capacities)
+        return store
+
+
+def default_timeseries_path() -> Path:
+    project_root = Path(__file__).resolve().parents[1]
+    return project_root / "monitor_timeseries.json"
+
+
+def _to_point(row: tuple[float, ...]) -> SeriesPoint:
+    timestamp, count, errors, sum_ms, min_ms, max_ms, status = row
+    successes = int(count) - int(errors)
+    return SeriesPoint(
+        timestamp=timestamp,
+        count=int(count),
+        errors=int(errors),
+        mean_ms=sum_ms / successes if successes else None,
+        min_ms=min_ms if successes else None,
+        max_ms=max_ms if successes else None,
+        status_code=int(status) or None,
+    )
+
+
+def _bucket_state(bucket: _Bucket | None) -> list[float] | None:
+    return list(bucket.row()) if bucket is not None else None
@@ -0,0 +1,373 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from core.model import WorkspaceCollection, WorkspaceData, WorkspaceFolder, WorkspaceRequest
+
+KIND_COLLECTION = "collection"
+KIND_FOLDER = "folder"
+KIND_REQUEST = "request"
+
+_ID_PREFIXES = {
+    KIND_COLLECTION: "col-",
+    KIND_FOLDER: "folder-",
+    KIND_REQUEST: "req-",
+}
+
+
+@dataclass(slots=True, eq=False)
+class WorkspaceNode:
+    id: str
+    kind: str
+    name: str
+    parent_id: str | None = None
+    method: str = ""
+    url: str = ""
+    children: list[str] = field(default_factory=list)
+    search_key: str = ""
+
+
+class WorkspaceIndex:
+    """Parent/child index over collections, folders and requests.
+
+    Every node keeps an ordered list of child ids, so the tree model can
+    answer ``rowCount``/``index``/``parent`` without walking the workspace.
+    A lowercase ``name method url`` key is kept per node for filtering.
+    Edits (add, rename, move, remove) touch only the nodes involved.
+    """
+
+    def __init__(
+        self,
+        collections: list[WorkspaceCollection] | None = None,
+        folders: list[WorkspaceFolder] | None = None,
+        requests: list[WorkspaceRequest] | None = None,
+    ) -> None:
+        self._nodes: dict[str, WorkspaceNode] = {}
+        self._roots: list[str] = []
+        self._rows: dict[str | None, dict[str, int]] = {}
+        self._counters = {kind: 1 for kind in _ID_PREFIXES}
+        self._last_query = ""
+        self._last_matches: list[str] | None = None
+        self._load(collections or [], folders or [], requests or [])
+
+    @classmethod
+    def for_workspace(cls, workspace: WorkspaceData) -> WorkspaceIndex:
+        """Index a loaded workspace; one without collections gets "Default"."""
+        collections = workspace.collections or [WorkspaceCollection(id="col-1", name="Default")]
+        return cls(collections, workspace.folders, workspace.requests)
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, node_id: object) -> bool:
+        return node_id in self._nodes
+
+    def node(self, node_id: str) -> WorkspaceNode | None:
+        return self._nodes.get(node_id)
+
+    def roots(self) -> list[str]:
+        return self._roots
+
+    def children_of(self, node_id: str | None) -> list[str]:
+        if node_id is None:
+            return self._roots
+        node = self._nodes.get(node_id)
+        if node is None:
+            return []
+        return node.children
+
+    def row_of(self, node_id: str) -> int:
+        node = self._nodes.get(node_id)
+        if node is None:
+            return -1
+        rows = self._rows.get(node.parent_id)
+        if rows is None:
+            siblings = self.children_of(node.parent_id)
+            rows = {child_id: row for row, child_id in enumerate(siblings)}
+            self._rows[node.parent_id] = rows
+        return rows.get(node_id, -1)
+
+    def ancestors(self, node_id: str) -> list[str]:
+        """Ids from the root down to, but excluding, ``node_id``."""
+        chain: list[str] = []
+        node = self._nodes.get(node_id)
+        while node is not None and node.parent_id is not None:
+            chain.append(node.parent_id)
+            node = self._nodes.get(node.parent_id)
+        chain.reverse()
+        return chain
+
+    def subtree_ids(self, node_id: str) -> set[str]:
+        """``node_id`` plus every node below it."""
+        found: set[str] = set()
+        pending = [node_id]
+        while pending:
+            current = pending.pop()
+            if current in found:
+                continue
+            found.add(current)
+            node = self._nodes.get(current)
+            if node is not None:
+                pending.extend(node.children)
+        return found
+
+    def request_ids(self) -> list[str]:
+        return [node.id for node in self._nodes.values() if node.kind == KIND_REQUEST]
+
+    def next_id(self, kind: str) -> str:
+        value = self._counters[kind]
+        self._counters[kind] = value + 1
+        return f"{_ID_PREFIXES[kind]}{value}"
+
+    def add(
+        self,
+        kind: str,
+        name: str,
+        parent_id: str | None,
+        node_id: str | None = None,
+        method: str = "",
+        url: str = "",
+        row: int | None = None,
+    ) -> WorkspaceNode:
+        if kind != KIND_COLLECTION and parent_id not in self._nodes:
+            raise KeyError(f"unknown parent: {parent_id}")
+        resolved_id = node_id or self.next_id(kind)
+        if resolved_id in self._nodes:
+            raise ValueError(f"duplicate id: {resolved_id}")
+        node = WorkspaceNode(
+            id=resolved_id,
+            kind=kind,
+            name=name,
+            parent_id=parent_id if kind != KIND_COLLECTION else None,
+            method=method,
+            url=url,
+        )
+        self._update_search_key(node)
+        self._nodes[resolved_id] = node
+        self._track_counter(kind, resolved_id)
+        siblings = self.children_of(node.parent_id)
+        if row is None or row < 0 or row > len(siblings):
+            row = len(siblings)
+        siblings.insert(row, resolved_id)
+        self._rows.pop(node.parent_id, None)
+        self._invalidate_search()
+        return node
+
+    def rename(self, node_id: str, name: str) -> None:
+        node = self._nodes[node_id]
+        node.name = name
+        self._update_search_key(node)
+        self._invalidate_search()
+
+    def update_request(self, node_id: str, name: str, method: str, url: str) -> None:
+        node = self._nodes[node_id]
+        node.name = name
+        node.method = method
+        node.url = url
+        self._update_search_key(node)
+        self._invalidate_search()
+
+    def can_move(self, node_id: str, parent_id: str | None) -> bool:
+        node = self._nodes.get(node_id)
+        if node is None or node.kind == KIND_COLLECTION:
+            return False
+        parent = self._nodes.get(parent_id) if parent_id is not None else None
+        if parent is None or parent.kind == KIND_REQUEST:
+            return False
+        return node_id != parent_id and node_id not in self.ancestors(parent_id)
+
+    def move(self, node_id: str, parent_id: str, row: int | None = None) -> None:
+        if not self.can_move(node_id, parent_id):
+            raise ValueError(f"cannot move {node_id} under {parent_id}")
+        node = self._nodes[node_id]
+        old_siblings = self.children_of(node.parent_id)
+        old_row = old_siblings.index(node_id)
+        del old_siblings[old_row]
+        self._rows.pop(node.parent_id, None)
+
+        new_siblings = self.children_of(parent_id)
+        if row is None or row < 0 or row > len(new_siblings):
+            row = len(new_siblings)
+        elif parent_id == node.parent_id and old_row < row:
+            row -= 1
+        new_siblings.insert(row, node_id)
+        node.parent_id = parent_id
+        self._rows.pop(parent_id, None)
+
+    def remove(self, node_id: str) -> list[str]:
+        """Remove a node and its subtree; returns the removed ids."""
+        node = self._nodes[node_id]
+        siblings = self.children_of(node.parent_id)
+        siblings.remove(node_id)
+        self._rows.pop(node.parent_id, None)
+        removed: list[str] = []
+        pending = [node_id]
+        while pending:
+            current = self._nodes.pop(pending.pop())
+            removed.append(current.id)
+            self._rows.pop(current.id, None)
+            pending.extend(current.children)
+        self._invalidate_search()
+        return removed
+
+    def search(self, text: str) -> set[str] | None:
+        """Ids to show for a filter: matches plus all their ancestors.
+
+        Whitespace separated terms must all occur in a node's name, method or
+        URL. Returns None for an empty filter. A query that extends the
+        previous one only rescans the previous matches.
+        """
+        query = " ".join(text.lower().split())
+        if 0 == len(query):
+            self._invalidate_search()
+            return None
+
+        terms = query.split(" ")
+        candidates: list[str] | None = None
+        if self._last_matches is not None and query.startswith(self._last_query):
+            candidates = self._last_matches
+        if candidates is None:
+            candidates = list(self._nodes)
+        nodes = self._nodes
+        if 1 == len(terms):
+            term = terms[0]
+            matches = [node_id for node_id in candidates if term in nodes[node_id].search_key]
+        else:
+            matches = [
+                node_id
+                for node_id in candidates
+                if all(term in nodes[node_id].search_key for term in terms)
+            ]
+        self._last_query = query
+        self._last_matches = matches
+
+        visible = set(matches)
+        for node_id in matches:
+            parent_id = nodes[node_id].parent_id
+            while parent_id is not None and parent_id not in visible:
+                visible.add(parent_id)
+                parent_id = nodes[parent_id].parent_id
+        return visible
+
+    def snapshot_state(self) -> tuple[list[tuple], list[str], dict[str, int]]:
+        """Plain-data copy of the index for the workspace snapshot cache."""
+        nodes = [
+            (
+                node.id,
+                node.kind,
+                node.name,
+                node.parent_id,
+                node.method,
+                node.url,
+                list(node.children),
+                node.search_key,
+            )
+            for node in self._nodes.values()
+        ]
+        return nodes, list(self._roots), dict(self._counters)
+
+    @classmethod
+    def from_snapshot_state(cls, state: tuple[list[tuple], list[str], dict[str, int]]) -> WorkspaceIndex:
+        nodes, roots, counters = state
+        index = cls()
+        index._nodes = {row[0]: WorkspaceNode(*row) for row in nodes}
+        index._roots = list(roots)
+        index._counters.update(counters)
+        return index
+
+    def build_collections(self) -> tuple[list[WorkspaceCollection], list[WorkspaceFolder]]:
+        collections: list[WorkspaceCollection] = []
+        folders: list[WorkspaceFolder] = []
+        for collection_id in self._roots:
+            collection = self._nodes[collection_id]
+            collections.append(WorkspaceCollection(id=collection.id, name=collection.name))
+            pending: list[tuple[str, str | None]] = [(collection_id, None)]
+            while pending:
+                container_id, parent_folder_id = pending.pop()
+                order = 0
+                subfolders: list[tuple[str, str | None]] = []
+                for child_id in self._nodes[container_id].children:
+                    child = self._nodes[child_id]
+                    if child.kind != KIND_FOLDER:
+                        continue
+                    folders.append(
+                        WorkspaceFolder(
+                            id=child.id,
+                            collection_id=collection_id,
+                            parent_id=parent_folder_id,
+                            name=child.name,
+                            order=order,
+                        )
+                    )
+                    order += 1
+                    subfolders.append((child.id, child.id))
+                pending.extend(reversed(subfolders))
+        return collections, folders
+
+    def _load(
+        self,
+        collections: list[WorkspaceCollection],
+        folders: list[WorkspaceFolder],
+        requests: list[WorkspaceRequest],
+    ) -> None:
+        for collection in collections:
+            self.add(KIND_COLLECTION, collection.name, None, node_id=collection.id)
+
+        known_folders = {folder.id for folder in folders}
+        for folder in sorted(folders, key=lambda item: (item.collection_id, item.order)):
+            # Folders are attached once all of them exist, so a child listed
+            # before its parent still lands in the right place.
+            node = WorkspaceNode(id=folder.id, kind=KIND_FOLDER, name=folder.name)
+            self._update_search_key(node)
+            self._nodes[folder.id] = node
+            self._track_counter(KIND_FOLDER, folder.id)
+        for folder in sorted(folders, key=lambda item: (item.collection_id, item.order)):
+            parent_id = folder.parent_id
+            if parent_id is None or parent_id not in known_folders:
+                parent_id = folder.collection_id
+            if parent_id not in self._nodes:
+                parent_id = self._roots[0] if self._roots else None
+            if parent_id is None or parent_id in self.subtree_ids(folder.id):
+                parent_id = self._roots[0] if self._roots else None
+            if parent_id is None:
+                del self._nodes[folder.id]
+                continue
+            self._nodes[folder.id].parent_id = parent_id
+            self._nodes[parent_id].children.append(folder.id)
+
+        for request in requests:
+            parent = self._nodes.get(request.folder_id)
+            if parent is None or parent.kind == KIND_REQUEST:
+                continue
+            node = WorkspaceNode(
+                id=request.id,
+                kind=KIND_REQUEST,
+                name=request.name,
+                parent_id=parent.id,
+                method=request.method,
+                url=request.url,
+            )
+            self._update_search_key(node)
+            self._nodes[request.id] = node
+            self._track_counter(KIND_REQUEST, request.id)
+            parent.children.append(request.id)
+        self._rows.clear()
+
+    def _track_counter(self, kind: str, node_id: str) -> None:
+        prefix = _ID_PREFIXES[kind]
+        if not node_id.startswith(prefix):
+            return
+        suffix = node_id[len(prefix) :]
+        if not suffix.isdigit():
+            return
+        value = int(suffix) + 1
+        if self._counters[kind] < value:
+            self._counters[kind] = value
+
+    def _invalidate_search(self) -> None:
+        self._last_query = ""
+        self._last_matches = None
+
+    @staticmethod
+    def _update_search_key(node: WorkspaceNode) -> None:
+        node.search_key = f"{node.name} {node.method} {node.url}".lower()
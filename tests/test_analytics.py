@@ -0,0 +1,120 @@
+import tempfile
+from pathlib import Path
+
+from core.analytics import (
+    build_history_columns,
+    compute_endpoint_stats,
+    compute_trend,
+    load_history_columns,
+    normalize_endpoint,
+    percentile,
+)
+from core.model import HistoryEntry
+from core.storage.history_jsonl import append_history_entry
+
+
+def _entry(timestamp, url, status_code=200, elapsed_ms=100, error=None, method="GET"):
+    return HistoryEntry(
+        timestamp=timestamp,
+        name="req",
+        method=method,
+        url=url,
+        status_code=status_code,
+        elapsed_ms=elapsed_ms,
+        error=error,
+    )
+
+
+def test_normalize_endpoint_collapses_ids():
+    assert normalize_endpoint("get", "https://API.test/users/42?x=1") == "GET https://api.test/users/{id}"
+    assert (
+        normalize_endpoint("DELETE", "https://api.test/items/123e4567-e89b-12d3-a456-426614174000")
+        == "DELETE https://api.test/items/{uuid}"
+    )
+    assert normalize_endpoint("GET", "https://api.test/blobs/deadbeefdeadbeef") == "GET https://api.test/blobs/{hash}"
+    assert normalize_endpoint("GET", "https://api.test") == "GET https://api.test/"
+
+
+def test_percentile_interpolates():
+    assert percentile([], 50) is None
+    assert percentile([7], 99) == 7.0
+    assert percentile([10, 20, 30, 40], 50) == 25.0
+    assert percentile(list(range(1, 101)), 95) == 95.05
+
+
+def test_endpoint_stats_groups_and_counts_errors():
+    entries = [
+        _entry("2026-01-01T00:00:00+00:00", "https://api.test/users/1", elapsed_ms=100),
+        _entry("2026-01-01T00:10:00+00:00", "https://api.test/users/2", elapsed_ms=300),
+        _entry("2026-01-01T00:20:00+00:00", "https://api.test/users/3", status_code=503, elapsed_ms=200),
+        _entry("2026-01-01T00:30:00+00:00", "https://api.test/health", status_code=None, elapsed_ms=None, error="ReadTimeout"),
+    ]
+    columns = build_history_columns(entries)
+    stats = {item.endpoint: item for item in compute_endpoint_stats(columns)}
+
+    users = stats["GET https://api.test/users/{id}"]
+    assert users.count == 3
+    assert users.error_count == 1
+    assert users.p50_ms == 200.0
+    assert users.last_seen - users.first_seen == 1200
+
+    health = stats["GET https://api.test/health"]
+    assert health.count == 1
+    assert health.error_rate == 1.0
+    assert health.p50_ms is None
+
+
+def test_trend_buckets_by_time_and_endpoint():
+    entries = [
+        _entry("2026-01-01T00:00:00+00:00", "https://api.test/a", elapsed_ms=100),
+        _entry("2026-01-01T00:30:00+00:00", "https://api.test/a", elapsed_ms=300),
+        _entry("2026-01-01T01:15:00+00:00", "https://api.test/a", elapsed_ms=50),
+        _entry("2026-01-01T01:20:00+00:00", "https://api.test/b", elapsed_ms=999),
+    ]
+    columns = build_history_columns(entries)
+    trend = compute_trend(columns, bucket_seconds=3600, endpoint="GET https://api.test/a")
+
+    assert [bucket.count for bucket in trend] == [2, 1]
+    assert trend[0].p50_ms == 200.0
+    assert trend[1].start - trend[0].start == 3600
+    assert compute_trend(columns, bucket_seconds=3600, endpoint="GET https://missing/") == []
+
+
+def test_load_history_columns_matches_entries():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / "history.jsonl"
+        append_history_entry(path, _entry("2026-01-01T00:00:00+00:00", "https://api.test/users/1"))
+        append_history_entry(path, _entry("2026-01-02T00:00:00+00:00", "https://api.test/users/2", error="Canceled"))
+        with path.open("a", encoding="utf-8") as handle:
+            handle.write("not json\n")
+
+        columns = load_history_columns(path)
+
+    assert len(columns) == 2
+    assert columns.endpoints == ["GET https://api.test/users/{id}"]
+    assert list(columns.failed) == [0, 1]
+
+    since = columns.timestamps[1]
+    stats = compute_endpoint_stats(columns, since=since)
+    assert stats[0].count == 1
+
+
+def test_load_history_columns_stops_when_asked():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / "history.jsonl"
+        for day in range(1, 4):
+            append_history_entry(path, _entry(f"2026-01-0{day}T00:00:00+00:00", "https://api.test/users"))
+        with path.open("a", encoding="utf-8") as handle:
+            for _ in range(2500):
+                handle.write("\n")
+
+        calls = []
+
+        def should_stop():
+            calls.append(True)
+            return True
+
+        columns = load_history_columns(path, should_stop=should_stop)
+
+    # Checked every thousand lines; everything before the first check is kept.
+    assert (len(columns), len(calls)) == (3, 1)
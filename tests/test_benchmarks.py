@@ -0,0 +1,72 @@
+from benchmarks.__main__ import main
+from benchmarks.harness import (
+    BenchContext,
+    Benchmark,
+    BenchResult,
+    compare,
+    load_results,
+    measure,
+    save_results,
+    select,
+)
+from benchmarks.synthetic import make_workspace, write_history
+from core.storage.history_jsonl import load_history_entries
+from core.storage.json_storage import load_workspace, save_workspace
+
+
+def _result(name, median_s):
+    return BenchResult(name, "core", "items", 3, 10, median_s, median_s, median_s, 0.0)
+
+
+def test_measure_times_the_returned_callable_and_shares_fixtures(tmp_path):
+    built = []
+    calls = []
+
+    def setup(context):
+        data = context.shared("data", lambda: built.append(1) or list(range(100)))
+        return lambda: calls.append(1) or len(data)
+
+    context = BenchContext(tmp_path)
+    item = Benchmark("sum", "core", "items", setup)
+    result = measure(item, context, repeat=3)
+    measure(item, context, repeat=1)
+
+    assert (result.repeat, result.work, len(calls), len(built)) == (3, 100, 6, 1)
+    assert result.min_s <= result.median_s <= result.max_s
+    assert result.throughput > 0
+    slow = Benchmark("slow", "core", "items", setup, full_only=True)
+    assert [item.name for item in select([item, slow], quick=True)] == ["sum"]
+    assert [item.name for item in select([item, slow], ["slo"])] == ["slow"]
+
+
+def test_compare_flags_regressions_beyond_the_threshold(tmp_path, capsys):
+    baseline_path = tmp_path / "baseline.json"
+    current_path = tmp_path / "current.json"
+    save_results(baseline_path, [_result("a", 1.0), _result("b", 1.0), _result("gone", 1.0)])
+    save_results(current_path, [_result("a", 1.05), _result("b", 1.5), _result("new", 1.0)])
+
+    comparisons = {item.name: item for item in compare(load_results(baseline_path), load_results(current_path))}
+    assert not comparisons["a"].is_regression(0.10)
+    assert comparisons["b"].is_regression(0.10)
+    assert comparisons["new"].ratio is None and comparisons["gone"].current_s is None
+
+    assert main(["compare", str(baseline_path), str(current_path)]) == 1
+    output = capsys.readouterr().out
+    assert "b " in output and "REGRESSION" in output and "missing" in output
+    assert main(["compare", str(baseline_path), str(current_path), "--threshold", "0.6"]) == 0
+
+
+def test_synthetic_data_round_trips_through_storage(tmp_path):
+    workspace = make_workspace(120, requests_per_folder=50, seed=3)
+    assert (len(workspace.requests), len(workspace.folders)) == (120, 3)
+    assert make_workspace(120, seed=3).requests == workspace.requests
+
+    path = tmp_path / "workspace.json"
+    save_workspace(path, workspace)
+    assert load_workspace(path).requests == workspace.requests
+
+    history_path = write_history(tmp_path / "history.jsonl", 50, body_every=10)
+    entries = load_history_entries(history_path)
+    assert len(entries) == 50
+    assert [entry.timestamp for entry in entries] == sorted(entry.timestamp for entry in entries)
+    assert 0 < sum(entry.response_body is not None for entry in entries) <= 5
@@ -0,0 +1,211 @@
+import json
+import socket
+import subprocess
+import sys
+import threading
+import time
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+import httpx
+import pytest
+
+from core.cli import main
+from core.model import (
+    EnvironmentScope,
+    WorkspaceCollection,
+    WorkspaceData,
+    WorkspaceEnvironment,
+    WorkspaceFolder,
+    WorkspaceRequest,
+)
+from core.storage.json_storage import load_workspace, save_workspace
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+
+@pytest.fixture
+def workspace_path(tmp_path):
+    path = tmp_path / "smoke.json"
+    save_workspace(
+        path,
+        WorkspaceData(
+            schema_version=1,
+            collections=[WorkspaceCollection(id="col-1", name="API")],
+            folders=[
+                WorkspaceFolder(id="folder-1", collection_id="col-1", parent_id=None, name="Health"),
+                WorkspaceFolder(id="folder-2", collection_id="col-1", parent_id=None, name="Broken"),
+            ],
+            requests=[
+                WorkspaceRequest(id="req-1", folder_id="folder-1", name="Ping", method="GET", url="{{base}}/200"),
+                WorkspaceRequest(id="req-2", folder_id="folder-1", name="Ready", method="GET", url="{{base}}/204"),
+                WorkspaceRequest(id="req-3", folder_id="folder-2", name="Missing", method="GET", url="{{base}}/404"),
+            ],
+            environments=[
+                WorkspaceEnvironment(EnvironmentScope.GLOBAL, None, {"name": "Local", "base": "http://unused"}),
+            ],
+        ),
+    )
+    return path
+
+
+def test_folder_run_writes_json_report(workspace_path, server_url, tmp_path, capsys):
+    report_path = tmp_path / "report.json"
+    code = main(
+        [str(workspace_path), "-e", "Local", "--var", f"base={server_url}", "-f", "Health", "-o", str(report_path)]
+    )
+    assert code == 0
+    report = json.loads(report_path.read_text(encoding="utf-8"))
+    assert report["summary"] == {"total": 2, "passed": 2, "failed": 0}
+    assert [item["status_code"] for item in report["results"]] == [200, 204]
+    assert report["results"][0]["path"] == "API / Health"
+
+
+def test_failures_are_reported_in_junit_and_exit_code(workspace_path, server_url, capsys):
+    code = main([str(workspace_path), "-e", "Local", "--var", f"base={server_url}", "-c", "API", "--format", "junit"])
+    assert code == 1
+    suite = ET.fromstring(capsys.readouterr().out).find("testsuite")
+    assert suite.get("tests") == "3"
+    assert suite.get("failures") == "1"
+    failed = [case.get("name") for case in suite.iter("testcase") if case.find("failure") is not None]
+    assert failed == ["Missing"]
+
+
+def test_unknown_selector_or_environment_is_a_usage_error(workspace_path, capsys):
+    assert main([str(workspace_path), "-r", "Nope"]) == 2
+    assert main([str(workspace_path), "-e", "Prod"]) == 2
+    assert "available: No Environment, Local" in capsys.readouterr().err
+
+
+def test_cli_does_not_import_qt(workspace_path):
+    script = (
+        "import sys\n"
+        "from core.cli import main\n"
+        f"code = main([{str(workspace_path)!r}, '--list'])\n"
+        "assert 'PySide6' not in sys.modules, 'PySide6 imported'\n"
+        "sys.exit(code)\n"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", script], cwd=PROJECT_ROOT, capture_output=True, text=True, timeout=60
+    )
+    assert completed.returncode == 0, completed.stderr
+    assert "req-3\tGET\tAPI / Broken / Missing" in completed.stdout
+
+
+def test_simulate_applies_a_seeded_network_profile(workspace_path, server_url, capsys):
+    args = [str(workspace_path), "-e", "Local", "--var", f"base={server_url}", "-f", "Health"]
+    assert main([*args, "--simulate", "latency=20 error=1 status=503"]) == 1
+    report = json.loads(capsys.readouterr().out)
+    assert [item["status_code"] for item in report["results"]] == [503, 503]
+    assert all(item["elapsed_ms"] >= 20 for item in report["results"])
+
+    assert main([*args, "--simulate", "warp=9"]) == 2
+    assert "unknown network profile key" in capsys.readouterr().err
+
+
+def test_compare_mode_reports_each_environment(workspace_path, server_url, capsys):
+    code = main(
+        [
+            str(workspace_path),
+            "-r",
+            "Ping",
+            "--var",
+            f"base={server_url}",
+            "--compare",
+            "Local",
+            "--compare",
+            "No Environment",
+            "--min-samples",
+            "5",
+            "--max-samples",
+            "5",
+        ]
+    )
+    assert code == 0
+    (report,) = json.loads(capsys.readouterr().out)
+    assert [entry["samples"] for entry in report["environments"]] == [5, 5]
+    assert report["comparisons"][0]["baseline"] == "Local"
+
+
+def test_monitor_mode_summarizes_samples_and_alerts(workspace_path, server_url, capsys):
+    code = main(
+        [
+            str(workspace_path),
+            "-c",
+            "API",
+            "--var",
+            f"base={server_url}",
+            "--monitor",
+            "0.05",
+            "--duration",
+            "0.5",
+            "--alert-after",
+            "2",
+            "--format",
+            "text",
+        ]
+    )
+    captured = capsys.readouterr()
+    assert code == 1
+    assert "ALERT failure: Missing failed 2 times in a row: HTTP 404" in captured.err
+    lines = captured.out.splitlines()
+    assert lines[0].startswith("Ping: ") and " 0 errors" in lines[0]
+    assert lines[-1].startswith("alert failure: Missing")
+
+
+def test_replay_mode_retargets_history(workspace_path, server_url, tmp_path, capsys):
+    history_path = tmp_path / "history.jsonl"
+    lines = [
+        {"timestamp": "2026-01-01T00:00:00+00:00", "name": "a", "method": "GET", "url": "https://prod/200"},
+        {"timestamp": "2026-01-01T00:00:01+00:00", "name": "b", "method": "GET", "url": "https://prod/204"},
+    ]
+    history_path.write_text("\n".join(json.dumps({**line, "status_code": 200}) for line in lines), encoding="utf-8")
+    code = main(
+        [
+            str(workspace_path),
+            "-e",
+            "Local",
+            "--var",
+            f"base={server_url}",
+            "--replay",
+            str(history_path),
+            "--target",
+            "{{base}}",
+            "--speed",
+            "0",
+        ]
+    )
+    assert code == 1
+    report = json.loads(capsys.readouterr().out)
+    assert report["summary"]["status_matches"] == 1
+    assert [item["replay"]["status_code"] for item in report["results"]] == [200, 204]
+
+
+def test_record_mode_adds_proxied_endpoints_to_a_collection(workspace_path, server_url, tmp_path, capsys):
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    history_path = tmp_path / "history.jsonl"
+    argv = [str(workspace_path), "--record", str(port), "--record-collection", "--history", str(history_path)]
+    result = {}
+    runner = threading.Thread(target=lambda: result.update(code=main([*argv, "--duration", "1"])))
+    runner.start()
+    proxy = f"http://127.0.0.1:{port}"
+    deadline = time.monotonic() + 5
+    while True:
+        try:
+            with httpx.Client(proxy=proxy) as client:
+                assert client.get(f"{server_url}/200").status_code == 200
+                assert client.post(f"{server_url}/201", content=b"{}").status_code == 201
+            break
+        except httpx.ConnectError:
+            assert time.monotonic() < deadline
+            time.sleep(0.05)
+    runner.join()
+
+    assert result["code"] == 0
+    assert "Added 2 requests" in capsys.readouterr().err
+    workspace = load_workspace(workspace_path)
+    assert [collection.name for collection in workspace.collections] == ["API", "Recorded"]
+    assert [request.name for request in workspace.requests[3:]] == ["GET /200", "POST /201"]
+    assert len(history_path.read_text(encoding="utf-8").splitlines()) == 2
@@ -0,0 +1,105 @@
+import json
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from core.diff import (
+    ChangeKind,
+    DiffMode,
+    DiffOptions,
+    DiffSource,
+    diff_json,
+    diff_sources,
+    diff_text,
+    parse_ignore_fields,
+)
+from core.model import HistoryEntry
+from core.storage.history_jsonl import append_history_entry, load_history_entries
+
+
+def test_json_diff_ignores_key_order():
+    left = {"a": 1, "b": {"x": [1, 2], "y": "z"}}
+    right = {"b": {"y": "z", "x": [1, 2]}, "a": 1}
+    changes, truncated = diff_json(left, right)
+    assert changes == []
+    assert not truncated
+
+
+def test_json_diff_reports_changes_in_document_order():
+    left = {"id": 1, "name": "old", "tags": ["a", "b"], "gone": True}
+    right = {"id": 1, "name": "new", "tags": ["a"], "extra": {"k": None}}
+    changes, _ = diff_json(left, right)
+    assert [(change.path, change.kind) for change in changes] == [
+        ("$.name", ChangeKind.CHANGED),
+        ("$.tags[1]", ChangeKind.REMOVED),
+        ("$.gone", ChangeKind.REMOVED),
+        ("$.extra", ChangeKind.ADDED),
+    ]
+    assert changes[0].old == "old" and changes[0].new == "new"
+
+
+def test_json_diff_keeps_booleans_and_numbers_apart():
+    changes, _ = diff_json([True, 1, 1.0], [1, True, 1])
+    assert [change.path for change in changes] == ["$[0]", "$[1]"]
+
+
+def test_json_diff_ignore_fields_by_key_and_path():
+    left = {"meta": {"request_id": "a", "took": 3}, "items": [{"updated_at": 1, "v": 1}], "date": "x"}
+    right = {"meta": {"request_id": "b", "took": 4}, "items": [{"updated_at": 2, "v": 1}], "date": "y"}
+    changes, _ = diff_json(left, right, ignore_fields=("date", "*_at", "$.meta.request_id"))
+    assert [change.path for change in changes] == ["$.meta.took"]
+
+
+def test_json_diff_truncates_at_max_changes():
+    changes, truncated = diff_json(list(range(10)), list(range(1, 11)), max_changes=3)
+    assert len(changes) == 3
+    assert truncated
+
+
+def test_text_diff_matches_difflib_format():
+    left = "\n".join(f"line {i}" for i in range(100))
+    right = left.replace("line 50", "line fifty")
+    output = diff_text(left, right, "a", "b", context_lines=1)
+    assert output == ["--- a", "+++ b", "@@ -50,3 +50,3 @@", " line 49", "-line 50", "+line fifty", " line 51"]
+    assert diff_text(left, left) == []
+
+
+def test_diff_sources_falls_back_to_text_and_forced_json_fails():
+    left = DiffSource("l", "not json\nsame")
+    right = DiffSource("r", "still not json\nsame")
+    result = diff_sources(left, right)
+    assert result.mode is DiffMode.TEXT
+    assert result.change_count == 2
+
+    with pytest.raises(ValueError):
+        diff_sources(left, right, DiffOptions(mode=DiffMode.JSON))
+
+
+def test_diff_sources_json_mode():
+    left = DiffSource("l", json.dumps({"a": 1, "ts": 1}))
+    right = DiffSource("r", json.dumps({"ts": 2, "a": 1}))
+    result = diff_sources(left, right, DiffOptions(ignore_fields=("ts",)))
+    assert result.mode is DiffMode.JSON
+    assert result.identical
+
+
+def test_parse_ignore_fields():
+    assert parse_ignore_fields(" a, b ,,\n$.c ") == ("a", "b", "$.c")
+
+
+def test_history_entry_response_body_round_trip():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / "history.jsonl"
+        entry = HistoryEntry(
+            timestamp="2026-01-01T00:00:00+00:00",
+            name="req",
+            method="GET",
+            url="https://example.com",
+            status_code=200,
+            response_body='{"ok": true}',
+        )
+        append_history_entry(path, entry)
+        (loaded,) = load_history_entries(path)
+        assert loaded.response_body == '{"ok": true}'
+        assert DiffSource.from_history(loaded).body == '{"ok": true}'
@@ -0,0 +1,83 @@
+from core.fuzzy_index import FuzzyEntry, FuzzyIndex
+
+
+def _index():
+    index = FuzzyIndex()
+    index.add(FuzzyEntry("req-1", "List Users", "GET", "https://api.test/users", "API / Users"))
+    index.add(FuzzyEntry("req-2", "Create User", "POST", "https://api.test/users", "API / Users"))
+    index.add(FuzzyEntry("req-3", "Refresh Token", "POST", "https://api.test/auth/refresh", "API / Auth"))
+    index.add(FuzzyEntry("req-4", "Health Check", "GET", "https://api.test/health", "Sandbox"))
+    return index
+
+
+def _keys(matches):
+    return [match.entry.key for match in matches]
+
+
+def test_name_prefix_ranks_before_url_match():
+    index = _index()
+    assert _keys(index.search("list"))[0] == "req-1"
+    assert _keys(index.search("users")) == ["req-1", "req-2"]
+
+
+def test_all_tokens_must_match():
+    index = _index()
+    assert _keys(index.search("post auth")) == ["req-3"]
+    assert _keys(index.search("get sandbox")) == ["req-4"]
+    assert index.search("health post") == []
+
+
+def test_short_tokens_match_word_prefixes():
+    index = _index()
+    assert _keys(index.search("r t")) == ["req-3"]
+    assert _keys(index.search("he")) == ["req-4"]
+
+
+def test_misspelt_token_falls_back_to_shared_trigrams():
+    index = _index()
+    assert _keys(index.search("refrsh tokn")) == ["req-3"]
+    assert index.search("xyzzy") == []
+
+
+def test_add_replaces_and_remove_forgets_entries():
+    index = _index()
+    index.add(FuzzyEntry("req-4", "Ping", "GET", "https://api.test/ping"))
+    assert index.search("health") == []
+    assert _keys(index.search("ping")) == ["req-4"]
+    assert len(index) == 4
+
+    index.remove("req-4")
+    assert "req-4" not in index
+    assert index.search("ping") == []
+    index.clear()
+    assert len(index) == 0
+
+
+def test_large_index_finds_specific_entry():
+    index = FuzzyIndex()
+    for number in range(20000):
+        index.add(FuzzyEntry(f"req-{number}", f"Get item {number}", "GET", f"https://api.test/items/{number}"))
+    matches = index.search("item 12345", limit=5)
+    assert _keys(matches)[0] == "req-12345"
+    assert len(index.search("get", limit=10)) == 10
+
+
+def test_broad_query_ranks_every_candidate():
+    index = FuzzyIndex()
+    for number in range(50000):
+        index.add(FuzzyEntry(f"r{number}", f"Item {number}", "POST", f"https://api.test/target/{number}/get"))
+    index.add(FuzzyEntry("exact", "Get", "POST", "https://api.test/target/get"))
+    matches = index.search("get", limit=5)
+    assert _keys(matches)[0] == "exact"
+    assert matches[0].score == 12
+
+
+def test_misspelt_broad_query_ranks_name_matches_first():
+    index = FuzzyIndex()
+    for number in range(3000):
+        name = f"Refresh session {number}" if number % 3 == 0 else f"Get item {number}"
+        index.add(FuzzyEntry(f"r{number}", name, "GET", f"https://api.test/v1/session/{number}"))
+    matches = index.search("sesion", limit=20)
+    assert len(matches) == 20
+    assert all(match.entry.name.startswith("Refresh session") and match.score == 2 for match in matches)
+    assert _keys(matches)[:2] == ["r0", "r3"]
@@ -0,0 +1,79 @@
+from core.model import HistoryEntry
+
+
+def _entry(number: int, error: str | None = None) -> HistoryEntry:
+    return HistoryEntry(
+        timestamp=f"2026-01-01T00:00:{number % 60:02d}",
+        name=f"Request {number}",
+        method="GET",
+        url=f"https://example.test/{number}",
+        status_code=None if error else 200,
+        elapsed_ms=number,
+        error=error,
+    )
+
+
+def test_rows_are_newest_first_and_appends_land_on_top(qapp):
+    from PySide6.QtCore import Qt
+
+    from app.ui.panels.history_panel import HistoryTableModel
+
+    model = HistoryTableModel()
+    model.set_entries([_entry(0), _entry(1), _entry(2)])
+    assert [model.entry_at(row).name for row in range(model.rowCount())] == ["Request 2", "Request 1", "Request 0"]
+
+    inserted = []
+    model.rowsInserted.connect(lambda _parent, first, last: inserted.append((first, last)))
+    model.add_entry(_entry(3))
+    assert inserted == [(0, 0)]
+    assert model.rowCount() == 4
+    assert model.data(model.index(0, 1)) == "Request 3"
+    assert model.data(model.index(3, 1)) == "Request 0"
+    assert model.data(model.index(0, 0), Qt.ItemDataRole.UserRole).elapsed_ms == 3
+    assert model.entry_at(4) is None
+    assert [entry.name for entry in model.entries()][:2] == ["Request 3", "Request 2"]
+
+
+def test_rows_are_fetched_in_batches(qapp):
+    from PySide6.QtCore import QModelIndex
+
+    from app.ui.panels.history_panel import HistoryTableModel
+
+    batch = HistoryTableModel.FETCH_BATCH
+    total = batch * 2 + 7
+    model = HistoryTableModel()
+    model.set_entries([_entry(number) for number in range(total)])
+    assert (model.rowCount(), model.total_count()) == (batch, total)
+    assert model.entry_at(batch) is None
+
+    root = QModelIndex()
+    counts = []
+    while model.canFetchMore(root):
+        model.fetchMore(root)
+        counts.append(model.rowCount())
+    assert counts == [batch * 2, total]
+    assert model.entry_at(total - 1).name == "Request 0"
+    model.fetchMore(root)
+    assert model.rowCount() == total
+
+
+def test_filter_proxy_splits_success_and_failure(qapp):
+    from app.ui.panels.history_panel import HistoryFilterProxyModel, HistoryTableModel
+
+    model = HistoryTableModel()
+    model.set_entries([_entry(0), _entry(1, error="timeout"), _entry(2), _entry(3, error="refused")])
+    proxy = HistoryFilterProxyModel()
+    proxy.setSourceModel(model)
+
+    def names() -> list[str]:
+        return [proxy.index(row, 1).data() for row in range(proxy.rowCount())]
+
+    assert names() == ["Request 3", "Request 2", "Request 1", "Request 0"]
+    proxy.set_mode(HistoryFilterProxyModel.FILTER_SUCCESS)
+    assert names() == ["Request 2", "Request 0"]
+    proxy.set_mode(HistoryFilterProxyModel.FILTER_FAILURE)
+    assert names() == ["Request 3", "Request 1"]
+    model.add_entry(_entry(4, error="reset"))
+    assert names() == ["Request 4", "Request 3", "Request 1"]
+    proxy.set_mode(HistoryFilterProxyModel.FILTER_ALL)
+    assert proxy.rowCount() == 5
@@ -0,0 +1,50 @@
+import time
+from pathlib import Path
+
+from core.model import HistoryEntry
+from core.storage.history_jsonl import append_history_entry
+
+
+def _wait_until_loaded(qapp, dialog) -> None:
+    deadline = time.monotonic() + 10
+    while dialog.is_loading() and time.monotonic() < deadline:
+        qapp.processEvents()
+        time.sleep(0.01)
+    qapp.processEvents()
+
+
+def test_dialog_loads_history_on_a_worker(qapp, tmp_path: Path):
+    from app.ui.panels.history_stats import HistoryStatsDialog
+
+    path = tmp_path / "history.jsonl"
+    for number in range(3):
+        append_history_entry(
+            path,
+            HistoryEntry(
+                timestamp="2026-01-01T00:00:00+00:00",
+                name="Users",
+                method="GET",
+                url=f"https://api.test/users/{number}",
+                status_code=200,
+                elapsed_ms=10 + number,
+            ),
+        )
+
+    dialog = HistoryStatsDialog(path)
+    assert dialog._summary_label.text() == "Loading history..."
+    assert not dialog._range_combo.isEnabled()
+    _wait_until_loaded(qapp, dialog)
+    assert not dialog.is_loading()
+    # The entries are older than the default range.
+    dialog._range_combo.setCurrentIndex(3)
+    assert dialog._summary_label.text() == "1 endpoints / 3 requests"
+    dialog.reject()
+
+
+def test_closing_while_loading_stops_the_worker(qapp, tmp_path: Path):
+    from app.ui.panels.history_stats import HistoryStatsDialog
+
+    dialog = HistoryStatsDialog(tmp_path / "missing.jsonl")
+    dialog.reject()
+    _wait_until_loaded(qapp, dialog)
+    assert not dialog.is_loading()
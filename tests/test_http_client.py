@@ -0,0 +1,47 @@
+import logging
+
+import httpx
+
+from core.http_client import HttpClient
+from core.logger import get_logger
+from core.model import RequestData
+
+
+def test_multipart_sends_repeated_form_fields_with_files(tmp_path, caplog):
+    upload = tmp_path / "report.csv"
+    upload.write_text("a,b\n1,2\n", encoding="utf-8")
+    seen = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen["content_type"] = request.headers["content-type"]
+        seen["body"] = request.read()
+        # A streamed body, so httpx sets `elapsed` once the client reads it.
+        return httpx.Response(204, stream=httpx.ByteStream(b""))
+
+    request = RequestData(
+        name="Upload",
+        method="POST",
+        url="http://upload.test/files",
+        headers=[("Content-Type", "application/json")],
+        body_type="multipart",
+        form_fields=[("tag", "a"), ("tag", "b"), ("note", "daily"), ("password", "hunter2")],
+        files=[("file", str(upload))],
+    )
+    # The DEBUG request dump must cope with the grouped form data too.
+    logger = get_logger("http_client")
+    level = logger.level
+    logger.setLevel(logging.DEBUG)
+    try:
+        with caplog.at_level(logging.DEBUG, logger=logger.name):
+            with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+                response = HttpClient().send(request, client)
+    finally:
+        logger.setLevel(level)
+    dump = "\n".join(record.getMessage() for record in caplog.records if record.name == logger.name)
+    assert "('tag', 'b')" in dump and "hunter2" not in dump
+
+    assert response.status_code == 204
+    assert seen["content_type"].startswith("multipart/form-data; boundary=")
+    body = seen["body"]
+    assert body.count(b'name="tag"') == 2 and b'name="note"' in body
+    assert b'filename="report.csv"' in body and b"a,b\n1,2\n" in body
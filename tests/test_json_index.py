@@ -0,0 +1,84 @@
+import json
+
+import pytest
+
+from core.json_index import JsonIndex, JsonNodeKind
+
+DOCUMENT = {
+    "id": 7,
+    "user name": "Jane",
+    "tags": ["a", {"deep": [1, 2, 3]}, []],
+    "flags": {"active": True, "deleted": False, "note": None},
+}
+
+
+def test_root_and_children_are_indexed_lazily():
+    text = json.dumps(DOCUMENT, indent=4)
+    index = JsonIndex(text)
+
+    (root,) = index.roots()
+    assert root.kind is JsonNodeKind.OBJECT
+    assert root.path == "$"
+    assert text[root.start : root.end] == text.strip()
+
+    children = index.children(root)
+    assert [child.key for child in children] == ["id", "user name", "tags", "flags"]
+    assert [child.kind for child in children] == [
+        JsonNodeKind.NUMBER,
+        JsonNodeKind.STRING,
+        JsonNodeKind.ARRAY,
+        JsonNodeKind.OBJECT,
+    ]
+    assert children[1].path == '$["user name"]'
+    assert children[1].preview == '"Jane"'
+
+    tags = index.children(children[2])
+    assert [child.path for child in tags] == ["$.tags[0]", "$.tags[1]", "$.tags[2]"]
+    assert index.children(tags[2]) == []
+
+    deep = index.children(index.children(tags[1])[0])
+    assert [child.preview for child in deep] == ["1", "2", "3"]
+    assert deep[2].path == "$.tags[1].deep[2]"
+
+    flags = index.children(children[3])
+    assert [child.kind for child in flags] == [
+        JsonNodeKind.BOOLEAN,
+        JsonNodeKind.BOOLEAN,
+        JsonNodeKind.NULL,
+    ]
+
+
+def test_node_offsets_point_into_text():
+    text = json.dumps(DOCUMENT, separators=(",", ":"))
+    index = JsonIndex(text)
+    for child in index.children(index.roots()[0]):
+        assert json.loads(text[child.start : child.end]) == DOCUMENT[child.key]
+
+
+def test_strings_with_brackets_and_escapes():
+    text = json.dumps({"a": "}{][\\\"", "b": [1]})
+    index = JsonIndex(text)
+    children = index.children(index.roots()[0])
+    assert json.loads(text[children[0].start : children[0].end]) == '}{][\\"'
+    assert children[1].kind is JsonNodeKind.ARRAY
+
+
+def test_multiple_top_level_values():
+    index = JsonIndex('{"a": 1}\n{"a": 2}\n')
+    roots = index.roots()
+    assert [root.path for root in roots] == ["$[0]", "$[1]"]
+    assert index.children(roots[1])[0].preview == "2"
+
+
+def test_large_array_children_are_streamed():
+    text = json.dumps(list(range(200_000)))
+    index = JsonIndex(text)
+    children = index.iter_children(index.roots()[0])
+    first = [next(children) for _ in range(3)]
+    assert [node.preview for node in first] == ["0", "1", "2"]
+
+
+@pytest.mark.parametrize("text", ["[1, 2", "{]", "]"])
+def test_unbalanced_documents_raise(text):
+    with pytest.raises(ValueError):
+        JsonIndex(text)
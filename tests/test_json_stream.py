@@ -0,0 +1,114 @@
+import io
+import json
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from core.json_stream import (
+    JsonStreamError,
+    JsonStreamFormatter,
+    format_json_file,
+    format_json_stream,
+    validate_json_stream,
+)
+
+SAMPLE = {
+    "id": 42,
+    "name": "Jane \"JJ\" Doe",
+    "tags": ["a", "b", []],
+    "empty": {},
+    "nested": {"ratio": -1.5e3, "ok": True, "missing": None, "items": [{"x": 0}, {"x": 1}]},
+}
+
+
+def _chunked(data: bytes, size: int):
+    return [data[index : index + size] for index in range(0, len(data), size)]
+
+
+def _format(data: bytes, chunk_size: int, indent=4) -> str:
+    output = io.StringIO()
+    format_json_stream(_chunked(data, chunk_size), output, indent=indent)
+    return output.getvalue()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 1024])
+def test_pretty_print_matches_json_dumps(chunk_size):
+    data = json.dumps(SAMPLE, separators=(",", ":")).encode("utf-8")
+    assert _format(data, chunk_size) == json.dumps(SAMPLE, indent=4)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 1024])
+def test_minify_matches_compact_dumps(chunk_size):
+    data = json.dumps(SAMPLE, indent=2).encode("utf-8")
+    assert _format(data, chunk_size, indent=None) == json.dumps(SAMPLE, separators=(",", ":"))
+
+
+def test_multibyte_characters_split_across_chunks():
+    data = json.dumps({"greeting": "안녕하세요 é"}, ensure_ascii=False).encode("utf-8")
+    assert json.loads(_format(data, 1)) == {"greeting": "안녕하세요 é"}
+
+
+def test_escape_sequences_are_preserved():
+    data = b'["line\\nbreak", "\\u00e9", "tab\\t"]'
+    assert _format(data, 1, indent=None) == '["line\\nbreak","\\u00e9","tab\\t"]'
+
+
+def test_ndjson_values_are_written_one_per_line():
+    data = b'{"a": 1}\n{"a": 2}\n[3]\n'
+    output = io.StringIO()
+    count = format_json_stream(_chunked(data, 4), output, indent=None)
+    assert count == 3
+    assert output.getvalue().splitlines() == ['{"a":1}', '{"a":2}', "[3]"]
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        b'{"a": 1,}',
+        b"[1 2]",
+        b'{"a" 1}',
+        b"[01]",
+        b"[1.]",
+        b"[tru]",
+        b'"unterminated',
+        b'["bad \\x escape"]',
+        b"[1]]",
+        b"{",
+        b"",
+        b"-",
+        b'["\x01"]',
+    ],
+)
+def test_invalid_documents_raise(payload):
+    with pytest.raises(JsonStreamError):
+        validate_json_stream(_chunked(payload, 1) if payload else [payload])
+
+
+def test_error_reports_offset():
+    with pytest.raises(JsonStreamError) as exc_info:
+        validate_json_stream([b'{"a": [1, 2', b", x]}"])
+    assert exc_info.value.offset == 13
+
+
+def test_output_is_flushed_per_chunk():
+    pieces = []
+    formatter = JsonStreamFormatter(sink=pieces.append, indent=None)
+    formatter.feed(b'["')
+    for _ in range(1000):
+        formatter.feed(b"x" * 100)
+    formatter.feed(b'", 1, 2]')
+    formatter.close()
+
+    assert max(len(piece) for piece in pieces) <= 100
+    assert json.loads("".join(pieces)) == ["x" * 100_000, 1, 2]
+
+
+def test_format_json_file_round_trip():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        source = Path(tmp_dir) / "in.json"
+        target = Path(tmp_dir) / "out.json"
+        source.write_text(json.dumps(SAMPLE), encoding="utf-8")
+
+        assert format_json_file(source, target, indent=2) == 1
+        assert target.read_text(encoding="utf-8") == json.dumps(SAMPLE, indent=2)
@@ -0,0 +1,53 @@
+import random
+
+import pytest
+
+from core.latency_compare import EnvironmentLatency, build_report, format_report, interleaved_schedule
+from core.stats import mann_whitney_u, mean_confidence_interval, t_ppf, t_sf, welch_t_test
+
+
+def test_t_distribution_matches_reference_values():
+    assert t_ppf(0.975, 10) == pytest.approx(2.228139, abs=1e-5)
+    assert t_ppf(0.975, 1e9) == pytest.approx(1.959964, abs=1e-5)
+    assert t_sf(2.0, 5) == pytest.approx(0.050970, abs=1e-5)
+    assert t_ppf(0.025, 10) == pytest.approx(-2.228139, abs=1e-5)
+
+
+def test_welch_and_mann_whitney_on_known_samples():
+    a = [1.0, 2, 3, 4, 5, 6, 7, 8]
+    b = [3.0, 4, 5, 6, 7, 8, 9, 10, 11]
+    welch = welch_t_test(a, b)
+    assert welch.difference == pytest.approx(2.5)
+    assert welch.df == pytest.approx(14.997, abs=1e-3)
+    assert welch.p_value == pytest.approx(0.0655, abs=1e-3)
+    assert welch.ci_low < 0 < welch.ci_high
+
+    rank_test = mann_whitney_u(a, b)
+    assert rank_test.u == 54
+    assert 0.05 < rank_test.p_value < 0.15
+
+
+def test_confidence_interval_contains_mean():
+    low, high = mean_confidence_interval([10.0, 12.0, 11.0, 13.0])
+    assert low < 11.5 < high
+    assert mean_confidence_interval([5.0]) == (5.0, 5.0)
+
+
+def test_interleaved_schedule_rotates_first_environment():
+    assert interleaved_schedule(["a", "b", "c"], 3) == ["a", "b", "c", "b", "c", "a", "c", "a", "b"]
+    assert interleaved_schedule(["a", "b"], 1, start_round=1) == ["b", "a"]
+
+
+def test_report_flags_real_differences_only():
+    rng = random.Random(7)
+    prod = EnvironmentLatency("Prod", [rng.gauss(100, 5) for _ in range(60)])
+    staging = EnvironmentLatency("Staging", [rng.gauss(130, 5) for _ in range(60)])
+    twin = EnvironmentLatency("Twin", [rng.gauss(100, 5) for _ in range(60)])
+    report = build_report("List users", [prod, staging, twin])
+
+    slower, same = report.comparisons
+    assert slower.other == "Staging" and slower.is_significant()
+    assert 25 < slower.mean_difference < 35
+    assert not same.is_significant()
+    text = format_report(report)
+    assert "Staging vs Prod" in text and "-> significant" in text
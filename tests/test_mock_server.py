@@ -0,0 +1,141 @@
+import json
+import time
+
+import httpx
+
+from core.mock_server import (
+    SOURCE_CONFIG,
+    SOURCE_DEFAULT,
+    SOURCE_HISTORY,
+    MockResponse,
+    MockRoute,
+    MockServerThread,
+    MockSource,
+    RouteTable,
+    build_routes,
+    route_path,
+)
+from core.model import HistoryEntry, WorkspaceData, WorkspaceRequest
+from core.storage.json_storage import save_workspace
+
+
+def _request(request_id, name, method, url):
+    return WorkspaceRequest(id=request_id, folder_id="folder-1", name=name, method=method, url=url)
+
+
+def test_route_paths_and_template_matching():
+    assert route_path("{{base_url}}/users/{{id}}?page=2") == "/users/{{id}}"
+    assert route_path("https://api.example/v1/items/") == "/v1/items"
+    assert route_path("{{host}}/a", {"host": "http://localhost/prefix"}) == "/prefix/a"
+
+    table = RouteTable.build(
+        [
+            MockRoute("GET", "/users/{{id}}", "user", MockResponse(200)),
+            MockRoute("GET", "/users/me", "me", MockResponse(200)),
+            MockRoute("DELETE", "/users/:id", "delete", MockResponse(204)),
+        ]
+    )
+    assert table.match("GET", "/users/me").name == "me"
+    assert table.match("GET", "/users/42/").name == "user"
+    assert table.match("POST", "/users/42") is None
+    assert table.allowed_methods("/users/42") == ["DELETE", "GET"]
+
+
+def test_configured_responses_win_over_history_captures():
+    requests = [
+        _request("req-1", "List users", "GET", "{{base}}/users"),
+        _request("req-2", "Get user", "GET", "{{base}}/users/{{id}}"),
+        _request("req-3", "Health", "GET", "{{base}}/health"),
+    ]
+    history = [
+        HistoryEntry("2026-01-01T00:00:00+00:00", "x", "GET", "https://prod/users/1", 200, 5, response_body='{"id": 1}'),
+        HistoryEntry("2026-01-01T00:00:01+00:00", "x", "GET", "https://prod/users/2", 404, 5, response_body="{}"),
+        HistoryEntry("2026-01-01T00:00:02+00:00", "x", "GET", "https://prod/users", 200, 5, response_body="[]"),
+    ]
+    mocks = {"List users": MockResponse(200, body=b'[{"id": 1}]')}
+    table = build_routes(requests, {}, mocks, history)
+
+    by_name = {route.name: route for route in table.routes}
+    assert by_name["List users"].source == SOURCE_CONFIG
+    assert by_name["List users"].response.body == b'[{"id": 1}]'
+    assert (by_name["Get user"].source, by_name["Get user"].response.status) == (SOURCE_HISTORY, 404)
+    assert (by_name["Health"].source, by_name["Health"].response.status) == (SOURCE_DEFAULT, 501)
+
+
+def test_many_history_captures_replace_each_route_once():
+    requests = [
+        _request(f"req-{number}", f"Item {number}", "GET", f"{{{{base}}}}/items{number}/{{{{id}}}}")
+        for number in range(2000)
+    ]
+    # Four passes over every route, each with a newer status.
+    history = [
+        HistoryEntry("2026-01-01T00:00:00+00:00", "x", "GET", f"https://prod/items{number % 2000}/7", 200 + pass_, 5)
+        for pass_ in range(4)
+        for number in range(2000)
+    ]
+    started = time.perf_counter()
+    table = build_routes(requests, {}, {}, history)
+    elapsed = time.perf_counter() - started
+
+    assert len(table.routes) == 2000
+    # The newest capture (last in the file) answers each route.
+    assert {route.response.status for route in table.routes} == {203}
+    assert table.match("GET", "/items5/1").source == SOURCE_HISTORY
+    assert elapsed < 2.0
+
+    # Templates in different lookup buckets still match in the order they were added.
+    table = RouteTable.build(
+        [
+            MockRoute("GET", "/{{kind}}/me", "any-me", MockResponse(200)),
+            MockRoute("GET", "/users/{{id}}", "user", MockResponse(200)),
+        ]
+    )
+    assert table.match("GET", "/users/me").name == "any-me"
+    assert table.match("GET", "/users/7").name == "user"
+
+
+def test_server_answers_routes_over_keep_alive():
+    routes = RouteTable.build(
+        [
+            MockRoute("GET", "/items/{{id}}", "item", MockResponse(200, body=b'{"ok": true}')),
+            MockRoute("POST", "/items", "create", MockResponse(201, (("X-Mock", "1"),), b"created", latency_ms=50)),
+        ]
+    )
+    with MockServerThread(routes) as server, httpx.Client(base_url=server.url) as client:
+        response = client.get("/items/7?verbose=1")
+        assert response.status_code == 200
+        assert response.json() == {"ok": True}
+        assert response.headers["content-type"] == "application/json"
+
+        started = time.perf_counter()
+        created = client.post("/items", content=b"x" * 1000)
+        assert (created.status_code, created.text, created.headers["x-mock"]) == (201, "created", "1")
+        assert time.perf_counter() - started >= 0.05
+
+        assert client.head("/items/7").content == b""
+        assert client.get("/missing").status_code == 404
+        not_allowed = client.delete("/items/7")
+        assert (not_allowed.status_code, not_allowed.headers["allow"]) == (405, "GET")
+        assert server.server.request_count == 5
+
+
+def test_routes_reload_when_mocks_file_changes(tmp_path):
+    workspace_path = tmp_path / "workspace.json"
+    save_workspace(
+        workspace_path,
+        WorkspaceData(schema_version=1, requests=[_request("req-1", "Ping", "GET", "{{base}}/ping")]),
+    )
+    mocks_path = tmp_path / "mocks.json"
+    mocks_path.write_text(json.dumps({"Ping": {"body": "one"}}), encoding="utf-8")
+    source = MockSource(workspace_path, mocks_path=mocks_path)
+
+    with MockServerThread(source.load(), source=source, reload_interval_s=0.05) as server:
+        assert httpx.get(server.url + "/ping").text == "one"
+        mocks_path.write_text(json.dumps({"Ping": {"status": 503, "body": {"state": "down"}}}), encoding="utf-8")
+        deadline = time.monotonic() + 5
+        response = httpx.get(server.url + "/ping")
+        while response.status_code != 503 and time.monotonic() < deadline:
+            time.sleep(0.05)
+            response = httpx.get(server.url + "/ping")
+        assert response.status_code == 503
+        assert response.json() == {"state": "down"}
@@ -0,0 +1,68 @@
+import random
+import time
+
+from core.model import RequestData
+from core.monitor import (
+    ALERT_FAILURE,
+    ALERT_LATENCY,
+    ALERT_RECOVERED,
+    AlertEvaluator,
+    AlertRule,
+    MonitorSample,
+    MonitorScheduler,
+    MonitorTarget,
+)
+from core.timeseries import RESOLUTION_RAW, TimeSeriesStore
+
+
+def _sample(latency_ms, error=None):
+    return MonitorSample("req-1", "Ping", 0.0, 500 if error else 200, latency_ms, error)
+
+
+def test_alerts_need_consecutive_breaches_and_fire_once_until_recovery():
+    evaluator = AlertEvaluator(AlertRule(max_latency_ms=100.0, consecutive=2))
+    assert evaluator.evaluate(_sample(150.0)) is None
+    alert = evaluator.evaluate(_sample(None, "HTTP 500"))
+    assert alert.kind == ALERT_FAILURE
+    assert evaluator.evaluate(_sample(200.0)) is None
+    assert evaluator.evaluate(_sample(20.0)).kind == ALERT_RECOVERED
+    assert evaluator.evaluate(_sample(20.0)) is None
+
+    evaluator.evaluate(_sample(150.0))
+    assert evaluator.evaluate(_sample(150.0)).kind == ALERT_LATENCY
+
+
+def test_jitter_stays_within_bounds():
+    scheduler = MonitorScheduler(
+        [MonitorTarget("req-1", RequestData(name="Ping", method="GET", url="http://unused"))],
+        TimeSeriesStore(),
+        rng=random.Random(1),
+    )
+    target = MonitorTarget("req-1", RequestData(name="Ping", method="GET", url="http://unused"), 10.0, 0.2)
+    intervals = [scheduler.next_interval(target) for _ in range(200)]
+    assert 8.0 <= min(intervals) < 8.5
+    assert 11.5 < max(intervals) <= 12.0
+
+
+def test_scheduler_probes_targets_and_records_samples(server_url, tmp_path):
+    store = TimeSeriesStore()
+    alerts = []
+    targets = [
+        MonitorTarget("ok", RequestData(name="Ping", method="GET", url=f"{server_url}/200"), 0.05, 0.0),
+        MonitorTarget("down", RequestData(name="Down", method="GET", url=f"{server_url}/503"), 0.05, 0.0),
+    ]
+    scheduler = MonitorScheduler(
+        targets, store, rule=AlertRule(consecutive=2), on_alert=alerts.append, autosave_path=tmp_path / "ts.json"
+    )
+    scheduler.start()
+    deadline = time.monotonic() + 10
+    while len(store.points("down", resolution=RESOLUTION_RAW)) < 3 and time.monotonic() < deadline:
+        time.sleep(0.02)
+    scheduler.stop()
+
+    ok_points = store.points("ok", resolution=RESOLUTION_RAW)
+    assert ok_points and all(point.errors == 0 and point.status_code == 200 for point in ok_points)
+    down_points = store.points("down", resolution=RESOLUTION_RAW)
+    assert all(point.errors == 1 and point.mean_ms is None for point in down_points)
+    assert [(alert.key, alert.kind) for alert in alerts] == [("down", ALERT_FAILURE)]
+    assert TimeSeriesStore.load(tmp_path / "ts.json").keys()
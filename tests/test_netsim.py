@@ -0,0 +1,114 @@
+import asyncio
+
+import httpx
+import pytest
+
+from core.http_client import HttpClient
+from core.model import NetworkConfig, RequestData
+from core.netsim import (
+    AsyncSimulatedTransport,
+    NetworkProfile,
+    NetworkSimulator,
+    SimulatedTransport,
+    parse_profile,
+)
+from core.template import SIMULATE_VARIABLE, render_request
+
+BODY = b"x" * 10240
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    # Consume the stream as a network transport would (read() may use cached content).
+    b"".join(request.stream)
+    return httpx.Response(200, headers={"Content-Length": str(len(BODY))}, stream=httpx.ByteStream(BODY))
+
+
+def _client(profile: NetworkProfile, sleeps: list[float]) -> httpx.Client:
+    transport = SimulatedTransport(NetworkSimulator(profile), httpx.MockTransport(_handler), sleep=sleeps.append)
+    return httpx.Client(transport=transport)
+
+
+def test_parse_profile_presets_overrides_and_errors():
+    profile = parse_profile("3g error=0.1, status=502/503 seed=7 down=0")
+    assert (profile.latency_ms, profile.upload_kb_s, profile.download_kb_s) == (560, 94, None)
+    assert (profile.error_rate, profile.error_statuses, profile.seed) == (0.1, (502, 503), 7)
+    assert parse_profile("") is None and parse_profile(" off ") is None
+    for bad in ("5g", "latency=-1", "error=2", "status=404", "speed=1"):
+        with pytest.raises(ValueError):
+            parse_profile(bad)
+
+
+def test_same_seed_gives_the_same_conditions():
+    profile = NetworkProfile(latency_ms=100, jitter_ms=50, reset_rate=0.3, error_rate=0.3, seed=42)
+    first = [simulator.plan() for simulator in [NetworkSimulator(profile)] for _ in range(20)]
+    second = [simulator.plan() for simulator in [NetworkSimulator(profile)] for _ in range(20)]
+    assert first == second
+    assert all(0.05 <= plan.delay_s <= 0.15 for plan in first)
+    assert any(plan.error_status for plan in first) and any(plan.reset_at is not None for plan in first)
+
+
+def test_latency_and_bandwidth_are_paced_through_sleep():
+    sleeps: list[float] = []
+    with _client(NetworkProfile(latency_ms=200, download_kb_s=20, upload_kb_s=4), sleeps) as client:
+        response = client.post("http://sim.test/upload", content=b"u" * 2048)
+    assert response.content == BODY
+    assert sleeps[0] == pytest.approx(0.2)
+    # 2 KiB up at 4 KiB/s plus 10 KiB down at 20 KiB/s.
+    assert sum(sleeps[1:]) == pytest.approx(0.5 + 0.5)
+
+
+def test_synthetic_errors_and_resets():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return _handler(request)
+
+    simulator = NetworkSimulator(NetworkProfile(error_rate=1.0, error_statuses=(503,)))
+    transport = SimulatedTransport(simulator, httpx.MockTransport(handler), sleep=lambda _: None)
+    with httpx.Client(transport=transport) as client:
+        response = client.get("http://sim.test/")
+    assert response.status_code == 503 and response.headers["X-Simulated"] == "error"
+    assert calls == []
+
+    with _client(NetworkProfile(reset_rate=1.0), []) as client:
+        with pytest.raises(httpx.ReadError, match="reset"):
+            client.get("http://sim.test/")
+
+    with _client(NetworkProfile(latency_ms=5000), []) as client:
+        with pytest.raises(httpx.ReadTimeout):
+            client.get("http://sim.test/", timeout=1.0)
+
+
+def test_async_transport_applies_the_same_conditions():
+    sleeps: list[float] = []
+
+    async def sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+
+    async def run() -> bytes:
+        simulator = NetworkSimulator(NetworkProfile(latency_ms=50, download_kb_s=10))
+        transport = AsyncSimulatedTransport(simulator, httpx.MockTransport(_handler), sleep=sleep)
+        async with httpx.AsyncClient(transport=transport) as client:
+            return (await client.get("http://sim.test/")).content
+
+    assert asyncio.run(run()) == BODY
+    assert sum(sleeps) == pytest.approx(0.05 + 1.0)
+
+
+def test_http_client_simulates_per_request_or_environment(server_url):
+    client = HttpClient()
+    request = RequestData(
+        name="Ping", method="GET", url=f"{server_url}/200", network=NetworkConfig(simulate="error=1 status=502")
+    )
+    assert client.send(request).status_code == 502
+
+    from_environment = render_request(
+        RequestData(name="Ping", method="GET", url="{{base}}/200"),
+        {"base": server_url, SIMULATE_VARIABLE: "error=1 status=504"},
+    )
+    with client.create_client(from_environment) as http:
+        assert client.send(from_environment, http).status_code == 504
+
+    opted_out = RequestData(name="Ping", method="GET", url=f"{server_url}/200", network=NetworkConfig(simulate="off"))
+    assert HttpClient(simulate="error=1").send(opted_out).status_code == 200
@@ -0,0 +1,40 @@
+from core.profiling import StartupProfiler
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 10.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_phases_and_marks_are_relative_to_origin():
+    clock = _FakeClock()
+    profiler = StartupProfiler(clock=clock)
+    clock.now += 0.005
+    with profiler.phase("import Qt"):
+        clock.now += 0.120
+    profiler.mark("first paint")
+
+    records = profiler.records()
+    assert [record.name for record in records] == ["import Qt", "first paint"]
+    assert round(records[0].start_ms, 3) == 5.0
+    assert round(records[0].duration_ms, 3) == 120.0
+    assert records[1].duration_ms == 0.0
+
+
+def test_timeline_is_sorted_and_ends_with_total():
+    clock = _FakeClock()
+    profiler = StartupProfiler(clock=clock)
+    with profiler.phase("outer"):
+        clock.now += 0.010
+        with profiler.phase("inner"):
+            clock.now += 0.002
+    clock.now += 0.001
+
+    lines = profiler.format_timeline().splitlines()
+    assert lines[0] == "Startup timeline (ms)"
+    assert lines[2].endswith("outer")
+    assert lines[3].endswith("inner")
+    assert lines[-1].split() == ["13.0", "-", "total"]
@@ -0,0 +1,185 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+
+from core.mock_server import MockResponse, MockRoute, MockServerThread, RouteTable
+from core.model import WorkspaceCollection, WorkspaceData, WorkspaceFolder, WorkspaceRequest
+from core.recording_proxy import (
+    CollectionRecorder,
+    HistoryRecorder,
+    RecordedExchange,
+    RecordFilter,
+    RecordingProxyThread,
+    add_recorded_requests,
+)
+from core.storage.history_jsonl import load_history_entries
+
+_PAYLOAD = bytes(range(256)) * 4096  # 1 MiB
+
+
+class _ChunkedHandler(BaseHTTPRequestHandler):
+    """Echoes the length of the request body, then streams ``_PAYLOAD`` in chunks."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:
+        received = len(self.rfile.read(int(self.headers.get("Content-Length") or 0)))
+        self.send_response(200)
+        self.send_header("Transfer-Encoding", "chunked")
+        self.send_header("X-Received", str(received))
+        self.end_headers()
+        for start in range(0, len(_PAYLOAD), 100_000):
+            chunk = _PAYLOAD[start : start + 100_000]
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+        self.wfile.write(b"0\r\n\r\n")
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+class _OneRequestPerConnectionHandler(BaseHTTPRequestHandler):
+    """Answers the first request on a connection and drops any later one unanswered."""
+
+    protocol_version = "HTTP/1.1"
+    connections = 0
+
+    def setup(self) -> None:
+        super().setup()
+        type(self).connections += 1
+        self.answered = False
+
+    def do_GET(self) -> None:
+        self._answer_once()
+
+    def do_POST(self) -> None:
+        self._answer_once()
+
+    def _answer_once(self) -> None:
+        if self.answered:
+            self.close_connection = True
+            return
+        self.answered = True
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+def test_record_filter_globs():
+    record_filter = RecordFilter(hosts=("*.example.com", "localhost:8080"), exclude_paths=("/health*",))
+    assert record_filter.matches("API.example.com", "/users")
+    assert record_filter.matches("localhost:8080", "/")
+    assert not record_filter.matches("example.org", "/users")
+    assert not record_filter.matches("api.example.com", "/healthz")
+    assert RecordFilter().matches("anything", "/")
+
+
+def test_proxy_relays_and_records_filtered_exchanges(tmp_path):
+    routes = RouteTable.build(
+        [
+            MockRoute("GET", "/users/{{id}}", "user", MockResponse(200, body=b'{"id": 1}')),
+            MockRoute("POST", "/users", "create", MockResponse(201, body=b"created")),
+            MockRoute("GET", "/health", "health", MockResponse(200, body=b"ok")),
+        ]
+    )
+    history_path = tmp_path / "history.jsonl"
+    collected = CollectionRecorder()
+    recorders = [HistoryRecorder(history_path), collected]
+    with MockServerThread(routes) as upstream:
+        with RecordingProxyThread(recorders, RecordFilter(exclude_paths=("/health",))) as proxy:
+            with httpx.Client(proxy=proxy.url) as client:
+                assert client.get(upstream.url + "/users/1?full=1").json() == {"id": 1}
+                assert client.post(upstream.url + "/users", json={"name": "a"}).text == "created"
+                assert client.get(upstream.url + "/health").text == "ok"
+                assert client.get("http://127.0.0.1:1/unreachable").status_code == 502
+        assert upstream.server.request_count == 3
+
+    assert (proxy.proxy.exchange_count, proxy.proxy.recorded_count) == (4, 3)
+    entries = load_history_entries(history_path)
+    assert [(entry.name, entry.status_code, entry.response_body) for entry in entries] == [
+        ("GET /users/1", 200, '{"id": 1}'),
+        ("POST /users", 201, "created"),
+        ("GET /unreachable", None, None),
+    ]
+    assert entries[2].error
+    assert collected.exchanges[1].request_text() == '{"name":"a"}'
+
+
+def test_large_chunked_bodies_stream_through_with_capped_capture():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ChunkedHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    collected = CollectionRecorder()
+    try:
+        with RecordingProxyThread([collected], capture_bytes=1024) as proxy:
+            with httpx.Client(proxy=proxy.url) as client:
+                for _ in range(2):
+                    response = client.post(f"http://127.0.0.1:{server.server_address[1]}/stream", content=_PAYLOAD)
+                    assert response.content == _PAYLOAD
+                    assert response.headers["x-received"] == str(len(_PAYLOAD))
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    exchange = collected.exchanges[0]
+    assert (len(exchange.request_body), exchange.request_truncated) == (1024, True)
+    assert exchange.response_body == _PAYLOAD[:1024]
+    assert exchange.response_text() is None
+
+
+def test_recorded_exchanges_become_workspace_requests():
+    workspace = WorkspaceData(
+        schema_version=1,
+        collections=[WorkspaceCollection("col-1", "Recorded")],
+        folders=[WorkspaceFolder("folder-1", "col-1", None, "api.example.com")],
+        requests=[WorkspaceRequest("req-1", "folder-1", "List", "GET", "http://api.example.com/users")],
+    )
+
+    def exchange(method, url, body=b""):
+        return RecordedExchange("2026-01-01T00:00:00+00:00", method, url, [("Host", "x"), ("X-Trace", "1")], body)
+
+    added = add_recorded_requests(
+        workspace,
+        [
+            exchange("GET", "http://api.example.com/users"),
+            exchange("GET", "http://api.example.com/users/1"),
+            exchange("GET", "http://api.example.com/users/2"),
+            exchange("POST", "http://other.example.com:8080/items", b'{"a": 1}'),
+        ],
+    )
+
+    assert [(request.id, request.name, request.folder_id) for request in added] == [
+        ("req-2", "GET /users/1", "folder-1"),
+        ("req-3", "POST /items", "folder-2"),
+    ]
+    assert added[0].headers == [("X-Trace", "1")]
+    assert added[1].body == '{"a": 1}'
+    assert workspace.folders[-1].name == "other.example.com:8080"
+
+
+def test_request_without_body_is_resent_when_a_pooled_connection_was_closed():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _OneRequestPerConnectionHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    collected = CollectionRecorder()
+    try:
+        with RecordingProxyThread([collected]) as proxy:
+            with httpx.Client(proxy=proxy.url) as client:
+                assert client.get(base + "/first").text == "ok"
+                assert client.get(base + "/second").text == "ok"
+                # A body has already been relayed and cannot be replayed.
+                assert client.post(base + "/third", content=b"payload").status_code == 502
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert _OneRequestPerConnectionHandler.connections == 2
+    assert [(exchange.status_code, exchange.error is None) for exchange in collected.exchanges] == [
+        (200, True),
+        (200, True),
+        (None, False),
+    ]
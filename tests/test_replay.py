@@ -0,0 +1,85 @@
+import json
+
+from core.model import HistoryEntry
+from core.replay import (
+    format_replay_report,
+    items_from_history,
+    load_har,
+    replay,
+    retarget_url,
+    summarize_replay,
+)
+
+
+def test_retarget_url_keeps_path_and_query():
+    url = retarget_url("https://prod.example/users/1?x=2", "http://localhost:8080")
+    assert url == "http://localhost:8080/users/1?x=2"
+    assert retarget_url("https://prod.example/users", "https://staging/api/") == "https://staging/api/users"
+
+
+def test_history_items_are_filtered_sorted_and_offset():
+    entries = [
+        HistoryEntry("2026-01-01T00:00:05+00:00", "b", "GET", "https://prod/b", 200, 40),
+        HistoryEntry("2026-01-01T00:00:00+00:00", "a", "GET", "https://prod/a", 200, 20),
+        HistoryEntry("2026-01-01T00:01:00+00:00", "late", "GET", "https://prod/c", 500, 10),
+        HistoryEntry("not a time", "bad", "GET", "https://prod/d"),
+    ]
+    items = items_from_history(entries, until=1767225630.0)
+    assert [(item.request.name, item.offset_s) for item in items] == [("a", 0.0), ("b", 5.0)]
+    assert items[1].elapsed_ms == 40.0
+
+
+def test_har_entries_keep_headers_and_bodies(tmp_path):
+    path = tmp_path / "traffic.har"
+    entries = [
+        {
+            "startedDateTime": "2026-01-01T00:00:01.500Z",
+            "time": 12.5,
+            "request": {
+                "method": "post",
+                "url": "https://prod/items?a=1",
+                "headers": [
+                    {"name": ":authority", "value": "prod"},
+                    {"name": "Host", "value": "prod"},
+                    {"name": "Content-Type", "value": "application/json"},
+                ],
+                "postData": {"mimeType": "application/json", "text": "{\"x\": 1}"},
+            },
+            "response": {"status": 201},
+        },
+        {
+            "startedDateTime": "2026-01-01T00:00:01Z",
+            "time": -1,
+            "request": {"method": "GET", "url": "https://prod/down", "headers": []},
+            "response": {"status": 0},
+        },
+        {"startedDateTime": "2026-01-01T00:00:02Z", "request": {}},
+    ]
+    path.write_text(json.dumps({"log": {"version": "1.2", "entries": entries}}), encoding="utf-8")
+
+    first, second = load_har(path)
+    assert (first.request.url, first.status_code, first.error) == ("https://prod/down", None, "no response")
+    assert second.offset_s == 0.5
+    assert second.request.method == "POST"
+    assert second.request.headers == [("Content-Type", "application/json")]
+    assert (second.request.body, second.status_code, second.elapsed_ms) == ("{\"x\": 1}", 201, 12.5)
+
+
+def test_replay_scales_timing_and_compares_with_originals(server_url):
+    entries = [
+        HistoryEntry(f"2026-01-01T00:00:0{second}+00:00", name, "GET", f"https://prod.example/{status}", 200, 5)
+        for second, name, status in ((0, "a", 200), (1, "b", 200), (2, "c", 503))
+    ]
+    report = replay(items_from_history(entries), target="{{base}}", variables={"base": server_url}, speed=4.0)
+
+    assert [result.url for result in report.results] == [
+        f"{server_url}/200",
+        f"{server_url}/200",
+        f"{server_url}/503",
+    ]
+    assert [result.scheduled_s for result in report.results] == [0.0, 0.25, 0.5]
+    assert all(result.started_s >= result.scheduled_s for result in report.results)
+    assert 0.5 <= report.duration_s < 2.0
+    summary = summarize_replay(report)
+    assert (summary["requests"], summary["status_matches"], summary["errors"]) == (3, 2, 0)
+    assert f"{server_url}/503: 200 -> 503" in format_replay_report(report)
@@ -0,0 +1,63 @@
+from core.model import RequestData, ResponseData
+
+
+def test_concurrent_tasks_report_results_under_their_own_keys(qapp, server_url):
+    from PySide6.QtCore import QThreadPool
+
+    from workers.request_worker import RequestTask
+
+    statuses: dict[str, int] = {}
+    finished: list[str] = []
+
+    def on_response(key: str, response: ResponseData) -> None:
+        statuses[key] = response.status_code
+
+    def on_finished(key: str) -> None:
+        finished.append(key)
+
+    pool = QThreadPool()
+    pool.setMaxThreadCount(2)
+    tasks = [
+        RequestTask("tab-a", RequestData(name="A", method="GET", url=f"{server_url}/200")),
+        RequestTask("tab-b", RequestData(name="B", method="GET", url=f"{server_url}/404")),
+    ]
+    for task in tasks:
+        task.signals.response_ready.connect(on_response)
+        task.signals.finished.connect(on_finished)
+        pool.start(task)
+    assert pool.waitForDone(10000)
+    # The signals object lives on this thread, so emissions arrive queued.
+    qapp.processEvents()
+
+    assert statuses == {"tab-a": 200, "tab-b": 404}
+    assert sorted(finished) == ["tab-a", "tab-b"]
+
+
+def test_clearing_the_viewer_drops_the_previous_result(qapp):
+    from app.ui.panels.response_viewer import ResponseViewerPanel
+
+    viewer = ResponseViewerPanel()
+    try:
+        viewer.set_error("connection refused")
+        viewer.clear()
+        assert viewer._status_label.text() == "Status: --"
+        assert viewer._body_view.toPlainText() == ""
+    finally:
+        viewer.shutdown()
+
+
+def test_partial_body_is_shown_without_load_full(qapp):
+    from app.ui.panels.response_viewer import ResponseViewerPanel
+
+    viewer = ResponseViewerPanel()
+    try:
+        viewer.set_response(ResponseData(200, [], "x" * 10, 5), body_length=4096)
+        assert not viewer._truncation_bar.isHidden()
+        assert viewer._load_full_button.isHidden()
+        assert "of 4.0 K chars" in viewer._truncation_label.text()
+
+        viewer.set_preview_limit(4)
+        viewer.set_response(ResponseData(200, [], "y" * 10, 5))
+        assert not viewer._load_full_button.isHidden()
+    finally:
+        viewer.shutdown()
@@ -0,0 +1,139 @@
+"""Wall-time and memory budgets for large workspaces and histories.
+
+Budgets leave a few times headroom over a typical developer machine for
+time (``BUDGET_TIME_FACTOR`` scales them on slow CI) and less for traced
+memory, which does not depend on the machine.
+"""
+
+import pytest
+
+from benchmarks.budget import Budget, check_budget, measure_usage
+from benchmarks.synthetic import make_workspace, write_history
+from core.analytics import load_history_columns
+from core.fuzzy_index import FuzzyEntry, FuzzyIndex
+from core.model import EnvironmentScope
+from core.storage.history_jsonl import load_history_entries
+from core.storage.json_storage import load_workspace, save_workspace
+
+REQUESTS = 5_000
+HISTORY_LINES = 25_000
+HISTORY_TAIL = 100
+QUICK_OPEN_REQUESTS = 50_000
+QUICK_OPEN_QUERIES = ("g", "get", "s", "api", "user", "post items", "delete tem", "sesions")
+
+pytestmark = pytest.mark.scale
+
+BUDGETS = {
+    "workspace.save": Budget(max_seconds=1.5, max_peak_mb=25),
+    "workspace.load": Budget(max_seconds=1.2, max_peak_mb=60, max_rss_growth_mb=150),
+    "history.load_tail": Budget(max_seconds=0.3, max_peak_mb=5),
+    "history.columns": Budget(max_seconds=1.5, max_peak_mb=6),
+    "collection_tree.populate": Budget(max_seconds=1.5, max_peak_mb=80),
+    "request_editor.populate": Budget(max_seconds=1.5, max_peak_mb=6),
+    # Eight broad searches: each should stay well under 10 ms.
+    "quick_open.search": Budget(max_seconds=0.08, max_peak_mb=8),
+}
+
+
+@pytest.fixture(scope="module")
+def workspace():
+    return make_workspace(REQUESTS)
+
+
+@pytest.fixture(scope="module")
+def workspace_path(workspace, tmp_path_factory):
+    path = tmp_path_factory.mktemp("scale") / "workspace.json"
+    save_workspace(path, workspace)
+    return path
+
+
+@pytest.fixture(scope="module")
+def history_path(tmp_path_factory):
+    return write_history(tmp_path_factory.mktemp("scale") / "history.jsonl", HISTORY_LINES)
+
+
+def test_generated_workspace_has_realistic_shape(workspace):
+    assert len(workspace.requests) == REQUESTS
+    folders = {folder.id: folder for folder in workspace.folders}
+
+    def depth(folder):
+        return 1 if folder.parent_id is None else 1 + depth(folders[folder.parent_id])
+
+    assert max(depth(folder) for folder in workspace.folders) == 3
+    scopes = {environment.scope for environment in workspace.environments}
+    assert scopes == {EnvironmentScope.GLOBAL, EnvironmentScope.COLLECTION, EnvironmentScope.REQUEST}
+    assert {request.body_type for request in workspace.requests} == {"raw", "multipart"}
+    assert max(len(request.body) for request in workspace.requests) > 20_000
+    assert make_workspace(200, seed=7) == make_workspace(200, seed=7)
+
+
+def test_workspace_save_and_load_stay_within_budget(workspace, tmp_path):
+    path = tmp_path / "workspace.json"
+    _, usage = measure_usage(lambda: save_workspace(path, workspace))
+    check_budget("save_workspace(5k requests)", usage, BUDGETS["workspace.save"])
+
+    loaded, usage = measure_usage(lambda: load_workspace(path))
+    check_budget("load_workspace(5k requests)", usage, BUDGETS["workspace.load"])
+    assert len(loaded.requests) == REQUESTS
+
+
+def test_history_loading_stays_within_budget(history_path):
+    entries, usage = measure_usage(lambda: load_history_entries(history_path, limit=HISTORY_TAIL))
+    check_budget("load_history_entries(25k lines, limit=100)", usage, BUDGETS["history.load_tail"])
+    assert len(entries) == HISTORY_TAIL
+
+    columns, usage = measure_usage(lambda: load_history_columns(history_path))
+    check_budget("load_history_columns(25k lines)", usage, BUDGETS["history.columns"])
+    assert len(columns) == HISTORY_LINES
+
+
+def test_quick_open_search_stays_within_budget(workspace):
+    folders = {folder.id: folder.name for folder in workspace.folders}
+    index = FuzzyIndex()
+    # The 5k workspace repeated ten times over, under fresh keys.
+    for copy in range(QUICK_OPEN_REQUESTS // REQUESTS):
+        for request in workspace.requests:
+            path = folders[request.folder_id]
+            index.add(FuzzyEntry(f"{request.id}-{copy}", request.name, request.method, request.url, path))
+
+    results, usage = measure_usage(lambda: [index.search(query) for query in QUICK_OPEN_QUERIES])
+    check_budget("FuzzyIndex.search(50k requests, 8 broad queries)", usage, BUDGETS["quick_open.search"])
+    assert all(len(matches) == 50 for matches in results)
+
+
+def test_collection_tree_populates_within_budget(qapp, workspace_path):
+    from app.ui.panels.collection_tree import CollectionTreePanel
+
+    workspace = load_workspace(workspace_path)
+    panel = CollectionTreePanel()
+
+    def populate():
+        panel.load_workspace_tree(workspace.collections, workspace.folders, workspace.requests)
+        # Quick Open indexing runs in event-loop batches after the tree is shown.
+        while panel.quick_open_pending():
+            qapp.processEvents()
+
+    _, usage = measure_usage(populate)
+    check_budget("CollectionTreePanel(5k requests)", usage, BUDGETS["collection_tree.populate"])
+    collections, folders = panel.build_workspace_collections()
+    assert (len(collections), len(folders)) == (len(workspace.collections), len(workspace.folders))
+    panel.deleteLater()
+
+
+def test_request_editor_populates_within_budget(qapp, workspace_path):
+    from app.ui.panels.request_editor import RequestEditorPanel
+
+    workspace = load_workspace(workspace_path)
+    panel = RequestEditorPanel()
+
+    def populate():
+        panel.load_workspace_requests(workspace.requests)
+        for request in workspace.requests[::125]:
+            panel.select_request(request.id)
+        return panel.open_tab_count()
+
+    open_tabs, usage = measure_usage(populate)
+    check_budget("RequestEditorPanel(5k requests, 40 opened)", usage, BUDGETS["request_editor.populate"])
+    assert open_tabs == 12
+    assert panel.build_workspace_requests() == workspace.requests
+    panel.deleteLater()
@@ -0,0 +1,69 @@
+import json
+import time
+
+from core.settings import SETTINGS_SCHEMA, AppSettings
+
+
+def test_missing_file_seeds_defaults_on_close(tmp_path):
+    path = tmp_path / "conf" / "settings.json"
+    settings = AppSettings(settings_path=path, write_delay=60)
+    assert settings.get("default_timeout_ms") == SETTINGS_SCHEMA["default_timeout_ms"].default
+    assert not path.exists()
+
+    settings.close()
+    data = json.loads(path.read_text(encoding="utf-8"))
+    assert data["history_max_items"] == 100
+    assert "last_workspace" not in data
+
+
+def test_set_value_is_debounced_into_one_write(tmp_path):
+    path = tmp_path / "settings.json"
+    path.write_text(json.dumps({key: spec.default for key, spec in SETTINGS_SCHEMA.items()}), encoding="utf-8")
+    settings = AppSettings(settings_path=path, write_delay=0.05)
+    for size in range(10, 20):
+        settings.setValue("editor_font_size", size)
+    assert json.loads(path.read_text(encoding="utf-8"))["editor_font_size"] == 12
+
+    deadline = time.monotonic() + 5
+    while settings.is_dirty() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    settings.close()
+    assert json.loads(path.read_text(encoding="utf-8"))["editor_font_size"] == 19
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_schema_coerces_bad_values_to_defaults(tmp_path):
+    path = tmp_path / "settings.json"
+    path.write_text(
+        json.dumps({"default_timeout_ms": "2500", "history_max_items": "lots", "diff_ignore_fields": "x"}),
+        encoding="utf-8",
+    )
+    settings = AppSettings(settings_path=path, write_delay=60)
+    assert settings.get("default_timeout_ms") == 2500
+    assert settings.get("history_max_items") == 100
+    assert settings.get("diff_ignore_fields") == SETTINGS_SCHEMA["diff_ignore_fields"].default
+    assert settings.value("unknown", "fallback") == "fallback"
+    settings.close()
+
+
+def test_listeners_see_changes_but_not_repeats(tmp_path):
+    settings = AppSettings(settings_path=tmp_path / "settings.json", write_delay=60)
+    changes = []
+    settings.add_listener(lambda key, value: changes.append((key, value)))
+    settings.setValue("window", {"geometry": "ab"})
+    settings.setValue("window", {"geometry": "ab"})
+    settings.setValue("last_workspace", "/tmp/ws.json")
+    assert changes == [("window", {"geometry": "ab"}), ("last_workspace", "/tmp/ws.json")]
+    settings.close()
+    assert json.loads(settings.path.read_text(encoding="utf-8"))["last_workspace"] == "/tmp/ws.json"
+
+
+def test_set_value_after_close_is_written_immediately(tmp_path, caplog):
+    path = tmp_path / "settings.json"
+    settings = AppSettings(settings_path=path, write_delay=60)
+    settings.close()
+
+    settings.setValue("editor_font_size", 17)
+    assert not settings.is_dirty()
+    assert json.loads(path.read_text(encoding="utf-8"))["editor_font_size"] == 17
+    assert "after settings were closed" in caplog.text
@@ -0,0 +1,107 @@
+import threading
+import time
+import traceback
+from pathlib import Path
+
+from core.stall import UNAVAILABLE_LOCATION, StallWatchdog, format_report, hot_spot_location
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _blocked_work(entered: threading.Event, release: threading.Event) -> None:
+    entered.set()
+    release.wait(5)
+
+
+def test_stall_captures_the_blocked_threads_stack_and_aggregates_by_location():
+    clock = _Clock()
+    entered = threading.Event()
+    release = threading.Event()
+    worker = threading.Thread(target=_blocked_work, args=(entered, release))
+    worker.start()
+    entered.wait(5)
+    stalls = []
+    watchdog = StallWatchdog(
+        threshold_ms=200, heartbeat_ms=100, thread_id=worker.ident, on_stall=stalls.append, clock=clock
+    )
+    try:
+        watchdog.beat()
+        # Not overdue yet: 0.25 s since the beat is 0.15 s past the expected one.
+        clock.now = 0.25
+        assert watchdog.check() is False
+        clock.now = 0.5
+        assert watchdog.check() is True
+        clock.now = 0.7
+        watchdog.beat()
+    finally:
+        release.set()
+        worker.join()
+
+    assert len(stalls) == 1
+    record = stalls[0]
+    assert round(record.duration_ms) == 600
+    assert "_blocked_work" in record.location and record.location.startswith("tests/test_stall.py:")
+    assert any("release.wait" in line for line in record.stack)
+
+    stats = watchdog.stats()
+    assert (stats.stall_count, round(stats.stall_max_ms)) == (1, 600)
+    assert stats.top_hot_spots()[0].count == 1
+    report = format_report(stats, watchdog.threshold_ms)
+    assert "stalls: 1" in report and "_blocked_work" in report
+
+    watchdog.reset()
+    assert watchdog.stats().stall_count == 0
+
+
+def test_late_beats_under_the_threshold_only_count_as_latency():
+    clock = _Clock()
+    watchdog = StallWatchdog(threshold_ms=200, heartbeat_ms=100, clock=clock)
+    watchdog.beat()
+    for now in (0.1, 0.25, 0.35):
+        clock.now = now
+        watchdog.beat()
+    stats = watchdog.stats()
+    assert stats.stall_count == 0
+    assert [round(value) for value in stats.latencies_ms] == [0, 50, 0]
+    assert round(stats.latency_percentiles()["p50"]) == 0
+
+
+def test_stall_without_a_captured_stack_is_still_counted():
+    # The checker never ran, as when the UI thread blocks in C code holding the GIL.
+    clock = _Clock()
+    watchdog = StallWatchdog(threshold_ms=200, heartbeat_ms=100, clock=clock)
+    watchdog.beat()
+    clock.now = 2.3
+    watchdog.beat()
+    stats = watchdog.stats()
+    assert (stats.stall_count, round(stats.stall_max_ms)) == (1, 2200)
+    assert stats.recent[0].location == UNAVAILABLE_LOCATION and stats.recent[0].stack == ()
+
+
+def test_watchdog_thread_detects_a_real_stall():
+    watchdog = StallWatchdog(threshold_ms=50, heartbeat_ms=10)
+    watchdog.start()
+    try:
+        watchdog.beat()
+        time.sleep(0.3)
+        watchdog.beat()
+    finally:
+        watchdog.stop()
+    stats = watchdog.stats()
+    assert stats.stall_count == 1
+    assert "test_watchdog_thread_detects_a_real_stall" in stats.recent[0].location
+
+
+def test_hot_spot_location_prefers_the_innermost_project_frame():
+    project_frame = (str(Path(__file__)), 12, "render", None)
+    library_frame = ("/usr/lib/python3/site-packages/PySide6/widgets.py", 40, "setPlainText", None)
+    frames = traceback.StackSummary.from_list([project_frame, library_frame])
+    assert hot_spot_location(frames) == "tests/test_stall.py:12 in render"
+    assert hot_spot_location(traceback.StackSummary.from_list([library_frame])) == "widgets.py:40 in setPlainText"
+    assert hot_spot_location(traceback.StackSummary()) == "<unknown>"
@@ -1,6 +1,7 @@
 import tempfile
 from pathlib import Path
-from core.model import WorkspaceRequest, AuthConfig, AuthType, NetworkConfig
+from core.model import WorkspaceRequest, AuthConfig, AuthType, HistoryEntry, NetworkConfig
+from core.storage.history_jsonl import append_history_entry, load_history_entries
 from core.storage.json_storage import JsonWorkspaceStorage, save_workspace, load_workspace, WorkspaceData
 
 def test_workspace_request_persistence_multipart():
@@ -48,3 +49,33 @@ def test_workspace_request_persistence_multipart():
     finally:
         if tmp_path.exists():
             tmp_path.unlink()
+
+
+def test_workspace_request_persistence_network_simulation(tmp_path):
+    path = tmp_path / "workspace.json"
+    request = WorkspaceRequest(
+        id="req-1",
+        folder_id="folder-1",
+        name="Flaky",
+        method="GET",
+        url="https://example.com",
+        network=NetworkConfig(simulate="flaky seed=3"),
+    )
+    save_workspace(path, WorkspaceData(schema_version=1, requests=[request]))
+
+    assert load_workspace(path).requests[0].network.simulate == "flaky seed=3"
+
+
+def test_history_limit_parses_only_the_tail(tmp_path):
+    history_path = tmp_path / "history.jsonl"
+    for index in range(5):
+        append_history_entry(
+            history_path,
+            HistoryEntry(timestamp=f"t{index}", name=f"R{index}", method="GET", url="https://x"),
+        )
+    with history_path.open("a", encoding="utf-8") as handle:
+        handle.write("\n")
+
+    entries = load_history_entries(history_path, limit=2)
+    assert [entry.name for entry in entries] == ["R3", "R4"]
+    assert len(load_history_entries(history_path)) == 5
@@ -0,0 +1,82 @@
+import random
+import re
+
+import pytest
+
+from core.text_search import (
+    SearchQuery,
+    astral_offsets,
+    compile_query,
+    find_all,
+    iter_match_batches,
+    utf16_position,
+)
+
+
+def test_plain_search_is_case_insensitive_and_escaped():
+    text = "GET /a.b\nget /axb\n"
+    assert find_all(text, SearchQuery("get")) == [(0, 3), (9, 12)]
+    assert find_all(text, SearchQuery("a.b")) == [(5, 8)]
+
+
+def test_case_sensitive_search():
+    text = "Token token TOKEN"
+    assert find_all(text, SearchQuery("token", case_sensitive=True)) == [(6, 11)]
+
+
+def test_regex_search_is_multiline_and_skips_empty_matches():
+    text = '"id": 1\n"id": 22\n'
+    assert find_all(text, SearchQuery(r'^"id": \d+$', regex=True)) == [(0, 7), (8, 16)]
+    assert find_all(text, SearchQuery(r"x*", regex=True)) == []
+
+
+def test_invalid_regex_raises():
+    with pytest.raises(re.error):
+        find_all("abc", SearchQuery("(", regex=True))
+
+
+def test_empty_pattern_yields_nothing():
+    assert find_all("abc", SearchQuery("")) == []
+
+
+def test_batches_and_early_stop():
+    text = "a" * 25
+    batches = list(iter_match_batches(text, SearchQuery("a"), batch_size=10))
+    assert [len(batch) for batch in batches] == [10, 10, 5]
+
+    stopped = list(iter_match_batches(text, SearchQuery("a"), batch_size=10, should_stop=lambda: True))
+    assert [len(batch) for batch in stopped] == [10]
+
+
+def test_windowed_scan_matches_a_full_scan():
+    rng = random.Random(3)
+    text = "".join(rng.choice("ab \n") for _ in range(2000))
+    queries = [SearchQuery("ab"), SearchQuery("a b"), SearchQuery(r"a+", regex=True), SearchQuery(r"b$", regex=True)]
+    for query in queries:
+        expected = [match.span() for match in compile_query(query).finditer(text) if match.start() != match.end()]
+        batches = iter_match_batches(text, query, batch_size=7, window_chars=13)
+        assert [span for batch in batches for span in batch] == expected
+
+
+def test_rare_pattern_stops_within_a_window_and_partial_batches_flush():
+    text = "x" * 100 + "needle" + "x" * 100
+    polls = []
+
+    def stop() -> bool:
+        polls.append(1)
+        return True
+
+    stopped = list(iter_match_batches(text, SearchQuery("needle"), window_chars=50, should_stop=stop))
+    assert stopped == [] and len(polls) == 1
+
+    ticks = iter(range(0, 1000))
+    batches = list(iter_match_batches(text, SearchQuery("needle"), window_chars=50, clock=lambda: next(ticks)))
+    assert batches == [[(100, 106)]]
+
+
+def test_utf16_positions_from_astral_offsets():
+    text = "a\U0001F600b\U0001F680c"
+    astral = astral_offsets(text)
+    assert astral == [1, 3]
+    assert astral_offsets("\U0001F600", base=10) == [10] and astral_offsets("plain") == []
+    assert [utf16_position(astral, offset) for offset in range(len(text) + 1)] == [0, 1, 3, 4, 6, 7]
@@ -0,0 +1,63 @@
+import pytest
+
+from core.timeseries import RESOLUTION_HOUR, RESOLUTION_MINUTE, RESOLUTION_RAW, TimeSeries, TimeSeriesStore
+
+
+def test_samples_roll_up_into_minute_and_hour_buckets():
+    series = TimeSeries()
+    series.add(0.0, 10.0, 200)
+    series.add(30.0, 30.0, 200)
+    series.add(45.0, None, 503)
+    series.add(60.0, 50.0, 200)
+
+    minutes = series.points(resolution=RESOLUTION_MINUTE)
+    assert [point.timestamp for point in minutes] == [0.0, 60.0]
+    assert (minutes[0].count, minutes[0].errors) == (3, 1)
+    assert minutes[0].mean_ms == pytest.approx(20.0)
+    assert (minutes[0].min_ms, minutes[0].max_ms) == (10.0, 30.0)
+    assert minutes[0].status_code == 503
+    # The current hour is still open and covers every sample.
+    (hour,) = series.points(resolution=RESOLUTION_HOUR)
+    assert (hour.count, hour.errors, hour.max_ms) == (4, 1, 50.0)
+
+
+def test_rings_stay_bounded_and_queries_fall_back_to_coarser_resolution():
+    series = TimeSeries(raw_capacity=10, minute_capacity=5, hour_capacity=3)
+    for second in range(0, 4 * 3600, 15):
+        series.add(float(second), 1.0 + second % 7, 200)
+
+    raw = series.points(resolution=RESOLUTION_RAW)
+    assert len(raw) == 10
+    assert raw[-1].timestamp == 4 * 3600 - 15
+    assert len(series.points(resolution=RESOLUTION_MINUTE)) == 6  # 5 closed + 1 open
+    assert len(series.points(resolution=RESOLUTION_HOUR)) == 4  # 3 closed + 1 open
+
+    now = 4 * 3600.0
+    assert series.resolution_for(now - 60) == RESOLUTION_RAW
+    assert series.resolution_for(now - 240) == RESOLUTION_MINUTE
+    assert series.resolution_for(now - 3 * 3600) == RESOLUTION_HOUR
+    hours = series.points(since=now - 3 * 3600)
+    assert sum(point.count for point in hours) == 3 * 240
+
+
+def test_store_round_trips_through_file(tmp_path):
+    path = tmp_path / "monitor.json"
+    store = TimeSeriesStore()
+    store.add("req-1", 0.0, 12.0, 200, name="Ping")
+    store.add("req-1", 61.0, None, None, name="Ping")
+    store.save(path)
+
+    loaded = TimeSeriesStore.load(path)
+    assert loaded.keys() == ["req-1"]
+    assert loaded.name("req-1") == "Ping"
+    assert loaded.points("req-1", resolution=RESOLUTION_RAW) == store.points("req-1", resolution=RESOLUTION_RAW)
+    # The open minute keeps accumulating after a reload.
+    loaded.add("req-1", 90.0, 20.0, 200)
+    last_minute = loaded.points("req-1", resolution=RESOLUTION_MINUTE)[-1]
+    assert (last_minute.count, last_minute.errors, last_minute.mean_ms) == (2, 1, 20.0)
+
+
+def test_unreadable_store_file_loads_empty(tmp_path):
+    path = tmp_path / "monitor.json"
+    path.write_text("{not json", encoding="utf-8")
+    assert TimeSeriesStore.load(path).keys() == []
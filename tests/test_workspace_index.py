@@ -0,0 +1,67 @@
+import pytest
+
+from core.model import WorkspaceCollection, WorkspaceFolder, WorkspaceRequest
+from core.workspace_index import KIND_FOLDER, KIND_REQUEST, WorkspaceIndex
+
+
+def _index():
+    collections = [WorkspaceCollection(id="col-1", name="API")]
+    folders = [
+        WorkspaceFolder(id="folder-2", collection_id="col-1", parent_id="folder-1", name="Admin", order=0),
+        WorkspaceFolder(id="folder-1", collection_id="col-1", parent_id=None, name="Users", order=1),
+    ]
+    requests = [
+        WorkspaceRequest(id="req-1", folder_id="folder-1", name="List Users", method="GET", url="https://api.test/users"),
+        WorkspaceRequest(id="req-2", folder_id="folder-2", name="Ban User", method="POST", url="https://api.test/admin/ban"),
+        WorkspaceRequest(id="req-9", folder_id="missing", name="Orphan", method="GET", url="https://x"),
+    ]
+    return WorkspaceIndex(collections, folders, requests)
+
+
+def test_children_and_rows_follow_workspace_order():
+    index = _index()
+    assert index.roots() == ["col-1"]
+    assert index.children_of("col-1") == ["folder-1"]
+    assert index.children_of("folder-1") == ["folder-2", "req-1"]
+    assert index.row_of("req-1") == 1
+    assert index.ancestors("req-2") == ["col-1", "folder-1", "folder-2"]
+    assert "req-9" not in index
+
+
+def test_search_matches_name_method_and_url_with_ancestors():
+    index = _index()
+    assert index.search("") is None
+    assert index.search("ban") == {"col-1", "folder-1", "folder-2", "req-2"}
+    assert index.search("ban post") == {"col-1", "folder-1", "folder-2", "req-2"}
+    assert index.search("get users") == {"col-1", "folder-1", "req-1"}
+    assert index.search("nothing") == set()
+
+
+def test_add_rename_move_update_search_and_ids():
+    index = _index()
+    node = index.add(KIND_REQUEST, "Health", "col-1", method="GET", url="https://api.test/health")
+    assert node.id == "req-3"
+    assert index.search("health") == {"col-1", node.id}
+
+    index.rename("req-1", "All Members")
+    assert index.search("members") == {"col-1", "folder-1", "req-1"}
+
+    index.move("req-1", "folder-2", 0)
+    assert index.children_of("folder-2") == ["req-1", "req-2"]
+    assert index.row_of("req-2") == 1
+    assert not index.can_move("folder-1", "folder-2")
+    with pytest.raises(ValueError):
+        index.move("folder-1", "folder-2")
+
+
+def test_build_collections_round_trips_folder_order():
+    index = _index()
+    folder = index.add(KIND_FOLDER, "Extra", "col-1")
+    index.move(folder.id, "col-1", 0)
+    collections, folders = index.build_collections()
+    assert [item.id for item in collections] == ["col-1"]
+    assert [(item.id, item.parent_id, item.order) for item in folders] == [
+        (folder.id, None, 0),
+        ("folder-1", None, 1),
+        ("folder-2", "folder-1", 0),
+    ]
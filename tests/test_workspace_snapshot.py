@@ -0,0 +1,97 @@
+import os
+
+from core.model import (
+    AuthConfig,
+    EnvironmentScope,
+    NetworkConfig,
+    WorkspaceCollection,
+    WorkspaceData,
+    WorkspaceEnvironment,
+    WorkspaceFolder,
+    WorkspaceRequest,
+)
+from core.storage.json_storage import save_workspace
+from core.storage.workspace_snapshot import WorkspaceSnapshotCache, snapshot_key
+from core.workspace_index import WorkspaceIndex
+
+
+def _workspace():
+    return WorkspaceData(
+        schema_version=1,
+        updated_at="2026-01-01T00:00:00Z",
+        collections=[WorkspaceCollection(id="col-1", name="API")],
+        folders=[WorkspaceFolder(id="folder-1", collection_id="col-1", parent_id=None, name="Users")],
+        requests=[
+            WorkspaceRequest(
+                id="req-1",
+                folder_id="folder-1",
+                name="Login",
+                method="POST",
+                url="https://api.test/login",
+                headers=[("Accept", "application/json")],
+                body='{"user": "a"}',
+                auth=AuthConfig.bearer("secret"),
+                network=NetworkConfig(proxy_url="http://proxy", verify_ssl=False, simulate="3g seed=1"),
+            )
+        ],
+        environments=[
+            WorkspaceEnvironment(scope=EnvironmentScope.GLOBAL, owner_id=None, variables={"name": "Dev"})
+        ],
+    )
+
+
+def _store(cache, path, workspace):
+    payload = cache.encode(workspace, WorkspaceIndex.for_workspace(workspace))
+    cache.store(snapshot_key(path), payload)
+
+
+def test_snapshot_round_trips_workspace_and_index(tmp_path):
+    path = tmp_path / "workspace.json"
+    workspace = _workspace()
+    save_workspace(path, workspace)
+    cache = WorkspaceSnapshotCache(tmp_path / "cache")
+    assert cache.load(path) is None
+
+    _store(cache, path, workspace)
+    snapshot = cache.load(path)
+    assert snapshot is not None
+    assert snapshot.workspace == workspace
+    assert snapshot.index.children_of("folder-1") == ["req-1"]
+    assert snapshot.index.ancestors("req-1") == ["col-1", "folder-1"]
+    assert snapshot.index.next_id("request") == "req-2"
+
+
+def test_snapshot_is_rejected_when_the_file_changes(tmp_path):
+    path = tmp_path / "workspace.json"
+    workspace = _workspace()
+    save_workspace(path, workspace)
+    cache = WorkspaceSnapshotCache(tmp_path / "cache")
+    _store(cache, path, workspace)
+
+    # Same size and mtime, different content: only the hash catches it.
+    stat = path.stat()
+    text = path.read_text(encoding="utf-8")
+    path.write_text(text.replace('"Login"', '"Logon"'), encoding="utf-8")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert path.stat().st_size == stat.st_size
+    assert cache.load(path) is None
+
+    workspace.requests[0].name = "Logon"
+    save_workspace(path, workspace)
+    assert cache.load(path) is None
+    _store(cache, path, workspace)
+    assert cache.load(path).workspace.requests[0].name == "Logon"
+
+
+def test_corrupt_snapshot_is_discarded(tmp_path):
+    path = tmp_path / "workspace.json"
+    workspace = _workspace()
+    save_workspace(path, workspace)
+    cache = WorkspaceSnapshotCache(tmp_path / "cache")
+    _store(cache, path, workspace)
+
+    snapshot_path = cache.snapshot_path(path)
+    data = snapshot_path.read_bytes()
+    snapshot_path.write_bytes(data[: len(data) // 2])
+    assert cache.load(path) is None
+    assert not snapshot_path.exists()
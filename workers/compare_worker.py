@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Mapping
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+from core.http_client import HttpClient
+from core.latency_compare import CompareCancelled, CompareOptions, compare_environments
+from core.logger import get_logger
+from core.model import RequestData
+
+
+class LatencyCompareSignals(QObject):
+    sample = Signal(int, str, object)
+    completed = Signal(int, object)
+    failed = Signal(int, str)
+    finished = Signal(int)
+
+
+class LatencyCompareTask(QRunnable):
+    """Runs ``compare_environments`` as one task on a shared ``QThreadPool``.
+
+    The task fans its sends out over ``options.concurrency`` threads of its
+    own, so it takes a single slot of the pool it runs on.
+    """
+
+    def __init__(
+        self,
+        generation: int,
+        request: RequestData,
+        environments: Mapping[str, Mapping[str, str]],
+        options: CompareOptions,
+        http_client: HttpClient | None = None,
+    ) -> None:
+        super().__init__()
+        self.setAutoDelete(False)
+        self.signals = LatencyCompareSignals()
+        self._generation = generation
+        self._request = request
+        self._environments = {name: dict(variables) for name, variables in environments.items()}
+        self._options = options
+        self._http_client = http_client
+        self._cancelled = threading.Event()
+        self._logger = get_logger("compare_worker")
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+
+    def run(self) -> None:
+        try:
+            report = compare_environments(
+                self._request,
+                self._environments,
+                self._options,
+                http_client=self._http_client,
+                on_sample=self._on_sample,
+                should_stop=self._cancelled.is_set,
+            )
+        except CompareCancelled:
+            self._logger.debug("Comparison interrupted (generation=%s)", self._generation)
+        except Exception as exc:
+            self._logger.exception("Latency comparison failed")
+            self.signals.failed.emit(self._generation, str(exc))
+        else:
+            self.signals.completed.emit(self._generation, report)
+        finally:
+            self.signals.finished.emit(self._generation)
+
+    def _on_sample(self, name: str, latency_ms: float | None) -> None:
+        self.signals.sample.emit(self._generation, name, latency_ms)
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from PySide6.QtCore import QThread, Signal
+
+from core.diff import DiffCancelled, DiffOptions, DiffSource, diff_sources
+from core.logger import get_logger
+
+
+class DiffWorker(QThread):
+    completed = Signal(int, object)
+    failed = Signal(int, str)
+
+    def __init__(
+        self,
+        generation: int,
+        left: DiffSource,
+        right: DiffSource,
+        options: DiffOptions,
+    ) -> None:
+        super().__init__()
+        self._generation = generation
+        self._left = left
+        self._right = right
+        self._options = options
+        self._logger = get_logger("diff_worker")
+
+    def run(self) -> None:
+        try:
+            result = diff_sources(
+                self._left,
+                self._right,
+                self._options,
+                should_stop=self.isInterruptionRequested,
+            )
+        except DiffCancelled:
+            self._logger.debug("Diff interrupted (generation=%s)", self._generation)
+            return
+        except ValueError as exc:
+            self.failed.emit(self._generation, str(exc))
+            return
+        if self.isInterruptionRequested():
+            return
+        self.completed.emit(self._generation, result)
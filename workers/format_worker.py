@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from PySide6.QtCore import QThread, Signal
+
+from core.json_stream import JsonStreamError, JsonStreamFormatter
+from core.logger import get_logger
+from core.text_search import astral_offsets
+
+DEFAULT_CHUNK_CHARS = 64 * 1024
+
+
+class _RenderInterrupted(Exception):
+    pass
+
+
+class ResponseFormatWorker(QThread):
+    """Formats a response body off the UI thread and hands it back in chunks.
+
+    JSON bodies are pretty-printed with the streaming formatter, so output
+    starts arriving before the whole body has been processed. If the body
+    turns out not to be JSON part-way through, ``reset`` is emitted and the
+    raw body is streamed instead. The chunks joined together are exactly the
+    text the document ends up holding; ``completed`` carries the offsets of
+    its non-BMP characters for mapping to document positions. Every emission carries the generation it
+    was started with so the panel can drop output from a superseded render.
+    """
+
+    chunk_ready = Signal(int, str)
+    reset = Signal(int)
+    completed = Signal(int, object)
+
+    def __init__(
+        self,
+        generation: int,
+        body: str,
+        pretty: bool = True,
+        chunk_chars: int = DEFAULT_CHUNK_CHARS,
+    ) -> None:
+        super().__init__()
+        self._generation = generation
+        self._body = body
+        self._pretty = pretty
+        self._chunk_chars = max(1, chunk_chars)
+        self._logger = get_logger("format_worker")
+        self._emitted_chars = 0
+        self._astral: list[int] = []
+
+    def run(self) -> None:
+        try:
+            if self._pretty and self.looks_like_json(self._body):
+                try:
+                    self._emit_pretty()
+                    self.completed.emit(self._generation, self._astral)
+                    return
+                except JsonStreamError as exc:
+                    self._logger.debug("Body is not valid JSON, showing raw text: %s", exc)
+                    self._emitted_chars = 0
+                    self._astral = []
+                    self.reset.emit(self._generation)
+            self._emit_raw()
+        except _RenderInterrupted:
+            self._logger.debug("Formatting interrupted (generation=%s)", self._generation)
+            return
+        self.completed.emit(self._generation, self._astral)
+
+    def _emit_pretty(self) -> None:
+        formatter = JsonStreamFormatter(sink=self._emit_chunk, indent=4)
+        body = self._body
+        for start in range(0, len(body), self._chunk_chars):
+            formatter.feed_text(body[start : start + self._chunk_chars])
+        formatter.close()
+
+    def _emit_raw(self) -> None:
+        # The document turns CR LF and lone CR into one line break; emit the
+        # same text so offsets into the chunks match document positions.
+        body = self._body.replace("\r\n", "\n").replace("\r", "\n")
+        for start in range(0, len(body), self._chunk_chars):
+            self._emit_chunk(body[start : start + self._chunk_chars])
+
+    def _emit_chunk(self, text: str) -> None:
+        if self.isInterruptionRequested():
+            raise _RenderInterrupted()
+        self._astral.extend(astral_offsets(text, self._emitted_chars))
+        self._emitted_chars += len(text)
+        self.chunk_ready.emit(self._generation, text)
+
+    @staticmethod
+    def looks_like_json(body: str) -> bool:
+        stripped = body[:64].lstrip()
+        return 0 < len(stripped) and stripped[0] in "{["
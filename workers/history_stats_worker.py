@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from PySide6.QtCore import QThread, Signal
+
+from core.analytics import load_history_columns
+from core.logger import get_logger
+
+
+class HistoryColumnsWorker(QThread):
+    """Reads the history file into ``HistoryColumns`` off the UI thread."""
+
+    loaded = Signal(object)
+    failed = Signal(str)
+
+    def __init__(self, history_path: str | Path) -> None:
+        super().__init__()
+        self._history_path = history_path
+        self._logger = get_logger("history_stats_worker")
+
+    def run(self) -> None:
+        try:
+            columns = load_history_columns(self._history_path, should_stop=self.isInterruptionRequested)
+        except Exception as exc:
+            self._logger.error("Failed to load history %s: %s", self._history_path, exc)
+            self.failed.emit(str(exc))
+            return
+        if self.isInterruptionRequested():
+            return
+        self.loaded.emit(columns)
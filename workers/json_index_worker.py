@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from PySide6.QtCore import QThread, Signal
+
+from core.json_index import JsonIndex
+from core.logger import get_logger
+
+
+class JsonIndexWorker(QThread):
+    index_ready = Signal(int, object)
+    failed = Signal(int, str)
+
+    def __init__(self, generation: int, text: str) -> None:
+        super().__init__()
+        self._generation = generation
+        self._text = text
+        self._logger = get_logger("json_index_worker")
+
+    def run(self) -> None:
+        try:
+            index = JsonIndex(self._text)
+        except ValueError as exc:
+            self._logger.debug("Failed to index JSON body: %s", exc)
+            self.failed.emit(self._generation, str(exc))
+            return
+        if self.isInterruptionRequested():
+            return
+        self.index_ready.emit(self._generation, index)
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from pathlib import Path
+
+from PySide6.QtCore import QObject, Signal
+
+from core.http_client import HttpClient
+from core.logger import get_logger
+from core.monitor import AlertRule, MonitorAlert, MonitorSample, MonitorScheduler, MonitorTarget
+from core.timeseries import TimeSeriesStore
+
+
+class MonitorWorker(QObject):
+    """Owns the monitor scheduler and relays its callbacks to the UI thread.
+
+    The scheduler calls back from its own pool threads; emitting this
+    object's signals from there queues the slots onto the thread the worker
+    lives on. Monitoring keeps running while the monitor dialog is closed.
+    """
+
+    sample_recorded = Signal(object)
+    alert_raised = Signal(object)
+    running_changed = Signal(bool)
+
+    def __init__(self, store: TimeSeriesStore, autosave_path: str | Path | None = None, parent=None) -> None:
+        super().__init__(parent)
+        self._store = store
+        self._autosave_path = autosave_path
+        self._scheduler: MonitorScheduler | None = None
+        self._logger = get_logger("monitor_worker")
+
+    @property
+    def store(self) -> TimeSeriesStore:
+        return self._store
+
+    def is_running(self) -> bool:
+        return self._scheduler is not None
+
+    def targets(self) -> list[MonitorTarget]:
+        return self._scheduler.targets if self._scheduler is not None else []
+
+    def start(
+        self,
+        targets: Sequence[MonitorTarget],
+        rule: AlertRule,
+        http_client: HttpClient | None = None,
+        max_workers: int = 4,
+    ) -> None:
+        self.stop()
+        self._scheduler = MonitorScheduler(
+            targets,
+            self._store,
+            http_client=http_client,
+            rule=rule,
+            on_sample=self._on_sample,
+            on_alert=self._on_alert,
+            max_workers=max_workers,
+            autosave_path=self._autosave_path,
+        )
+        self._scheduler.start()
+        self._logger.info("Monitoring %s request(s)", len(targets))
+        self.running_changed.emit(True)
+
+    def stop(self) -> None:
+        """Stop scheduling without waiting for probes in flight, then save the store."""
+        if self._scheduler is None:
+            return
+        scheduler, self._scheduler = self._scheduler, None
+        scheduler.stop(wait=False)
+        self._logger.info("Monitoring stopped")
+        self.running_changed.emit(False)
+
+    def _on_sample(self, sample: MonitorSample) -> None:
+        self.sample_recorded.emit(sample)
+
+    def _on_alert(self, alert: MonitorAlert) -> None:
+        self.alert_raised.emit(alert)
@@ -1,70 +1,116 @@
 from __future__ import annotations
 
+import threading
+
 import httpx
-from PySide6.QtCore import QThread, Signal
+from PySide6.QtCore import QObject, QRunnable, Signal
 
 from core.http_client import HttpClient
-from core.logger import get_logger
+from core.logger import get_logger, redact_url
 from core.model import RequestData, ResponseData
 from core.template import render_request
 
 
-class RequestWorker(QThread):
-    response_ready = Signal(ResponseData)
-    failed = Signal(str)
-    canceled = Signal()
+class RequestTaskSignals(QObject):
+    # Every signal carries the key the task was started with (the request id
+    # of the editor tab), so one window can track many tasks at once.
+    response_ready = Signal(str, ResponseData)
+    failed = Signal(str, str)
+    canceled = Signal(str)
+    finished = Signal(str)
+
+
+class RequestTask(QRunnable):
+    """Sends one request on a ``QThreadPool`` thread.
+
+    Exactly one of ``response_ready``, ``failed`` or ``canceled`` is emitted,
+    followed by ``finished``. ``cancel()`` may be called from any thread; it
+    closes the task's HTTP client so a blocked send returns promptly.
+    """
 
     def __init__(
         self,
+        key: str,
         request: RequestData,
         http_client: HttpClient | None = None,
         environment: dict[str, str] | None = None,
     ) -> None:
         super().__init__()
+        # The window keeps a reference until ``finished``; Qt must not delete
+        # the C++ side underneath it.
+        self.setAutoDelete(False)
+        self.signals = RequestTaskSignals()
+        self._key = key
         self._request = request
         self._http_client = http_client or HttpClient()
         self._environment = environment or {}
         self._logger = get_logger("worker")
         self._client: httpx.Client | None = None
-        self._cancelled = False
+        self._client_lock = threading.Lock()
+        self._cancelled = threading.Event()
+
+    @property
+    def key(self) -> str:
+        return self._key
 
     def cancel(self) -> None:
-        self._cancelled = True
-        self.requestInterruption()
-        self._logger.info("Cancel requested")
+        self._cancelled.set()
+        self._logger.info("Cancel requested for %s", self._key)
         self._close_client()
 
+    def is_cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
     def run(self) -> None:
+        try:
+            self._run()
+        finally:
+            self.signals.finished.emit(self._key)
+
+    def _run(self) -> None:
         rendered_request = render_request(self._request, self._environment)
-        if self._is_cancelled():
+        if self.is_cancelled():
             self._logger.info("Request cancelled before start")
-            self.canceled.emit()
+            self.signals.canceled.emit(self._key)
             return
 
         self._logger.info(
             "Sending request '%s' %s %s",
             rendered_request.name,
             rendered_request.method,
-            rendered_request.url,
+            redact_url(rendered_request.url),
         )
 
-        self._client = self._http_client.create_client(rendered_request)
         try:
-            response = self._http_client.send(rendered_request, self._client)
+            client = self._http_client.create_client(rendered_request)
+        except ValueError as exc:
+            # e.g. an invalid network simulation profile
+            self._logger.error("Cannot send request: %s", exc)
+            self.signals.failed.emit(self._key, str(exc))
+            return
+        with self._client_lock:
+            self._client = client
+        # cancel() may have run between the check above and storing the client.
+        if self.is_cancelled():
+            self._close_client()
+            self.signals.canceled.emit(self._key)
+            return
+        try:
+            response = self._http_client.send(rendered_request, client)
         except Exception as exc:
-            if self._is_cancelled():
+            if self.is_cancelled():
                 self._logger.info("Request cancelled")
-                self.canceled.emit()
+                self.signals.canceled.emit(self._key)
             else:
                 self._logger.exception("Request failed")
-                self.failed.emit(str(exc))
+                self.signals.failed.emit(self._key, str(exc))
             return
         finally:
             self._close_client()
 
-        if self._is_cancelled():
+        if self.is_cancelled():
             self._logger.info("Request cancelled after response")
-            self.canceled.emit()
+            self.signals.canceled.emit(self._key)
             return
 
         self._logger.info(
@@ -73,17 +119,14 @@ class RequestWorker(QThread):
             response.status_code,
             response.elapsed_ms,
         )
-        self.response_ready.emit(response)
+        self.signals.response_ready.emit(self._key, response)
 
     def _close_client(self) -> None:
-        client = self._client
+        with self._client_lock:
+            client, self._client = self._client, None
         if client is None:
             return
         try:
             client.close()
         except Exception:
             self._logger.exception("Failed to close HTTP client")
-        self._client = None
-
-    def _is_cancelled(self) -> bool:
-        return self._cancelled or self.isInterruptionRequested()
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import re
+
+from PySide6.QtCore import QThread, Signal
+
+from core.logger import get_logger
+from core.text_search import SearchQuery, iter_match_batches
+
+
+class SearchWorker(QThread):
+    """Scans text for a query and streams match offsets back in batches."""
+
+    matches_found = Signal(int, list)
+    completed = Signal(int)
+    failed = Signal(int, str)
+
+    def __init__(self, generation: int, text: str, query: SearchQuery) -> None:
+        super().__init__()
+        self._generation = generation
+        self._text = text
+        self._query = query
+        self._logger = get_logger("search_worker")
+
+    def run(self) -> None:
+        try:
+            for batch in iter_match_batches(
+                self._text,
+                self._query,
+                should_stop=self.isInterruptionRequested,
+            ):
+                if self.isInterruptionRequested():
+                    return
+                self.matches_found.emit(self._generation, batch)
+        except re.error as exc:
+            self.failed.emit(self._generation, str(exc))
+            return
+        if self.isInterruptionRequested():
+            self._logger.debug("Search interrupted (generation=%s)", self._generation)
+            return
+        self.completed.emit(self._generation)
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from PySide6.QtCore import QThread
+
+from core.logger import get_logger
+from core.model import WorkspaceData
+from core.storage.workspace_snapshot import WorkspaceSnapshotCache, snapshot_key
+from core.workspace_index import WorkspaceIndex
+
+
+class SnapshotWriteWorker(QThread):
+    """Rewrites the snapshot of a workspace that was just saved.
+
+    Indexing, encoding, hashing the saved file and writing the snapshot all
+    happen here instead of on the UI thread. Call ``requestInterruption()``
+    before the file is saved again: the worker then drops its snapshot
+    rather than pairing the new file's hash with the older workspace.
+    """
+
+    def __init__(self, path: str, workspace: WorkspaceData, snapshot_cache: WorkspaceSnapshotCache) -> None:
+        super().__init__()
+        self._path = path
+        self._workspace = workspace
+        self._snapshot_cache = snapshot_cache
+        self._logger = get_logger("snapshot_worker")
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def run(self) -> None:
+        try:
+            index = WorkspaceIndex.for_workspace(self._workspace)
+            payload = self._snapshot_cache.encode(self._workspace, index)
+            if self.isInterruptionRequested():
+                return
+            key = snapshot_key(self._path)
+            # Checked after hashing: a save that started before this point has
+            # already requested interruption.
+            if self.isInterruptionRequested():
+                return
+            self._snapshot_cache.store(key, payload)
+        except Exception as exc:
+            self._logger.warning("Failed to write workspace snapshot for %s: %s", self._path, exc)
+            self._snapshot_cache.invalidate(self._path)
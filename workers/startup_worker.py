@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from PySide6.QtCore import QThread, Signal
+
+from core.logger import get_logger
+from core.profiling import StartupProfiler
+from core.storage.history_jsonl import load_history_entries
+from core.storage.json_storage import load_workspace
+from core.storage.workspace_snapshot import SnapshotKey, WorkspaceSnapshotCache, snapshot_key
+from core.workspace_index import WorkspaceIndex
+
+
+class StartupLoadWorker(QThread):
+    """Reads the last workspace and the history tail off the UI thread.
+
+    ``workspace_path`` may be None when there is no workspace to open; the
+    worker then only loads history. Results are emitted separately so the
+    window can fill in each panel as soon as its data is ready. With a
+    snapshot cache, an unchanged workspace is restored from its snapshot;
+    otherwise it is parsed and the snapshot is rewritten after history has
+    been delivered.
+    """
+
+    workspace_loaded = Signal(str, object, object)
+    workspace_failed = Signal(str, str)
+    history_loaded = Signal(list)
+    history_failed = Signal(str)
+
+    def __init__(
+        self,
+        workspace_path: str | None,
+        history_path: str | Path,
+        history_limit: int,
+        profiler: StartupProfiler | None = None,
+        snapshot_cache: WorkspaceSnapshotCache | None = None,
+    ) -> None:
+        super().__init__()
+        self._workspace_path = workspace_path
+        self._history_path = history_path
+        self._history_limit = history_limit
+        self._profiler = profiler or StartupProfiler()
+        self._snapshot_cache = snapshot_cache
+        self._logger = get_logger("startup_worker")
+
+    def run(self) -> None:
+        pending_snapshot = None
+        if self._workspace_path is not None:
+            pending_snapshot = self._load_workspace(self._workspace_path)
+
+        if self.isInterruptionRequested():
+            return
+        try:
+            with self._profiler.phase("history parse (worker)"):
+                entries = load_history_entries(self._history_path, limit=self._history_limit)
+        except Exception as exc:
+            self._logger.error("Failed to load history %s: %s", self._history_path, exc)
+            self.history_failed.emit(str(exc))
+        else:
+            self.history_loaded.emit(entries)
+
+        if pending_snapshot is not None and self._snapshot_cache is not None:
+            key, payload = pending_snapshot
+            try:
+                with self._profiler.phase("snapshot refresh (worker)"):
+                    self._snapshot_cache.store(key, payload)
+            except Exception as exc:
+                self._logger.warning("Failed to write workspace snapshot: %s", exc)
+
+    def _load_workspace(self, path: str) -> tuple[SnapshotKey, tuple] | None:
+        """Emit the workspace; returns a snapshot to write, if one is due."""
+        cache = self._snapshot_cache
+        if cache is not None:
+            with self._profiler.phase("workspace snapshot load (worker)"):
+                snapshot = cache.load(path)
+            if snapshot is not None:
+                self.workspace_loaded.emit(path, snapshot.workspace, snapshot.index)
+                return None
+
+        try:
+            with self._profiler.phase("workspace parse (worker)"):
+                key = snapshot_key(path) if cache is not None else None
+                workspace = load_workspace(path)
+                index = WorkspaceIndex.for_workspace(workspace)
+        except Exception as exc:
+            self._logger.error("Failed to load workspace %s: %s", path, exc)
+            self.workspace_failed.emit(path, str(exc))
+            return None
+
+        pending_snapshot = None
+        if cache is not None and key is not None:
+            # Encode before the UI thread gets the objects and starts
+            # editing them; the file itself is written later.
+            pending_snapshot = (key, cache.encode(workspace, index))
+        self.workspace_loaded.emit(path, workspace, index)
+        return pending_snapshot